@@ -0,0 +1,20 @@
+"""Reproducible benchmark suite for todopro-cli.
+
+Synthetic vaults of 1k to 1M tasks are generated deterministically from a
+seed (projects, labels, location contexts, recurring tasks, optional E2EE
+and a year of focus history), then the operations users wait on are timed
+against them: listing, short-ID resolution, search, sync diffing,
+export/import, stats rollups, CLI cold start and, against a local mock of
+the TodoPro API with injected latency, the REST adapters. Results are
+written as JSON so two runs (e.g. before and after a change) can be
+compared.
+
+Usage (from the repository root):
+    python -m benchmarks run --sizes 1k,10k [--e2ee] [--out results.json]
+    python -m benchmarks run --sizes 100k --only list_all,search
+    python -m benchmarks run --sizes 10k --only api_list_all --latency 50
+    python -m benchmarks serve --tasks 5000 --latency 80 --rate-limit 20
+    python -m benchmarks compare base.json new.json
+    python -m benchmarks generate --sizes 1m
+    python -m benchmarks list
+"""
@@ -0,0 +1,264 @@
+"""Command line entry point: ``python -m benchmarks <command>``."""
+
+import argparse
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+VAULT_DIR = REPO_ROOT / "benchmarks" / ".vaults"
+RESULTS_DIR = REPO_ROOT / "benchmarks" / "results"
+
+# Allow running without installing the package
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+
+def _isolate_home() -> None:
+    """Point HOME and the XDG directories at a throwaway directory.
+
+    Done before todopro_cli is imported, since some of its modules resolve
+    their config and cache paths at import time; the user's real config,
+    caches and vault are never touched.
+    """
+    home = Path(tempfile.mkdtemp(prefix="todopro-bench-home-"))
+    atexit.register(shutil.rmtree, home, ignore_errors=True)
+    os.environ["HOME"] = str(home)
+    for var, sub in (
+        ("XDG_CONFIG_HOME", "config"),
+        ("XDG_DATA_HOME", "data"),
+        ("XDG_CACHE_HOME", "cache"),
+    ):
+        os.environ[var] = str(home / sub)
+    os.environ.setdefault("TODOPRO_BACKEND_URL", "http://127.0.0.1:9")
+
+
+def _sizes(value: str) -> list[int]:
+    from benchmarks.generator import SIZES
+
+    sizes = []
+    for item in value.split(","):
+        item = item.strip().lower()
+        if item in SIZES:
+            sizes.append(SIZES[item])
+        elif item.isdigit():
+            sizes.append(int(item))
+        else:
+            raise argparse.ArgumentTypeError(
+                f"unknown size {item!r} (use {', '.join(SIZES)} or a number)"
+            )
+    return sizes
+
+
+def _vaults(args: argparse.Namespace) -> list:
+    from benchmarks.generator import VaultSpec, generate_vault
+
+    vaults = []
+    for tasks in args.sizes:
+        spec = VaultSpec(
+            tasks=tasks, seed=args.seed, e2ee=args.e2ee, anchor=args.anchor
+        )
+        print(f"vault {spec.name}: generating / loading ...", flush=True)
+        vaults.append(generate_vault(spec, args.vault_dir))
+    return vaults
+
+
+def _network(args: argparse.Namespace):
+    from benchmarks.mock_api import NetworkProfile
+
+    return NetworkProfile(
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        bandwidth=args.bandwidth * 1024 if args.bandwidth else None,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+    )
+
+
+def _cmd_generate(args: argparse.Namespace) -> int:
+    for vault in _vaults(args):
+        print(f"  {vault.path}")
+    return 0
+
+
+def _cmd_run(args: argparse.Namespace) -> int:
+    import json
+
+    from benchmarks.runner import run_suite
+
+    def report(vault, name, stats):
+        print(
+            f"  {vault.spec.name:20} {name:22} "
+            f"median {stats['median'] * 1000:10.1f} ms   "
+            f"min {stats['min'] * 1000:10.1f} ms   "
+            f"p95 {stats['p95'] * 1000:10.1f} ms",
+            flush=True,
+        )
+
+    results = run_suite(
+        _vaults(args),
+        case_names=args.only,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        on_result=report,
+        network=_network(args),
+    )
+    out = args.out
+    if out is None:
+        commit = (results["environment"]["git_commit"] or "nogit")[:10]
+        stamp = results["created_at"][:19].replace(":", "").replace("-", "")
+        out = RESULTS_DIR / f"{stamp}-{commit}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(results, indent=2))
+    print(f"results written to {out}")
+    return 0
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
+    import time
+
+    from benchmarks.mock_api import MockServer, MockTodoProAPI
+
+    api = MockTodoProAPI(_network(args), token_ttl=args.token_ttl)
+    api.populate(tasks=args.tasks, seed=args.seed)
+    access, refresh = api.issue_tokens()
+    with MockServer(api, port=args.port) as server:
+        print(f"mock TodoPro API at {server.url} ({args.tasks:,} tasks)")
+        print(f"  access token:  {access}")
+        print(f"  refresh token: {refresh}")
+        print("Ctrl+C to stop", flush=True)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+    print(f"served {api.stats.total} requests")
+    return 0
+
+
+def _cmd_compare(args: argparse.Namespace) -> int:
+    from benchmarks.runner import compare, load_results
+
+    rows = compare(
+        load_results(args.base), load_results(args.new), threshold=args.threshold
+    )
+    if not rows:
+        print("no cases in common")
+        return 1
+    for row in rows:
+        print(
+            f"{row['vault']:20} {row['case']:22} "
+            f"{row['base'] * 1000:10.1f} ms -> {row['new'] * 1000:10.1f} ms  "
+            f"x{row['ratio']:5.2f}  {row['verdict']}"
+        )
+    slower = [row for row in rows if row["verdict"] == "slower"]
+    return 1 if slower and args.fail_on_regression else 0
+
+
+def _cmd_list(_args: argparse.Namespace) -> int:
+    from benchmarks.cases import CASES
+
+    for case in CASES.values():
+        limit = f" (up to {case.max_tasks:,} tasks)" if case.max_tasks else ""
+        print(f"{case.name:22} {case.description}{limit}")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    _isolate_home()
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="todopro-cli benchmark suite."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    vault_options = argparse.ArgumentParser(add_help=False)
+    vault_options.add_argument(
+        "--sizes", type=_sizes, default=[1_000, 10_000], help="e.g. 1k,10k,100k,1m"
+    )
+    vault_options.add_argument("--seed", type=int, default=42)
+    vault_options.add_argument("--e2ee", action="store_true", help="Encrypt task text")
+    vault_options.add_argument(
+        "--anchor",
+        type=date.fromisoformat,
+        default=None,
+        help="Day the data is centred on (default: today)",
+    )
+    vault_options.add_argument("--vault-dir", type=Path, default=VAULT_DIR)
+
+    network_options = argparse.ArgumentParser(add_help=False)
+    network_options.add_argument(
+        "--latency", type=float, default=0.0, help="Mock API latency in ms"
+    )
+    network_options.add_argument(
+        "--jitter", type=float, default=0.0, help="Latency variation in ms"
+    )
+    network_options.add_argument(
+        "--bandwidth", type=float, default=None, help="Mock API bandwidth in KiB/s"
+    )
+    network_options.add_argument(
+        "--error-rate", type=float, default=0.0, help="Share of requests failing (503)"
+    )
+    network_options.add_argument(
+        "--rate-limit", type=float, default=None, help="Requests per second (429s)"
+    )
+
+    generate = commands.add_parser(
+        "generate", parents=[vault_options], help="Build (or reuse) vaults"
+    )
+    generate.set_defaults(func=_cmd_generate)
+
+    run = commands.add_parser(
+        "run", parents=[vault_options, network_options], help="Run cases"
+    )
+    run.add_argument(
+        "--only",
+        type=lambda v: [name.strip() for name in v.split(",")],
+        default=None,
+        help="Comma-separated cases (see `list`)",
+    )
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--warmup", type=int, default=1)
+    run.add_argument("--out", type=Path, default=None)
+    run.set_defaults(func=_cmd_run)
+
+    serve = commands.add_parser(
+        "serve", parents=[network_options], help="Run the mock API standalone"
+    )
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--tasks", type=int, default=1_000)
+    serve.add_argument("--seed", type=int, default=42)
+    serve.add_argument(
+        "--token-ttl", type=int, default=None, help="Requests per access token"
+    )
+    serve.set_defaults(func=_cmd_serve)
+
+    compare = commands.add_parser("compare", help="Compare two result files")
+    compare.add_argument("base", type=Path)
+    compare.add_argument("new", type=Path)
+    compare.add_argument("--threshold", type=float, default=0.10)
+    compare.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 if any case got slower",
+    )
+    compare.set_defaults(func=_cmd_compare)
+
+    listing = commands.add_parser("list", help="List the cases")
+    listing.set_defaults(func=_cmd_list)
+
+    args = parser.parse_args(argv)
+    if args.command == "run" and args.only:
+        from benchmarks.cases import CASES
+
+        unknown = sorted(set(args.only) - set(CASES))
+        if unknown:
+            parser.error(f"unknown case(s): {', '.join(unknown)}")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,318 @@
+"""Benchmark cases.
+
+A case is an async function ``case(ws, timer)`` registered with
+:func:`case`. It may prepare whatever it needs first (fresh connections,
+scratch copies of the vault) and wraps only the measured work in
+``with timer:``. One-off preparation shared by every repetition, such as
+the archive the import case reads, goes through ``await ws.cached(...)``.
+
+The ``api_*`` cases go through the REST adapters to a local mock API
+(:mod:`benchmarks.mock_api`) serving the vault, shaped by the run's
+network profile.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from io import StringIO
+
+from rich.console import Console
+
+from todopro_cli.adapters.mirror import MirrorRevalidator, MirrorStore
+from todopro_cli.models import ProjectFilters, TaskCreate, TaskFilters, TaskUpdate
+from todopro_cli.models.focus.analytics import FocusAnalytics
+from todopro_cli.models.focus.history import HistoryLogger
+from todopro_cli.services.data_archive import ArchiveWriter, iter_records, open_archive
+from todopro_cli.services.data_transfer import ArchiveExporter, ArchiveImporter
+from todopro_cli.services.sync_conflicts import SyncConflictTracker
+from todopro_cli.services.sync_service import SyncPullService
+from todopro_cli.services.sync_state import SyncState
+from todopro_cli.services.task_service import TaskService
+from todopro_cli.utils.task_helpers import resolve_task_id
+
+# Short IDs resolved per run of the suffix case
+SUFFIX_LOOKUPS = 200
+
+# Share of source tasks touched before a sync diff
+SYNC_CHANGE_RATIO = 0.01
+
+# Tasks created per run of the API write case
+API_WRITES = 100
+
+# Tasks completed per run of the API batch case
+API_BATCH = 200
+
+# Sizes the slow cases skip by default (they would dominate a run)
+_SLOW_ABOVE = 100_000
+
+
+class Timer:
+    """Context manager timing the measured section of one repetition."""
+
+    def __init__(self) -> None:
+        self.elapsed: float | None = None
+        self._start = 0.0
+
+    def __enter__(self) -> Timer:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.elapsed = time.perf_counter() - self._start
+
+
+CaseFunc = Callable[["Workspace", Timer], Awaitable[None]]  # noqa: F821
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    func: CaseFunc
+    description: str
+    max_tasks: int | None = None
+
+
+CASES: dict[str, Case] = {}
+
+
+def case(name: str, max_tasks: int | None = None) -> Callable[[CaseFunc], CaseFunc]:
+    """Register a benchmark case.
+
+    Args:
+        name: Case name, as used by ``--only`` and in the results
+        max_tasks: Largest vault the case runs on unless asked for explicitly
+    """
+
+    def decorator(func: CaseFunc) -> CaseFunc:
+        doc = (func.__doc__ or "").strip().splitlines()
+        CASES[name] = Case(name, func, doc[0] if doc else "", max_tasks)
+        return func
+
+    return decorator
+
+
+@case("list_all")
+async def list_all(ws, timer: Timer) -> None:
+    """List every active task."""
+    repo = ws.storage().task_repository
+    with timer:
+        await repo.list_all(TaskFilters(status="active"))
+
+
+@case("list_page")
+async def list_page(ws, timer: Timer) -> None:
+    """First page of the default task list."""
+    repo = ws.storage().task_repository
+    with timer:
+        await repo.list_all(TaskFilters(status="active", limit=30))
+
+
+@case("suffix_resolve")
+async def suffix_resolve(ws, timer: Timer) -> None:
+    """Resolve short task IDs the way ``tp done <id>`` does."""
+    suffixes = await ws.cached("suffixes", _sample_suffixes)
+    service = TaskService(ws.storage().task_repository)
+    with timer:
+        for suffix in suffixes:
+            # Ambiguous suffixes raise; they are resolved as far as the CLI would
+            with contextlib.suppress(ValueError):
+                await resolve_task_id(service, suffix)
+
+
+async def _sample_suffixes(ws) -> list[str]:
+    rows = ws.connection().execute("SELECT id FROM tasks").fetchall()
+    rng = random.Random(ws.vault.spec.seed)
+    picked = rng.sample([row[0] for row in rows], min(SUFFIX_LOOKUPS, len(rows)))
+    return [task_id[-6:] for task_id in picked]
+
+
+@case("search")
+async def search(ws, timer: Timer) -> None:
+    """Full-text search over task content."""
+    repo = ws.storage().task_repository
+    with timer:
+        for term in ("invoice", "review report", "zzz-no-match"):
+            await repo.list_all(TaskFilters(status="all", search=term))
+
+
+@case("sync_diff", max_tasks=_SLOW_ABOVE)
+async def sync_diff(ws, timer: Timer) -> None:
+    """Pull a vault into a copy of itself with 1% of tasks changed."""
+    source = await ws.cached("sync_source", _changed_copy)
+    target_path = ws.scratch("sync_target.db")
+    shutil.copyfile(ws.vault.path, target_path)
+    source_storage = ws.storage(source)
+    target_storage = ws.storage(target_path)
+    service = SyncPullService(
+        source_storage.task_repository,
+        source_storage.project_repository,
+        source_storage.label_repository,
+        source_storage.location_context_repository,
+        target_storage.task_repository,
+        target_storage.project_repository,
+        target_storage.label_repository,
+        target_storage.location_context_repository,
+        console=Console(file=StringIO()),
+    )
+    service.sync_state = SyncState(ws.scratch("sync_state"))
+    service.conflict_tracker = SyncConflictTracker(ws.scratch("sync_conflicts"))
+    with timer:
+        result = await service.pull("source", "target", strategy="remote_wins")
+    if not result.success:
+        raise RuntimeError(result.error)
+
+
+async def _changed_copy(ws):
+    path = ws.scratch("sync_source.db", keep=True)
+    shutil.copyfile(ws.vault.path, path)
+    conn = ws.connection(path)
+    with conn:
+        conn.execute(
+            "UPDATE tasks SET updated_at = datetime('now'), priority = 5 - priority "
+            "WHERE abs(random() % ?) = 0",
+            (round(1 / SYNC_CHANGE_RATIO),),
+        )
+    return path
+
+
+@case("export", max_tasks=_SLOW_ABOVE)
+async def export(ws, timer: Timer) -> None:
+    """Export the vault to an NDJSON archive."""
+    storage = ws.storage()
+    path = ws.scratch("export.ndjson")
+    with timer, ArchiveWriter(open_archive(path, "w")) as writer:
+        writer.write_header(encryption_enabled=ws.vault.spec.e2ee)
+        await ArchiveExporter(storage).export(writer, contexts=[])
+        writer.write_stats()
+
+
+@case("import", max_tasks=_SLOW_ABOVE)
+async def import_(ws, timer: Timer) -> None:
+    """Import an archive of the vault into an empty vault."""
+    archive = await ws.cached("archive", _export_archive)
+    storage = ws.storage(ws.scratch("import.db"))
+    with timer:
+        importer = ArchiveImporter(storage)
+        with storage.transaction():
+            for record_type, data in iter_records(archive):
+                await importer.import_record(record_type, data)
+            await importer.flush()
+
+
+async def _export_archive(ws):
+    path = ws.scratch("archive.ndjson", keep=True)
+    with ArchiveWriter(open_archive(path, "w")) as writer:
+        writer.write_header(encryption_enabled=ws.vault.spec.e2ee)
+        await ArchiveExporter(ws.storage()).export(writer, contexts=[])
+    return path
+
+
+@case("project_stats")
+async def project_stats(ws, timer: Timer) -> None:
+    """Per-project task counts for every project."""
+    repo = ws.storage().project_repository
+    with timer:
+        for project in await repo.list_all(ProjectFilters()):
+            await repo.get_stats(project.id)
+
+
+@case("focus_stats")
+async def focus_stats(ws, timer: Timer) -> None:
+    """Focus rollups behind ``tp stats`` and ``tp analytics``."""
+    analytics = FocusAnalytics(HistoryLogger(db_path=ws.vault.focus_path))
+    with timer:
+        analytics.get_daily_summary()
+        analytics.get_weekly_summary()
+        analytics.get_monthly_summary()
+        analytics.get_current_streak()
+        analytics.get_heatmap_data(days=365)
+
+
+@case("cli_version")
+async def cli_version(ws, timer: Timer) -> None:
+    """Cold start of ``tp version`` in a fresh interpreter."""
+    _run_cli(ws, timer, ["version"])
+
+
+@case("cli_list")
+async def cli_list(ws, timer: Timer) -> None:
+    """Cold start of ``tp task list`` against the vault."""
+    _run_cli(ws, timer, ["task", "list", "--limit", "30"])
+
+
+def _run_cli(ws, timer: Timer, args: list[str]) -> None:
+    env = {**os.environ, **ws.cli_env()}
+    with timer:
+        subprocess.run(
+            [sys.executable, "-m", "todopro_cli.main", *args],
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+
+@case("api_list_all", max_tasks=_SLOW_ABOVE)
+async def api_list_all(ws, timer: Timer) -> None:
+    """Page through every task over the REST API."""
+    remote = await ws.remote()
+    with timer:
+        async for _task in remote.task_repository.iter_all(TaskFilters(status="all")):
+            pass
+
+
+@case("api_add_many", max_tasks=_SLOW_ABOVE)
+async def api_add_many(ws, timer: Timer) -> None:
+    """Create tasks over the REST API with concurrent requests."""
+    remote = await ws.remote()
+    tasks = [
+        TaskCreate(content=f"Benchmark task {index}", priority=1 + index % 4)
+        for index in range(API_WRITES)
+    ]
+    with timer:
+        await remote.task_repository.add_many(tasks)
+
+
+@case("api_bulk_complete", max_tasks=_SLOW_ABOVE)
+async def api_bulk_complete(ws, timer: Timer) -> None:
+    """Complete a batch of tasks through the batch endpoint."""
+    remote = await ws.remote()
+    task_ids = await ws.cached("api_batch", _sample_task_ids)
+    with timer:
+        await remote.task_repository.bulk_update(
+            task_ids, TaskUpdate(is_completed=True)
+        )
+
+
+async def _sample_task_ids(ws) -> list[str]:
+    api = await ws.api()
+    rng = random.Random(ws.vault.spec.seed)
+    return rng.sample(sorted(api.tasks), min(API_BATCH, len(api.tasks)))
+
+
+@case("api_mirror_revalidate", max_tasks=_SLOW_ABOVE)
+async def api_mirror_revalidate(ws, timer: Timer) -> None:
+    """Full revalidation of an empty remote-context mirror."""
+    remote = await ws.remote()
+    store = MirrorStore(str(ws.scratch("mirror.db")))
+    store._e2ee_handler = ws.vault.e2ee_handler()
+    revalidator = MirrorRevalidator(
+        store,
+        remote.task_repository,
+        remote.project_repository,
+        remote.label_repository,
+        max_age=0,
+    )
+    try:
+        with timer:
+            await revalidator.revalidate()
+    finally:
+        store.connection.close()
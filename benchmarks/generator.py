@@ -0,0 +1,419 @@
+"""Deterministic synthetic vaults for the benchmark suite.
+
+A vault is fully determined by its :class:`VaultSpec`: the same size, seed,
+E2EE setting and anchor date always produce the same projects, labels,
+contexts, tasks (IDs included) and focus history. Only E2EE ciphertexts
+differ between builds, since every encryption draws a fresh nonce.
+
+Rows are written with ``executemany`` straight into a vault created by
+``DatabaseConnection.open`` (so the schema and every migration are
+current), which keeps a 1M-task build to a couple of minutes. The layout
+mirrors what the repositories write: E2EE tasks keep their text only in
+the ``*_encrypted`` columns, and recurring tasks sit on an occurrence of
+their rule with ``next_occurrence`` filled in.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import random
+import sqlite3
+import uuid
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from pathlib import Path
+
+from todopro_cli.adapters.sqlite.connection import DatabaseConnection, transaction
+from todopro_cli.adapters.sqlite.e2ee import E2EEHandler
+from todopro_cli.adapters.sqlite.utils import bounding_box
+from todopro_cli.models.crypto.manager import EncryptionManager
+from todopro_cli.models.crypto.storage import KeyStorage
+from todopro_cli.models.focus.history import HistoryLogger
+from todopro_cli.services.encryption_service import EncryptionService
+from todopro_cli.utils import recurrence
+
+# Bumped whenever the generated data changes, so cached vaults are rebuilt
+GENERATOR_VERSION = 1
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+# Rows per executemany batch
+BATCH_SIZE = 10_000
+
+LABEL_COUNT = 40
+CONTEXT_COUNT = 25
+RECURRING_RATIO = 0.05
+COMPLETED_RATIO = 0.3
+DELETED_RATIO = 0.02
+
+RECURRENCE_RULES = [
+    "FREQ=DAILY",
+    "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR",
+    "FREQ=WEEKLY",
+    "FREQ=WEEKLY;INTERVAL=2",
+    "FREQ=MONTHLY",
+]
+
+_VERBS = [
+    "Review",
+    "Write",
+    "Call",
+    "Email",
+    "Fix",
+    "Plan",
+    "Update",
+    "Book",
+    "Buy",
+    "Clean",
+    "Draft",
+    "Prepare",
+    "Refactor",
+    "Test",
+    "Deploy",
+    "Schedule",
+    "Read",
+    "Organize",
+    "Submit",
+    "Research",
+]
+_OBJECTS = [
+    "report",
+    "invoice",
+    "proposal",
+    "roadmap",
+    "budget",
+    "slides",
+    "newsletter",
+    "contract",
+    "dentist",
+    "groceries",
+    "release",
+    "migration",
+    "backlog",
+    "interview",
+    "agenda",
+    "taxes",
+    "garden",
+    "car",
+    "parser",
+    "benchmark",
+    "dashboard",
+    "onboarding",
+]
+_QUALIFIERS = [
+    "",
+    "for Q3",
+    "with the team",
+    "before Friday",
+    "for the client",
+    "draft v2",
+    "follow-up",
+    "next week",
+]
+_COLORS = ["#db4035", "#ff9933", "#fad000", "#7ecc49", "#299438", "#14aaf5", "#884dff"]
+
+
+@dataclass(frozen=True)
+class VaultSpec:
+    """What to generate.
+
+    Args:
+        tasks: Number of tasks
+        seed: Seed of every random choice
+        e2ee: Store task text encrypted
+        anchor: Day the data is centred on (due dates, focus history)
+    """
+
+    tasks: int
+    seed: int = 42
+    e2ee: bool = False
+    anchor: date | None = None
+
+    @property
+    def projects(self) -> int:
+        return min(max(self.tasks // 100, 5), 2_000)
+
+    @property
+    def focus_sessions(self) -> int:
+        return min(max(self.tasks // 10, 50), 20_000)
+
+    @property
+    def name(self) -> str:
+        size = next((k for k, v in SIZES.items() if v == self.tasks), str(self.tasks))
+        mode = "e2ee" if self.e2ee else "plain"
+        return f"{size}-{mode}-s{self.seed}"
+
+
+@dataclass
+class Vault:
+    """A generated vault on disk."""
+
+    spec: VaultSpec
+    path: Path
+    focus_path: Path
+    keys_dir: Path | None
+    user_id: str
+    anchor: date
+
+    def e2ee_handler(self) -> E2EEHandler:
+        """The handler the vault's tasks were written with."""
+        if self.keys_dir is None:
+            return E2EEHandler()
+        return E2EEHandler(EncryptionService(config_dir=self.keys_dir))
+
+    def metadata(self) -> dict:
+        spec = asdict(self.spec)
+        spec["anchor"] = self.anchor.isoformat()
+        return {"name": self.spec.name, **spec, "generator": GENERATOR_VERSION}
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _batches(rows: Iterator[tuple], size: int = BATCH_SIZE) -> Iterator[list[tuple]]:
+    batch: list[tuple] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _setup_keys(rng: random.Random, keys_dir: Path) -> E2EEHandler:
+    """Save a master key derived from the seed and return a handler using it."""
+    key = base64.b64encode(rng.randbytes(32)).decode()
+    KeyStorage(keys_dir).save_key(EncryptionManager.from_base64_key(key).export_key())
+    return E2EEHandler(EncryptionService(config_dir=keys_dir))
+
+
+def generate_vault(spec: VaultSpec, directory: Path) -> Vault:
+    """Build the vault described by *spec* inside *directory*.
+
+    An existing vault of the same spec and generator version is reused.
+
+    Returns:
+        The generated vault
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    anchor = spec.anchor or datetime.now(UTC).date()
+    stem = f"{spec.name}-{anchor:%Y%m%d}-g{GENERATOR_VERSION}"
+    path = directory / f"{stem}.db"
+    focus_path = directory / f"{stem}.focus.db"
+    keys_dir = directory / f"{stem}.keys" if spec.e2ee else None
+    meta_path = directory / f"{stem}.json"
+
+    if meta_path.exists() and path.exists() and focus_path.exists():
+        user_id = json.loads(meta_path.read_text())["user_id"]
+        return Vault(spec, path, focus_path, keys_dir, user_id, anchor)
+
+    for stale in (path, focus_path, meta_path):
+        stale.unlink(missing_ok=True)
+
+    # The key has its own stream, so plain and E2EE vaults hold the same data
+    rng = random.Random(spec.seed)
+    handler = E2EEHandler()
+    if keys_dir is not None:
+        handler = _setup_keys(random.Random(f"{spec.seed}-key"), keys_dir)
+    connection = DatabaseConnection.open(path)
+    try:
+        user_id = _uuid(rng)
+        with transaction(connection):
+            _write_vault(connection, rng, spec, anchor, user_id, handler)
+        connection.execute("ANALYZE")
+    finally:
+        connection.close()
+    _write_focus_history(focus_path, random.Random(spec.seed + 1), spec, anchor)
+
+    vault = Vault(spec, path, focus_path, keys_dir, user_id, anchor)
+    meta_path.write_text(json.dumps({**vault.metadata(), "user_id": user_id}))
+    return vault
+
+
+def _write_vault(
+    connection: sqlite3.Connection,
+    rng: random.Random,
+    spec: VaultSpec,
+    anchor: date,
+    user_id: str,
+    handler: E2EEHandler,
+) -> None:
+    created = datetime.combine(anchor - timedelta(days=365), time(9), tzinfo=UTC)
+    stamp = _iso(created)
+    connection.execute(
+        "INSERT INTO users (id, email, name, timezone, created_at, updated_at) "
+        "VALUES (?, 'local@todopro.local', 'Local User', 'UTC', ?, ?)",
+        (user_id, stamp, stamp),
+    )
+
+    project_ids = [_uuid(rng) for _ in range(spec.projects)]
+    connection.executemany(
+        "INSERT INTO projects (id, name, color, is_favorite, is_archived, user_id, "
+        "display_order, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                project_id,
+                f"{rng.choice(_OBJECTS).title()} {index}",
+                rng.choice(_COLORS),
+                rng.random() < 0.1,
+                rng.random() < 0.05,
+                user_id,
+                index,
+                stamp,
+                stamp,
+            )
+            for index, project_id in enumerate(project_ids)
+        ],
+    )
+
+    label_ids = [_uuid(rng) for _ in range(LABEL_COUNT)]
+    connection.executemany(
+        "INSERT INTO labels (id, name, color, user_id, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (label_id, f"label-{index}", rng.choice(_COLORS), user_id, stamp, stamp)
+            for index, label_id in enumerate(label_ids)
+        ],
+    )
+
+    context_ids = []
+    for index in range(CONTEXT_COUNT):
+        context_id = _uuid(rng)
+        context_ids.append(context_id)
+        lat, lon = rng.uniform(-60, 60), rng.uniform(-179, 179)
+        radius = rng.choice([100.0, 250.0, 1000.0])
+        connection.execute(
+            "INSERT INTO contexts (id, name, latitude, longitude, radius, user_id, "
+            "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (context_id, f"place-{index}", lat, lon, radius, user_id, stamp, stamp),
+        )
+        if _has_table(connection, "contexts_rtree"):
+            connection.execute(
+                "INSERT INTO contexts_rtree VALUES ((SELECT rowid FROM contexts "
+                "WHERE id = ?), ?, ?, ?, ?)",
+                (context_id, *bounding_box(lat, lon, radius)),
+            )
+
+    task_links: list[tuple[str, str]] = []
+    context_links: list[tuple[str, str]] = []
+
+    def tasks() -> Iterator[tuple]:
+        for _ in range(spec.tasks):
+            task_id = _uuid(rng)
+            text = (
+                f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)} "
+                f"{rng.choice(_QUALIFIERS)}".strip()
+            )
+            note = None
+            if rng.random() < 0.3:
+                note = f"Notes about the {rng.choice(_OBJECTS)}"
+            content, content_enc, description, description_enc = (
+                handler.prepare_task_for_storage(text, note)
+            )
+            created_at = created + timedelta(minutes=rng.randrange(365 * 24 * 60))
+            updated_at = created_at + timedelta(minutes=rng.randrange(30 * 24 * 60))
+            due = None
+            if rng.random() < 0.6:
+                due = datetime.combine(
+                    anchor + timedelta(days=rng.randint(-60, 60)),
+                    time(rng.choice([9, 12, 17])),
+                )
+            rule = next_occurrence = None
+            if due is not None and rng.random() < RECURRING_RATIO / 0.6:
+                rule = rng.choice(RECURRENCE_RULES)
+                due = recurrence.first_occurrence(rule, due) or due
+                next_occurrence = recurrence.next_occurrence(rule, due, None)
+            completed = rule is None and rng.random() < COMPLETED_RATIO
+            deleted = rng.random() < DELETED_RATIO
+
+            for label_id in rng.sample(label_ids, rng.choice([0, 0, 1, 1, 2, 3])):
+                task_links.append((task_id, label_id))
+            if rng.random() < 0.05:
+                context_links.append((task_id, rng.choice(context_ids)))
+
+            yield (
+                task_id,
+                content,
+                description,
+                content_enc,
+                description_enc,
+                rng.choice(project_ids) if rng.random() < 0.8 else None,
+                _iso(due),
+                rng.randint(1, 4),
+                completed,
+                user_id,
+                _iso(created_at),
+                _iso(updated_at),
+                _iso(updated_at) if completed else None,
+                _iso(updated_at) if deleted else None,
+                rule is not None,
+                rule,
+                _iso(next_occurrence),
+                rng.choice([None, 15, 30, 60]),
+            )
+
+    for batch in _batches(tasks()):
+        connection.executemany(
+            "INSERT INTO tasks (id, content, description, content_encrypted, "
+            "description_encrypted, project_id, due_date, priority, is_completed, "
+            "user_id, created_at, updated_at, completed_at, deleted_at, "
+            "is_recurring, recurrence_rule, next_occurrence, estimated_time) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            batch,
+        )
+        connection.executemany("INSERT INTO task_labels VALUES (?, ?)", task_links)
+        connection.executemany("INSERT INTO task_contexts VALUES (?, ?)", context_links)
+        task_links.clear()
+        context_links.clear()
+
+
+def _has_table(connection: sqlite3.Connection, name: str) -> bool:
+    return (
+        connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = ?", (name,)
+        ).fetchone()
+        is not None
+    )
+
+
+def _write_focus_history(
+    path: Path, rng: random.Random, spec: VaultSpec, anchor: date
+) -> None:
+    """Fill a focus history database with a year of Pomodoro sessions."""
+    HistoryLogger(db_path=path)
+    start = datetime.combine(anchor - timedelta(days=365), time(8))
+    rows = []
+    for _ in range(spec.focus_sessions):
+        begin = start + timedelta(minutes=rng.randrange(365 * 24 * 60))
+        duration = rng.choice([25, 25, 25, 50, 5, 15])
+        status = rng.choices(["completed", "interrupted"], weights=[5, 1])[0]
+        focus = duration if status == "completed" else rng.randint(1, duration)
+        rows.append(
+            (
+                _uuid(rng),
+                None,
+                f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)}",
+                begin.isoformat(),
+                (begin + timedelta(minutes=duration)).isoformat(),
+                duration,
+                focus,
+                rng.random() < 0.2,
+                status,
+                "focus" if duration >= 25 else "break",
+                rng.choice(["work", "home", "study"]),
+                begin.isoformat(),
+            )
+        )
+    with sqlite3.connect(path) as conn:
+        conn.executemany(
+            "INSERT INTO pomodoro_sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
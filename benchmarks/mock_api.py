@@ -0,0 +1,825 @@
+"""In-process stand-in for the TodoPro API, for offline network benchmarks.
+
+:class:`MockTodoProAPI` is a plain ASGI application (no framework) holding
+tasks, projects, labels and sections in memory. It answers the endpoints
+the CLI's REST adapters call - ``/v1/tasks`` (with offset or cursor
+pagination and the batch complete endpoint), projects with their sections
+and stats, labels and ``/v1/auth/*`` including token refresh - and shapes
+every response through a :class:`NetworkProfile`: added latency and jitter,
+a bandwidth cap, a token-bucket rate limit (429) and injected 503s.
+
+:class:`MockServer` serves an app on localhost from a background thread
+with a small HTTP/1.1 server, so the real ``APIClient`` (and ``httpx``
+connection pooling) is exercised end to end without extra dependencies.
+For in-process tests the app also works with ``httpx.ASGITransport``.
+
+Usage:
+    api = MockTodoProAPI(NetworkProfile(latency=0.05, jitter=0.01))
+    api.populate(tasks=1000)
+    with MockServer(api) as server:
+        os.environ["TODOPRO_BACKEND_URL"] = server.url
+        ...
+    print(api.stats.requests)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from typing import Any
+from urllib.parse import parse_qsl, unquote
+
+# Largest page the list endpoint returns when a limit is given
+MAX_PAGE_SIZE = 500
+
+Handler = Callable[["_Request"], tuple[int, Any]]
+
+
+@dataclass
+class NetworkProfile:
+    """How the mock server's network behaves.
+
+    Attributes:
+        latency: Seconds added before every response
+        jitter: Latency varies uniformly by up to this many seconds either way
+        bandwidth: Response body throughput in bytes per second (None: unlimited)
+        error_rate: Share of requests answered with 503 Service Unavailable
+        rate_limit: Sustained requests per second before 429s (None: unlimited)
+        burst: Requests allowed at once on top of the sustained rate
+        seed: Seed of the jitter and error injection
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    bandwidth: float | None = None
+    error_rate: float = 0.0
+    rate_limit: float | None = None
+    burst: int = 10
+    seed: int = 0
+
+
+@dataclass
+class MockStats:
+    """Traffic seen by the mock server."""
+
+    requests: Counter[str] = field(default_factory=Counter)
+    statuses: Counter[int] = field(default_factory=Counter)
+    bytes_sent: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.requests.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.total,
+            "by_route": dict(self.requests),
+            "statuses": {str(k): v for k, v in self.statuses.items()},
+            "bytes_sent": self.bytes_sent,
+            "max_in_flight": self.max_in_flight,
+        }
+
+
+class HTTPError(Exception):
+    """Raised by a handler to answer with an error status."""
+
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+@dataclass
+class _Request:
+    method: str
+    path: str
+    params: dict[str, str]
+    headers: dict[str, str]
+    body: Any
+    match: re.Match
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _bool(value: str | None) -> bool | None:
+    if value is None:
+        return None
+    return value.lower() in ("1", "true", "yes")
+
+
+class MockTodoProAPI:
+    """ASGI app emulating the TodoPro API.
+
+    Args:
+        profile: Network behaviour applied to every response
+        cursor_pagination: Return ``next_cursor`` from the task list (as
+            current servers do); otherwise clients page by offset
+        require_auth: Reject requests without a valid bearer token
+        token_ttl: Requests an access token is valid for before it expires
+            and the client has to refresh it (None: never expires)
+    """
+
+    def __init__(
+        self,
+        profile: NetworkProfile | None = None,
+        *,
+        cursor_pagination: bool = True,
+        require_auth: bool = True,
+        token_ttl: int | None = None,
+    ):
+        self.profile = profile or NetworkProfile()
+        self.cursor_pagination = cursor_pagination
+        self.require_auth = require_auth
+        self.token_ttl = token_ttl
+        self.stats = MockStats()
+        self._rng = random.Random(self.profile.seed)
+
+        self.tasks: dict[str, dict[str, Any]] = {}
+        self.projects: dict[str, dict[str, Any]] = {}
+        self.labels: dict[str, dict[str, Any]] = {}
+        self.sections: dict[str, dict[str, Any]] = {}
+
+        self.user = {"id": self._id(), "email": "bench@todopro.local", "name": "Bench"}
+        # Access token -> requests it may still serve (None: unlimited)
+        self._tokens: dict[str, int | None] = {}
+        self._refresh_tokens: set[str] = set()
+
+        self._bucket = float(self.profile.burst)
+        self._bucket_at = time.monotonic()
+        self._routes = self._build_routes()
+
+    # -- Setup -----------------------------------------------------------
+
+    def _id(self) -> str:
+        return str(uuid.UUID(int=self._rng.getrandbits(128), version=4))
+
+    def issue_tokens(self) -> tuple[str, str]:
+        """Create an access/refresh token pair, as a login would."""
+        access, refresh = f"at-{self._id()}", f"rt-{self._id()}"
+        self._tokens[access] = self.token_ttl
+        self._refresh_tokens.add(refresh)
+        return access, refresh
+
+    def populate(
+        self, tasks: int, projects: int = 20, labels: int = 10, seed: int = 42
+    ) -> None:
+        """Fill the store with deterministic synthetic data."""
+        rng = random.Random(seed)
+        stamp = _now()
+        project_ids = []
+        for index in range(projects):
+            project = self.add_project({"name": f"Project {index}"}, stamp)
+            project_ids.append(project["id"])
+        label_ids = [
+            self.add_label({"name": f"label-{index}"}, stamp)["id"]
+            for index in range(labels)
+        ]
+        for index in range(tasks):
+            self.add_task(
+                {
+                    "content": f"Task {index}",
+                    "priority": rng.randint(1, 4),
+                    "project_id": rng.choice(project_ids) if project_ids else None,
+                    "labels": rng.sample(label_ids, min(len(label_ids), 2)),
+                    "is_completed": rng.random() < 0.3,
+                },
+                stamp,
+            )
+
+    def add_task(self, data: dict[str, Any], stamp: str | None = None) -> dict:
+        """Store a task (missing fields get the server's defaults)."""
+        stamp = stamp or _now()
+        task = {
+            "id": data.get("id") or self._id(),
+            "content": data.get("content", ""),
+            "description": data.get("description"),
+            "content_encrypted": data.get("content_encrypted"),
+            "description_encrypted": data.get("description_encrypted"),
+            "project_id": data.get("project_id"),
+            "section_id": data.get("section_id"),
+            "due_date": data.get("due_date"),
+            "priority": data.get("priority", 4),
+            "is_completed": data.get("is_completed", False),
+            "is_recurring": data.get("is_recurring", False),
+            "recurrence_rule": data.get("recurrence_rule"),
+            "recurrence_end": data.get("recurrence_end"),
+            "labels": list(data.get("labels") or []),
+            "contexts": list(data.get("contexts") or []),
+            "created_at": data.get("created_at", stamp),
+            "updated_at": data.get("updated_at", stamp),
+            "completed_at": stamp if data.get("is_completed") else None,
+            "version": 1,
+        }
+        self.tasks[task["id"]] = task
+        return task
+
+    def add_project(self, data: dict[str, Any], stamp: str | None = None) -> dict:
+        """Store a project."""
+        stamp = stamp or _now()
+        project = {
+            "id": data.get("id") or self._id(),
+            "name": data["name"],
+            "color": data.get("color"),
+            "is_favorite": data.get("is_favorite", False),
+            "is_archived": False,
+            "protected": False,
+            "workspace_id": data.get("workspace_id"),
+            "created_at": stamp,
+            "updated_at": stamp,
+        }
+        self.projects[project["id"]] = project
+        return project
+
+    def add_label(self, data: dict[str, Any], stamp: str | None = None) -> dict:
+        """Store a label."""
+        stamp = stamp or _now()
+        label = {
+            "id": data.get("id") or self._id(),
+            "name": data["name"],
+            "color": data.get("color"),
+            "created_at": stamp,
+            "updated_at": stamp,
+        }
+        self.labels[label["id"]] = label
+        return label
+
+    # -- ASGI ------------------------------------------------------------
+
+    async def __call__(self, scope: dict, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        stats = self.stats
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        try:
+            status, payload, headers = await self._respond(scope, body)
+            data = b"" if payload is None else json.dumps(payload).encode()
+            await self._shape(len(data))
+        finally:
+            stats.in_flight -= 1
+        stats.statuses[status] += 1
+        stats.bytes_sent += len(data)
+
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(data)).encode()),
+            *headers,
+        ]
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": data})
+
+    async def _shape(self, size: int) -> None:
+        """Hold the response back as the network profile says."""
+        profile = self.profile
+        delay = profile.latency
+        if profile.jitter:
+            delay += self._rng.uniform(-profile.jitter, profile.jitter)
+        if profile.bandwidth:
+            delay += size / profile.bandwidth
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _take_token(self) -> float | None:
+        """Spend a rate-limit token; return seconds to wait if none is left."""
+        rate = self.profile.rate_limit
+        if rate is None:
+            return None
+        now = time.monotonic()
+        self._bucket = min(
+            float(self.profile.burst), self._bucket + (now - self._bucket_at) * rate
+        )
+        self._bucket_at = now
+        if self._bucket < 1:
+            return (1 - self._bucket) / rate
+        self._bucket -= 1
+        return None
+
+    async def _respond(self, scope: dict, body: bytes):
+        method = scope["method"]
+        path = scope["path"].rstrip("/") or "/"
+        headers = {k.decode().lower(): v.decode() for k, v in scope["headers"]}
+
+        route = self._match_route(method, path)
+        if route is None:
+            self.stats.requests[f"{method} <unknown>"] += 1
+            return 404, {"detail": f"No route for {method} {path}"}, []
+        name, handler, match = route
+        self.stats.requests[name] += 1
+
+        wait = self._take_token()
+        if wait is not None:
+            retry_after = str(max(1, round(wait))).encode()
+            return 429, {"detail": "Rate limited"}, [(b"retry-after", retry_after)]
+        profile = self.profile
+        if profile.error_rate and self._rng.random() < profile.error_rate:
+            return 503, {"detail": "Injected failure"}, []
+
+        try:
+            if not name.startswith("POST /v1/auth/"):
+                self._authorize(headers)
+            request = _Request(
+                method,
+                path,
+                dict(parse_qsl(scope["query_string"].decode())),
+                headers,
+                json.loads(body) if body else None,
+                match,
+            )
+            status, payload = handler(request)
+        except HTTPError as e:
+            return e.status, {"detail": e.detail}, []
+        return status, payload, []
+
+    def _match_route(
+        self, method: str, path: str
+    ) -> tuple[str, Handler, re.Match] | None:
+        for route_method, pattern, name, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if match and route_method == method:
+                return name, handler, match
+        return None
+
+    def _authorize(self, headers: dict[str, str]) -> None:
+        if not self.require_auth:
+            return
+        token = headers.get("authorization", "").removeprefix("Bearer ").strip()
+        if token not in self._tokens:
+            raise HTTPError(401, "Not authenticated")
+        remaining = self._tokens[token]
+        if remaining is not None:
+            if remaining <= 0:
+                raise HTTPError(401, "Token expired")
+            self._tokens[token] = remaining - 1
+
+    # -- Routes ----------------------------------------------------------
+
+    def _build_routes(self) -> list[tuple[str, re.Pattern, str, Handler]]:
+        uid = r"(?P<id>[^/]+)"
+        sid = r"(?P<section_id>[^/]+)"
+        table: list[tuple[str, str, Handler]] = [
+            ("POST", "/v1/auth/login", self._login),
+            ("POST", "/v1/auth/register", self._login),
+            ("POST", "/v1/auth/refresh", self._refresh),
+            ("POST", "/v1/auth/logout", lambda _request: (204, None)),
+            ("GET", "/v1/auth/profile", lambda _request: (200, self.user)),
+            ("GET", "/v1/tasks", self._list_tasks),
+            ("POST", "/v1/tasks", self._create_task),
+            ("POST", "/v1/tasks/batch/complete", self._batch_complete),
+            ("GET", f"/v1/tasks/{uid}", lambda r: (200, self._task(r))),
+            ("PATCH", f"/v1/tasks/{uid}", self._update_task),
+            ("DELETE", f"/v1/tasks/{uid}", self._delete_task),
+            ("POST", f"/v1/tasks/{uid}/close", lambda r: (200, self._close(r, True))),
+            ("POST", f"/v1/tasks/{uid}/reopen", lambda r: (200, self._close(r, False))),
+            ("POST", f"/v1/tasks/{uid}/skip", self._skip_task),
+            ("GET", "/v1/projects", self._list_projects),
+            ("POST", "/v1/projects", lambda r: (201, self.add_project(r.body))),
+            ("GET", f"/v1/projects/{uid}", lambda r: (200, self._project(r))),
+            ("PATCH", f"/v1/projects/{uid}", self._update_project),
+            ("DELETE", f"/v1/projects/{uid}", self._delete_project),
+            ("POST", f"/v1/projects/{uid}/archive", self._archive_project),
+            ("POST", f"/v1/projects/{uid}/unarchive", self._unarchive_project),
+            ("GET", f"/v1/projects/{uid}/stats", self._project_stats),
+            ("GET", f"/v1/projects/{uid}/sections", self._list_sections),
+            ("POST", f"/v1/projects/{uid}/sections", self._create_section),
+            ("PATCH", f"/v1/projects/{uid}/sections/reorder", self._reorder_sections),
+            ("GET", f"/v1/projects/{uid}/sections/{sid}", self._get_section),
+            ("PATCH", f"/v1/projects/{uid}/sections/{sid}", self._update_section),
+            ("DELETE", f"/v1/projects/{uid}/sections/{sid}", self._delete_section),
+            ("GET", "/v1/labels", self._list_labels),
+            ("POST", "/v1/labels", lambda r: (201, self.add_label(r.body))),
+            ("GET", f"/v1/labels/{uid}", lambda r: (200, self._label(r))),
+            ("PATCH", f"/v1/labels/{uid}", self._update_label),
+            ("DELETE", f"/v1/labels/{uid}", self._delete_label),
+        ]
+        routes = []
+        for method, template, handler in table:
+            # Stats are keyed by the route's template, e.g. "GET /v1/tasks/{id}"
+            name = method + " " + re.sub(r"\(\?P<(\w+)>[^)]*\)", r"{\1}", template)
+            routes.append((method, re.compile(template), name, handler))
+        return routes
+
+    # -- Auth --
+
+    def _login(self, _request: _Request) -> tuple[int, Any]:
+        access, refresh = self.issue_tokens()
+        return 200, {
+            "access_token": access,
+            "refresh_token": refresh,
+            "user": self.user,
+        }
+
+    def _refresh(self, request: _Request) -> tuple[int, Any]:
+        refresh = (request.body or {}).get("refresh_token")
+        if refresh not in self._refresh_tokens:
+            raise HTTPError(401, "Invalid refresh token")
+        self._refresh_tokens.discard(refresh)
+        access, new_refresh = self.issue_tokens()
+        return 200, {"access_token": access, "refresh_token": new_refresh}
+
+    # -- Tasks --
+
+    def _task(self, request: _Request) -> dict:
+        task = self.tasks.get(request.match["id"])
+        if task is None:
+            raise HTTPError(404, "Task not found")
+        return task
+
+    def _list_tasks(self, request: _Request) -> tuple[int, Any]:
+        params = request.params
+        status = params.get("status", "active")
+        tasks = list(self.tasks.values())
+        if status == "active":
+            tasks = [t for t in tasks if not t["is_completed"]]
+        elif status == "completed":
+            tasks = [t for t in tasks if t["is_completed"]]
+        if "project_id" in params:
+            tasks = [t for t in tasks if t["project_id"] == params["project_id"]]
+        if "priority" in params:
+            tasks = [t for t in tasks if t["priority"] == int(params["priority"])]
+        if "search" in params:
+            needle = params["search"].lower()
+            tasks = [t for t in tasks if needle in t["content"].lower()]
+        if "updated_after" in params:
+            tasks = [t for t in tasks if t["updated_at"] >= params["updated_after"]]
+
+        total = len(tasks)
+        if "cursor" in params:
+            offset = int(base64.urlsafe_b64decode(params["cursor"]).decode())
+        else:
+            offset = int(params.get("offset", 0))
+        # Without a limit the whole list is returned, as ``list_all`` expects
+        limit = min(int(params["limit"]), MAX_PAGE_SIZE) if "limit" in params else total
+        page = tasks[offset : offset + limit]
+
+        result: dict[str, Any] = {"tasks": page, "total": total}
+        if self.cursor_pagination:
+            end = offset + len(page)
+            result["next_cursor"] = (
+                base64.urlsafe_b64encode(str(end).encode()).decode()
+                if end < total
+                else None
+            )
+        return 200, result
+
+    def _create_task(self, request: _Request) -> tuple[int, Any]:
+        data = dict(request.body or {})
+        data.pop("id", None)
+        data.pop("is_completed", None)
+        return 201, self.add_task(data)
+
+    def _update_task(self, request: _Request) -> tuple[int, Any]:
+        task = self._task(request)
+        for key, value in (request.body or {}).items():
+            if key in task and key not in ("id", "created_at", "version"):
+                task[key] = value
+        task["updated_at"] = _now()
+        task["version"] += 1
+        return 200, task
+
+    def _delete_task(self, request: _Request) -> tuple[int, Any]:
+        self._task(request)
+        del self.tasks[request.match["id"]]
+        return 204, None
+
+    def _close(self, request: _Request, completed: bool) -> dict:
+        task = self._task(request)
+        task["is_completed"] = completed
+        task["completed_at"] = _now() if completed else None
+        task["updated_at"] = _now()
+        return task
+
+    def _skip_task(self, request: _Request) -> tuple[int, Any]:
+        task = self._task(request)
+        if task["due_date"]:
+            due = datetime.fromisoformat(task["due_date"]) + timedelta(days=1)
+            task["due_date"] = due.isoformat()
+        task["updated_at"] = _now()
+        return 200, task
+
+    def _batch_complete(self, request: _Request) -> tuple[int, Any]:
+        stamp = _now()
+        done = []
+        for task_id in (request.body or {}).get("task_ids", []):
+            task = self.tasks.get(task_id)
+            if task is not None:
+                task.update(is_completed=True, completed_at=stamp, updated_at=stamp)
+                done.append(task)
+        return 200, {"tasks": done, "completed": len(done)}
+
+    # -- Projects and sections --
+
+    def _project(self, request: _Request) -> dict:
+        project = self.projects.get(request.match["id"])
+        if project is None:
+            raise HTTPError(404, "Project not found")
+        return project
+
+    def _list_projects(self, request: _Request) -> tuple[int, Any]:
+        projects = list(self.projects.values())
+        archived = _bool(request.params.get("archived"))
+        if archived is not None:
+            projects = [p for p in projects if p["is_archived"] == archived]
+        favorites = _bool(request.params.get("favorites"))
+        if favorites:
+            projects = [p for p in projects if p["is_favorite"]]
+        return 200, {"projects": projects}
+
+    def _update_project(self, request: _Request) -> tuple[int, Any]:
+        project = self._project(request)
+        for key, value in (request.body or {}).items():
+            if key in ("name", "color", "is_favorite", "workspace_id"):
+                project[key] = value
+        project["updated_at"] = _now()
+        return 200, project
+
+    def _delete_project(self, request: _Request) -> tuple[int, Any]:
+        self._project(request)
+        del self.projects[request.match["id"]]
+        return 204, None
+
+    def _archive(self, request: _Request, archived: bool) -> tuple[int, Any]:
+        project = self._project(request)
+        project["is_archived"] = archived
+        project["updated_at"] = _now()
+        return 200, project
+
+    def _archive_project(self, request: _Request) -> tuple[int, Any]:
+        return self._archive(request, True)
+
+    def _unarchive_project(self, request: _Request) -> tuple[int, Any]:
+        return self._archive(request, False)
+
+    def _project_stats(self, request: _Request) -> tuple[int, Any]:
+        project_id = self._project(request)["id"]
+        tasks = [t for t in self.tasks.values() if t["project_id"] == project_id]
+        completed = sum(t["is_completed"] for t in tasks)
+        total = len(tasks)
+        return 200, {
+            "total_tasks": total,
+            "completed_tasks": completed,
+            "pending_tasks": total - completed,
+            "overdue_tasks": 0,
+            "completion_rate": round(completed / total * 100, 1) if total else 0,
+        }
+
+    def _section(self, request: _Request) -> dict:
+        section = self.sections.get(request.match["section_id"])
+        if section is None or section["project_id"] != request.match["id"]:
+            raise HTTPError(404, "Section not found")
+        return section
+
+    def _list_sections(self, request: _Request) -> tuple[int, Any]:
+        project_id = self._project(request)["id"]
+        sections = [s for s in self.sections.values() if s["project_id"] == project_id]
+        return 200, sorted(sections, key=lambda s: s["display_order"])
+
+    def _create_section(self, request: _Request) -> tuple[int, Any]:
+        project_id = self._project(request)["id"]
+        stamp = _now()
+        body = request.body or {}
+        section = {
+            "id": self._id(),
+            "project_id": project_id,
+            "name": body["name"],
+            "display_order": body.get("display_order", 0),
+            "task_count": 0,
+            "created_at": stamp,
+            "updated_at": stamp,
+        }
+        self.sections[section["id"]] = section
+        return 201, section
+
+    def _get_section(self, request: _Request) -> tuple[int, Any]:
+        return 200, self._section(request)
+
+    def _update_section(self, request: _Request) -> tuple[int, Any]:
+        section = self._section(request)
+        for key in ("name", "display_order"):
+            if key in (request.body or {}):
+                section[key] = request.body[key]
+        section["updated_at"] = _now()
+        return 200, section
+
+    def _delete_section(self, request: _Request) -> tuple[int, Any]:
+        del self.sections[self._section(request)["id"]]
+        return 204, None
+
+    def _reorder_sections(self, request: _Request) -> tuple[int, Any]:
+        self._project(request)
+        for order in (request.body or {}).get("section_orders", []):
+            section = self.sections.get(order.get("id"))
+            if section is not None:
+                section["display_order"] = order.get("display_order", 0)
+        return 200, {"status": "ok"}
+
+    # -- Labels --
+
+    def _list_labels(self, _request: _Request) -> tuple[int, Any]:
+        return 200, {"labels": list(self.labels.values())}
+
+    def _label(self, request: _Request) -> dict:
+        label = self.labels.get(request.match["id"])
+        if label is None:
+            raise HTTPError(404, "Label not found")
+        return label
+
+    def _update_label(self, request: _Request) -> tuple[int, Any]:
+        label = self._label(request)
+        for key in ("name", "color"):
+            if key in (request.body or {}):
+                label[key] = request.body[key]
+        label["updated_at"] = _now()
+        return 200, label
+
+    def _delete_label(self, request: _Request) -> tuple[int, Any]:
+        self._label(request)
+        del self.labels[request.match["id"]]
+        return 204, None
+
+
+class MockServer:
+    """Serve an ASGI app over HTTP/1.1 on localhost from a background thread.
+
+    Only what the CLI's httpx client needs is implemented: Content-Length
+    request bodies and keep-alive connections.
+
+    Args:
+        app: ASGI application
+        host: Interface to bind
+        port: Port to bind (0 picks a free one)
+    """
+
+    def __init__(
+        self,
+        app: Callable[[dict, Any, Any], Awaitable[None]],
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.app = app
+        self.host = host
+        self.port = port
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.Server | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> str:
+        """Start serving; returns the base URL."""
+        ready = threading.Event()
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+
+        def run() -> None:
+            asyncio.set_event_loop(loop)
+            self._server = loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port)
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+            ready.set()
+            loop.run_forever()
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+        self._thread = threading.Thread(
+            target=run, name="todopro-mock-api", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+        return self.url
+
+    def stop(self) -> None:
+        """Stop serving and close open connections."""
+        if self._loop is None:
+            return
+
+        async def shutdown() -> None:
+            self._server.close()
+            current = asyncio.current_task()
+            for task in asyncio.all_tasks():
+                if task is not current:
+                    task.cancel()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop = None
+
+    def __enter__(self) -> MockServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while await self._serve_one(reader, writer):
+                pass
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_one(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """Serve one request; returns whether the connection stays open."""
+        line = await reader.readline()
+        if not line:
+            return False
+        method, target, _version = line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+        headers = []
+        while True:
+            raw = await reader.readline()
+            if raw in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = raw.decode("latin-1").partition(":")
+            headers.append((name.strip().lower().encode(), value.strip().encode()))
+        header_map = dict(headers)
+        length = int(header_map.get(b"content-length", b"0"))
+        body = await reader.readexactly(length) if length else b""
+        path, _, query = target.partition("?")
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": unquote(path),
+            "raw_path": path.encode(),
+            "query_string": query.encode("latin-1"),
+            "headers": headers,
+            "client": writer.get_extra_info("peername"),
+            "server": (self.host, self.port),
+        }
+        request_sent = False
+
+        async def receive() -> dict:
+            nonlocal request_sent
+            if request_sent:
+                return {"type": "http.disconnect"}
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        start: dict = {}
+        chunks: list[bytes] = []
+
+        async def send(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+
+        data = b"".join(chunks)
+        keep_alive = header_map.get(b"connection", b"").lower() != b"close"
+        status = HTTPStatus(start.get("status", 500))
+        head = [f"HTTP/1.1 {status.value} {status.phrase}".encode()]
+        for name, value in start.get("headers", []):
+            if name.lower() != b"content-length":
+                head.append(name + b": " + value)
+        head.append(b"content-length: " + str(len(data)).encode())
+        head.append(b"connection: " + (b"keep-alive" if keep_alive else b"close"))
+        writer.write(b"\r\n".join(head) + b"\r\n\r\n" + data)
+        await writer.drain()
+        return keep_alive
@@ -0,0 +1,447 @@
+"""Run benchmark cases against generated vaults and compare result files.
+
+Results are JSON documents::
+
+    {
+      "schema": 1,
+      "created_at": "...",
+      "environment": {"git_commit": ..., "python": ..., "sqlite": ..., ...},
+      "network": {"latency": 0.0, "bandwidth": null, ...},
+      "runs": [
+        {"vault": {"name": "10k-plain-s42", "tasks": 10000, ...},
+         "cases": {"list_all": {"median": 0.041, "min": ..., "times": [...]}}}
+      ]
+    }
+
+Network cases also record the median number of API requests per
+repetition (``"requests"``), which is what batching and concurrency change.
+
+Two result files are compared case by case on the median, which is less
+sensitive to the odd slow repetition than the mean.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import tempfile
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from todopro_cli.adapters.rest_api import (
+    RestApiLabelRepository,
+    RestApiProjectRepository,
+    RestApiTaskRepository,
+)
+from todopro_cli.adapters.sqlite.connection import DatabaseConnection
+from todopro_cli.adapters.sqlite.context_repository import (
+    SqliteLocationContextRepository,
+)
+from todopro_cli.adapters.sqlite.e2ee import E2EEHandler
+from todopro_cli.adapters.sqlite.label_repository import SqliteLabelRepository
+from todopro_cli.adapters.sqlite.project_repository import SqliteProjectRepository
+from todopro_cli.adapters.sqlite.reminder_repository import SqliteReminderRepository
+from todopro_cli.adapters.sqlite.task_repository import SqliteTaskRepository
+from todopro_cli.models import ProjectFilters, TaskFilters
+from todopro_cli.models.config_models import AppConfig, Context
+from todopro_cli.models.storage_strategy import (
+    LocalStorageStrategy,
+    StorageStrategyContext,
+)
+from todopro_cli.services.api.client import APIClient
+from todopro_cli.services.config_service import get_config_service
+
+from .cases import CASES, Case, Timer
+from .generator import Vault
+from .mock_api import MockServer, MockTodoProAPI, NetworkProfile
+
+RESULTS_SCHEMA = 1
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class _VaultStrategy(LocalStorageStrategy):
+    """Local storage over one standalone connection.
+
+    The vault singleton is bypassed, so a case can open the vault and a
+    scratch copy side by side, and the E2EE handler is the vault's own.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, handler: E2EEHandler):
+        self.db_path = None
+        self._task_repo = SqliteTaskRepository(connection=connection)
+        self._task_repo._e2ee_handler = handler
+        self._project_repo = SqliteProjectRepository(connection=connection)
+        self._label_repo = SqliteLabelRepository(connection=connection)
+        self._location_context_repo = SqliteLocationContextRepository(
+            connection=connection
+        )
+        self._reminder_repo = SqliteReminderRepository(connection=connection)
+
+
+@dataclass
+class Remote:
+    """REST repositories sharing one API client, pointed at the mock server."""
+
+    client: APIClient
+    task_repository: RestApiTaskRepository
+    project_repository: RestApiProjectRepository
+    label_repository: RestApiLabelRepository
+
+
+class Workspace:
+    """What a case runs against: a vault plus a scratch directory.
+
+    Connections and API clients opened through the workspace during a
+    repetition are closed when it ends (:meth:`release`), so each repetition
+    starts cold, as a command does. Network cases talk to a mock API serving
+    the vault's data, started on first use and stopped by :meth:`close`.
+    """
+
+    def __init__(
+        self, vault: Vault, scratch_dir: Path, network: NetworkProfile | None = None
+    ):
+        self.vault = vault
+        self.scratch_dir = scratch_dir
+        self.network = network or NetworkProfile()
+        self._handler = vault.e2ee_handler()
+        self._cache: dict[str, Any] = {}
+        self._connections: list[sqlite3.Connection] = []
+        self._clients: list[APIClient] = []
+        self._server: MockServer | None = None
+        self._cli_env: dict[str, str] | None = None
+
+    def connection(self, path: Path | None = None) -> sqlite3.Connection:
+        """Open a connection to the vault (or another database)."""
+        connection = DatabaseConnection.open(path or self.vault.path)
+        self._connections.append(connection)
+        return connection
+
+    def storage(self, path: Path | None = None) -> StorageStrategyContext:
+        """Repositories over a fresh connection to the vault (or a copy)."""
+        strategy = _VaultStrategy(self.connection(path), self._handler)
+        return StorageStrategyContext(strategy)
+
+    async def api(self) -> MockTodoProAPI:
+        """The mock API serving the vault's data (started on first use)."""
+        return await self.cached("api", _serve_vault)
+
+    async def remote(self) -> Remote:
+        """REST repositories over a fresh client to the mock API."""
+        await self.api()
+        client = APIClient()
+        client.base_url = self._server.url
+        self._clients.append(client)
+        repos = (RestApiTaskRepository(), RestApiProjectRepository())
+        repos += (RestApiLabelRepository(),)
+        for repo in repos:
+            repo._client = client
+        repos[0]._e2ee_handler = self._handler
+        return Remote(client, *repos)
+
+    def requests_served(self) -> int:
+        """Requests the mock API has answered so far (0 if not started)."""
+        api = self._cache.get("api")
+        return api.stats.total if api is not None else 0
+
+    def scratch(self, name: str, keep: bool = False) -> Path:
+        """Path of a scratch file, removed first unless *keep* is set."""
+        path = self.scratch_dir / name
+        if not keep:
+            for stale in (path, Path(f"{path}-wal"), Path(f"{path}-shm")):
+                if stale.is_dir():
+                    shutil.rmtree(stale)
+                else:
+                    stale.unlink(missing_ok=True)
+        return path
+
+    async def cached(self, key: str, factory: Callable[[Workspace], Awaitable[Any]]):
+        """Run a one-off preparation step once per workspace."""
+        if key not in self._cache:
+            self._cache[key] = await factory(self)
+        return self._cache[key]
+
+    def cli_env(self) -> dict[str, str]:
+        """Environment for a ``tp`` subprocess whose local context is the vault."""
+        if self._cli_env is None:
+            home = self.scratch_dir / "cli-home"
+            env = {
+                "HOME": str(home),
+                "XDG_CONFIG_HOME": str(home / "config"),
+                "XDG_DATA_HOME": str(home / "data"),
+                "XDG_CACHE_HOME": str(home / "cache"),
+                "TODOPRO_BACKEND_URL": "http://127.0.0.1:9",
+                "PYTHONPATH": os.pathsep.join(
+                    filter(None, [str(REPO_ROOT / "src"), os.environ.get("PYTHONPATH")])
+                ),
+            }
+            config = AppConfig(
+                current_context_name="bench",
+                contexts=[
+                    Context(
+                        name="bench",
+                        type="local",
+                        source=str(self.vault.path),
+                        user_id=self.vault.user_id,
+                    )
+                ],
+            )
+            config.e2ee.enabled = self.vault.keys_dir is not None
+            config_dir = home / "config" / "todopro_cli"
+            config_dir.mkdir(parents=True, exist_ok=True)
+            (config_dir / "config.json").write_text(config.model_dump_json(indent=2))
+            if self.vault.keys_dir is not None:
+                keys_dir = home / "config" / "todopro-cli"
+                keys_dir.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(self.vault.keys_dir / ".todopro_key", keys_dir)
+            self._cli_env = env
+        return self._cli_env
+
+    async def release_clients(self) -> None:
+        """Close the API clients opened since the last release."""
+        for client in self._clients:
+            await client.close()
+        self._clients.clear()
+
+    def release(self) -> None:
+        """Close the connections opened since the last release."""
+        for connection in self._connections:
+            connection.close()
+        self._connections.clear()
+
+    def close(self) -> None:
+        """Stop the mock API server, if one was started."""
+        if self._server is not None:
+            self._server.stop()
+            self._server = None
+        self._cache.pop("api", None)
+
+
+async def _serve_vault(ws: Workspace) -> MockTodoProAPI:
+    """Start a mock API holding the vault's projects, labels and tasks.
+
+    E2EE vaults are served encrypted, as the real server stores them, and a
+    token pair for the mock is saved as the current context's credentials.
+    """
+    api = MockTodoProAPI(ws.network)
+    storage = ws.storage()
+    for project in await storage.project_repository.list_all(ProjectFilters()):
+        api.add_project(project.model_dump(mode="json"))
+    for label in await storage.label_repository.list_all():
+        api.add_label(label.model_dump(mode="json"))
+    handler = ws._handler
+    async for task in storage.task_repository.iter_all(TaskFilters(status="all")):
+        data = task.model_dump(mode="json")
+        if handler.enabled:
+            data["content"], data["content_encrypted"], desc, desc_encrypted = (
+                handler.prepare_task_for_storage(task.content, task.description)
+            )
+            data["description"], data["description_encrypted"] = desc, desc_encrypted
+        api.add_task(data, data["created_at"])
+
+    ws._server = MockServer(api)
+    ws._server.start()
+    config = get_config_service()
+    access, refresh = api.issue_tokens()
+    config.save_credentials(access, refresh, config.get_current_context().name)
+    return api
+
+
+def summarize(times: list[float]) -> dict[str, Any]:
+    """Summary statistics of one case's timings, in seconds."""
+    ordered = sorted(times)
+    p95 = ordered[-1]
+    if len(ordered) >= 2:
+        p95 = statistics.quantiles(ordered, n=20, method="inclusive")[18]
+    return {
+        "runs": len(times),
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "mean": statistics.fmean(ordered),
+        "p95": p95,
+        "stdev": statistics.stdev(ordered) if len(ordered) >= 2 else 0.0,
+        "times": times,
+    }
+
+
+def run_case(case: Case, ws: Workspace, repeat: int, warmup: int = 1) -> dict[str, Any]:
+    """Time *repeat* repetitions of a case after *warmup* untimed ones.
+
+    Raises:
+        RuntimeError: If the case never entered its timer
+    """
+
+    async def repetition(timer: Timer) -> None:
+        try:
+            await case.func(ws, timer)
+        finally:
+            await ws.release_clients()
+
+    times = []
+    requests = []
+    for index in range(warmup + repeat):
+        timer = Timer()
+        served = ws.requests_served()
+        try:
+            asyncio.run(repetition(timer))
+        finally:
+            ws.release()
+        if timer.elapsed is None:
+            raise RuntimeError(f"Case {case.name} did not time anything")
+        if index >= warmup:
+            times.append(timer.elapsed)
+            requests.append(ws.requests_served() - served)
+    stats = summarize(times)
+    if any(requests):
+        stats["requests"] = statistics.median(requests)
+    return stats
+
+
+def select_cases(names: Iterable[str] | None, tasks: int) -> list[Case]:
+    """Cases to run on a vault of *tasks* tasks.
+
+    Named cases always run; otherwise every case runs except the slow ones
+    above their size limit.
+
+    Raises:
+        KeyError: If a name is not a registered case
+    """
+    if names:
+        return [CASES[name] for name in names]
+    return [c for c in CASES.values() if c.max_tasks is None or tasks <= c.max_tasks]
+
+
+def environment() -> dict[str, Any]:
+    """Where the results were produced, so runs can be compared sensibly."""
+
+    def git(*args: str) -> str | None:
+        try:
+            out = subprocess.run(
+                ["git", *args],
+                cwd=REPO_ROOT,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return out.stdout.strip()
+
+    return {
+        "git_commit": git("rev-parse", "HEAD"),
+        "git_dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_suite(
+    vaults: list[Vault],
+    case_names: list[str] | None = None,
+    repeat: int = 5,
+    warmup: int = 1,
+    on_result: Callable[[Vault, str, dict[str, Any]], None] | None = None,
+    network: NetworkProfile | None = None,
+) -> dict[str, Any]:
+    """Run the selected cases on every vault.
+
+    Args:
+        vaults: Generated vaults
+        case_names: Cases to run (default: all that suit each vault's size)
+        repeat: Timed repetitions per case
+        warmup: Untimed repetitions before them
+        on_result: Called with each case's summary as soon as it is known
+        network: Behaviour of the mock API the network cases talk to
+
+    Returns:
+        The results document
+    """
+    network = network or NetworkProfile()
+    runs = []
+    for vault in vaults:
+        cases: dict[str, Any] = {}
+        with tempfile.TemporaryDirectory(prefix="todopro-bench-") as scratch:
+            ws = Workspace(vault, Path(scratch), network)
+            try:
+                for case in select_cases(case_names, vault.spec.tasks):
+                    cases[case.name] = run_case(case, ws, repeat, warmup)
+                    if on_result is not None:
+                        on_result(vault, case.name, cases[case.name])
+            finally:
+                ws.close()
+        runs.append({"vault": vault.metadata(), "cases": cases})
+    return {
+        "schema": RESULTS_SCHEMA,
+        "created_at": datetime.now(UTC).isoformat(),
+        "environment": environment(),
+        "network": asdict(network),
+        "runs": runs,
+    }
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    """Read a results document.
+
+    Raises:
+        ValueError: If the file is not a results document of a known schema
+    """
+    data = json.loads(path.read_text())
+    if not isinstance(data, dict) or data.get("schema") != RESULTS_SCHEMA:
+        raise ValueError(f"{path} is not a benchmark results file")
+    return data
+
+
+def compare(
+    base: dict[str, Any], new: dict[str, Any], threshold: float = 0.10
+) -> list[dict[str, Any]]:
+    """Compare the medians of the cases both documents ran.
+
+    Args:
+        base: Baseline results document
+        new: Results document to compare against it
+        threshold: Relative change beyond which a case counts as changed
+
+    Returns:
+        One row per (vault, case) present in both, with ``ratio`` (new/base)
+        and ``verdict`` ("slower", "faster" or "same")
+    """
+    base_medians = {
+        (run["vault"]["name"], name): stats["median"]
+        for run in base["runs"]
+        for name, stats in run["cases"].items()
+    }
+    rows = []
+    for run in new["runs"]:
+        for name, stats in run["cases"].items():
+            key = (run["vault"]["name"], name)
+            if key not in base_medians:
+                continue
+            before, after = base_medians[key], stats["median"]
+            ratio = after / before if before else float("inf")
+            verdict = "same"
+            if ratio > 1 + threshold:
+                verdict = "slower"
+            elif ratio < 1 / (1 + threshold):
+                verdict = "faster"
+            rows.append(
+                {
+                    "vault": key[0],
+                    "case": name,
+                    "base": before,
+                    "new": after,
+                    "ratio": ratio,
+                    "verdict": verdict,
+                }
+            )
+    return rows
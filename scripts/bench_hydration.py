@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: list throughput of the SQLite task repository.
+
+Compares the previous listing path (``SELECT *``, every row validated with
+``Task(**row)`` and two relation queries per task) against the current one
+(narrow SELECT, one validation call per page and bulk relation loading), on
+a throwaway vault.
+
+Usage:
+    uv run scripts/bench_hydration.py [--tasks N] [--repeat R]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Allow running from repo root or scripts/ directory
+repo_root = Path(__file__).parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+
+from todopro_cli.adapters.sqlite.connection import DatabaseConnection  # noqa: E402
+from todopro_cli.adapters.sqlite.e2ee import E2EEHandler  # noqa: E402
+from todopro_cli.adapters.sqlite.label_repository import (  # noqa: E402
+    SqliteLabelRepository,
+)
+from todopro_cli.adapters.sqlite.task_repository import (  # noqa: E402
+    SqliteTaskRepository,
+)
+from todopro_cli.models import LabelCreate, Task, TaskCreate, TaskFilters  # noqa: E402
+from todopro_cli.models.hydration import validate_many  # noqa: E402
+from todopro_cli.utils.ui.console import get_console  # noqa: E402
+
+
+async def _seed(
+    repo: SqliteTaskRepository, labels: SqliteLabelRepository, n: int
+) -> None:
+    label_ids = await labels.create_many(
+        [LabelCreate(name=f"label-{i}") for i in range(5)]
+    )
+    batch = []
+    for i in range(n):
+        batch.append(
+            TaskCreate(
+                content=f"Task {i}",
+                description="Benchmark task" if i % 3 else None,
+                priority=i % 4 + 1,
+                due_date=f"2024-{i % 12 + 1:02d}-01T09:00:00" if i % 2 else None,
+                labels=label_ids[: i % 3],
+            )
+        )
+        if len(batch) == 5000:
+            await repo.add_many(batch)
+            batch = []
+    if batch:
+        await repo.add_many(batch)
+
+
+def _legacy_list(repo: SqliteTaskRepository) -> list[Task]:
+    rows = repo.connection.execute(
+        "SELECT * FROM tasks WHERE deleted_at IS NULL "
+        "ORDER BY priority ASC, project_id ASC, created_at DESC"
+    ).fetchall()
+    tasks = []
+    for row in rows:
+        task_dict = dict(row)
+        task_dict["labels"] = repo._get_task_labels(task_dict["id"])
+        task_dict["contexts"] = repo._get_task_contexts(task_dict["id"])
+        tasks.append(Task(**task_dict))
+    return tasks
+
+
+def _best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark task list hydration.")
+    parser.add_argument(
+        "--tasks", type=int, default=50_000, help="Tasks in the vault"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (best is kept)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        connection = DatabaseConnection.open(Path(tmp) / "bench.db")
+        repo = SqliteTaskRepository(connection=connection)
+        repo._e2ee_handler = E2EEHandler()
+        labels = SqliteLabelRepository(connection=connection)
+        asyncio.run(_seed(repo, labels, args.tasks))
+
+        rows = [dict(row) for row in connection.execute("SELECT * FROM tasks")]
+        for row in rows:
+            row["labels"], row["contexts"] = [], []
+
+        results = {
+            "validate rows (Task(**row))": _best_of(
+                args.repeat, lambda: [Task(**row) for row in rows]
+            ),
+            "validate rows (validate_many)": _best_of(
+                args.repeat, lambda: validate_many(Task, rows)
+            ),
+            "list_all, previous path": _best_of(
+                args.repeat, lambda: _legacy_list(repo)
+            ),
+            "list_all, current path": _best_of(
+                args.repeat, lambda: asyncio.run(repo.list_all(TaskFilters()))
+            ),
+        }
+        connection.close()
+
+    console = get_console()
+    console.print(f"{args.tasks:,} tasks, best of {args.repeat}")
+    for name, seconds in results.items():
+        rate = args.tasks / seconds
+        console.print(f"  {name:32} {seconds * 1000:9.1f} ms  {rate:12,.0f} tasks/s")
+
+
+if __name__ == "__main__":
+    main()
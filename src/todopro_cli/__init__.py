@@ -1,3 +1,8 @@
 """TodoPro CLI - Professional command-line task management."""
 
+import time
+
+# When the package began importing; the profiler measures imports from here
+IMPORT_STARTED = time.perf_counter()
+
 __version__ = "1.0.0"
@@ -0,0 +1,756 @@
+"""Mirrored adapters - Serve remote contexts from a local SQLite mirror.
+
+The mirror is a regular vault database (same schema and migrations as a local
+context) holding a copy of the remote account. Reads are answered from the
+mirror immediately; once it is older than its freshness budget a background
+revalidation pulls changes from the REST API (stale-while-revalidate). Writes
+go through to the API first and the entity the server returns is written to
+the mirror, so the next read already reflects it.
+
+Location contexts and sections are not mirrored and go straight to the API.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+
+from todopro_cli.adapters.sqlite.connection import open_connection
+from todopro_cli.adapters.sqlite.label_repository import SqliteLabelRepository
+from todopro_cli.adapters.sqlite.project_repository import SqliteProjectRepository
+from todopro_cli.adapters.sqlite.task_repository import SqliteTaskRepository
+from todopro_cli.adapters.sqlite.user_manager import get_or_create_local_user
+from todopro_cli.adapters.sqlite.worker import offloaded
+from todopro_cli.models import (
+    Label,
+    LabelCreate,
+    Page,
+    Project,
+    ProjectCreate,
+    ProjectFilters,
+    ProjectUpdate,
+    Task,
+    TaskCreate,
+    TaskFilters,
+    TaskUpdate,
+)
+from todopro_cli.repositories.repository import (
+    DEFAULT_PAGE_SIZE,
+    LabelRepository,
+    ProjectRepository,
+    TaskRepository,
+)
+from todopro_cli.utils import deferred, metrics, profiler
+
+# Bookkeeping table, private to mirror databases
+CREATE_MIRROR_STATE_TABLE = """
+CREATE TABLE IF NOT EXISTS mirror_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+)
+"""
+
+# A full pull (which also drops rows deleted on the server) runs at least this often
+FULL_REVALIDATE_INTERVAL = timedelta(hours=24)
+
+# Delta pulls overlap the previous one by this much to absorb clock skew
+DELTA_OVERLAP = timedelta(minutes=2)
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+class MirrorStore:
+    """Local SQLite copy of a remote account.
+
+    Rows keep their server IDs and are owned by the mirror's single local
+    user, so the regular SQLite repositories can read them unchanged. Like
+    those repositories, the store runs its statements on the SQLite worker,
+    so its writes and the readers' queries never overlap on the connection.
+    """
+
+    def __init__(self, db_path: str):
+        """Initialize the mirror store.
+
+        Args:
+            db_path: Path of the mirror database file
+        """
+        self.db_path = db_path
+        self._connection: sqlite3.Connection | None = None
+        self._user_id: str | None = None
+        self._e2ee_handler = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get or open the mirror's own connection.
+
+        The owning user is resolved while opening, before the connection is
+        shared with the worker.
+        """
+        if self._connection is None:
+            connection = open_connection(self.db_path)
+            connection.execute(CREATE_MIRROR_STATE_TABLE)
+            connection.commit()
+            self._user_id = get_or_create_local_user(connection)
+            self._connection = connection
+        return self._connection
+
+    @property
+    def user_id(self) -> str:
+        """Get the mirror's owning user ID."""
+        if self._user_id is None:
+            self._user_id = get_or_create_local_user(self.connection)
+        return self._user_id
+
+    @property
+    def e2ee(self):
+        """Get E2EE handler so mirrored content is encrypted at rest like a vault."""
+        if self._e2ee_handler is None:
+            from todopro_cli.adapters.sqlite.e2ee import get_e2ee_handler
+
+            self._e2ee_handler = get_e2ee_handler()
+        return self._e2ee_handler
+
+    # -- readers -------------------------------------------------------------
+
+    def task_reader(self) -> SqliteTaskRepository:
+        """SQLite task repository bound to the mirror."""
+        repo = SqliteTaskRepository(connection=self.connection)
+        repo._user_id = self.user_id
+        repo._e2ee_handler = self.e2ee
+        return repo
+
+    def project_reader(self) -> SqliteProjectRepository:
+        """SQLite project repository bound to the mirror.
+
+        The owner is pre-resolved so no local Inbox is ever fabricated; the
+        server's own Inbox arrives with the mirrored projects.
+        """
+        repo = SqliteProjectRepository(connection=self.connection)
+        repo._user_id = self.user_id
+        return repo
+
+    def label_reader(self) -> SqliteLabelRepository:
+        """SQLite label repository bound to the mirror."""
+        repo = SqliteLabelRepository(connection=self.connection)
+        repo._user_id = self.user_id
+        return repo
+
+    # -- freshness -------------------------------------------------------------
+
+    @offloaded
+    def get_state(self, key: str) -> str | None:
+        """Read a bookkeeping value."""
+        return self._get_state(key)
+
+    def _get_state(self, key: str) -> str | None:
+        row = self.connection.execute(
+            "SELECT value FROM mirror_state WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    @offloaded
+    def set_state(self, key: str, value: str) -> None:
+        """Write a bookkeeping value."""
+        self._set_state(key, value)
+
+    def _set_state(self, key: str, value: str) -> None:
+        self.connection.execute(
+            "INSERT INTO mirror_state (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+        self.connection.commit()
+
+    def _get_timestamp(self, key: str) -> datetime | None:
+        value = self._get_state(key)
+        return datetime.fromisoformat(value) if value else None
+
+    @offloaded
+    def last_revalidated(self) -> datetime | None:
+        """When the last successful revalidation started."""
+        return self._get_timestamp("revalidated_at")
+
+    @offloaded
+    def is_primed(self) -> bool:
+        """Whether the mirror has ever been fully populated."""
+        return self._get_timestamp("full_revalidated_at") is not None
+
+    @offloaded
+    def is_fresh(self, max_age: float) -> bool:
+        """Whether the mirror is within its freshness budget.
+
+        Args:
+            max_age: Freshness budget in seconds
+        """
+        last = self._get_timestamp("revalidated_at")
+        if last is None:
+            return False
+        return datetime.now(UTC) - last < timedelta(seconds=max_age)
+
+    @offloaded
+    def needs_full_revalidation(self) -> bool:
+        """Whether the next revalidation should be a full, pruning pull."""
+        last_full = self._get_timestamp("full_revalidated_at")
+        return last_full is None or datetime.now(UTC) - last_full >= FULL_REVALIDATE_INTERVAL
+
+    @offloaded
+    def mark_revalidated(self, started_at: datetime, *, full: bool) -> None:
+        """Record a successful revalidation."""
+        self._set_state("revalidated_at", started_at.isoformat())
+        if full:
+            self._set_state("full_revalidated_at", started_at.isoformat())
+
+    # -- writes ------------------------------------------------------------------
+
+    @offloaded
+    def upsert_projects(self, projects: list[Project], *, prune: bool = False) -> None:
+        """Insert or update mirrored projects.
+
+        Args:
+            projects: Projects as returned by the server
+            prune: Soft-delete mirrored projects missing from ``projects``
+        """
+        now = datetime.now(UTC).isoformat()
+        self.connection.executemany(
+            """INSERT INTO projects (
+                id, name, color, is_favorite, is_archived, protected,
+                workspace_id, user_id, created_at, updated_at, deleted_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL)
+            ON CONFLICT(id) DO UPDATE SET
+                name = excluded.name, color = excluded.color,
+                is_favorite = excluded.is_favorite, is_archived = excluded.is_archived,
+                protected = excluded.protected, workspace_id = excluded.workspace_id,
+                updated_at = excluded.updated_at, deleted_at = NULL""",
+            [
+                (
+                    p.id,
+                    p.name,
+                    p.color,
+                    int(p.is_favorite),
+                    int(p.is_archived),
+                    int(p.protected),
+                    p.workspace_id,
+                    self.user_id,
+                    _iso(p.created_at),
+                    _iso(p.updated_at),
+                )
+                for p in projects
+            ],
+        )
+        if prune:
+            self._prune("projects", [p.id for p in projects], now)
+        self.connection.commit()
+
+    @offloaded
+    def upsert_labels(self, labels: list[Label], *, prune: bool = False) -> None:
+        """Insert or update mirrored labels.
+
+        Args:
+            labels: Labels as returned by the server
+            prune: Delete mirrored labels missing from ``labels``
+        """
+        now = datetime.now(UTC).isoformat()
+        self.connection.executemany(
+            """INSERT INTO labels (id, name, color, user_id, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                name = excluded.name, color = excluded.color,
+                updated_at = excluded.updated_at""",
+            [(lbl.id, lbl.name, lbl.color, self.user_id, now, now) for lbl in labels],
+        )
+        if prune:
+            keep = {lbl.id for lbl in labels}
+            stale = [
+                row[0]
+                for row in self.connection.execute("SELECT id FROM labels")
+                if row[0] not in keep
+            ]
+            self.connection.executemany(
+                "DELETE FROM labels WHERE id = ?", [(label_id,) for label_id in stale]
+            )
+        self.connection.commit()
+
+    @offloaded
+    def upsert_tasks(self, tasks: list[Task], *, prune: bool = False) -> None:
+        """Insert or update mirrored tasks, including label/context links.
+
+        References to projects or labels the mirror has not seen yet are
+        dropped rather than violating foreign keys; the next revalidation
+        fills them in.
+
+        Args:
+            tasks: Tasks as returned by the server (already decrypted)
+            prune: Soft-delete mirrored tasks missing from ``tasks``
+        """
+        now = datetime.now(UTC).isoformat()
+        rows = []
+        for t in tasks:
+            content, content_encrypted, description, description_encrypted = (
+                self.e2ee.prepare_task_for_storage(t.content, t.description)
+            )
+            rows.append(
+                (
+                    t.id,
+                    content,
+                    description,
+                    content_encrypted,
+                    description_encrypted,
+                    int(t.is_completed),
+                    _iso(t.due_date),
+                    t.priority,
+                    t.project_id,
+                    self.user_id,
+                    _iso(t.created_at),
+                    _iso(t.updated_at),
+                    _iso(t.completed_at),
+                    t.version,
+                    int(t.is_recurring),
+                    t.recurrence_rule,
+                    _iso(t.recurrence_end),
+                    _iso(t.next_occurrence),
+                )
+            )
+
+        self.connection.executemany(
+            """INSERT INTO tasks (
+                id, content, description, content_encrypted, description_encrypted,
+                is_completed, due_date, priority, project_id, user_id,
+                created_at, updated_at, completed_at, version,
+                is_recurring, recurrence_rule, recurrence_end, next_occurrence,
+                deleted_at
+            ) VALUES (
+                ?, ?, ?, ?, ?, ?, ?, ?, (SELECT id FROM projects WHERE id = ?),
+                ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL
+            )
+            ON CONFLICT(id) DO UPDATE SET
+                content = excluded.content,
+                description = excluded.description,
+                content_encrypted = excluded.content_encrypted,
+                description_encrypted = excluded.description_encrypted,
+                is_completed = excluded.is_completed,
+                due_date = excluded.due_date,
+                priority = excluded.priority,
+                project_id = excluded.project_id,
+                updated_at = excluded.updated_at,
+                completed_at = excluded.completed_at,
+                version = excluded.version,
+                is_recurring = excluded.is_recurring,
+                recurrence_rule = excluded.recurrence_rule,
+                recurrence_end = excluded.recurrence_end,
+                next_occurrence = excluded.next_occurrence,
+                deleted_at = NULL""",
+            rows,
+        )
+
+        ids = [(t.id,) for t in tasks]
+        self.connection.executemany("DELETE FROM task_labels WHERE task_id = ?", ids)
+        self.connection.executemany(
+            "DELETE FROM task_contexts WHERE task_id = ?", ids
+        )
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO task_labels (task_id, label_id) "
+            "SELECT ?, id FROM labels WHERE id = ?",
+            [(t.id, label_id) for t in tasks for label_id in t.labels],
+        )
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO task_contexts (task_id, context_id) "
+            "SELECT ?, id FROM contexts WHERE id = ?",
+            [(t.id, context_id) for t in tasks for context_id in t.contexts],
+        )
+
+        if prune:
+            self._prune("tasks", [t.id for t in tasks], now)
+        self.connection.commit()
+
+    @offloaded
+    def prune_tasks(self, keep_ids: list[str]) -> None:
+        """Soft-delete mirrored tasks whose IDs are not in ``keep_ids``."""
+        self._prune("tasks", keep_ids, datetime.now(UTC).isoformat())
+        self.connection.commit()
+
+    @offloaded
+    def delete_tasks(self, task_ids: list[str]) -> None:
+        """Soft-delete mirrored tasks."""
+        now = datetime.now(UTC).isoformat()
+        self.connection.executemany(
+            "UPDATE tasks SET deleted_at = ? WHERE id = ?",
+            [(now, task_id) for task_id in task_ids],
+        )
+        self.connection.commit()
+
+    @offloaded
+    def delete_projects(self, project_ids: list[str]) -> None:
+        """Soft-delete mirrored projects."""
+        now = datetime.now(UTC).isoformat()
+        self.connection.executemany(
+            "UPDATE projects SET deleted_at = ? WHERE id = ?",
+            [(now, project_id) for project_id in project_ids],
+        )
+        self.connection.commit()
+
+    @offloaded
+    def delete_labels(self, label_ids: list[str]) -> None:
+        """Delete mirrored labels."""
+        self.connection.executemany(
+            "DELETE FROM labels WHERE id = ?", [(label_id,) for label_id in label_ids]
+        )
+        self.connection.commit()
+
+    def _prune(self, table: str, keep_ids: list[str], now: str) -> None:
+        """Soft-delete rows of ``table`` whose IDs are not in ``keep_ids``."""
+        keep = set(keep_ids)
+        stale = [
+            row[0]
+            for row in self.connection.execute(
+                f"SELECT id FROM {table} WHERE deleted_at IS NULL"
+            )
+            if row[0] not in keep
+        ]
+        self.connection.executemany(
+            f"UPDATE {table} SET deleted_at = ? WHERE id = ?",
+            [(now, row_id) for row_id in stale],
+        )
+
+
+class MirrorRevalidator:
+    """Pulls remote changes into a mirror, at most once at a time."""
+
+    def __init__(
+        self,
+        store: MirrorStore,
+        task_repo: TaskRepository,
+        project_repo: ProjectRepository,
+        label_repo: LabelRepository,
+        max_age: float,
+    ):
+        """Initialize the revalidator.
+
+        Args:
+            store: Mirror to keep up to date
+            task_repo: Remote task repository
+            project_repo: Remote project repository
+            label_repo: Remote label repository
+            max_age: Freshness budget in seconds
+        """
+        self.store = store
+        self.task_repo = task_repo
+        self.project_repo = project_repo
+        self.label_repo = label_repo
+        self.max_age = max_age
+
+    @property
+    def key(self) -> str:
+        """Coalescing key for deferred revalidations of this mirror."""
+        return f"mirror-revalidate:{self.store.db_path}"
+
+    async def schedule(self) -> None:
+        """Revalidate in the background if the mirror is past its budget."""
+        if deferred.is_pending(self.key) or await self.store.is_fresh(self.max_age):
+            return
+        deferred.defer(self.key, self.revalidate())
+
+    async def ensure_primed(self) -> None:
+        """Populate an empty mirror before the first read is served from it."""
+        if not await self.store.is_primed():
+            metrics.cache_lookup("mirror", False)
+            await self.revalidate()
+        elif metrics.is_enabled():
+            fresh = await self.store.is_fresh(self.max_age)
+            metrics.cache_lookup("mirror", fresh or None)
+
+    async def revalidate(self) -> None:
+        """Pull remote state into the mirror.
+
+        A full pull replaces the mirror contents (dropping rows deleted on
+        the server); otherwise only tasks updated since the previous
+        revalidation are fetched. Tasks are streamed and written a page at
+        a time, and a full pull only prunes once every page has arrived, so
+        a pull cut short never drops tasks it simply did not reach.
+        """
+        started_at = datetime.now(UTC)
+        full = await self.store.needs_full_revalidation()
+
+        projects = await self.project_repo.list_all(ProjectFilters())
+        labels = await self.label_repo.list_all()
+        await self.store.upsert_projects(projects, prune=full)
+        await self.store.upsert_labels(labels, prune=full)
+
+        filters = TaskFilters(status="all")
+        last = await self.store.last_revalidated()
+        if not full and last is not None:
+            filters.updated_after = last - DELTA_OVERLAP
+        seen: list[str] = []
+        page: list[Task] = []
+        async for task in self.task_repo.iter_all(filters):
+            page.append(task)
+            if len(page) >= DEFAULT_PAGE_SIZE:
+                await self.store.upsert_tasks(page)
+                seen.extend(t.id for t in page)
+                page = []
+        await self.store.upsert_tasks(page)
+        seen.extend(t.id for t in page)
+        if full:
+            await self.store.prune_tasks(seen)
+
+        await self.store.mark_revalidated(started_at, full=full)
+
+
+@profiler.traced_methods("mirror")
+class MirroredTaskRepository(TaskRepository):
+    """Task repository reading from the mirror and writing through to the API."""
+
+    def __init__(
+        self, remote: TaskRepository, store: MirrorStore, revalidator: MirrorRevalidator
+    ):
+        """Initialize mirrored task repository.
+
+        Args:
+            remote: REST API task repository
+            store: Local mirror
+            revalidator: Shared revalidator for the mirror
+        """
+        self.remote = remote
+        self.store = store
+        self.revalidator = revalidator
+        self._local: SqliteTaskRepository | None = None
+
+    @property
+    def local(self) -> SqliteTaskRepository:
+        """SQLite reader over the mirror."""
+        if self._local is None:
+            self._local = self.store.task_reader()
+        return self._local
+
+    async def list_all(self, filters: TaskFilters) -> list[Task]:
+        """List tasks from the mirror, revalidating in the background if stale."""
+        await self.revalidator.ensure_primed()
+        await self.revalidator.schedule()
+
+        tasks = await self.local.list_all(filters)
+        if tasks or not (filters.id_suffix or filters.id_prefix):
+            return tasks
+
+        # An ID lookup that misses may just mean the mirror is behind
+        tasks = await self.remote.list_all(filters)
+        await self.store.upsert_tasks(tasks)
+        return tasks
+
+    async def iter_all(
+        self, filters: TaskFilters, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[Task]:
+        """Stream tasks from the mirror."""
+        await self.revalidator.ensure_primed()
+        await self.revalidator.schedule()
+        async for task in self.local.iter_all(filters, page_size):
+            yield task
+
+    async def list_page(
+        self, filters: TaskFilters, with_total: bool = False
+    ) -> Page[Task]:
+        """Fetch one keyset page of tasks from the mirror."""
+        await self.revalidator.ensure_primed()
+        await self.revalidator.schedule()
+        return await self.local.list_page(filters, with_total)
+
+    async def get(self, task_id: str) -> Task:
+        """Get a task from the mirror, falling back to the API on a miss."""
+        try:
+            return await self.local.get(task_id)
+        except ValueError:
+            task = await self.remote.get(task_id)
+            await self.store.upsert_tasks([task])
+            return task
+
+    async def add(self, task_data: TaskCreate) -> Task:
+        """Create a task on the server and mirror the result."""
+        task = await self.remote.add(task_data)
+        await self.store.upsert_tasks([task])
+        return task
+
+    async def update(self, task_id: str, updates: TaskUpdate) -> Task:
+        """Update a task on the server and mirror the result."""
+        task = await self.remote.update(task_id, updates)
+        await self.store.upsert_tasks([task])
+        return task
+
+    async def delete(self, task_id: str) -> bool:
+        """Delete a task on the server and drop it from the mirror."""
+        result = await self.remote.delete(task_id)
+        await self.store.delete_tasks([task_id])
+        return result
+
+    async def complete(self, task_id: str) -> Task:
+        """Complete a task on the server and mirror the result."""
+        task = await self.remote.complete(task_id)
+        await self.store.upsert_tasks([task])
+        return task
+
+    async def bulk_update(self, task_ids: list[str], updates: TaskUpdate) -> list[Task]:
+        """Update tasks on the server and mirror the results."""
+        tasks = await self.remote.bulk_update(task_ids, updates)
+        await self.store.upsert_tasks(tasks)
+        return tasks
+
+    async def skip(self, task_id: str) -> Task:
+        """Skip an occurrence on the server and mirror the result."""
+        task = await self.remote.skip(task_id)
+        await self.store.upsert_tasks([task])
+        return task
+
+    async def list_upcoming(self, start: datetime, end: datetime) -> list[Task]:
+        """List upcoming tasks from the mirror's next-occurrence index."""
+        await self.revalidator.ensure_primed()
+        await self.revalidator.schedule()
+        return await self.local.list_upcoming(start, end)
+
+
+@profiler.traced_methods("mirror")
+class MirroredProjectRepository(ProjectRepository):
+    """Project repository reading from the mirror and writing through to the API."""
+
+    def __init__(
+        self,
+        remote: ProjectRepository,
+        store: MirrorStore,
+        revalidator: MirrorRevalidator,
+    ):
+        """Initialize mirrored project repository.
+
+        Args:
+            remote: REST API project repository
+            store: Local mirror
+            revalidator: Shared revalidator for the mirror
+        """
+        self.remote = remote
+        self.store = store
+        self.revalidator = revalidator
+        self._local: SqliteProjectRepository | None = None
+
+    @property
+    def local(self) -> SqliteProjectRepository:
+        """SQLite reader over the mirror."""
+        if self._local is None:
+            self._local = self.store.project_reader()
+        return self._local
+
+    async def list_all(self, filters: ProjectFilters) -> list[Project]:
+        """List projects from the mirror, revalidating in the background if stale."""
+        await self.revalidator.ensure_primed()
+        await self.revalidator.schedule()
+        return await self.local.list_all(filters)
+
+    async def get(self, project_id: str) -> Project:
+        """Get a project from the mirror, falling back to the API on a miss."""
+        try:
+            return await self.local.get(project_id)
+        except ValueError:
+            project = await self.remote.get(project_id)
+            await self.store.upsert_projects([project])
+            return project
+
+    async def create(self, project_data: ProjectCreate) -> Project:
+        """Create a project on the server and mirror the result."""
+        project = await self.remote.create(project_data)
+        await self.store.upsert_projects([project])
+        return project
+
+    async def update(self, project_id: str, updates: ProjectUpdate) -> Project:
+        """Update a project on the server and mirror the result."""
+        project = await self.remote.update(project_id, updates)
+        await self.store.upsert_projects([project])
+        return project
+
+    async def delete(self, project_id: str) -> bool:
+        """Delete a project on the server and drop it from the mirror."""
+        result = await self.remote.delete(project_id)
+        await self.store.delete_projects([project_id])
+        return result
+
+    async def archive(self, project_id: str) -> Project:
+        """Archive a project on the server and mirror the result."""
+        project = await self.remote.archive(project_id)
+        await self.store.upsert_projects([project])
+        return project
+
+    async def unarchive(self, project_id: str) -> Project:
+        """Unarchive a project on the server and mirror the result."""
+        project = await self.remote.unarchive(project_id)
+        await self.store.upsert_projects([project])
+        return project
+
+    async def get_stats(self, project_id: str) -> dict:
+        """Compute project statistics from the mirror."""
+        await self.revalidator.ensure_primed()
+        await self.revalidator.schedule()
+        return await self.local.get_stats(project_id)
+
+    async def get_stats_many(
+        self, project_ids: list[str] | None = None
+    ) -> dict[str, dict]:
+        """Compute statistics for many projects from the mirror."""
+        await self.revalidator.ensure_primed()
+        await self.revalidator.schedule()
+        return await self.local.get_stats_many(project_ids)
+
+
+@profiler.traced_methods("mirror")
+class MirroredLabelRepository(LabelRepository):
+    """Label repository reading from the mirror and writing through to the API."""
+
+    def __init__(
+        self, remote: LabelRepository, store: MirrorStore, revalidator: MirrorRevalidator
+    ):
+        """Initialize mirrored label repository.
+
+        Args:
+            remote: REST API label repository
+            store: Local mirror
+            revalidator: Shared revalidator for the mirror
+        """
+        self.remote = remote
+        self.store = store
+        self.revalidator = revalidator
+        self._local: SqliteLabelRepository | None = None
+
+    @property
+    def local(self) -> SqliteLabelRepository:
+        """SQLite reader over the mirror."""
+        if self._local is None:
+            self._local = self.store.label_reader()
+        return self._local
+
+    async def list_all(self) -> list[Label]:
+        """List labels from the mirror, revalidating in the background if stale."""
+        await self.revalidator.ensure_primed()
+        await self.revalidator.schedule()
+        return await self.local.list_all()
+
+    async def get(self, label_id: str) -> Label:
+        """Get a label from the mirror, falling back to the API on a miss."""
+        try:
+            return await self.local.get(label_id)
+        except ValueError:
+            label = await self.remote.get(label_id)
+            await self.store.upsert_labels([label])
+            return label
+
+    async def create(self, label_data: LabelCreate) -> Label:
+        """Create a label on the server and mirror the result."""
+        label = await self.remote.create(label_data)
+        await self.store.upsert_labels([label])
+        return label
+
+    async def delete(self, label_id: str) -> bool:
+        """Delete a label on the server and drop it from the mirror."""
+        result = await self.remote.delete(label_id)
+        await self.store.delete_labels([label_id])
+        return result
+
+    async def search(self, prefix: str) -> list[Label]:
+        """Search labels in the mirror by name prefix."""
+        await self.revalidator.ensure_primed()
+        await self.revalidator.schedule()
+        return await self.local.search(prefix)
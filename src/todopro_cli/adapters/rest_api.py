@@ -5,6 +5,8 @@ These adapters wrap the existing API client to implement the repository interfac
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
 from datetime import datetime
 
 from todopro_cli.models import (
@@ -12,6 +14,7 @@ from todopro_cli.models import (
     LabelCreate,
     LocationContext,
     LocationContextCreate,
+    Page,
     Project,
     ProjectCreate,
     ProjectFilters,
@@ -24,30 +27,39 @@ from todopro_cli.models import (
     TaskFilters,
     TaskUpdate,
 )
+from todopro_cli.models.hydration import validate_many
 from todopro_cli.repositories.repository import (
+    DEFAULT_PAGE_SIZE,
     LabelRepository,
     LocationContextRepository,
     ProjectRepository,
     SectionRepository,
     TaskRepository,
+    decode_cursor,
+    encode_cursor,
 )
 from todopro_cli.services.api.client import APIClient
 from todopro_cli.services.api.labels import LabelsAPI
 from todopro_cli.services.api.projects import ProjectsAPI
 from todopro_cli.services.api.sections import SectionsAPI
 from todopro_cli.services.api.tasks import TasksAPI
+from todopro_cli.utils import profiler
 
+# Create requests sent at once by bulk writes
+MAX_CONCURRENT_WRITES = 8
 
+
+@profiler.traced_methods("http")
 class RestApiTaskRepository(TaskRepository):
     """Task repository implementation using REST API with E2EE support."""
 
-    def __init__(self):
+    def __init__(self, client: APIClient | None = None):
         """Initialize REST API task repository.
 
         Args:
-            config_service: ConfigService instance for API configuration
+            client: API client to use (defaults to one for the current context)
         """
-        self._client: APIClient | None = None
+        self._client: APIClient | None = client
         self._tasks_api: TasksAPI | None = None
         self._e2ee_handler = None
 
@@ -124,8 +136,8 @@ class RestApiTaskRepository(TaskRepository):
 
         return task_data
 
-    async def list_all(self, filters: TaskFilters) -> list[Task]:
-        """List all tasks with filtering."""
+    def _filter_params(self, filters: TaskFilters) -> dict:
+        """Translate TaskFilters into list query parameters (without paging)."""
         params = {}
 
         if filters.status:
@@ -138,34 +150,100 @@ class RestApiTaskRepository(TaskRepository):
             params["search"] = filters.search
         if filters.sort:
             params["sort"] = filters.sort
+        if filters.updated_after:
+            params["updated_after"] = filters.updated_after.isoformat()
+
+        return params
+
+    def _parse_tasks(self, tasks_data: list[dict]) -> list[Task]:
+        """Decrypt (if E2EE is enabled) and build Task models from API dicts."""
+        if self.e2ee.enabled:
+            tasks_data = [
+                self._decrypt_task_fields(task_dict) for task_dict in tasks_data
+            ]
+        return validate_many(Task, tasks_data)
 
-        # When resolving by suffix, skip pagination so we search the full dataset
+    async def list_all(self, filters: TaskFilters) -> list[Task]:
+        """List all tasks with filtering."""
+        # Suffix resolution has to scan the full dataset; stream it page by
+        # page instead of requesting one unbounded response
         if filters.id_suffix:
-            params["limit"] = 10000
-        else:
-            if filters.limit is not None:
-                params["limit"] = filters.limit
-            if filters.offset is not None:
-                params["offset"] = filters.offset
+            return [task async for task in self.iter_all(filters)]
+
+        params = self._filter_params(filters)
+        if filters.limit is not None:
+            params["limit"] = filters.limit
+        if filters.offset is not None:
+            params["offset"] = filters.offset
 
         result = await self.tasks_api.list_tasks(**params)
 
         # Parse response - API returns {"tasks": [...]}
         tasks_data = result.get("tasks", []) if isinstance(result, dict) else result
 
-        # Decrypt task fields if E2EE is enabled
-        if self.e2ee.enabled:
-            tasks_data = [
-                self._decrypt_task_fields(task_dict) for task_dict in tasks_data
-            ]
+        return self._parse_tasks(tasks_data)
 
-        tasks = [Task(**task_dict) for task_dict in tasks_data]
+    async def list_page(
+        self, filters: TaskFilters, with_total: bool = False
+    ) -> Page[Task]:
+        """Fetch one page of tasks, using the server's cursor when it has one.
 
-        # Apply client-side suffix filter (server does not support id_suffix)
-        if filters.id_suffix:
-            tasks = [t for t in tasks if t.id.endswith(filters.id_suffix)]
+        Servers that paginate by cursor get their ``next_cursor`` passed back
+        verbatim (wrapped in our opaque cursor); older servers are paged by
+        offset. A ``total``/``count`` field in the response fills in the
+        total estimate.
+        """
+        size = filters.limit or DEFAULT_PAGE_SIZE
+        state = decode_cursor(filters.cursor) if filters.cursor else {}
+        params = self._filter_params(filters)
+        offset = int(state.get("offset", filters.offset or 0))
+        if "server" in state:
+            params.update(limit=size, cursor=state["server"])
+        else:
+            # One extra row tells whether another page follows
+            params.update(limit=size + 1, offset=offset)
 
-        return tasks
+        result = await self.tasks_api.list_tasks(**params)
+        tasks_data = result.get("tasks", []) if isinstance(result, dict) else result
+        tasks = self._parse_tasks(tasks_data)
+
+        if isinstance(result, dict) and "next_cursor" in result:
+            server_cursor = result["next_cursor"]
+            has_more = bool(server_cursor)
+            next_cursor = encode_cursor({"server": server_cursor}) if has_more else None
+        else:
+            has_more = len(tasks) > size
+            next_cursor = encode_cursor({"offset": offset + size}) if has_more else None
+
+        total = None
+        if with_total and isinstance(result, dict):
+            total = result.get("total", result.get("count"))
+        return Page[Task](
+            items=tasks[:size],
+            next_cursor=next_cursor,
+            has_more=has_more,
+            total_estimate=total,
+        )
+
+    async def iter_all(
+        self, filters: TaskFilters, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[Task]:
+        """Stream tasks page by page, following the server's cursor or offset."""
+        remaining = filters.limit
+        pages = self.tasks_api.iter_task_pages(
+            page_size=page_size, **self._filter_params(filters)
+        )
+        async for page in pages:
+            for task in self._parse_tasks(page):
+                # Apply client-side suffix filter (server does not support id_suffix)
+                if filters.id_suffix and not task.id.endswith(filters.id_suffix):
+                    continue
+                yield task
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining == 0:
+                        await pages.aclose()
+                        return
 
     async def get(self, task_id: str) -> Task:
         """Get a specific task by ID."""
@@ -197,6 +275,20 @@ class RestApiTaskRepository(TaskRepository):
 
         return Task(**result)
 
+    async def add_many(self, tasks: list[TaskCreate]) -> list[str]:
+        """Create several tasks with up to MAX_CONCURRENT_WRITES requests at once.
+
+        The API has no bulk create endpoint. Tasks are not created
+        atomically: if a request fails, the others may still have succeeded.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_WRITES)
+
+        async def add_one(task_data: TaskCreate) -> str:
+            async with semaphore:
+                return (await self.add(task_data)).id
+
+        return list(await asyncio.gather(*(add_one(task) for task in tasks)))
+
     async def update(self, task_id: str, updates: TaskUpdate) -> Task:
         """Update an existing task."""
         update_data = updates.model_dump(exclude_none=True)
@@ -232,6 +324,11 @@ class RestApiTaskRepository(TaskRepository):
 
         return Task(**result)
 
+    async def skip(self, task_id: str) -> Task:
+        """Skip the current occurrence of a recurring task."""
+        await self.tasks_api.skip_task(task_id)
+        return await self.get(task_id)
+
     async def bulk_update(self, task_ids: list[str], updates: TaskUpdate) -> list[Task]:
         """Update multiple tasks at once."""
         # Note: Current API might not have a true bulk update endpoint
@@ -258,12 +355,13 @@ class RestApiTaskRepository(TaskRepository):
         return updated_tasks
 
 
+@profiler.traced_methods("http")
 class RestApiProjectRepository(ProjectRepository):
     """Project repository implementation using REST API."""
 
-    def __init__(self):
+    def __init__(self, client: APIClient | None = None):
         """Initialize REST API project repository."""
-        self._client: APIClient | None = None
+        self._client: APIClient | None = client
         self._projects_api: ProjectsAPI | None = None
 
     @property
@@ -283,7 +381,7 @@ class RestApiProjectRepository(ProjectRepository):
         projects_data = (
             result.get("projects", []) if isinstance(result, dict) else result
         )
-        projects = [Project(**proj_dict) for proj_dict in projects_data]
+        projects = validate_many(Project, projects_data)
 
         # Apply filters
         if filters.is_favorite is not None:
@@ -335,13 +433,14 @@ class RestApiProjectRepository(ProjectRepository):
         return await self.projects_api.get_project_stats(project_id)
 
 
+@profiler.traced_methods("http")
 class RestApiLabelRepository(LabelRepository):
     """Label repository implementation using REST API."""
 
-    def __init__(self):
+    def __init__(self, client: APIClient | None = None):
         """Initialize REST API label repository."""
 
-        self._client: APIClient | None = None
+        self._client: APIClient | None = client
         self._labels_api: LabelsAPI | None = None
 
     @property
@@ -357,7 +456,7 @@ class RestApiLabelRepository(LabelRepository):
         """List all labels."""
         result = await self.labels_api.list_labels()
         labels_data = result.get("labels", []) if isinstance(result, dict) else result
-        return [Label(**label_dict) for label_dict in labels_data]
+        return validate_many(Label, labels_data)
 
     async def get(self, label_id: str) -> Label:
         """Get a specific label by ID."""
@@ -385,6 +484,7 @@ class RestApiLabelRepository(LabelRepository):
         ]
 
 
+@profiler.traced_methods("http")
 class RestApiLocationContextRepository(LocationContextRepository):
     """Context repository implementation using REST API.
 
@@ -415,10 +515,10 @@ class RestApiLocationContextRepository(LocationContextRepository):
     - POST /v1/contexts/check-available - geofencing query
     """
 
-    def __init__(self):
+    def __init__(self, client: APIClient | None = None):
         """Initialize REST API context repository."""
 
-        self._client: APIClient | None = None
+        self._client: APIClient | None = client
 
     @property
     def client(self) -> APIClient:
@@ -527,11 +627,12 @@ class RestApiLocationContextRepository(LocationContextRepository):
             return []
 
 
+@profiler.traced_methods("http")
 class RestApiSectionRepository(SectionRepository):
     """Section repository implementation using REST API."""
 
-    def __init__(self):
-        self._client: APIClient | None = None
+    def __init__(self, client: APIClient | None = None):
+        self._client: APIClient | None = client
         self._sections_api: SectionsAPI | None = None
 
     @property
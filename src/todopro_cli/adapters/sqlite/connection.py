@@ -7,8 +7,11 @@ ensuring proper connection lifecycle, WAL mode, and foreign key enforcement.
 from __future__ import annotations
 
 import atexit
+import itertools
 import os
 import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from platformdirs import user_data_dir
@@ -17,7 +20,23 @@ from todopro_cli.adapters.sqlite.migrations.m001_initial_schema import initial_m
 from todopro_cli.adapters.sqlite.migrations.m003_project_protected import (
     project_protected_migration,
 )
+from todopro_cli.adapters.sqlite.migrations.m004_task_list_index import (
+    task_list_index_migration,
+)
+from todopro_cli.adapters.sqlite.migrations.m005_next_occurrence_index import (
+    next_occurrence_index_migration,
+)
+from todopro_cli.adapters.sqlite.migrations.m006_reminder_indexes import (
+    reminder_indexes_migration,
+)
+from todopro_cli.adapters.sqlite.migrations.m007_context_spatial_index import (
+    context_spatial_index_migration,
+)
+from todopro_cli.adapters.sqlite.migrations.m008_project_counters import (
+    project_counters_migration,
+)
 from todopro_cli.adapters.sqlite.migrations.runner import MigrationRunner
+from todopro_cli.utils import profiler
 
 
 class DatabaseConnection:
@@ -69,6 +88,33 @@ class DatabaseConnection:
         if instance._connection is not None:
             instance._connection.close()
 
+        connection = cls.open(db_path)
+
+        # Store connection and path
+        instance._connection = connection
+        instance._db_path = db_path
+
+        # Register cleanup on exit
+        atexit.register(cls.close_connection)
+
+        return connection
+
+    @classmethod
+    @profiler.traced("sqlite.open", "sqlite")
+    def open(cls, db_path: str | Path) -> sqlite3.Connection:
+        """Open a new, fully configured connection outside the singleton.
+
+        Used for secondary databases (e.g. the local mirror of a remote
+        context) that must not replace the process-wide vault connection.
+
+        Args:
+            db_path: Path to database file
+
+        Returns:
+            sqlite3.Connection with pragmas applied and migrations run
+        """
+        db_path = Path(db_path)
+
         # Create data directory if it doesn't exist
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -84,6 +130,8 @@ class DatabaseConnection:
 
         # Configure connection
         connection.row_factory = sqlite3.Row  # Enable dict-like access
+        if profiler.is_enabled():
+            connection.set_trace_callback(profiler.count_sql)
         connection.execute("PRAGMA foreign_keys = ON")  # Enforce foreign keys
         connection.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging
 
@@ -94,16 +142,10 @@ class DatabaseConnection:
         # Run migrations to ensure schema is up to date
         cls._run_migrations(connection)
 
-        # Store connection and path
-        instance._connection = connection
-        instance._db_path = db_path
-
-        # Register cleanup on exit
-        atexit.register(cls.close_connection)
-
         return connection
 
     @classmethod
+    @profiler.traced("sqlite.migrations", "sqlite")
     def _run_migrations(cls, connection: sqlite3.Connection) -> None:
         """Run database migrations.
 
@@ -114,6 +156,11 @@ class DatabaseConnection:
         migrations = [
             initial_migration,
             project_protected_migration,
+            task_list_index_migration,
+            next_occurrence_index_migration,
+            reminder_indexes_migration,
+            context_spatial_index_migration,
+            project_counters_migration,
         ]
 
         # Run migrations
@@ -190,3 +237,75 @@ def get_connection(db_path: str | Path | None = None) -> sqlite3.Connection:
         Configured sqlite3.Connection
     """
     return DatabaseConnection.get_connection(db_path)
+
+
+def open_connection(db_path: str | Path) -> sqlite3.Connection:
+    """Helper function to open a standalone (non-singleton) connection.
+
+    Args:
+        db_path: Path to database file
+
+    Returns:
+        Configured sqlite3.Connection owned by the caller
+    """
+    return DatabaseConnection.open(db_path)
+
+
+_savepoint_ids = itertools.count()
+
+# Connections (by id) inside the outermost block of transaction()
+_open_transactions: set[int] = set()
+
+
+def commit(connection: sqlite3.Connection) -> None:
+    """Commit a single repository write, unless a transaction() block is open.
+
+    Inside :func:`transaction` the write becomes part of the enclosing
+    transaction, which commits (or rolls back) as a whole when the block
+    ends.
+
+    Args:
+        connection: Connection to commit
+    """
+    if id(connection) not in _open_transactions:
+        connection.commit()
+
+
+@contextmanager
+def transaction(connection: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run a block atomically, nesting inside an enclosing transaction.
+
+    Outside a transaction this is BEGIN ... COMMIT (ROLLBACK on error), and
+    repository writes in the block that would commit on their own through
+    :func:`commit` join it instead. Inside one it uses a SAVEPOINT, so a
+    failing block is undone on its own while the enclosing transaction
+    carries on and commits later as a whole.
+
+    Args:
+        connection: Connection to run the transaction on
+
+    Yields:
+        The same connection
+    """
+    if not connection.in_transaction:
+        connection.execute("BEGIN")
+        _open_transactions.add(id(connection))
+        try:
+            yield connection
+        except BaseException:
+            connection.rollback()
+            raise
+        finally:
+            _open_transactions.discard(id(connection))
+        connection.commit()
+        return
+
+    savepoint = f"sp_{next(_savepoint_ids)}"
+    connection.execute(f"SAVEPOINT {savepoint}")
+    try:
+        yield connection
+    except BaseException:
+        connection.execute(f"ROLLBACK TO {savepoint}")
+        connection.execute(f"RELEASE {savepoint}")
+        raise
+    connection.execute(f"RELEASE {savepoint}")
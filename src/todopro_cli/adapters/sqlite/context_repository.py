@@ -4,31 +4,45 @@ from __future__ import annotations
 
 import sqlite3
 
-from todopro_cli.adapters.sqlite.connection import get_connection
+from todopro_cli.adapters.sqlite.connection import commit, get_connection, transaction
 from todopro_cli.adapters.sqlite.user_manager import get_or_create_local_user
 from todopro_cli.adapters.sqlite.utils import (
+    bounding_box,
     generate_uuid,
     haversine_distance,
     now_iso,
     row_to_dict,
 )
+from todopro_cli.adapters.sqlite.worker import offloaded
 from todopro_cli.models import LocationContext, LocationContextCreate
+from todopro_cli.models.hydration import validate_many
 from todopro_cli.repositories import LocationContextRepository
+from todopro_cli.utils import profiler
 
 
+@profiler.traced_methods("sqlite")
 class SqliteLocationContextRepository(LocationContextRepository):
     """SQLite implementation of context repository."""
 
-    def __init__(self, db_path: str | None = None, config_manager=None):
+    # Whether the vault has the contexts_rtree index; looked up on first use
+    _spatial_index: bool | None = None
+
+    def __init__(
+        self,
+        db_path: str | None = None,
+        config_manager=None,
+        connection: sqlite3.Connection | None = None,
+    ):
         """Initialize SQLite context repository.
 
         Args:
             db_path: Optional database file path. If None, uses default location.
             config_manager: Optional config manager for user ID.
+            connection: Optional pre-opened connection (bypasses the vault singleton).
         """
         self.db_path = db_path
         self.config_manager = config_manager
-        self._connection: sqlite3.Connection | None = None
+        self._connection: sqlite3.Connection | None = connection
         self._user_id: str | None = None
 
     @property
@@ -46,9 +60,19 @@ class SqliteLocationContextRepository(LocationContextRepository):
         self._user_id = get_or_create_local_user(self.connection)
         return self._user_id
 
-        return self._user_id
+    def _has_spatial_index(self) -> bool:
+        """Whether the vault has the spatial index (migration 007)."""
+        if self._spatial_index is None:
+            self._spatial_index = (
+                self.connection.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'contexts_rtree'"
+                ).fetchone()
+                is not None
+            )
+        return self._spatial_index
 
-    async def list_all(self) -> list[LocationContext]:
+    @offloaded
+    def list_all(self) -> list[LocationContext]:
         """List all contexts."""
         user_id = self._get_user_id()
 
@@ -57,10 +81,14 @@ class SqliteLocationContextRepository(LocationContextRepository):
         )
         rows = cursor.fetchall()
 
-        return [LocationContext(**row_to_dict(row)) for row in rows]
+        return validate_many(LocationContext, map(row_to_dict, rows))
 
-    async def get(self, context_id: str) -> LocationContext:
+    @offloaded
+    def get(self, context_id: str) -> LocationContext:
         """Get a specific context by ID."""
+        return self._get(context_id)
+
+    def _get(self, context_id: str) -> LocationContext:
         user_id = self._get_user_id()
 
         cursor = self.connection.execute(
@@ -73,32 +101,43 @@ class SqliteLocationContextRepository(LocationContextRepository):
 
         return LocationContext(**row_to_dict(row))
 
-    async def create(self, context_data: LocationContextCreate) -> LocationContext:
+    @offloaded
+    def create(self, context_data: LocationContextCreate) -> LocationContext:
         """Create a new context."""
         user_id = self._get_user_id()
         context_id = generate_uuid()
         now = now_iso()
 
         data = context_data.model_dump()
+        latitude, longitude = data["latitude"], data["longitude"]
+        radius = data.get("radius", 100.0)
+
+        with transaction(self.connection):
+            cursor = self.connection.execute(
+                """INSERT INTO contexts (id, name, latitude, longitude, radius, user_id,
+                                         created_at, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    context_id,
+                    data["name"],
+                    latitude,
+                    longitude,
+                    radius,
+                    user_id,
+                    now,
+                    now,
+                ),
+            )
+            if self._has_spatial_index():
+                self.connection.execute(
+                    "INSERT INTO contexts_rtree VALUES (?, ?, ?, ?, ?)",
+                    (cursor.lastrowid, *bounding_box(latitude, longitude, radius)),
+                )
 
-        self.connection.execute(
-            """INSERT INTO contexts (id, name, latitude, longitude, radius, user_id, created_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (
-                context_id,
-                data["name"],
-                data["latitude"],
-                data["longitude"],
-                data.get("radius", 100.0),
-                user_id,
-                now,
-            ),
-        )
-        self.connection.commit()
-
-        return await self.get(context_id)
+        return self._get(context_id)
 
-    async def delete(self, context_id: str) -> bool:
+    @offloaded
+    def delete(self, context_id: str) -> bool:
         """Delete a context."""
         user_id = self._get_user_id()
 
@@ -106,24 +145,36 @@ class SqliteLocationContextRepository(LocationContextRepository):
         self.connection.execute(
             "DELETE FROM contexts WHERE id = ? AND user_id = ?", (context_id, user_id)
         )
-        self.connection.commit()
+        commit(self.connection)
 
         return True
 
-    async def get_available(
+    @offloaded
+    def get_available(
         self, latitude: float, longitude: float
     ) -> list[LocationContext]:
         """Get contexts available at a specific location (within geofence).
 
-        Uses haversine formula to calculate distance and filter contexts
-        where the given location is within their radius.
+        The spatial index narrows the search to contexts whose bounding box
+        contains the location; the haversine formula then checks those
+        candidates exactly. Deleted contexts are never available.
         """
         user_id = self._get_user_id()
 
-        # Get all contexts for this user
-        cursor = self.connection.execute(
-            "SELECT * FROM contexts WHERE user_id = ?", (user_id,)
-        )
+        if self._has_spatial_index():
+            cursor = self.connection.execute(
+                """SELECT c.* FROM contexts_rtree AS r
+                   JOIN contexts AS c ON c.rowid = r.id
+                   WHERE r.min_lat <= ?1 AND r.max_lat >= ?1
+                     AND r.min_lon <= ?2 AND r.max_lon >= ?2
+                     AND c.user_id = ?3 AND c.deleted_at IS NULL""",
+                (latitude, longitude, user_id),
+            )
+        else:
+            cursor = self.connection.execute(
+                "SELECT * FROM contexts WHERE user_id = ? AND deleted_at IS NULL",
+                (user_id,),
+            )
         rows = cursor.fetchall()
 
         # Filter by distance using haversine formula
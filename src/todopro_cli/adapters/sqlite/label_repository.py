@@ -3,27 +3,38 @@
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import AsyncIterator
 
-from todopro_cli.adapters.sqlite.connection import get_connection
+from todopro_cli.adapters.sqlite.connection import commit, get_connection, transaction
 from todopro_cli.adapters.sqlite.user_manager import get_or_create_local_user
 from todopro_cli.adapters.sqlite.utils import generate_uuid, now_iso, row_to_dict
+from todopro_cli.adapters.sqlite.worker import offloaded, run
 from todopro_cli.models import Label, LabelCreate
-from todopro_cli.repositories import LabelRepository
+from todopro_cli.models.hydration import validate_many
+from todopro_cli.repositories import DEFAULT_PAGE_SIZE, LabelRepository
+from todopro_cli.utils import profiler
 
 
+@profiler.traced_methods("sqlite")
 class SqliteLabelRepository(LabelRepository):
     """SQLite implementation of label repository."""
 
-    def __init__(self, db_path: str | None = None, config_manager=None):
+    def __init__(
+        self,
+        db_path: str | None = None,
+        config_manager=None,
+        connection: sqlite3.Connection | None = None,
+    ):
         """Initialize SQLite label repository.
 
         Args:
             db_path: Optional database file path. If None, uses default location.
             config_manager: Optional config manager for user ID.
+            connection: Optional pre-opened connection (bypasses the vault singleton).
         """
         self.db_path = db_path
         self.config_manager = config_manager
-        self._connection: sqlite3.Connection | None = None
+        self._connection: sqlite3.Connection | None = connection
         self._user_id: str | None = None
 
     @property
@@ -41,7 +52,8 @@ class SqliteLabelRepository(LabelRepository):
         self._user_id = get_or_create_local_user(self.connection)
         return self._user_id
 
-    async def list_all(self) -> list[Label]:
+    @offloaded
+    def list_all(self) -> list[Label]:
         """List all labels."""
         user_id = self._get_user_id()
 
@@ -50,10 +62,33 @@ class SqliteLabelRepository(LabelRepository):
         )
         rows = cursor.fetchall()
 
-        return [Label(**row_to_dict(row)) for row in rows]
-
-    async def get(self, label_id: str) -> Label:
+        return validate_many(Label, map(row_to_dict, rows))
+
+    async def iter_all(self, page_size: int = DEFAULT_PAGE_SIZE) -> AsyncIterator[Label]:
+        """Stream labels using keyset pagination on the primary key."""
+
+        def fetch(last_id: str) -> tuple[list[sqlite3.Row], list[Label]]:
+            rows = self.connection.execute(
+                "SELECT * FROM labels WHERE user_id = ? AND id > ? ORDER BY id LIMIT ?",
+                (self._get_user_id(), last_id, page_size),
+            ).fetchall()
+            return rows, validate_many(Label, map(row_to_dict, rows))
+
+        last_id = ""
+        while True:
+            rows, labels = await run(self.connection, fetch, last_id)
+            for label in labels:
+                yield label
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1]["id"]
+
+    @offloaded
+    def get(self, label_id: str) -> Label:
         """Get a specific label by ID."""
+        return self._get(label_id)
+
+    def _get(self, label_id: str) -> Label:
         user_id = self._get_user_id()
 
         cursor = self.connection.execute(
@@ -70,7 +105,8 @@ class SqliteLabelRepository(LabelRepository):
         """Alias for get() method for compatibility."""
         return await self.get(id)
 
-    async def create(self, label_data: LabelCreate) -> Label:
+    @offloaded
+    def create(self, label_data: LabelCreate) -> Label:
         """Create a new label."""
         user_id = self._get_user_id()
         label_id = generate_uuid()
@@ -84,15 +120,40 @@ class SqliteLabelRepository(LabelRepository):
                    VALUES (?, ?, ?, ?, ?, ?)""",
                 (label_id, data["name"], data.get("color"), user_id, now, now),
             )
-            self.connection.commit()
+            commit(self.connection)
         except sqlite3.IntegrityError as e:
             if "UNIQUE constraint" in str(e):
                 raise ValueError(f"Label '{data['name']}' already exists") from e
             raise
 
-        return await self.get(label_id)
+        return self._get(label_id)
+
+    @offloaded
+    def create_many(self, labels: list[LabelCreate]) -> list[str]:
+        """Create several labels in a single transaction."""
+        user_id = self._get_user_id()
+        now = now_iso()
+
+        label_ids = [generate_uuid() for _ in labels]
+        try:
+            with transaction(self.connection):
+                self.connection.executemany(
+                    """INSERT INTO labels (id, name, color, user_id, created_at, updated_at)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    [
+                        (label_id, label_data.name, label_data.color, user_id, now, now)
+                        for label_id, label_data in zip(label_ids, labels, strict=True)
+                    ],
+                )
+        except sqlite3.IntegrityError as e:
+            if "UNIQUE constraint" in str(e):
+                raise ValueError(f"Label already exists: {e}") from e
+            raise
+
+        return label_ids
 
-    async def delete(self, label_id: str) -> bool:
+    @offloaded
+    def delete(self, label_id: str) -> bool:
         """Delete a label."""
         user_id = self._get_user_id()
 
@@ -100,11 +161,12 @@ class SqliteLabelRepository(LabelRepository):
         self.connection.execute(
             "DELETE FROM labels WHERE id = ? AND user_id = ?", (label_id, user_id)
         )
-        self.connection.commit()
+        commit(self.connection)
 
         return True
 
-    async def search(self, prefix: str) -> list[Label]:
+    @offloaded
+    def search(self, prefix: str) -> list[Label]:
         """Search labels by name prefix (for autocomplete)."""
         user_id = self._get_user_id()
 
@@ -114,4 +176,4 @@ class SqliteLabelRepository(LabelRepository):
         )
         rows = cursor.fetchall()
 
-        return [Label(**row_to_dict(row)) for row in rows]
+        return validate_many(Label, map(row_to_dict, rows))
@@ -0,0 +1,36 @@
+"""Migration 004: Add a covering index for the default task listing order.
+
+Keyset pagination of ``tp list`` seeks on
+``(user_id, priority, project_id, created_at DESC, id)``; the expressions
+match the ones SqliteTaskRepository.list_page orders by, so SQLite can walk
+the index instead of sorting the whole table for every page.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+from todopro_cli.adapters.sqlite.migrations.runner import Migration
+
+
+class TaskListIndexMigration(Migration):
+    """Index tasks in default listing order."""
+
+    @property
+    def version(self) -> int:
+        return 4
+
+    @property
+    def description(self) -> str:
+        return "Add idx_tasks_list_order index for keyset pagination of task lists"
+
+    def up(self, connection: sqlite3.Connection) -> None:
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_list_order ON tasks("
+            "user_id, COALESCE(priority, 0), COALESCE(project_id, ''), "
+            "created_at DESC, id)"
+        )
+        connection.commit()
+
+
+task_list_index_migration = TaskListIndexMigration()
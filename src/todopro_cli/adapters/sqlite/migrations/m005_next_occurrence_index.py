@@ -0,0 +1,60 @@
+"""Migration 005: Index and backfill tasks.next_occurrence.
+
+Upcoming-occurrence queries find recurring tasks by a range scan on
+``next_occurrence`` instead of expanding every rule. The index is partial:
+only recurring tasks have a next occurrence, so it stays small.
+
+Vaults written before the recurrence engine never filled the column in, so
+it is computed here for open recurring tasks. Tasks whose rule cannot be
+parsed are left without one.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+from todopro_cli.adapters.sqlite.migrations.runner import Migration
+from todopro_cli.adapters.sqlite.utils import parse_datetime
+from todopro_cli.utils import recurrence
+
+
+class NextOccurrenceIndexMigration(Migration):
+    """Index recurring tasks by next occurrence."""
+
+    @property
+    def version(self) -> int:
+        return 5
+
+    @property
+    def description(self) -> str:
+        return "Add idx_tasks_next_occurrence index and backfill next_occurrence"
+
+    def up(self, connection: sqlite3.Connection) -> None:
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_next_occurrence "
+            "ON tasks(next_occurrence) WHERE next_occurrence IS NOT NULL"
+        )
+
+        rows = connection.execute(
+            "SELECT id, due_date, recurrence_rule, recurrence_end FROM tasks "
+            "WHERE is_recurring = 1 AND recurrence_rule IS NOT NULL "
+            "AND due_date IS NOT NULL AND is_completed = 0 AND deleted_at IS NULL"
+        ).fetchall()
+        updates = []
+        for task_id, due_date, rule, recurrence_end in rows:
+            try:
+                following = recurrence.next_occurrence(
+                    rule, parse_datetime(due_date), parse_datetime(recurrence_end)
+                )
+            except ValueError:
+                continue
+            if following is not None:
+                updates.append((following.isoformat(), task_id))
+
+        connection.executemany(
+            "UPDATE tasks SET next_occurrence = ? WHERE id = ?", updates
+        )
+        connection.commit()
+
+
+next_occurrence_index_migration = NextOccurrenceIndexMigration()
@@ -0,0 +1,39 @@
+"""Migration 006: Index reminders for the local scheduler.
+
+The scheduler repeatedly asks for the pending reminders due before a time.
+A partial index on ``reminder_date`` covering only pending reminders turns
+that into a short range scan; sent and snoozed reminders, which pile up
+over time, are left out of it. Reminders are also indexed by task, for
+per-task listings and the ON DELETE CASCADE from tasks.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+from todopro_cli.adapters.sqlite.migrations.runner import Migration
+
+
+class ReminderIndexesMigration(Migration):
+    """Index pending reminders by date and all reminders by task."""
+
+    @property
+    def version(self) -> int:
+        return 6
+
+    @property
+    def description(self) -> str:
+        return "Add idx_reminders_pending and idx_reminders_task indexes"
+
+    def up(self, connection: sqlite3.Connection) -> None:
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_reminders_pending "
+            "ON reminders(reminder_date) WHERE is_sent = 0 AND is_snoozed = 0"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_reminders_task ON reminders(task_id)"
+        )
+        connection.commit()
+
+
+reminder_indexes_migration = ReminderIndexesMigration()
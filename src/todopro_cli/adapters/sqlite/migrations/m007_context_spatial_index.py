@@ -0,0 +1,59 @@
+"""Migration 007: Spatial index for location contexts.
+
+``get_available`` used to load every context and compute a haversine
+distance for each. ``contexts_rtree`` is an R*Tree over each geofence's
+bounding box, keyed by the context's rowid, so a lookup first fetches the
+few boxes that contain the point and only checks those exactly.
+
+Boxes are written by the context repository (computing them needs
+trigonometry that not every SQLite build provides); a trigger removes the
+box when its context row is deleted, including by ON DELETE CASCADE.
+
+SQLite builds without the R*Tree module skip the index; the repository
+then falls back to a full scan.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+from todopro_cli.adapters.sqlite.migrations.runner import Migration
+from todopro_cli.adapters.sqlite.utils import bounding_box
+
+
+class ContextSpatialIndexMigration(Migration):
+    """Index location contexts by geofence bounding box."""
+
+    @property
+    def version(self) -> int:
+        return 7
+
+    @property
+    def description(self) -> str:
+        return "Add contexts_rtree spatial index over geofence bounding boxes"
+
+    def up(self, connection: sqlite3.Connection) -> None:
+        try:
+            connection.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS contexts_rtree "
+                "USING rtree(id, min_lat, max_lat, min_lon, max_lon)"
+            )
+        except sqlite3.OperationalError:
+            return  # no R*Tree module in this SQLite build
+
+        connection.execute(
+            "CREATE TRIGGER IF NOT EXISTS contexts_rtree_delete "
+            "AFTER DELETE ON contexts BEGIN "
+            "DELETE FROM contexts_rtree WHERE id = old.rowid; END"
+        )
+        rows = connection.execute(
+            "SELECT rowid, latitude, longitude, radius FROM contexts"
+        ).fetchall()
+        connection.executemany(
+            "INSERT OR REPLACE INTO contexts_rtree VALUES (?, ?, ?, ?, ?)",
+            [(rowid, *bounding_box(lat, lon, r)) for rowid, lat, lon, r in rows],
+        )
+        connection.commit()
+
+
+context_spatial_index_migration = ContextSpatialIndexMigration()
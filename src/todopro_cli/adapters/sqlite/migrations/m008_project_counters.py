@@ -0,0 +1,96 @@
+"""Migration 008: Trigger-maintained task counters per project.
+
+Project statistics used to aggregate a project's tasks on every request,
+so listing projects with their stats scanned each project's tasks once.
+``project_counters`` keeps the total, completed and pending counts of each
+project's live (not soft-deleted) tasks, and triggers on ``tasks`` keep it
+current on every insert, update and delete, so reading the counts is a
+lookup.
+
+Overdue counts depend on the current time and cannot be kept this way; the
+project repository reads them from ``idx_tasks_due_date`` instead.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+from todopro_cli.adapters.sqlite.migrations.runner import Migration
+
+# Adds a live task's row to its project's counters
+_COUNT_NEW = """
+INSERT INTO project_counters (user_id, project_id, total, completed, pending)
+SELECT new.user_id, new.project_id, 1, new.is_completed = 1, new.is_completed = 0
+WHERE new.project_id IS NOT NULL AND new.deleted_at IS NULL
+ON CONFLICT (user_id, project_id) DO UPDATE SET
+    total = total + 1,
+    completed = completed + excluded.completed,
+    pending = pending + excluded.pending;
+"""
+
+# Removes a live task's row from its project's counters
+_UNCOUNT_OLD = """
+UPDATE project_counters SET
+    total = total - 1,
+    completed = completed - (old.is_completed = 1),
+    pending = pending - (old.is_completed = 0)
+WHERE user_id = old.user_id AND project_id = old.project_id
+    AND old.deleted_at IS NULL;
+"""
+
+
+class ProjectCountersMigration(Migration):
+    """Keep per-project task counts in a trigger-maintained table."""
+
+    @property
+    def version(self) -> int:
+        return 8
+
+    @property
+    def description(self) -> str:
+        return "Add trigger-maintained project_counters table"
+
+    def up(self, connection: sqlite3.Connection) -> None:
+        connection.execute(
+            """CREATE TABLE IF NOT EXISTS project_counters (
+                user_id TEXT NOT NULL,
+                project_id TEXT NOT NULL,
+                total INTEGER NOT NULL DEFAULT 0,
+                completed INTEGER NOT NULL DEFAULT 0,
+                pending INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (user_id, project_id)
+            ) WITHOUT ROWID"""
+        )
+        connection.execute(
+            "CREATE TRIGGER IF NOT EXISTS project_counters_insert "
+            f"AFTER INSERT ON tasks BEGIN {_COUNT_NEW} END"
+        )
+        connection.execute(
+            "CREATE TRIGGER IF NOT EXISTS project_counters_update "
+            "AFTER UPDATE OF user_id, project_id, is_completed, deleted_at ON tasks "
+            f"BEGIN {_UNCOUNT_OLD} {_COUNT_NEW} END"
+        )
+        connection.execute(
+            "CREATE TRIGGER IF NOT EXISTS project_counters_delete "
+            f"AFTER DELETE ON tasks BEGIN {_UNCOUNT_OLD} END"
+        )
+        connection.execute(
+            "CREATE TRIGGER IF NOT EXISTS project_counters_project_delete "
+            "AFTER DELETE ON projects BEGIN "
+            "DELETE FROM project_counters WHERE project_id = old.id; END"
+        )
+
+        connection.execute("DELETE FROM project_counters")
+        connection.execute(
+            """INSERT INTO project_counters
+                   (user_id, project_id, total, completed, pending)
+               SELECT user_id, project_id, COUNT(*),
+                      SUM(is_completed = 1), SUM(is_completed = 0)
+               FROM tasks
+               WHERE project_id IS NOT NULL AND deleted_at IS NULL
+               GROUP BY user_id, project_id"""
+        )
+        connection.commit()
+
+
+project_counters_migration = ProjectCountersMigration()
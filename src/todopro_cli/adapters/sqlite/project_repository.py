@@ -3,28 +3,45 @@
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import AsyncIterator
 from typing import Any
 
-from todopro_cli.adapters.sqlite.connection import get_connection
+from todopro_cli.adapters.sqlite.connection import commit, get_connection, transaction
 from todopro_cli.adapters.sqlite.user_manager import get_or_create_local_user
 from todopro_cli.adapters.sqlite.utils import generate_uuid, now_iso, row_to_dict
+from todopro_cli.adapters.sqlite.worker import offloaded, run
 from todopro_cli.models import Project, ProjectCreate, ProjectFilters, ProjectUpdate
-from todopro_cli.repositories import ProjectRepository
+from todopro_cli.models.hydration import validate_many
+from todopro_cli.repositories import DEFAULT_PAGE_SIZE, ProjectRepository
+from todopro_cli.utils import profiler
 
+# Project IDs per IN (...) query, below SQLite's bound-parameter limit
+_STATS_CHUNK_SIZE = 900
 
+
+@profiler.traced_methods("sqlite")
 class SqliteProjectRepository(ProjectRepository):
     """SQLite implementation of project repository."""
 
-    def __init__(self, db_path: str | None = None, config_manager=None):
+    # Whether the vault has project_counters, checked on first use
+    _counters: bool | None = None
+
+    def __init__(
+        self,
+        db_path: str | None = None,
+        config_manager=None,
+        connection: sqlite3.Connection | None = None,
+    ):
         """Initialize SQLite project repository.
 
         Args:
             db_path: Optional database file path. If None, uses default location.
             config_manager: Optional config manager for user ID.
+            connection: Optional pre-opened connection (bypasses the vault singleton).
         """
         self.db_path = db_path
         self.config_manager = config_manager
-        self._connection: sqlite3.Connection | None = None
+        self._connection: sqlite3.Connection | None = connection
         self._user_id: str | None = None
 
     @property
@@ -60,7 +77,7 @@ class SqliteProjectRepository(ProjectRepository):
                    VALUES (?, 'Inbox', '#4a90d9', 0, 0, 1, ?, ?, ?, 1, 0)""",
                 (inbox_id, user_id, now, now),
             )
-            self.connection.commit()
+            commit(self.connection)
             inbox_id_for_migration = inbox_id
         else:
             inbox_id_for_migration = row[0]
@@ -70,44 +87,77 @@ class SqliteProjectRepository(ProjectRepository):
             "UPDATE tasks SET project_id = ? WHERE user_id = ? AND project_id IS NULL AND deleted_at IS NULL",
             (inbox_id_for_migration, user_id),
         )
-        self.connection.commit()
+        commit(self.connection)
 
-    async def list_all(self, filters: ProjectFilters) -> list[Project]:
-        """List all projects with filtering."""
+    def _build_where(self, filters: ProjectFilters) -> tuple[str, list[Any]]:
+        """Build the WHERE clause and parameters for a project filter."""
         user_id = self._get_user_id()
 
-        query = "SELECT * FROM projects WHERE user_id = ? AND deleted_at IS NULL"
+        where = "user_id = ? AND deleted_at IS NULL"
         params: list[Any] = [user_id]
 
         if filters.id_prefix:
-            query += " AND id LIKE ?"
+            where += " AND id LIKE ?"
             params.append(f"{filters.id_prefix}%")
 
         if filters.is_favorite is not None:
-            query += " AND is_favorite = ?"
+            where += " AND is_favorite = ?"
             params.append(1 if filters.is_favorite else 0)
 
         if filters.is_archived is not None:
-            query += " AND is_archived = ?"
+            where += " AND is_archived = ?"
             params.append(1 if filters.is_archived else 0)
 
         if filters.workspace_id:
-            query += " AND workspace_id = ?"
+            where += " AND workspace_id = ?"
             params.append(filters.workspace_id)
 
         if filters.search:
-            query += " AND name LIKE ?"
+            where += " AND name LIKE ?"
             params.append(f"%{filters.search}%")
 
-        query += " ORDER BY display_order, name"
+        return where, params
+
+    @offloaded
+    def list_all(self, filters: ProjectFilters) -> list[Project]:
+        """List all projects with filtering."""
+        where, params = self._build_where(filters)
+        query = f"SELECT * FROM projects WHERE {where} ORDER BY display_order, name"
 
         cursor = self.connection.execute(query, params)
         rows = cursor.fetchall()
 
-        return [Project(**row_to_dict(row)) for row in rows]
+        return validate_many(Project, map(row_to_dict, rows))
 
-    async def get(self, project_id: str) -> Project:
+    async def iter_all(
+        self, filters: ProjectFilters, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[Project]:
+        """Stream projects using keyset pagination on the primary key."""
+        where, base_params = self._build_where(filters)
+        query = f"SELECT * FROM projects WHERE {where} AND id > ? ORDER BY id LIMIT ?"
+
+
+        def fetch(params: list[Any]) -> tuple[list[sqlite3.Row], list[Project]]:
+            rows = self.connection.execute(query, params).fetchall()
+            return rows, validate_many(Project, map(row_to_dict, rows))
+
+        last_id = ""
+        while True:
+            rows, projects = await run(
+                self.connection, fetch, [*base_params, last_id, page_size]
+            )
+            for project in projects:
+                yield project
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1]["id"]
+
+    @offloaded
+    def get(self, project_id: str) -> Project:
         """Get a specific project by ID."""
+        return self._get(project_id)
+
+    def _get(self, project_id: str) -> Project:
         user_id = self._get_user_id()
 
         cursor = self.connection.execute(
@@ -125,7 +175,8 @@ class SqliteProjectRepository(ProjectRepository):
         """Alias for get() method for compatibility."""
         return await self.get(id)
 
-    async def create(self, project_data: ProjectCreate) -> Project:
+    @offloaded
+    def create(self, project_data: ProjectCreate) -> Project:
         """Create a new project."""
         user_id = self._get_user_id()
         project_id = generate_uuid()
@@ -165,11 +216,60 @@ class SqliteProjectRepository(ProjectRepository):
                 1,
             ),
         )
-        self.connection.commit()
+        commit(self.connection)
+
+        return self._get(project_id)
+
+    @offloaded
+    def create_many(self, projects: list[ProjectCreate]) -> list[str]:
+        """Create several projects in a single transaction."""
+        user_id = self._get_user_id()
+        now = now_iso()
+
+        # Enforce case-insensitive name uniqueness per user, within the batch too
+        taken = {
+            row[0]
+            for row in self.connection.execute(
+                "SELECT LOWER(name) FROM projects WHERE user_id = ? AND deleted_at IS NULL",
+                (user_id,),
+            )
+        }
+        for project_data in projects:
+            key = project_data.name.lower()
+            if key in taken:
+                raise ValueError(f"A project named '{project_data.name}' already exists")
+            taken.add(key)
+
+        project_ids = [generate_uuid() for _ in projects]
+        with transaction(self.connection):
+            self.connection.executemany(
+                """INSERT INTO projects (
+                    id, name, color, is_favorite, is_archived,
+                    workspace_id, user_id, created_at, updated_at, version
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    (
+                        project_id,
+                        project_data.name,
+                        project_data.color,
+                        1 if project_data.is_favorite else 0,
+                        0,
+                        project_data.workspace_id,
+                        user_id,
+                        now,
+                        now,
+                        1,
+                    )
+                    for project_id, project_data in zip(
+                        project_ids, projects, strict=True
+                    )
+                ],
+            )
 
-        return await self.get(project_id)
+        return project_ids
 
-    async def update(self, project_id: str, updates: ProjectUpdate) -> Project:
+    @offloaded
+    def update(self, project_id: str, updates: ProjectUpdate) -> Project:
         """Update an existing project."""
         user_id = self._get_user_id()
         now = now_iso()
@@ -177,7 +277,7 @@ class SqliteProjectRepository(ProjectRepository):
         update_dict = updates.model_dump(exclude_none=True)
 
         if not update_dict:
-            return await self.get(project_id)
+            return self._get(project_id)
 
         # Enforce case-insensitive name uniqueness per user when renaming
         if "name" in update_dict:
@@ -212,11 +312,12 @@ class SqliteProjectRepository(ProjectRepository):
         params.extend([project_id, user_id])
 
         self.connection.execute(query, params)
-        self.connection.commit()
+        commit(self.connection)
 
-        return await self.get(project_id)
+        return self._get(project_id)
 
-    async def delete(self, project_id: str) -> bool:
+    @offloaded
+    def delete(self, project_id: str) -> bool:
         """Delete a project (soft delete)."""
         user_id = self._get_user_id()
         now = now_iso()
@@ -225,11 +326,12 @@ class SqliteProjectRepository(ProjectRepository):
             "UPDATE projects SET deleted_at = ? WHERE id = ? AND user_id = ?",
             (now, project_id, user_id),
         )
-        self.connection.commit()
+        commit(self.connection)
 
         return True
 
-    async def archive(self, project_id: str) -> Project:
+    @offloaded
+    def archive(self, project_id: str) -> Project:
         """Archive a project."""
         user_id = self._get_user_id()
         now = now_iso()
@@ -240,11 +342,12 @@ class SqliteProjectRepository(ProjectRepository):
                WHERE id = ? AND user_id = ?""",
             (now, project_id, user_id),
         )
-        self.connection.commit()
+        commit(self.connection)
 
-        return await self.get(project_id)
+        return self._get(project_id)
 
-    async def unarchive(self, project_id: str) -> Project:
+    @offloaded
+    def unarchive(self, project_id: str) -> Project:
         """Unarchive a project."""
         user_id = self._get_user_id()
         now = now_iso()
@@ -255,47 +358,108 @@ class SqliteProjectRepository(ProjectRepository):
                WHERE id = ? AND user_id = ?""",
             (now, project_id, user_id),
         )
-        self.connection.commit()
+        commit(self.connection)
 
-        return await self.get(project_id)
+        return self._get(project_id)
 
-    async def get_stats(self, project_id: str) -> dict:
+    @offloaded
+    def get_stats(self, project_id: str) -> dict:
         """Get project statistics."""
-        user_id = self._get_user_id()
+        return self._stats_many([project_id])[project_id]
 
-        # Count tasks by status
-        cursor = self.connection.execute(
-            """SELECT 
-                COUNT(*) as total_tasks,
-                SUM(CASE WHEN is_completed = 1 THEN 1 ELSE 0 END) as completed_tasks,
-                SUM(CASE WHEN is_completed = 0 THEN 1 ELSE 0 END) as pending_tasks,
-                SUM(CASE WHEN is_completed = 0 AND due_date < datetime('now') THEN 1 ELSE 0 END) as overdue_tasks
-            FROM tasks 
-            WHERE project_id = ? AND user_id = ? AND deleted_at IS NULL""",
-            (project_id, user_id),
-        )
-        row = cursor.fetchone()
+    @offloaded
+    def get_stats_many(self, project_ids: list[str] | None = None) -> dict[str, dict]:
+        """Get statistics for many projects with one query per figure and chunk.
 
-        if not row:
-            return {
-                "total_tasks": 0,
-                "completed_tasks": 0,
-                "pending_tasks": 0,
-                "overdue_tasks": 0,
-                "completion_rate": 0,
+        Counts come from ``project_counters`` (kept current by triggers) or,
+        on a vault without it, from one ``GROUP BY project_id`` over the
+        tasks; overdue counts from one range scan of the due date index.
+        """
+        return self._stats_many(project_ids)
+
+    def _stats_many(self, project_ids: list[str] | None) -> dict[str, dict]:
+        user_id = self._get_user_id()
+        if project_ids is None:
+            project_ids = [
+                row[0]
+                for row in self.connection.execute(
+                    "SELECT id FROM projects WHERE user_id = ? AND deleted_at IS NULL",
+                    (user_id,),
+                )
+            ]
+        if not project_ids:
+            return {}
+
+        counts: dict[str, tuple] = {}
+        overdue: dict[str, int] = {}
+        for start in range(0, len(project_ids), _STATS_CHUNK_SIZE):
+            chunk = project_ids[start : start + _STATS_CHUNK_SIZE]
+            counts.update(self._counts(user_id, chunk))
+            overdue.update(self._overdue_counts(user_id, chunk))
+
+        stats = {}
+        for project_id in project_ids:
+            total, completed, pending = counts.get(project_id, (0, 0, 0))
+            stats[project_id] = {
+                "total_tasks": total,
+                "completed_tasks": completed,
+                "pending_tasks": pending,
+                "overdue_tasks": overdue.get(project_id, 0),
+                "completion_rate": int(completed / total * 100) if total > 0 else 0,
             }
+        return stats
+
+    def _counts(self, user_id: str, project_ids: list[str]) -> dict[str, tuple]:
+        """Total, completed and pending task counts of each project."""
+        placeholders = ",".join("?" * len(project_ids))
+        if self._has_counters():
+            rows = self.connection.execute(
+                f"""SELECT project_id, total, completed, pending
+                    FROM project_counters
+                    WHERE user_id = ? AND project_id IN ({placeholders})""",
+                (user_id, *project_ids),
+            )
+        else:
+            rows = self.connection.execute(
+                f"""SELECT project_id, COUNT(*),
+                        SUM(is_completed = 1), SUM(is_completed = 0)
+                    FROM tasks
+                    WHERE user_id = ? AND project_id IN ({placeholders})
+                        AND deleted_at IS NULL
+                    GROUP BY project_id""",
+                (user_id, *project_ids),
+            )
+        return {row[0]: row[1:] for row in rows}
 
-        total = row[0] or 0
-        completed = row[1] or 0
-        pending = row[2] or 0
-        overdue = row[3] or 0
+    def _overdue_counts(self, user_id: str, project_ids: list[str]) -> dict[str, int]:
+        """Open, past-due task counts of each project.
 
-        completion_rate = int(completed / total * 100) if total > 0 else 0
+        Only the tasks already past due are read: the unary ``+`` keeps the
+        planner off the project and user indexes (for the filter and for
+        the grouping), which would walk every task of the projects, and
+        leaves it the due date range. A vault without ``idx_tasks_due_date``
+        still answers, with a table scan.
+        """
+        placeholders = ",".join("?" * len(project_ids))
+        return dict(
+            self.connection.execute(
+                f"""SELECT project_id, COUNT(*) FROM tasks
+                    WHERE due_date < datetime('now') AND +user_id = ?
+                        AND +project_id IN ({placeholders})
+                        AND +is_completed = 0 AND deleted_at IS NULL
+                    GROUP BY +project_id""",
+                (user_id, *project_ids),
+            ).fetchall()
+        )
 
-        return {
-            "total_tasks": total,
-            "completed_tasks": completed,
-            "pending_tasks": pending,
-            "overdue_tasks": overdue,
-            "completion_rate": completion_rate,
-        }
+    def _has_counters(self) -> bool:
+        """Whether the vault has the trigger-maintained counters (migration 8)."""
+        if self._counters is None:
+            self._counters = (
+                self.connection.execute(
+                    "SELECT 1 FROM sqlite_master "
+                    "WHERE type = 'table' AND name = 'project_counters'"
+                ).fetchone()
+                is not None
+            )
+        return self._counters
@@ -0,0 +1,174 @@
+"""SQLite implementation of ReminderRepository."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime
+
+from todopro_cli.adapters.sqlite.connection import commit, get_connection, transaction
+from todopro_cli.adapters.sqlite.user_manager import get_or_create_local_user
+from todopro_cli.adapters.sqlite.utils import generate_uuid, now_iso, row_to_dict
+from todopro_cli.adapters.sqlite.worker import offloaded
+from todopro_cli.models import Reminder
+from todopro_cli.models.hydration import validate_many
+from todopro_cli.repositories import ReminderRepository
+from todopro_cli.utils import profiler
+
+
+def _utc_iso(value: datetime) -> str:
+    """Store times in UTC so ISO strings order chronologically in the index.
+
+    Naive datetimes are taken to be local time.
+    """
+    return value.astimezone(UTC).isoformat()
+
+
+@profiler.traced_methods("sqlite")
+class SqliteReminderRepository(ReminderRepository):
+    """SQLite implementation of reminder repository.
+
+    The reminders table has no owner column; reminders belong to the user
+    who owns their task.
+    """
+
+    def __init__(
+        self,
+        db_path: str | None = None,
+        config_manager=None,
+        connection: sqlite3.Connection | None = None,
+    ):
+        """Initialize SQLite reminder repository.
+
+        Args:
+            db_path: Optional database file path. If None, uses default location.
+            config_manager: Optional config manager for user ID.
+            connection: Optional pre-opened connection (bypasses the vault singleton).
+        """
+        self.db_path = db_path
+        self.config_manager = config_manager
+        self._connection: sqlite3.Connection | None = connection
+        self._user_id: str | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get or create database connection."""
+        if self._connection is None:
+            self._connection = get_connection(self.db_path)
+        return self._connection
+
+    def _get_user_id(self) -> str:
+        """Get current user ID."""
+        if self._user_id is not None:
+            return self._user_id
+
+        self._user_id = get_or_create_local_user(self.connection)
+        return self._user_id
+
+    @offloaded
+    def list_for_task(self, task_id: str) -> list[Reminder]:
+        """List every reminder of a task, oldest first."""
+        rows = self.connection.execute(
+            """SELECT r.* FROM reminders AS r JOIN tasks AS t ON t.id = r.task_id
+               WHERE r.task_id = ? AND t.user_id = ?
+               ORDER BY r.reminder_date""",
+            (task_id, self._get_user_id()),
+        ).fetchall()
+        return validate_many(Reminder, map(row_to_dict, rows))
+
+    @offloaded
+    def list_pending(self, before: datetime) -> list[Reminder]:
+        """List pending reminders of open tasks due before a time.
+
+        The scan runs on idx_reminders_pending; the unary ``+`` keeps the
+        planner from driving the query off the (much larger) tasks indexes
+        instead.
+        """
+        rows = self.connection.execute(
+            """SELECT r.* FROM reminders AS r JOIN tasks AS t ON t.id = r.task_id
+               WHERE r.is_sent = 0 AND r.is_snoozed = 0 AND r.reminder_date < ?
+                 AND +t.user_id = ? AND +t.is_completed = 0
+                 AND t.deleted_at IS NULL
+               ORDER BY r.reminder_date""",
+            (_utc_iso(before), self._get_user_id()),
+        ).fetchall()
+        return validate_many(Reminder, map(row_to_dict, rows))
+
+    @offloaded
+    def get(self, reminder_id: str) -> Reminder:
+        """Get a specific reminder by ID."""
+        return self._get(reminder_id)
+
+    def _get(self, reminder_id: str) -> Reminder:
+        row = self.connection.execute(
+            """SELECT r.* FROM reminders AS r JOIN tasks AS t ON t.id = r.task_id
+               WHERE r.id = ? AND t.user_id = ?""",
+            (reminder_id, self._get_user_id()),
+        ).fetchone()
+
+        if not row:
+            raise ValueError(f"Reminder not found: {reminder_id}")
+
+        return Reminder(**row_to_dict(row))
+
+    @offloaded
+    def add(self, task_id: str, reminder_date: datetime) -> Reminder:
+        """Schedule a reminder for a task."""
+        owned = self.connection.execute(
+            "SELECT 1 FROM tasks WHERE id = ? AND user_id = ? AND deleted_at IS NULL",
+            (task_id, self._get_user_id()),
+        ).fetchone()
+        if not owned:
+            raise ValueError(f"Task not found: {task_id}")
+
+        reminder_id = generate_uuid()
+        self.connection.execute(
+            """INSERT INTO reminders (id, task_id, reminder_date, created_at)
+               VALUES (?, ?, ?, ?)""",
+            (reminder_id, task_id, _utc_iso(reminder_date), now_iso()),
+        )
+        commit(self.connection)
+
+        return self._get(reminder_id)
+
+    @offloaded
+    def snooze(self, reminder_id: str, until: datetime) -> Reminder:
+        """Snooze a reminder, replacing it with a new one at *until*."""
+        original = self._get(reminder_id)
+        new_id = generate_uuid()
+        with transaction(self.connection):
+            self.connection.execute(
+                """UPDATE reminders SET is_snoozed = 1, snoozed_until = ?
+                   WHERE id = ?""",
+                (_utc_iso(until), reminder_id),
+            )
+            self.connection.execute(
+                """INSERT INTO reminders
+                       (id, task_id, reminder_date, snoozed_from_id, created_at)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (new_id, original.task_id, _utc_iso(until), reminder_id, now_iso()),
+            )
+
+        return self._get(new_id)
+
+    @offloaded
+    def mark_sent(self, reminder_id: str) -> Reminder:
+        """Mark a reminder as sent."""
+        self._get(reminder_id)
+        self.connection.execute(
+            "UPDATE reminders SET is_sent = 1 WHERE id = ?", (reminder_id,)
+        )
+        commit(self.connection)
+
+        return self._get(reminder_id)
+
+    @offloaded
+    def delete(self, reminder_id: str) -> bool:
+        """Delete a reminder."""
+        try:
+            self._get(reminder_id)
+        except ValueError:
+            return False
+
+        self.connection.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
+        commit(self.connection)
+        return True
@@ -3,31 +3,149 @@
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 
-from todopro_cli.adapters.sqlite.connection import get_connection
+from todopro_cli.adapters.sqlite.connection import commit, get_connection, transaction
 from todopro_cli.adapters.sqlite.e2ee import E2EEHandler
 from todopro_cli.adapters.sqlite.user_manager import get_or_create_local_user
-from todopro_cli.adapters.sqlite.utils import generate_uuid, now_iso, row_to_dict
-from todopro_cli.models import Task, TaskCreate, TaskFilters, TaskUpdate
+from todopro_cli.adapters.sqlite.utils import (
+    generate_uuid,
+    now_iso,
+    parse_datetime,
+    row_to_dict,
+)
+from todopro_cli.adapters.sqlite.worker import offloaded, run
+from todopro_cli.models import Page, Task, TaskCreate, TaskFilters, TaskUpdate
 from todopro_cli.models.config_models import AppConfig
-from todopro_cli.repositories import TaskRepository
+from todopro_cli.models.hydration import validate_many
+from todopro_cli.repositories import (
+    DEFAULT_PAGE_SIZE,
+    TOTAL_ESTIMATE_CAP,
+    TaskRepository,
+    decode_cursor,
+    encode_cursor,
+)
+from todopro_cli.utils import profiler, recurrence
+
+# Keyset sort keys: (column, direction, substitute for NULL). NULLs are
+# coalesced to a value that sorts the same way (first ascending, last
+# descending) so keys can be compared with plain < and >.
+_DEFAULT_SORT_KEYS = (
+    ("priority", "ASC", 0),
+    ("project_id", "ASC", ""),
+    ("created_at", "DESC", None),
+)
+_SORTABLE_COLUMNS = {"due_date": "", "priority": 0, "created_at": None, "updated_at": None}
+
+# Columns read into Task models; the rest of the row is never used
+_TASK_COLUMNS = ", ".join(
+    f"t.{column}"
+    for column in (
+        "id",
+        "content",
+        "description",
+        "content_encrypted",
+        "description_encrypted",
+        "project_id",
+        "due_date",
+        "priority",
+        "is_completed",
+        "is_recurring",
+        "recurrence_rule",
+        "recurrence_end",
+        "next_occurrence",
+        "created_at",
+        "updated_at",
+        "completed_at",
+        "version",
+    )
+)
+
+# Task IDs per IN (...) query, below SQLite's bound-parameter limit
+_RELATION_CHUNK_SIZE = 900
+
+# Fields that change when a recurring task's next occurrence falls
+_SCHEDULE_FIELDS = {"due_date", "is_recurring", "recurrence_rule", "recurrence_end"}
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _schedule(
+    rule: str | None, due: datetime | None, until: datetime | None
+) -> tuple[datetime | None, datetime | None]:
+    """Place a recurring task on its rule.
+
+    The due date is moved to the first occurrence at or after it (or after
+    today's start if the task has none), so it is always an occurrence of
+    the series it starts.
+
+    Returns:
+        (due date, next occurrence); unchanged due date and None for tasks
+        without a rule
+
+    Raises:
+        ValueError: If the rule cannot be parsed
+    """
+    if not rule:
+        return due, None
+    anchor = due or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    first = recurrence.first_occurrence(rule, anchor, until) or anchor
+    return first, recurrence.next_occurrence(rule, first, until)
+
+
+def _key_expr(column: str, null_value: Any) -> str:
+    if null_value is None:
+        return f"t.{column}"
+    return f"COALESCE(t.{column}, {null_value!r})"
+
+
+def _keyset_predicate(
+    keys: list[tuple[str, str, Any]], values: list[Any]
+) -> tuple[str, list[Any]]:
+    """Build ``WHERE`` terms selecting rows strictly after *values*.
+
+    Uses the nested form ``k1 >= v1 AND (k1 > v1 OR (k2 >= v2 AND ...))``,
+    which handles mixed sort directions and lets SQLite seek on the leading
+    key instead of scanning from the start.
+    """
+    sql, params = "", []
+    for (column, direction, null_value), value in reversed(
+        list(zip(keys, values, strict=True))
+    ):
+        expr = _key_expr(column, null_value)
+        op = ">" if direction == "ASC" else "<"
+        if not sql:
+            sql, params = f"{expr} {op} ?", [value]
+        else:
+            sql = f"{expr} {op}= ? AND ({expr} {op} ? OR ({sql}))"
+            params = [value, value, *params]
+    return sql, params
 
 
+@profiler.traced_methods("sqlite")
 class SqliteTaskRepository(TaskRepository):
     """SQLite implementation of task repository."""
 
-    def __init__(self, db_path: str | None = None, config_service=None):
+    def __init__(
+        self,
+        db_path: str | None = None,
+        config_service=None,
+        connection: sqlite3.Connection | None = None,
+    ):
         """Initialize SQLite task repository.
 
         Args:
             db_path: Optional database file path. If None, uses default location.
             config_service: Optional config manager for user ID and E2EE settings.
+            connection: Optional pre-opened connection (bypasses the vault singleton).
         """
         self.db_path = db_path
         self.config_service = config_service
-        self._connection: sqlite3.Connection | None = None
+        self._connection: sqlite3.Connection | None = connection
         self._user_id: str | None = None
         self._e2ee_handler: E2EEHandler | None = None
 
@@ -88,47 +206,43 @@ class SqliteTaskRepository(TaskRepository):
 
         return user_id
 
-    async def list_all(self, filters: TaskFilters) -> list[Task]:
-        """List all tasks with filtering."""
+    def _build_where(self, filters: TaskFilters) -> tuple[str, list[Any]]:
+        """Build the WHERE clause and parameters for a task filter."""
         user_id = self._get_user_id()
 
-        # Build query
-        query = """
-            SELECT t.* FROM tasks t
-            WHERE t.user_id = ? AND t.deleted_at IS NULL
-        """
+        where = "t.user_id = ? AND t.deleted_at IS NULL"
         params: list[Any] = [user_id]
 
         # Apply filters
         if filters.id_prefix:
-            query += " AND t.id LIKE ?"
+            where += " AND t.id LIKE ?"
             params.append(f"{filters.id_prefix}%")
 
         if filters.id_suffix:
-            query += " AND t.id LIKE ?"
+            where += " AND t.id LIKE ?"
             params.append(f"%{filters.id_suffix}")
 
         if filters.status == "active":
-            query += " AND t.is_completed = 0"
+            where += " AND t.is_completed = 0"
         elif filters.status == "completed":
-            query += " AND t.is_completed = 1"
+            where += " AND t.is_completed = 1"
         # "all" means no filter on is_completed
 
         if filters.project_id:
-            query += " AND t.project_id = ?"
+            where += " AND t.project_id = ?"
             params.append(filters.project_id)
 
         if filters.priority is not None:
-            query += " AND t.priority = ?"
+            where += " AND t.priority = ?"
             params.append(filters.priority)
 
         if filters.search:
-            query += " AND (t.content LIKE ? OR t.description LIKE ?)"
+            where += " AND (t.content LIKE ? OR t.description LIKE ?)"
             search_term = f"%{filters.search}%"
             params.extend([search_term, search_term])
 
         if filters.due_before:
-            query += " AND t.due_date <= ?"
+            where += " AND t.due_date <= ?"
             params.append(
                 filters.due_before.isoformat()
                 if isinstance(filters.due_before, datetime)
@@ -136,19 +250,81 @@ class SqliteTaskRepository(TaskRepository):
             )
 
         if filters.due_after:
-            query += " AND t.due_date >= ?"
+            where += " AND t.due_date >= ?"
             params.append(
                 filters.due_after.isoformat()
                 if isinstance(filters.due_after, datetime)
                 else filters.due_after
             )
 
+        if filters.updated_after:
+            where += " AND t.updated_at >= ?"
+            params.append(filters.updated_after.isoformat())
+
+        return where, params
+
+    def _task_dict(
+        self,
+        row: sqlite3.Row,
+        labels: list[str] | None = None,
+        contexts: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Turn a tasks row into Task fields, decrypting and attaching relations.
+
+        Args:
+            row: tasks row
+            labels: Label IDs of the task; queried if not given
+            contexts: Context IDs of the task; queried if not given
+        """
+        task_dict = row_to_dict(row)
+
+        # Decrypt content if E2EE is enabled
+        if self.e2ee.enabled:
+            content, description = self.e2ee.extract_task_content(
+                task_dict.get("content", ""),
+                task_dict.get("content_encrypted"),
+                task_dict.get("description", ""),
+                task_dict.get("description_encrypted"),
+            )
+            task_dict["content"] = content
+            task_dict["description"] = description
+
+        if labels is None:
+            labels = self._get_task_labels(task_dict["id"])
+        if contexts is None:
+            contexts = self._get_task_contexts(task_dict["id"])
+        task_dict["labels"] = labels
+        task_dict["contexts"] = contexts
+        return task_dict
+
+    def _row_to_task(self, row: sqlite3.Row) -> Task:
+        """Convert a tasks row into a Task."""
+        return Task.model_validate(self._task_dict(row))
+
+    def _rows_to_tasks(self, rows: list[sqlite3.Row]) -> list[Task]:
+        """Convert tasks rows into Tasks, loading all their relations at once."""
+        task_ids = [row["id"] for row in rows]
+        labels = self._get_relation_ids("task_labels", "label_id", task_ids)
+        contexts = self._get_relation_ids("task_contexts", "context_id", task_ids)
+        return validate_many(
+            Task,
+            (
+                self._task_dict(row, labels.get(row["id"], []), contexts.get(row["id"], []))
+                for row in rows
+            ),
+        )
+
+    @offloaded
+    def list_all(self, filters: TaskFilters) -> list[Task]:
+        """List all tasks with filtering."""
+        where, params = self._build_where(filters)
+        query = f"SELECT {_TASK_COLUMNS} FROM tasks t WHERE {where}"
+
         # Sorting
         if filters.sort:
-            sort_field, *sort_dir = filters.sort.split(":")
-            direction = sort_dir[0].upper() if sort_dir else "ASC"
-            if sort_field in ["due_date", "priority", "created_at", "updated_at"]:
-                query += f" ORDER BY t.{sort_field} {direction}"
+            query += " ORDER BY " + ", ".join(
+                f"t.{column} {direction}" for column, direction, _ in self._sort_keys(filters)
+            )
         else:
             query += " ORDER BY t.priority ASC, t.project_id ASC, t.created_at DESC"
 
@@ -166,33 +342,135 @@ class SqliteTaskRepository(TaskRepository):
         rows = cursor.fetchall()
 
         # Convert to Task models with labels
-        tasks = []
-        for row in rows:
-            task_dict = row_to_dict(row)
-
-            # Decrypt content if E2EE is enabled
-            if self.e2ee.enabled:
-                content, description = self.e2ee.extract_task_content(
-                    task_dict.get("content", ""),
-                    task_dict.get("content_encrypted"),
-                    task_dict.get("description", ""),
-                    task_dict.get("description_encrypted"),
-                )
-                task_dict["content"] = content
-                task_dict["description"] = description
+        return self._rows_to_tasks(rows)
+
+    @staticmethod
+    def _sort_keys(filters: TaskFilters) -> list[tuple[str, str, Any]]:
+        """Keyset sort keys for a listing, ending with the unique task ID.
+
+        ``filters.sort`` is one or more comma-separated ``field[:direction]``
+        terms (e.g. ``"priority:asc,created_at:desc"``); unknown fields are
+        ignored.
+        """
+        keys = []
+        for term in (filters.sort or "").split(","):
+            sort_field, *sort_dir = term.strip().split(":")
+            if sort_field in _SORTABLE_COLUMNS:
+                direction = "DESC" if sort_dir and sort_dir[0].upper() == "DESC" else "ASC"
+                keys.append((sort_field, direction, _SORTABLE_COLUMNS[sort_field]))
+        return [*(keys or _DEFAULT_SORT_KEYS), ("id", "ASC", None)]
+
+    @offloaded
+    def list_page(
+        self, filters: TaskFilters, with_total: bool = False
+    ) -> Page[Task]:
+        """Fetch one page of tasks using keyset pagination.
+
+        The cursor holds the sort key of the last task on the previous page,
+        and the next page starts strictly after it. Each page is an index
+        seek, so page 1,000 costs the same as page 1, unlike OFFSET.
+        ``filters.offset`` is still honoured for the first page.
+        """
+        size = filters.limit or DEFAULT_PAGE_SIZE
+        keys = self._sort_keys(filters)
+        sort_spec = ",".join(f"{column}:{direction}" for column, direction, _ in keys)
+
+        where, params = self._build_where(filters)
+        filter_where, filter_params = where, list(params)
+        if filters.cursor:
+            state = decode_cursor(filters.cursor)
+            if state.get("sort") != sort_spec:
+                raise ValueError("Page cursor does not match this listing's sort order")
+            keyset_sql, keyset_params = _keyset_predicate(keys, state["after"])
+            where += f" AND ({keyset_sql})"
+            params.extend(keyset_params)
+
+        order_by = ", ".join(
+            f"{_key_expr(column, null_value)} {direction}"
+            for column, direction, null_value in keys
+        )
+        query = (
+            f"SELECT {_TASK_COLUMNS} FROM tasks t "
+            f"WHERE {where} ORDER BY {order_by} LIMIT ?"
+        )
+        params.append(size + 1)
+        if filters.offset and not filters.cursor:
+            query += " OFFSET ?"
+            params.append(filters.offset)
+
+        rows = self.connection.execute(query, params).fetchall()
+        has_more = len(rows) > size
+        rows = rows[:size]
+
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            after = [
+                last[column] if last[column] is not None or null_value is None else null_value
+                for column, _, null_value in keys
+            ]
+            next_cursor = encode_cursor({"sort": sort_spec, "after": after})
+
+        total_estimate = None
+        if with_total:
+            total_estimate = self.connection.execute(
+                f"SELECT COUNT(*) FROM (SELECT 1 FROM tasks t WHERE {filter_where} LIMIT ?)",
+                [*filter_params, TOTAL_ESTIMATE_CAP],
+            ).fetchone()[0]
+
+        return Page[Task](
+            items=self._rows_to_tasks(rows),
+            next_cursor=next_cursor,
+            has_more=has_more,
+            total_estimate=total_estimate,
+        )
+
+    async def iter_all(
+        self, filters: TaskFilters, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[Task]:
+        """Stream tasks using keyset pagination on the primary key.
 
-            task_dict["labels"] = self._get_task_labels(task_dict["id"])
-            task_dict["contexts"] = self._get_task_contexts(task_dict["id"])
-            tasks.append(Task(**task_dict))
+        Each page is ``WHERE ... AND t.id > <last id> ORDER BY t.id LIMIT n``,
+        which stays an index range scan however deep the iteration goes,
+        unlike OFFSET. Tasks are yielded in ID order.
+        """
+        where, base_params = self._build_where(filters)
+        query = (
+            f"SELECT {_TASK_COLUMNS} FROM tasks t "
+            f"WHERE {where} AND t.id > ? ORDER BY t.id LIMIT ?"
+        )
 
-        return tasks
 
-    async def get(self, task_id: str) -> Task:
+        def fetch(params: list[Any]) -> tuple[list[sqlite3.Row], list[Task]]:
+            rows = self.connection.execute(query, params).fetchall()
+            return rows, self._rows_to_tasks(rows)
+
+        remaining = filters.limit
+        last_id = ""
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            rows, tasks = await run(
+                self.connection, fetch, [*base_params, last_id, size]
+            )
+            for task in tasks:
+                yield task
+            if len(rows) < size:
+                return
+            last_id = rows[-1]["id"]
+            if remaining is not None:
+                remaining -= len(rows)
+
+    @offloaded
+    def get(self, task_id: str) -> Task:
         """Get a specific task by ID."""
+        return self._get(task_id)
+
+    def _get(self, task_id: str) -> Task:
         user_id = self._get_user_id()
 
         cursor = self.connection.execute(
-            "SELECT * FROM tasks WHERE id = ? AND user_id = ? AND deleted_at IS NULL",
+            f"SELECT {_TASK_COLUMNS} FROM tasks t "
+            "WHERE t.id = ? AND t.user_id = ? AND t.deleted_at IS NULL",
             (task_id, user_id),
         )
         row = cursor.fetchone()
@@ -200,29 +478,14 @@ class SqliteTaskRepository(TaskRepository):
         if not row:
             raise ValueError(f"Task not found: {task_id}")
 
-        task_dict = row_to_dict(row)
-
-        # Decrypt content if E2EE is enabled
-        if self.e2ee.enabled:
-            content, description = self.e2ee.extract_task_content(
-                task_dict.get("content", ""),
-                task_dict.get("content_encrypted"),
-                task_dict.get("description", ""),
-                task_dict.get("description_encrypted"),
-            )
-            task_dict["content"] = content
-            task_dict["description"] = description
-
-        task_dict["labels"] = self._get_task_labels(task_id)
-        task_dict["contexts"] = self._get_task_contexts(task_id)
-
-        return Task(**task_dict)
+        return self._row_to_task(row)
 
     async def get_by_id(self, id: str):
         """Alias for get() method for compatibility."""
         return await self.get(id)
 
-    async def add(self, task_data: TaskCreate) -> Task:
+    @offloaded
+    def add(self, task_data: TaskCreate) -> Task:
         """Create a new task."""
         user_id = self._get_user_id()
         task_id = generate_uuid()
@@ -231,26 +494,24 @@ class SqliteTaskRepository(TaskRepository):
         # Convert TaskCreate to dict
         data = task_data.model_dump(exclude={"labels", "contexts"})
 
-        # Convert datetime to ISO string
-        if (
-            "due_date" in data
-            and data["due_date"] is not None
-            and isinstance(data["due_date"], datetime)
-        ):
-            data["due_date"] = data["due_date"].isoformat()
-
         # Prepare content for storage (with E2EE if enabled)
         content, content_encrypted, description, description_encrypted = (
             self.e2ee.prepare_task_for_storage(data["content"], data.get("description"))
         )
 
+        # Recurring tasks start on an occurrence of their rule
+        due_date, next_occurrence = _schedule(
+            task_data.recurrence_rule, task_data.due_date, task_data.recurrence_end
+        )
+
         # Insert task
         self.connection.execute(
             """INSERT INTO tasks (
                 id, content, description, content_encrypted, description_encrypted,
                 project_id, due_date, priority, is_completed, user_id, 
-                created_at, updated_at, version
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                created_at, updated_at, version,
+                is_recurring, recurrence_rule, recurrence_end, next_occurrence
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
             (
                 task_id,
                 content,
@@ -258,13 +519,17 @@ class SqliteTaskRepository(TaskRepository):
                 content_encrypted,
                 description_encrypted,
                 data.get("project_id"),
-                data.get("due_date"),
+                _iso(due_date),
                 data.get("priority", 4),
                 False,
                 user_id,
                 now,
                 now,
                 1,
+                bool(task_data.recurrence_rule),
+                task_data.recurrence_rule,
+                _iso(task_data.recurrence_end),
+                _iso(next_occurrence),
             ),
         )
 
@@ -276,12 +541,84 @@ class SqliteTaskRepository(TaskRepository):
         if task_data.contexts:
             self._set_task_contexts(task_id, task_data.contexts)
 
-        self.connection.commit()
+        commit(self.connection)
+
+        return self._get(task_id)
+
+    @offloaded
+    def add_many(self, tasks: list[TaskCreate]) -> list[str]:
+        """Create several tasks in a single transaction."""
+        user_id = self._get_user_id()
+        now = now_iso()
+
+        task_ids = [generate_uuid() for _ in tasks]
+        rows = []
+        for task_id, task_data in zip(task_ids, tasks, strict=True):
+            content, content_encrypted, description, description_encrypted = (
+                self.e2ee.prepare_task_for_storage(
+                    task_data.content, task_data.description
+                )
+            )
+            due_date, next_occurrence = _schedule(
+                task_data.recurrence_rule, task_data.due_date, task_data.recurrence_end
+            )
+            rows.append(
+                (
+                    task_id,
+                    content,
+                    description,
+                    content_encrypted,
+                    description_encrypted,
+                    task_data.project_id,
+                    _iso(due_date),
+                    task_data.priority,
+                    False,
+                    user_id,
+                    now,
+                    now,
+                    1,
+                    bool(task_data.recurrence_rule),
+                    task_data.recurrence_rule,
+                    _iso(task_data.recurrence_end),
+                    _iso(next_occurrence),
+                )
+            )
+
+        with transaction(self.connection):
+            self.connection.executemany(
+                """INSERT INTO tasks (
+                    id, content, description, content_encrypted, description_encrypted,
+                    project_id, due_date, priority, is_completed, user_id,
+                    created_at, updated_at, version,
+                    is_recurring, recurrence_rule, recurrence_end, next_occurrence
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
+            self.connection.executemany(
+                "INSERT INTO task_labels (task_id, label_id) VALUES (?, ?)",
+                [
+                    (task_id, label_id)
+                    for task_id, task_data in zip(task_ids, tasks, strict=True)
+                    for label_id in task_data.labels
+                ],
+            )
+            self.connection.executemany(
+                "INSERT INTO task_contexts (task_id, context_id) VALUES (?, ?)",
+                [
+                    (task_id, context_id)
+                    for task_id, task_data in zip(task_ids, tasks, strict=True)
+                    for context_id in task_data.contexts
+                ],
+            )
 
-        return await self.get(task_id)
+        return task_ids
 
-    async def update(self, task_id: str, updates: TaskUpdate) -> Task:
+    @offloaded
+    def update(self, task_id: str, updates: TaskUpdate) -> Task:
         """Update an existing task."""
+        return self._update(task_id, updates)
+
+    def _update(self, task_id: str, updates: TaskUpdate) -> Task:
         user_id = self._get_user_id()
         now = now_iso()
 
@@ -290,8 +627,17 @@ class SqliteTaskRepository(TaskRepository):
             exclude_none=True, exclude={"labels", "contexts"}
         )
 
+        # Completing a recurring task moves it on to its next occurrence
+        if update_dict.get("is_completed") and self._advance(
+            task_id, after=datetime.now()
+        ):
+            del update_dict["is_completed"]
+            if not update_dict:
+                commit(self.connection)
+                return self._get(task_id)
+
         if not update_dict:
-            return await self.get(task_id)
+            return self._get(task_id)
 
         # Convert datetime to ISO string
         if (
@@ -304,7 +650,7 @@ class SqliteTaskRepository(TaskRepository):
         # Handle E2EE for content and description updates
         if "content" in update_dict or "description" in update_dict:
             # Get current task to preserve existing content if not updating
-            current_task = await self.get(task_id)
+            current_task = self._get(task_id)
             content = update_dict.get("content", current_task.content)
             description = update_dict.get("description", current_task.description)
 
@@ -337,6 +683,13 @@ class SqliteTaskRepository(TaskRepository):
 
         self.connection.execute(query, params)
 
+        if _SCHEDULE_FIELDS & update_dict.keys():
+            try:
+                self._reschedule(task_id)
+            except ValueError:
+                self.connection.rollback()
+                raise
+
         # Update labels if provided
         if updates.labels is not None:
             self._set_task_labels(task_id, updates.labels)
@@ -345,11 +698,12 @@ class SqliteTaskRepository(TaskRepository):
         if updates.contexts is not None:
             self._set_task_contexts(task_id, updates.contexts)
 
-        self.connection.commit()
+        commit(self.connection)
 
-        return await self.get(task_id)
+        return self._get(task_id)
 
-    async def delete(self, task_id: str) -> bool:
+    @offloaded
+    def delete(self, task_id: str) -> bool:
         """Delete a task (soft delete)."""
         user_id = self._get_user_id()
         now = now_iso()
@@ -358,41 +712,158 @@ class SqliteTaskRepository(TaskRepository):
             "UPDATE tasks SET deleted_at = ? WHERE id = ? AND user_id = ?",
             (now, task_id, user_id),
         )
-        self.connection.commit()
+        commit(self.connection)
 
         return True
 
-    async def complete(self, task_id: str) -> Task:
-        """Mark a task as completed."""
+    @offloaded
+    def complete(self, task_id: str) -> Task:
+        """Mark a task as completed.
+
+        A recurring task stays open and moves on to its first occurrence
+        after now; it is only completed once its series has ended.
+        """
         user_id = self._get_user_id()
         now = now_iso()
 
-        self.connection.execute(
-            """UPDATE tasks 
-               SET is_completed = 1, completed_at = ?, updated_at = ?, version = version + 1
-               WHERE id = ? AND user_id = ?""",
-            (now, now, task_id, user_id),
-        )
-        self.connection.commit()
+        if not self._advance(task_id, after=datetime.now()):
+            self.connection.execute(
+                """UPDATE tasks 
+                   SET is_completed = 1, completed_at = ?, updated_at = ?,
+                       next_occurrence = NULL, version = version + 1
+                   WHERE id = ? AND user_id = ?""",
+                (now, now, task_id, user_id),
+            )
+        commit(self.connection)
+
+        return self._get(task_id)
+
+    @offloaded
+    def skip(self, task_id: str) -> Task:
+        """Skip the current occurrence of a recurring task.
+
+        Skipping the last occurrence of a series completes the task.
+        """
+        task = self._get(task_id)
+        if not task.is_recurring or not task.recurrence_rule:
+            raise ValueError(f"Task is not recurring: {task_id}")
+
+        if not self._advance(task_id, skipped=True):
+            now = now_iso()
+            self.connection.execute(
+                """UPDATE tasks
+                   SET is_completed = 1, completed_at = ?, is_skipped = 1,
+                       skipped_at = ?, updated_at = ?, next_occurrence = NULL,
+                       version = version + 1
+                   WHERE id = ? AND user_id = ?""",
+                (now, now, now, task_id, self._get_user_id()),
+            )
+        commit(self.connection)
 
-        return await self.get(task_id)
+        return self._get(task_id)
 
-    async def bulk_update(self, task_ids: list[str], updates: TaskUpdate) -> list[Task]:
+    @offloaded
+    def list_upcoming(self, start: datetime, end: datetime) -> list[Task]:
+        """List open tasks with an occurrence in ``[start, end)``.
+
+        A single query over two index ranges: tasks due in the window, and
+        recurring tasks whose next occurrence is before its end. Rules are
+        never evaluated here; callers expand the occurrences of the few
+        recurring tasks returned.
+        """
+        # The unary + keeps SQLite from scanning idx_tasks_user_completed
+        # (every open task) instead of unioning the two date ranges
+        rows = self.connection.execute(
+            f"SELECT {_TASK_COLUMNS} FROM tasks t "
+            "WHERE +t.user_id = ? AND t.deleted_at IS NULL AND +t.is_completed = 0 "
+            "AND ((t.due_date >= ? AND t.due_date < ?) OR t.next_occurrence < ?)",
+            (self._get_user_id(), start.isoformat(), end.isoformat(), end.isoformat()),
+        ).fetchall()
+        return self._rows_to_tasks(rows)
+
+    @offloaded
+    def bulk_update(self, task_ids: list[str], updates: TaskUpdate) -> list[Task]:
         """Update multiple tasks at once."""
         # Use transaction for atomicity
+        with transaction(self.connection):
+            return [self._update(task_id, updates) for task_id in task_ids]
+
+    def _advance(
+        self, task_id: str, *, after: datetime | None = None, skipped: bool = False
+    ) -> bool:
+        """Move a recurring task on to its next occurrence (uncommitted).
+
+        Args:
+            task_id: Task to move
+            after: Also pass every occurrence up to this time
+            skipped: Record the current occurrence as skipped
+
+        Returns:
+            False, changing nothing, if the task is not recurring, its rule
+            cannot be parsed, or its series has no further occurrences
+        """
+        row = self.connection.execute(
+            "SELECT due_date, recurrence_rule, recurrence_end FROM tasks "
+            "WHERE id = ? AND user_id = ? AND deleted_at IS NULL "
+            "AND is_recurring = 1 AND recurrence_rule IS NOT NULL",
+            (task_id, self._get_user_id()),
+        ).fetchone()
+        if row is None:
+            return False
+
+        until = parse_datetime(row["recurrence_end"])
+        current = parse_datetime(row["due_date"]) or datetime.now().replace(
+            second=0, microsecond=0
+        )
         try:
-            self.connection.execute("BEGIN")
+            step = recurrence.advance(
+                row["recurrence_rule"], current, after=after, until=until
+            )
+        except ValueError:
+            return False
+        if step is None:
+            return False
+
+        due_date, rule = step
+        now = now_iso()
+        self.connection.execute(
+            """UPDATE tasks
+               SET due_date = ?, next_occurrence = ?, recurrence_rule = ?,
+                   skipped_at = COALESCE(?, skipped_at), updated_at = ?,
+                   version = version + 1
+               WHERE id = ?""",
+            (
+                due_date.isoformat(),
+                _iso(recurrence.next_occurrence(rule, due_date, until)),
+                rule,
+                now if skipped else None,
+                now,
+                task_id,
+            ),
+        )
+        return True
 
-            updated_tasks = []
-            for task_id in task_ids:
-                task = await self.update(task_id, updates)
-                updated_tasks.append(task)
+    def _reschedule(self, task_id: str) -> None:
+        """Recompute a task's next occurrence after its schedule changed.
 
-            self.connection.commit()
-            return updated_tasks
-        except Exception as e:
-            self.connection.rollback()
-            raise e
+        Raises:
+            ValueError: If the task's rule cannot be parsed
+        """
+        row = self.connection.execute(
+            "SELECT due_date, is_recurring, recurrence_rule, recurrence_end "
+            "FROM tasks WHERE id = ?",
+            (task_id,),
+        ).fetchone()
+        following = None
+        due_date = parse_datetime(row["due_date"])
+        if row["is_recurring"] and row["recurrence_rule"] and due_date:
+            following = recurrence.next_occurrence(
+                row["recurrence_rule"], due_date, parse_datetime(row["recurrence_end"])
+            )
+        self.connection.execute(
+            "UPDATE tasks SET next_occurrence = ? WHERE id = ?",
+            (_iso(following), task_id),
+        )
 
     def _get_task_labels(self, task_id: str) -> list[str]:
         """Get label IDs for a task."""
@@ -408,6 +879,31 @@ class SqliteTaskRepository(TaskRepository):
         )
         return [row[0] for row in cursor.fetchall()]
 
+    def _get_relation_ids(
+        self, table: str, column: str, task_ids: list[str]
+    ) -> dict[str, list[str]]:
+        """Get the related IDs of many tasks from a junction table.
+
+        Args:
+            table: Junction table ("task_labels" or "task_contexts")
+            column: Related ID column ("label_id" or "context_id")
+            task_ids: Tasks to look up
+
+        Returns:
+            Mapping of task ID to related IDs; tasks without any are absent
+        """
+        related: dict[str, list[str]] = {}
+        for start in range(0, len(task_ids), _RELATION_CHUNK_SIZE):
+            chunk = task_ids[start : start + _RELATION_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = self.connection.execute(
+                f"SELECT task_id, {column} FROM {table} WHERE task_id IN ({placeholders})",
+                chunk,
+            )
+            for task_id, related_id in cursor:
+                related.setdefault(task_id, []).append(related_id)
+        return related
+
     def _set_task_labels(self, task_id: str, label_ids: list[str]) -> None:
         """Set labels for a task (replaces existing)."""
         # Remove existing
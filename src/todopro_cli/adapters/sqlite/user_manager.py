@@ -12,6 +12,8 @@ from datetime import UTC, datetime
 
 import tzlocal
 
+from todopro_cli.adapters.sqlite.connection import commit
+
 
 def get_system_timezone() -> str:
     """Detect system timezone.
@@ -51,7 +53,7 @@ def create_default_user(
         """,
         (user_id, email, name, timezone, now, now),
     )
-    connection.commit()
+    commit(connection)
 
     return user_id
 
@@ -91,7 +93,7 @@ def update_user_timezone(
         "UPDATE users SET timezone = ?, updated_at = ? WHERE id = ?",
         (timezone, now, user_id),
     )
-    connection.commit()
+    commit(connection)
 
 
 def get_user_info(connection: sqlite3.Connection, user_id: str) -> dict | None:
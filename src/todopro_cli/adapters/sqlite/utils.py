@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+import sqlite3
 import uuid
 from datetime import UTC, datetime
 from typing import Any
@@ -26,6 +27,10 @@ def now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
+# Mean Earth radius in meters, as used by the haversine formula
+EARTH_RADIUS_M = 6371000
+
+
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate distance between two geographic points using Haversine formula.
 
@@ -38,8 +43,7 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         Distance in meters
     """
-    # Earth's radius in meters
-    r = 6371000
+    r = EARTH_RADIUS_M
 
     # Convert to radians
     lat1_rad = math.radians(lat1)
@@ -56,6 +60,40 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return r * c
 
 
+def bounding_box(
+    latitude: float, longitude: float, radius: float
+) -> tuple[float, float, float, float]:
+    """Smallest latitude/longitude box containing a geofence.
+
+    Every point within *radius* meters (haversine distance) of the center
+    lies inside the box, so it can prefilter geofence lookups. Boxes that
+    reach a pole or cross the antimeridian span all longitudes.
+
+    Args:
+        latitude: Center latitude
+        longitude: Center longitude
+        radius: Geofence radius in meters
+
+    Returns:
+        (min_lat, max_lat, min_lon, max_lon) in degrees
+    """
+    angle = radius / EARTH_RADIUS_M
+    delta_lat = math.degrees(angle)
+    min_lat, max_lat = latitude - delta_lat, latitude + delta_lat
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0
+
+    # Widest longitude offset of a small circle around the center
+    ratio = math.sin(angle) / math.cos(math.radians(latitude))
+    if ratio >= 1:
+        return min_lat, max_lat, -180.0, 180.0
+    delta_lon = math.degrees(math.asin(ratio))
+    min_lon, max_lon = longitude - delta_lon, longitude + delta_lon
+    if min_lon < -180 or max_lon > 180:
+        return min_lat, max_lat, -180.0, 180.0
+    return min_lat, max_lat, min_lon, max_lon
+
+
 def row_to_dict(row: Any) -> dict[str, Any]:
     """Convert sqlite3.Row to dictionary.
 
@@ -67,6 +105,9 @@ def row_to_dict(row: Any) -> dict[str, Any]:
     """
     if row is None:
         return {}
+    if isinstance(row, sqlite3.Row):
+        # Much faster than dict(row), which looks every column up by name
+        return dict(zip(row.keys(), row, strict=True))
     return dict(row)
 
 
@@ -0,0 +1,121 @@
+"""Dedicated thread for the SQLite repositories' blocking calls.
+
+``sqlite3`` blocks, so a repository coroutine that queried on the event loop
+would hold up everything else scheduled on it: while a sync applies local
+upserts, the next page of remote tasks cannot even be requested. The
+repositories therefore keep their bodies synchronous and run them here,
+through :func:`offloaded` or :func:`run`, and only the awaiting coroutine
+waits.
+
+All calls share one worker thread, and every statement on a connection the
+worker serves goes through it: the repositories, the mirror store
+(``MirrorStore``) and the BEGIN/COMMIT of multi-call transactions, which
+open and close through :func:`transaction`. Statements thus keep the order
+they were issued in and never run on two threads at once, which
+transactions spanning several calls and repositories sharing one
+connection rely on. Opening a connection is the one exception; it happens
+before the connection is handed to anything else.
+
+Cancelling the awaiting coroutine drops a call that has not started yet and
+interrupts the statement of one that has; a transaction the interrupted call
+opened is rolled back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import sqlite3
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any
+
+from todopro_cli.adapters.sqlite import connection as sqlite_connection
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="todopro-sqlite"
+            )
+        return _executor
+
+
+def _call[T](
+    connection: sqlite3.Connection,
+    cancelled: threading.Event,
+    func: Callable[..., T],
+    args: tuple,
+    kwargs: dict,
+) -> T:
+    in_transaction = connection.in_transaction
+    try:
+        return func(*args, **kwargs)
+    except sqlite3.OperationalError:
+        if cancelled.is_set() and connection.in_transaction and not in_transaction:
+            connection.rollback()
+        raise
+
+
+async def run[T](
+    connection: sqlite3.Connection, func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """Run ``func(*args, **kwargs)`` on the worker thread and await its result.
+
+    Args:
+        connection: Connection the call uses, interrupted on cancellation
+        func: Blocking callable to run
+    """
+    cancelled = threading.Event()
+    future = _get_executor().submit(_call, connection, cancelled, func, args, kwargs)
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        # A call still queued is dropped, a running one interrupted
+        if not future.cancel() and future.running():
+            cancelled.set()
+            connection.interrupt()
+        raise
+
+
+def offloaded[**P, T](func: Callable[P, T]) -> Callable[P, Any]:
+    """Turn a blocking repository method into a coroutine run on the worker.
+
+    The decorated method's instance must have a ``connection`` property.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        return await run(self.connection, func, self, *args, **kwargs)
+
+    return wrapper
+
+
+@asynccontextmanager
+async def transaction(
+    connection: sqlite3.Connection,
+) -> AsyncIterator[sqlite3.Connection]:
+    """Run a block of offloaded calls atomically.
+
+    The async counterpart of :func:`connection.transaction`: BEGIN (or
+    SAVEPOINT) and COMMIT or ROLLBACK run on the worker, ordered with the
+    calls the block awaits.
+
+    Args:
+        connection: Connection the block's calls use
+    """
+    block = sqlite_connection.transaction(connection)
+    await run(connection, block.__enter__)
+    try:
+        yield connection
+    except BaseException as e:
+        await run(connection, block.__exit__, type(e), e, e.__traceback__)
+        raise
+    await run(connection, block.__exit__, None, None, None)
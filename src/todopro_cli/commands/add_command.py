@@ -3,6 +3,8 @@
 import asyncio
 import json
 from datetime import datetime
+from pathlib import Path
+from typing import Annotated
 
 import typer
 
@@ -35,6 +37,27 @@ def add(
     json_opt: bool = typer.Option(
         False, "--json", help="Output as JSON (alias for --output json)"
     ),
+    batch: bool = typer.Option(
+        False,
+        "--batch",
+        "-b",
+        help="Add one task per line (plain text or NDJSON) from stdin or --file",
+    ),
+    file: Annotated[
+        Path | None,
+        typer.Option(
+            "--file",
+            "-f",
+            exists=True,
+            dir_okay=False,
+            help="Read --batch input from a file instead of stdin",
+        ),
+    ] = None,
+    create_missing: bool = typer.Option(
+        False,
+        "--create-missing",
+        help="With --batch, create unknown #projects and @labels",
+    ),
 ) -> None:
     """
     Quick add a task using natural language.
@@ -43,6 +66,8 @@ def add(
       todopro add "Review PR tomorrow at 2pm #Work p1 @urgent"
       todopro add "Buy groceries every Friday @Shopping"
       todopro add "Team standup every monday at 9am #Work"
+      todopro add --batch < tasks.txt
+      todopro add --batch --file tasks.ndjson --create-missing
 
     Syntax:
       #ProjectName - Assign to project
@@ -51,6 +76,11 @@ def add(
       Natural dates - tomorrow, next monday, at 3pm
       Recurrence - every day/week/monday, etc.
 
+    Batch mode (--batch) reads one task per line. A line is either quick-add
+    text or an NDJSON object such as
+    {"content": "Pay rent tomorrow", "project": "Home", "labels": ["bills"]}.
+    Invalid lines are reported by line number; the others are still added.
+
     Note: Natural language parsing requires cloud context.
     For local context, creates a simple task with the text as content.
     """
@@ -59,6 +89,14 @@ def add(
     if json_opt:
         output = "json"
 
+    if batch:
+        if file is not None:
+            lines = file.read_text(encoding="utf-8").splitlines()
+        else:
+            lines = sys.stdin.read().splitlines()
+        _add_batch(lines, project, create_missing, output)
+        return
+
     text = text.strip() if text else None
 
     # If no text provided, determine how to get it
@@ -247,6 +285,42 @@ def add(
         raise typer.Exit(1) from e
 
 
+def _add_batch(
+    lines: list[str],
+    project: str | None,
+    create_missing: bool,
+    output: str,
+) -> None:
+    """Create the tasks of --batch input lines in bulk."""
+    from todopro_cli.services.batch_add_service import BatchAddService, parse_lines
+
+    parsed = parse_lines(lines)
+    if not parsed:
+        format_error("No tasks in batch input")
+        raise typer.Exit(1)
+
+    service = BatchAddService(get_storage_strategy_context())
+    result = asyncio.run(
+        service.add_all(parsed, default_project=project, create_missing=create_missing)
+    )
+
+    if output == "json":
+        payload = {"created": len(result.task_ids), **result.model_dump()}
+        console.print(json.dumps(payload, indent=2, default=str))
+    else:
+        format_success(f"Created {len(result.task_ids)} of {len(parsed)} tasks")
+        if result.projects_created or result.labels_created:
+            console.print(
+                f"[dim]New projects: {result.projects_created}, "
+                f"new labels: {result.labels_created}[/dim]"
+            )
+        for error in result.errors:
+            console.print(f"[yellow]  line {error.line}: {error.error}[/yellow]")
+
+    if result.has_errors:
+        raise typer.Exit(1)
+
+
 def _create_local_task(
     text: str, project_override: str | None = None, output: str = "pretty"
 ) -> None:
@@ -7,6 +7,13 @@ from datetime import datetime
 from pathlib import Path
 
 import typer
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    TextColumn,
+    TimeElapsedColumn,
+)
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
 
@@ -16,6 +23,22 @@ from todopro_cli.services.config_service import (
     get_config_service,
     get_storage_strategy_context,
 )
+from todopro_cli.services.data_archive import (
+    COMPRESSIONS,
+    ArchiveWriter,
+    ThroughputColumn,
+    count_records,
+    is_ndjson_archive,
+    is_ndjson_path,
+    iter_document_records,
+    iter_records,
+    open_archive,
+)
+from todopro_cli.services.data_transfer import (
+    ApiArchiveImporter,
+    ArchiveExporter,
+    ArchiveImporter,
+)
 from todopro_cli.utils.typer_helpers import SuggestingGroup
 from todopro_cli.utils.ui.console import get_console
 from todopro_cli.utils.ui.formatters import (
@@ -31,6 +54,35 @@ app = typer.Typer(cls=SuggestingGroup, help="Data management commands")
 console = get_console()
 
 
+def _record_progress(total: int | None = None) -> Progress:
+    """Progress display showing record counts and throughput."""
+    columns = [TextColumn("[progress.description]{task.description}")]
+    if total:
+        columns += [BarColumn(), MofNCompleteColumn()]
+    else:
+        columns.append(TextColumn("{task.completed:,} records"))
+    columns += [ThroughputColumn(), TimeElapsedColumn()]
+    return Progress(*columns, console=console, transient=True)
+
+
+def _print_export_summary(stats: dict, encryption_enabled: bool) -> None:
+    """Print the export summary table."""
+    table = Table(title="Export Summary", show_header=True)
+    table.add_column("Type", style="cyan")
+    table.add_column("Count", justify="right", style="green")
+
+    table.add_row("Tasks", str(stats.get("tasks_count", 0)))
+    table.add_row("Projects", str(stats.get("projects_count", 0)))
+    table.add_row("Labels", str(stats.get("labels_count", 0)))
+    table.add_row("Contexts", str(stats.get("contexts_count", 0)))
+
+    console.print(table)
+
+    # Show encryption status
+    if encryption_enabled:
+        format_info("🔐 Data includes encrypted fields")
+
+
 @app.command("export")
 @command_wrapper
 def export_data(
@@ -46,15 +98,68 @@ def export_data(
         "-z",
         help="Compress output with gzip",
     ),
+    export_format: str | None = typer.Option(
+        None,
+        "--format",
+        "-f",
+        help="Archive format: json or ndjson (default: from file name, else json)",
+    ),
+    compression: str | None = typer.Option(
+        None,
+        "--compression",
+        help="Compression for ndjson archives: gzip or zstd",
+    ),
 ) -> None:
     """
     Export all your data (tasks, projects, labels, contexts) to JSON.
 
+    The ndjson format streams records straight from storage to disk, so
+    exports of any size run in constant memory.
+
     Examples:
         todopro data export
         todopro data export --output backup.json
         todopro data export --compress
+        todopro data export --format ndjson --compression zstd
     """
+    if compression is not None and compression not in COMPRESSIONS:
+        format_error(f"Unknown compression: {compression} (use gzip or zstd)")
+        raise typer.Exit(2)
+    if compress and compression is None:
+        compression = "gzip"
+
+    if export_format is None:
+        export_format = "ndjson" if output and is_ndjson_path(Path(output)) else "json"
+    if export_format not in ("json", "ndjson"):
+        format_error(f"Unknown format: {export_format} (use json or ndjson)")
+        raise typer.Exit(2)
+
+    async def do_export_ndjson(output_path: Path) -> None:
+        config_svc = get_config_service()
+        e2ee_enabled = (
+            config_svc.config.e2ee.enabled if config_svc.config.e2ee else False
+        )
+        exporter = ArchiveExporter(get_storage_strategy_context())
+
+        format_info("Exporting your data...")
+        with (
+            ArchiveWriter(open_archive(output_path, "w", compression)) as writer,
+            _record_progress() as progress,
+        ):
+            writer.write_header(encryption_enabled=e2ee_enabled)
+            task_id = progress.add_task("Exporting", total=None)
+            await exporter.export(
+                writer,
+                config_svc.config.contexts,
+                on_record=lambda: progress.advance(task_id),
+            )
+            elapsed = progress.tasks[task_id].elapsed or 0.0
+
+        total = sum(writer.counts.values())
+        _print_export_summary(writer.stats, e2ee_enabled)
+        if elapsed > 0:
+            format_info(f"{total:,} records in {elapsed:.1f}s ({total / elapsed:,.0f}/s)")
+        format_success(f"✓ Data exported to: {output_path.absolute()}")
 
     async def do_export() -> None:
         # Detect context type
@@ -119,14 +224,6 @@ def export_data(
             response = await client.request("GET", "/api/export/data", params=params)
             await client.close()
 
-        # Determine output filename
-        if output is None:
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-            extension = ".json.gz" if compress else ".json"
-            filename = f"todopro-export-{timestamp}{extension}"
-        else:
-            filename = output
-
         # Write to file
         output_path = Path(filename)
 
@@ -146,49 +243,69 @@ def export_data(
 
         # Show stats
         if isinstance(response, dict):
-            stats = response.get("stats", {})
+            _print_export_summary(
+                response.get("stats", {}),
+                response.get("encryption", {}).get("enabled", False),
+            )
 
-            table = Table(title="Export Summary", show_header=True)
-            table.add_column("Type", style="cyan")
-            table.add_column("Count", justify="right", style="green")
+        format_success(f"✓ Data exported to: {output_path.absolute()}")
 
-            table.add_row("Tasks", str(stats.get("tasks_count", 0)))
-            table.add_row("Projects", str(stats.get("projects_count", 0)))
-            table.add_row("Labels", str(stats.get("labels_count", 0)))
-            table.add_row("Contexts", str(stats.get("contexts_count", 0)))
+    # Determine output filename
+    if output is None:
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        extension = ".ndjson" if export_format == "ndjson" else ".json"
+        extension += {"gzip": ".gz", "zstd": ".zst", None: ""}[compression]
+        filename = f"todopro-export-{timestamp}{extension}"
+    else:
+        filename = output
 
-            console.print(table)
+    if export_format == "ndjson":
+        asyncio.run(do_export_ndjson(Path(filename)))
+    else:
+        asyncio.run(do_export())
 
-            # Show encryption status
-            encryption = response.get("encryption", {})
-            if encryption.get("enabled"):
-                format_info("🔐 Data includes encrypted fields")
 
-        format_success(f"✓ Data exported to: {output_path.absolute()}")
+def _print_import_preview(counts: dict) -> None:
+    """Print the import preview table."""
+    table = Table(title="Import Preview", show_header=True)
+    table.add_column("Type", style="cyan")
+    table.add_column("Count", justify="right", style="yellow")
+
+    table.add_row("Tasks", str(counts.get("tasks_count", 0)))
+    table.add_row("Projects", str(counts.get("projects_count", 0)))
+    table.add_row("Labels", str(counts.get("labels_count", 0)))
+    table.add_row("Contexts", str(counts.get("contexts_count", 0)))
 
-    asyncio.run(do_export())
+    console.print(table)
 
 
 @app.command("import")
 @command_wrapper
 def import_data(
-    file: str = typer.Argument(..., help="JSON file to import"),
+    file: str = typer.Argument(..., help="JSON or NDJSON archive to import"),
     yes: bool = typer.Option(
         False,
         "--yes",
         "-y",
         help="Skip confirmation prompt",
     ),
+    parallel_parse: bool = typer.Option(
+        False,
+        "--parallel-parse",
+        help="Parse NDJSON archives on all CPU cores (for very large files)",
+    ),
 ) -> None:
     """
     Import data from JSON file (exported via 'export' command).
 
     This will merge imported data with your existing data.
     Existing items with the same name will be skipped.
+    NDJSON archives (optionally .gz or .zst) are streamed record by record.
 
     Examples:
         todopro data import backup.json
         todopro data import backup.json --yes
+        todopro data import backup.ndjson.zst --parallel-parse
     """
 
     file_path = Path(file)
@@ -198,46 +315,47 @@ def import_data(
         format_error(f"File not found: {file}")
         raise typer.Exit(5)  # Exit code 5: Resource not found
 
-    # Read and parse file
+    data = None
     try:
-        if file_path.suffix == ".gz":
-            with gzip.open(file_path, "rt") as f:
-                data = json.load(f)
-        else:
-            with file_path.open(encoding="utf-8") as f:
-                data = json.load(f)
-    except json.JSONDecodeError as e:
-        format_error(f"Invalid JSON file: {str(e)}")
-        raise typer.Exit(2) from e  # Exit code 2: Invalid arguments
-    except Exception as e:
-        format_error(f"Failed to read file: {str(e)}")
-        raise typer.Exit(1) from e
-
-    # Show preview
-    stats = data.get("stats", {})
-
-    table = Table(title="Import Preview", show_header=True)
-    table.add_column("Type", style="cyan")
-    table.add_column("Count", justify="right", style="yellow")
+        streaming = is_ndjson_archive(file_path)
+    except Exception:
+        streaming = False
 
-    table.add_row(
-        "Tasks",
-        str(stats.get("tasks_count", len(data.get("data", {}).get("tasks", [])))),
-    )
-    table.add_row(
-        "Projects",
-        str(stats.get("projects_count", len(data.get("data", {}).get("projects", [])))),
-    )
-    table.add_row(
-        "Labels",
-        str(stats.get("labels_count", len(data.get("data", {}).get("labels", [])))),
-    )
-    table.add_row(
-        "Contexts",
-        str(stats.get("contexts_count", len(data.get("data", {}).get("contexts", [])))),
-    )
-
-    console.print(table)
+    if streaming:
+        # Count records without parsing them, for the preview
+        try:
+            counts = count_records(file_path)
+        except Exception as e:
+            format_error(f"Failed to read file: {str(e)}")
+            raise typer.Exit(1) from e
+        _print_import_preview({f"{k}s_count": v for k, v in counts.items()})
+        total_records = sum(counts.values())
+    else:
+        # Read and parse file
+        try:
+            if file_path.suffix == ".gz":
+                with gzip.open(file_path, "rt") as f:
+                    data = json.load(f)
+            else:
+                with file_path.open(encoding="utf-8") as f:
+                    data = json.load(f)
+        except json.JSONDecodeError as e:
+            format_error(f"Invalid JSON file: {str(e)}")
+            raise typer.Exit(2) from e  # Exit code 2: Invalid arguments
+        except Exception as e:
+            format_error(f"Failed to read file: {str(e)}")
+            raise typer.Exit(1) from e
+
+        # Show preview
+        stats = data.get("stats", {})
+        payload = data.get("data", {})
+        _print_import_preview(
+            {
+                f"{kind}_count": stats.get(f"{kind}_count", len(payload.get(kind, [])))
+                for kind in ("tasks", "projects", "labels", "contexts")
+            }
+        )
+        total_records = None
 
     format_info("Note: Existing items with the same name will be skipped")
 
@@ -246,6 +364,16 @@ def import_data(
         format_info("Import cancelled")
         raise typer.Exit(0)
 
+    async def feed(importer, records) -> None:
+        """Stream records into an importer, showing throughput."""
+        with _record_progress(total_records) as progress:
+            task_id = progress.add_task("Importing", total=total_records)
+            for record_type, record in records:
+                await importer.import_record(record_type, record)
+                if record_type not in ("header", "stats"):
+                    progress.advance(task_id)
+            await importer.flush()
+
     async def do_import() -> None:
         # Detect context type
         config_svc = get_config_service()
@@ -258,146 +386,28 @@ def import_data(
 
         format_info("Importing data...")
 
+        if streaming:
+            records = iter_records(file_path, parallel=parallel_parse)
+        else:
+            records = iter_document_records(data)
+
         # Import to local SQLite or remote API
         if is_local:
-            # Local import - write to SQLite repositories
+            # Local import - bulk writes, all in one transaction
             storage_strategy_context = get_storage_strategy_context()
-
-            # Track import results
-            summary = {
-                "projects": "0 created, 0 skipped",
-                "labels": "0 created, 0 skipped",
-                "contexts": "0 created, 0 skipped",
-                "tasks": "0 created, 0 skipped",
-            }
-            details = {
-                "projects": {"errors": []},
-                "labels": {"errors": []},
-                "tasks": {"errors": []},
-            }
-
-            import_data_payload = data.get("data", {})
-
-            # Import projects first (tasks may reference them)
-            projects_created = 0
-            projects_skipped = 0
-            for project_data in import_data_payload.get("projects", []):
-                try:
-                    # Check if project already exists by name
-                    existing = (
-                        await storage_strategy_context.project_repository.list_all(
-                            ProjectFilters(search=project_data.get("name"))
-                        )
-                    )
-                    # Filter by exact name match (search is substring search)
-                    if any(p.name == project_data.get("name") for p in existing):
-                        projects_skipped += 1
-                        continue
-
-                    # Create project (excluding id to let DB generate new one)
-                    from todopro_cli.models import ProjectCreate
-
-                    project_create = ProjectCreate(
-                        name=project_data["name"],
-                        description=project_data.get("description"),
-                        color=project_data.get("color"),
-                        archived=project_data.get("archived", False),
-                    )
-                    await storage_strategy_context.project_repository.create(
-                        project_create
-                    )
-                    projects_created += 1
-                except Exception as e:
-                    details["projects"]["errors"].append(
-                        f"{project_data.get('name', 'Unknown')}: {str(e)}"
-                    )
-
-            summary["projects"] = (
-                f"{projects_created} created, {projects_skipped} skipped"
-            )
-
-            # Import labels
-            labels_created = 0
-            labels_skipped = 0
-            for label_data in import_data_payload.get("labels", []):
-                try:
-                    # Check if label already exists by name
-                    existing = (
-                        await storage_strategy_context.label_repository.list_all()
-                    )
-                    if any(lbl.name == label_data.get("name") for lbl in existing):
-                        labels_skipped += 1
-                        continue
-
-                    # Create label
-                    from todopro_cli.models import LabelCreate
-
-                    label_create = LabelCreate(
-                        name=label_data["name"],
-                        color=label_data.get("color"),
-                    )
-                    await storage_strategy_context.label_repository.create(label_create)
-                    labels_created += 1
-                except Exception as e:
-                    details["labels"]["errors"].append(
-                        f"{label_data.get('name', 'Unknown')}: {str(e)}"
-                    )
-
-            summary["labels"] = f"{labels_created} created, {labels_skipped} skipped"
-
-            # Import tasks
-            tasks_created = 0
-            tasks_skipped = 0
-            for task_data in import_data_payload.get("tasks", []):
-                try:
-                    # Check if task already exists by content
-                    existing = await storage_strategy_context.task_repository.list_all(
-                        TaskFilters(search=task_data.get("content"))
-                    )
-                    # Skip if exact content match found
-                    if any(t.content == task_data.get("content") for t in existing):
-                        tasks_skipped += 1
-                        continue
-
-                    # Create task (map project name to ID if present)
-                    from todopro_cli.models import TaskCreate
-
-                    project_id = None
-                    if task_data.get("project_name"):
-                        projects = (
-                            await storage_strategy_context.project_repository.list_all(
-                                ProjectFilters(search=task_data["project_name"])
-                            )
-                        )
-                        # Filter by exact name match (search is substring search)
-                        matching = [p for p in projects if p.name == task_data["project_name"]]
-                        if matching:
-                            project_id = matching[0].id
-
-                    task_create = TaskCreate(
-                        content=task_data["content"],
-                        description=task_data.get("description"),
-                        priority=task_data.get("priority", 4),
-                        project_id=project_id,
-                        label_ids=task_data.get("label_ids", []),
-                    )
-                    await storage_strategy_context.task_repository.add(task_create)
-                    tasks_created += 1
-                except Exception as e:
-                    details["tasks"]["errors"].append(
-                        f"{task_data.get('content', 'Unknown')[:30]}: {str(e)}"
-                    )
-
-            summary["tasks"] = f"{tasks_created} created, {tasks_skipped} skipped"
-
-            # Contexts are handled by ConfigService (not in DB)
-            summary["contexts"] = "N/A (contexts not imported to local)"
-
-            # Build response matching remote API format
-            response = {
-                "summary": summary,
-                "details": details,
-            }
+            importer = ArchiveImporter(storage_strategy_context)
+            async with storage_strategy_context.transaction():
+                await feed(importer, records)
+            response = importer.result()
+        elif streaming:
+            # Remote import - upload the archive in chunks
+            client = get_client()
+            importer = ApiArchiveImporter(client)
+            try:
+                await feed(importer, records)
+            finally:
+                await client.close()
+            response = importer.result()
         else:
             # Remote import - call API
             client = get_client()
@@ -421,18 +431,21 @@ def import_data(
 
             # Show errors if any
             details = response.get("details", {})
-            total_errors = sum(len(d.get("errors", [])) for d in details.values())
+            total_errors = sum(
+                d.get("error_count", len(d.get("errors", []))) for d in details.values()
+            )
 
             if total_errors > 0:
                 format_warning(f"⚠ {total_errors} error(s) occurred during import")
                 for resource_type, resource_details in details.items():
                     errors = resource_details.get("errors", [])
+                    error_count = resource_details.get("error_count", len(errors))
                     if errors:
                         format_error(f"\n{resource_type.capitalize()} errors:")
                         for error in errors[:5]:  # Show first 5 errors
                             console.print(f"  - {error}")
-                        if len(errors) > 5:
-                            console.print(f"  ... and {len(errors) - 5} more")
+                        if error_count > 5:
+                            console.print(f"  ... and {error_count - 5} more")
 
             format_success("✓ Import completed")
 
@@ -8,6 +8,7 @@ import typer
 
 from todopro_cli.services.auth_service import AuthService
 from todopro_cli.services.config_service import get_config_service
+from todopro_cli.utils import deferred, metrics, profiler
 from todopro_cli.utils.ui.formatters import format_error
 
 
@@ -35,6 +36,15 @@ def _require_auth() -> None:
         raise typer.Exit(1)
 
 
+async def _run_and_drain(func: Callable, *args, **kwargs):
+    """Await a command coroutine, then finish any deferred background work."""
+    try:
+        return await func(*args, **kwargs)
+    finally:
+        with profiler.span("deferred.drain", "command"):
+            await deferred.drain()
+
+
 class AppError(Exception):
     """Custom application error with exit code."""
 
@@ -50,14 +60,20 @@ def command_wrapper(_func: Callable | None = None, *, auth_required: bool = True
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
-                # 1. Handle Auth
-                if auth_required:
-                    _require_auth()
-
-                # 2. Run Sync or Async
-                if asyncio.iscoroutinefunction(func):
-                    return asyncio.run(func(*args, **kwargs))
-                return func(*args, **kwargs)
+                with (
+                    profiler.span(f"command {func.__name__}", "command"),
+                    metrics.timed(
+                        "todopro_command_duration_seconds", command=func.__name__
+                    ),
+                ):
+                    # 1. Handle Auth
+                    if auth_required:
+                        _require_auth()
+
+                    # 2. Run Sync or Async
+                    if asyncio.iscoroutinefunction(func):
+                        return asyncio.run(_run_and_drain(func, *args, **kwargs))
+                    return func(*args, **kwargs)
 
             except AppError as e:
                 format_error(str(e))
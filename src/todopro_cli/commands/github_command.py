@@ -7,8 +7,16 @@ import httpx
 import typer
 from rich.table import Table
 
-from todopro_cli.services.api.client import get_client
-from todopro_cli.services.api.tasks import TasksAPI
+from todopro_cli.services.config_service import (
+    get_config_service,
+    get_storage_strategy_context,
+)
+from todopro_cli.services.github import (
+    GitHubClient,
+    GitHubSyncEngine,
+    GitHubSyncStore,
+    priority_from_labels,
+)
 from todopro_cli.utils.typer_helpers import SuggestingGroup
 from todopro_cli.utils.ui.console import get_console
 
@@ -16,41 +24,15 @@ app = typer.Typer(cls=SuggestingGroup, help="GitHub integration commands")
 console = get_console()
 
 
-def _get_priority_from_labels(labels: list[dict]) -> int:
-    """Map GitHub issue labels to TodoPro priority (1-4)."""
-    label_names = {lbl.get("name", "").lower() for lbl in labels}
-    if "bug" in label_names:
-        return 4
-    if "enhancement" in label_names or "feature" in label_names:
-        return 2
-    if "docs" in label_names or "documentation" in label_names:
-        return 1
-    return 1
-
-
 async def _fetch_issues(
     repo: str,
     token: str,
     state: str,
     limit: int,
 ) -> list[dict]:
-    """Fetch issues from GitHub API."""
-    url = f"https://api.github.com/repos/{repo}/issues"
-    headers = {
-        "Authorization": f"token {token}",
-        "User-Agent": "todopro-cli",
-    }
-    params = {"state": state, "per_page": limit}
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, params=params)
-        if response.status_code == 401:
-            console.print("[red]Error: Invalid GitHub token[/red]")
-            raise typer.Exit(1)
-        if response.status_code == 404:
-            console.print(f"[red]Error: Repository not found: {repo}[/red]")
-            raise typer.Exit(1)
-        response.raise_for_status()
-        return response.json()
+    """Fetch issues from GitHub API, following pagination up to *limit*."""
+    batch = await GitHubClient(token).fetch_issues(repo, state=state, limit=limit)
+    return batch.issues
 
 
 @app.command("import")
@@ -65,9 +47,17 @@ def import_issues(
         "github", "--label", help="Label to apply to imported tasks"
     ),
     _profile: str = typer.Option("default", "--_profile", help="TodoPro _profile to use"),
+    full: bool = typer.Option(
+        False, "--full", help="Re-list all issues instead of only those changed since the last sync"
+    ),
     dry_run: bool = typer.Option(False, "--dry-run", help="Preview without importing"),
 ) -> None:
-    """Import GitHub Issues as TodoPro tasks."""
+    """Import GitHub Issues as TodoPro tasks.
+
+    Re-running the import syncs incrementally: only issues updated since the
+    previous run are fetched, already imported issues update their tasks
+    instead of creating duplicates, and closed issues complete them.
+    """
     # Resolve token
     gh_token = token or os.environ.get("GITHUB_TOKEN")
     if not gh_token:
@@ -76,63 +66,70 @@ def import_issues(
         )
         raise typer.Exit(1)
 
-    try:
-        issues = asyncio.run(_fetch_issues(repo, gh_token, state, limit))
-    except typer.Exit:
-        raise
-    except httpx.ConnectError:
-        console.print("[red]Error: Cannot connect to GitHub API[/red]")
-        raise typer.Exit(1) from None
-    except Exception as exc:
-        console.print(f"[red]Error: {exc}[/red]")
-        raise typer.Exit(1) from exc
-
-    # Filter out pull requests
-    issues = [i for i in issues if i.get("pull_request") is None]
-
-    if not issues:
-        console.print(f"No {state} issues found in {repo}")
-        return
-
     if dry_run:
+        try:
+            issues = asyncio.run(_fetch_issues(repo, gh_token, state, limit))
+        except httpx.ConnectError:
+            console.print("[red]Error: Cannot connect to GitHub API[/red]")
+            raise typer.Exit(1) from None
+        except Exception as exc:
+            console.print(f"[red]Error: {exc}[/red]")
+            raise typer.Exit(1) from exc
+
+        # Filter out pull requests
+        issues = [i for i in issues if i.get("pull_request") is None]
+        if not issues:
+            console.print(f"No {state} issues found in {repo}")
+            return
+
         table = Table(title=f"Issues to import from {repo} (dry run)")
         table.add_column("#", style="cyan")
         table.add_column("Title")
         table.add_column("Priority", style="yellow")
         for issue in issues:
-            priority = _get_priority_from_labels(issue.get("labels", []))
+            priority = priority_from_labels(issue.get("labels", []))
             table.add_row(str(issue["number"]), issue["title"], str(priority))
         console.print(table)
         return
 
     async def _do_import():
-        client = get_client()
-        tasks_api = TasksAPI(client)
-        count = 0
+        config_service = get_config_service()
+        context = config_service.get_current_context()
+        store = GitHubSyncStore(config_service.get_github_sync_path(context.name))
         try:
-            for issue in issues:
-                priority = _get_priority_from_labels(issue.get("labels", []))
-                content = f"[GitHub #{issue['number']}] {issue['title']}"
-                description = (issue.get("body") or "")[:500]
-                await tasks_api.create_task(
-                    content,
-                    description=description,
-                    priority=priority,
-                )
-                count += 1
+            engine = GitHubSyncEngine(
+                GitHubClient(gh_token), get_storage_strategy_context(), store
+            )
+            return await engine.sync(repo, state=state, limit=limit, full=full)
         finally:
-            await client.close()
-        return count
+            store.close()
 
     try:
-        count = asyncio.run(_do_import())
-        console.print(f"[green]✓ Imported {count} tasks from {repo}[/green]")
-    except typer.Exit:
-        raise
+        result = asyncio.run(_do_import())
+    except httpx.ConnectError:
+        console.print("[red]Error: Cannot connect to GitHub API[/red]")
+        raise typer.Exit(1) from None
     except Exception as exc:
         console.print(f"[red]Error: {exc}[/red]")
         raise typer.Exit(1) from exc
 
+    if result.not_modified:
+        console.print(f"No changes in {repo} since the last sync")
+        return
+    if not (result.created or result.updated or result.unchanged or result.errors):
+        console.print(f"No {state} issues found in {repo}")
+        return
+
+    console.print(
+        f"[green]✓ Imported {result.created} tasks from {repo}[/green] "
+        f"({result.updated} updated, {result.unchanged} unchanged)"
+    )
+    if result.has_errors:
+        console.print(f"[red]{len(result.errors)} error(s) occurred during sync:[/red]")
+        for err in result.errors[:10]:
+            console.print(f"  • {err}")
+        raise typer.Exit(1)
+
 
 @app.command("list-issues")
 def list_issues(
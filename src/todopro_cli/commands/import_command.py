@@ -65,6 +65,12 @@ async def import_todoist(
         "--dry-run",
         help="Fetch and count data without writing anything",
     ),
+    concurrency: int = typer.Option(
+        4,
+        "--concurrency",
+        help="Maximum concurrent Todoist requests when fetching tasks",
+        min=1,
+    ),
 ) -> None:
     """Import tasks, projects, and labels from Todoist using the v1 API.
 
@@ -89,6 +95,7 @@ async def import_todoist(
     options = TodoistImportOptions(
         project_name_prefix=project_prefix,
         max_tasks_per_project=max_tasks,
+        max_concurrent_fetches=concurrency,
         dry_run=dry_run,
     )
 
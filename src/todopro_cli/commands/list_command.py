@@ -1,23 +1,51 @@
 """List command - List resources (tasks, projects, labels, etc.)."""
 
+from collections.abc import AsyncIterator
+
 import typer
 
+from todopro_cli.repositories import TOTAL_ESTIMATE_CAP
 from todopro_cli.services.api.client import get_client
 from todopro_cli.services.api.filters import FiltersAPI
 from todopro_cli.services.api.tasks import TasksAPI
-from todopro_cli.services.cache_service import get_background_cache
+from todopro_cli.services.cache_service import (
+    get_background_cache,
+    get_list_cursor,
+    save_list_cursor,
+)
 from todopro_cli.services.label_service import get_label_service
 from todopro_cli.services.project_service import get_project_service
 from todopro_cli.services.task_service import get_task_service
 from todopro_cli.utils.typer_helpers import SuggestingGroup
 from todopro_cli.utils.ui.console import get_console
 from todopro_cli.utils.ui.formatters import format_output
+from todopro_cli.utils.ui.streaming import STREAM_FORMATS, stream_items
 
 from .decorators import command_wrapper
 
 app = typer.Typer(cls=SuggestingGroup, help="List resources")
 console = get_console()
 
+# Pretty listings longer than this are streamed instead of rendered at once
+STREAM_THRESHOLD = 1000
+
+
+def _is_listed(task, completing_tasks: set[str], recurring: bool) -> bool:
+    """Whether a fetched task belongs in the listing."""
+    # Hide tasks being completed in background
+    if completing_tasks and any(task.id.endswith(s) for s in completing_tasks):
+        return False
+    # Apply recurring filter client-side (API may not support it for all backends)
+    return not recurring or getattr(task, "is_recurring", False)
+
+
+async def _stream_rows(
+    tasks: AsyncIterator, completing_tasks: set[str], recurring: bool, json_mode: bool
+) -> AsyncIterator[dict]:
+    async for task in tasks:
+        if _is_listed(task, completing_tasks, recurring):
+            yield task.model_dump(mode="json") if json_mode else task.model_dump()
+
 
 @app.command("tasks")
 @command_wrapper
@@ -34,13 +62,28 @@ async def list_tasks(
     ),
     limit: int = typer.Option(30, "--limit", help="Limit results (default 30)"),
     offset: int = typer.Option(0, "--offset", help="Pagination offset"),
-    output: str = typer.Option("pretty", "--output", "-o", help="Output format"),
+    next_page: bool = typer.Option(
+        False, "--next-page", help="Show the page after the previous identical listing"
+    ),
+    cursor: str | None = typer.Option(
+        None, "--cursor", help="Continue from a next_cursor printed by --json output"
+    ),
+    output: str = typer.Option(
+        "pretty",
+        "--output",
+        "-o",
+        help="Output format (pretty, json, yaml, table, ndjson, csv, tsv)",
+    ),
     json_opt: bool = typer.Option(
         False, "--json", help="Output as JSON (alias for --output json)"
     ),
     compact: bool = typer.Option(False, "--compact", help="Compact output"),
 ) -> None:
-    """List tasks. Completed tasks are hidden by default; use --show-completed to include them."""
+    """List tasks. Completed tasks are hidden by default; use --show-completed to include them.
+
+    ndjson, csv and tsv output, and pretty output of more than 1000 tasks,
+    are streamed: tasks are printed as they are read.
+    """
     import sys
 
     if json_opt:
@@ -52,56 +95,72 @@ async def list_tasks(
 
     task_service = get_task_service()
 
-    # When using default limit, check total count first and warn if large
-    _BIG_TASK_THRESHOLD = 100
-    if limit <= _BIG_TASK_THRESHOLD:
-        # Quick count with a high limit to detect large sets
-        count_check = await task_service.list_tasks(
+    # The listing a saved --next-page cursor belongs to
+    listing = {
+        "status": status,
+        "project": project,
+        "priority": priority,
+        "search": search,
+        "limit": limit,
+    }
+    if next_page:
+        cursor = get_list_cursor(listing)
+        if cursor is None:
+            console.print("[yellow]No further page of this listing.[/yellow]")
+            return
+
+    # Filter out tasks being completed in background
+    cache = get_background_cache()
+    completing_tasks = set(cache.get_completing_tasks())
+
+    if output in STREAM_FORMATS or (output == "pretty" and limit > STREAM_THRESHOLD):
+        tasks = task_service.iter_tasks(
             status=status,
             project_id=project,
             priority=priority,
             search=search,
-            limit=_BIG_TASK_THRESHOLD + 1,
-            offset=0,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+        rows = _stream_rows(
+            tasks, completing_tasks, recurring, json_mode=output != "pretty"
         )
-        total = len(count_check)
-        if (
-            total > _BIG_TASK_THRESHOLD
-            and sys.stdin.isatty()
-            and output not in ("json",)
-        ):
-            console.print(
-                f"[yellow]Found {total}+ tasks. Showing first {limit}.[/yellow]"
-            )
-            console.print(
-                f"[dim]Use --limit {total} to show all, or --limit N for a different amount.[/dim]"
-            )
-
-    tasks = await task_service.list_tasks(
+        await stream_items(rows, output)
+        return
+
+    warn_if_more = sys.stdin.isatty() and output not in ("json",)
+    page = await task_service.list_task_page(
         status=status,
         project_id=project,
         priority=priority,
         search=search,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        with_total=warn_if_more,
     )
+    save_list_cursor(listing, page.next_cursor)
+    tasks = page.items
+
+    if page.has_more and warn_if_more:
+        if page.total_estimate is None:
+            found = f"Found {len(tasks)}+ tasks"
+        elif page.total_estimate >= TOTAL_ESTIMATE_CAP:
+            # Counting stopped at the cap
+            found = f"Found {TOTAL_ESTIMATE_CAP}+ tasks"
+        else:
+            found = f"Found {page.total_estimate} tasks"
+        console.print(f"[yellow]{found}. Showing {len(tasks)}.[/yellow]")
+        console.print(
+            "[dim]Use --next-page for the next page, or --limit N for a different amount.[/dim]"
+        )
 
-    # Filter out tasks being completed in background
-    cache = get_background_cache()
-    completing_tasks = set(cache.get_completing_tasks())
-
-    if completing_tasks:
-        tasks = [
-            task
-            for task in tasks
-            if not any(task.id.endswith(short_id) for short_id in completing_tasks)
-        ]
-
-    # Apply recurring filter client-side (API may not support it for all backends)
-    if recurring:
-        tasks = [t for t in tasks if getattr(t, "is_recurring", False)]
+    tasks = [t for t in tasks if _is_listed(t, completing_tasks, recurring)]
 
     result = {"tasks": [t.model_dump() for t in tasks]}
+    if output in ("json", "json-pretty", "yaml"):
+        result["next_cursor"] = page.next_cursor
     format_output(result, output, compact=compact)
 
 
@@ -0,0 +1,70 @@
+"""Performance metrics commands (show, serve)."""
+
+import os
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from todopro_cli.utils import metrics
+from todopro_cli.utils.typer_helpers import SuggestingGroup
+from todopro_cli.utils.ui.console import get_console
+from todopro_cli.utils.ui.formatters import format_error, format_info
+
+from .decorators import command_wrapper
+
+app = typer.Typer(cls=SuggestingGroup, help="Performance metrics")
+console = get_console()
+
+FILE_HELP = f"Metrics file (defaults to ${metrics.ENV_VAR})"
+
+
+def _metrics_path(file: Path | None) -> Path:
+    """The metrics file to read, from --file or the environment."""
+    path = file or os.environ.get(metrics.ENV_VAR)
+    if not path:
+        format_error(
+            f"No metrics file. Pass --file or set {metrics.ENV_VAR} "
+            "for the commands whose metrics you want to collect."
+        )
+        raise typer.Exit(1)
+    return Path(path).expanduser()
+
+
+@app.command("show")
+@command_wrapper(auth_required=False)
+def show_command(
+    file: Annotated[Path | None, typer.Option("--file", "-f", help=FILE_HELP)] = None,
+) -> None:
+    """Print the collected metrics in OpenMetrics text format.
+
+    Examples:
+        TODOPRO_METRICS_FILE=~/todopro.prom tp sync pull
+        tp metrics show --file ~/todopro.prom
+    """
+    path = _metrics_path(file)
+    typer.echo(metrics.render(metrics.load_state(path)), nl=False)
+
+
+@app.command("serve")
+@command_wrapper(auth_required=False)
+def serve_command(
+    file: Annotated[Path | None, typer.Option("--file", "-f", help=FILE_HELP)] = None,
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind"),
+    port: int = typer.Option(9464, "--port", "-p", help="Port to listen on"),
+) -> None:
+    """Serve the collected metrics over HTTP for Prometheus to scrape.
+
+    Examples:
+        tp metrics serve --file ~/todopro.prom --port 9464
+    """
+    path = _metrics_path(file)
+    server = metrics.make_server(path, host, port)
+    format_info(f"Serving {path} at http://{host}:{server.server_port}/metrics")
+    console.print("[dim]Press Ctrl+C to stop[/dim]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -25,6 +25,9 @@ async def list_projects(
         False, "--json", help="Output as JSON (alias for --output json)"
     ),
     compact: bool = typer.Option(False, "--compact", help="Compact output"),
+    stats: bool = typer.Option(
+        False, "--stats", help="Show task counts and completion for each project"
+    ),
 ) -> None:
     """List projects."""
     if json_opt:
@@ -38,6 +41,17 @@ async def list_projects(
 
     # Convert to dict format for formatters
     result = {"projects": [p.model_dump() for p in projects]}
+    if stats and projects:
+        # One batched lookup, however many projects are listed
+        all_stats = await project_service.get_projects_stats([p.id for p in projects])
+        for project in result["projects"]:
+            project_stats = all_stats.get(project["id"], {})
+            project.update(
+                tasks_active=project_stats.get("pending_tasks", 0),
+                tasks_done=project_stats.get("completed_tasks", 0),
+                completion_percentage=project_stats.get("completion_rate", 0),
+                overdue_count=project_stats.get("overdue_tasks", 0),
+            )
     format_output(result, output, compact=compact)
 
 
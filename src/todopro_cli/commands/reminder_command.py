@@ -0,0 +1,52 @@
+"""Command 'reminder' of todopro-cli — deliver reminders of local contexts."""
+
+import typer
+
+from todopro_cli.models import Reminder
+from todopro_cli.services.config_service import get_storage_strategy_context
+from todopro_cli.services.reminder_scheduler import ReminderScheduler
+from todopro_cli.utils.typer_helpers import SuggestingGroup
+from todopro_cli.utils.ui.console import get_console
+
+from .decorators import command_wrapper
+
+app = typer.Typer(cls=SuggestingGroup, help="Reminders — watch and deliver")
+console = get_console()
+
+
+@app.command("watch")
+@command_wrapper
+async def watch_command(
+    once: bool = typer.Option(
+        False, "--once", help="Deliver the reminders due now and exit"
+    ),
+) -> None:
+    """Deliver reminders as they fall due, until interrupted.
+
+    Only local contexts need this; the server sends reminders for remote ones.
+    """
+    storage = get_storage_strategy_context()
+    try:
+        repository = storage.reminder_repository
+    except NotImplementedError:
+        console.print(
+            "[yellow]Reminders are delivered by the server in remote contexts.[/yellow]"
+        )
+        raise typer.Exit(1) from None
+    task_repository = storage.task_repository
+
+    async def deliver(reminder: Reminder) -> None:
+        task = await task_repository.get(reminder.task_id)
+        at = reminder.reminder_date.astimezone()
+        console.print(f"\a🔔 [bold]{task.content}[/bold] [dim]{at:%a %H:%M}[/dim]")
+
+    scheduler = ReminderScheduler(repository, deliver)
+    if once:
+        await scheduler.load()
+        fired = await scheduler.fire_due()
+        if not fired:
+            console.print("[green]No reminders due.[/green]")
+        return
+
+    console.print("[dim]Watching reminders. Press Ctrl+C to stop.[/dim]")
+    await scheduler.run()
@@ -1,9 +1,21 @@
 """Task management commands."""
 
+from itertools import islice
+
 import typer
 
+from todopro_cli.models.storage_strategy import StorageStrategyContext
 from todopro_cli.services.cache_service import get_background_cache
-from todopro_cli.services.config_service import get_storage_strategy_context
+from todopro_cli.services.config_service import (
+    get_config_service,
+    get_storage_strategy_context,
+)
+from todopro_cli.services.context_fanout import (
+    TASK_SORT,
+    ContextFanout,
+    merge,
+    task_sort_key,
+)
 from todopro_cli.services.task_service import TaskService, get_task_service
 from todopro_cli.utils.task_helpers import resolve_task_id
 from todopro_cli.utils.typer_helpers import SuggestingGroup
@@ -13,6 +25,7 @@ from todopro_cli.utils.ui.formatters import (
     format_info,
     format_output,
     format_success,
+    format_warning,
 )
 from todopro_cli.utils.uuid_utils import resolve_project_uuid
 
@@ -31,6 +44,35 @@ app.add_typer(_link_app, name="link", help="Manage task dependencies")
 app.add_typer(_apply_app, name="apply", help="Apply saved filters")
 
 
+async def _list_all_contexts(
+    project: str | None, limit: int, offset: int, **filters
+) -> list[dict]:
+    """List tasks from every context, merged and tagged with their context."""
+
+    async def query(storage: StorageStrategyContext) -> list:
+        project_id = None
+        if project is not None:
+            try:
+                project_id = await resolve_project_uuid(
+                    project, storage.project_repository
+                )
+            except ValueError:
+                return []  # No such project in this context
+        # Every context may hold the whole merged page, taken in merge order
+        return await TaskService(storage.task_repository).list_tasks(
+            project_id=project_id, limit=offset + limit, sort=TASK_SORT, **filters
+        )
+
+    async with ContextFanout(get_config_service()) as fanout:
+        results = await fanout.gather(query)
+
+    for result in results:
+        if not result.ok:
+            format_warning(f"Skipped context '{result.context}': {result.error}")
+    merged = islice(merge(results, task_sort_key), offset, offset + limit)
+    return [{**task.model_dump(), "context": context} for context, task in merged]
+
+
 @app.command("list")
 @command_wrapper
 async def list_tasks(
@@ -50,6 +92,11 @@ async def list_tasks(
         False, "--json", help="Output as JSON (alias for --output json)"
     ),
     compact: bool = typer.Option(False, "--compact", help="Compact output"),
+    all_contexts: bool = typer.Option(
+        False,
+        "--all-contexts",
+        help="List tasks from every context at once, tagged with their context",
+    ),
 ) -> None:
     """List tasks. Completed tasks are hidden by default."""
     if json_opt:
@@ -58,6 +105,18 @@ async def list_tasks(
         status = "all" if show_completed else "active"
     # TODO: consider deprecated --status in favor of dedicated commands to view project tasks, etc.
 
+    if all_contexts:
+        rows = await _list_all_contexts(
+            project,
+            limit,
+            offset,
+            status=status,
+            priority=priority,
+            search=search,
+        )
+        format_output({"tasks": rows}, output, compact=compact)
+        return
+
     storage_strategy_context = get_storage_strategy_context()
     task_repo = storage_strategy_context.task_repository
     task_service = TaskService(task_repo)
@@ -345,17 +404,15 @@ async def skip_task(
     output: str = typer.Option("table", "--output", "-o", help="Output format"),
 ) -> None:
     """Skip the current instance of a recurring task."""
-    from todopro_cli.services.api.client import get_client
-    from todopro_cli.services.api.tasks import TasksAPI
-
-    client = get_client()
-    api = TasksAPI(client)
+    task_service = get_task_service()
+    resolved_id = await resolve_task_id(task_service, task_id)
     try:
-        result = await api.skip_task(task_id)
-        format_success(f"Skipped recurring task: {task_id}")
-        format_output(result, output)
-    finally:
-        await client.close()
+        task = await task_service.skip_task(resolved_id)
+    except ValueError as exc:
+        format_error(str(exc))
+        raise typer.Exit(1) from exc
+    format_success(f"Skipped recurring task: {task_id}")
+    format_output(task.model_dump(), output)
 
 
 # ---------- migrate ----------
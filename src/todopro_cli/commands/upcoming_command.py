@@ -0,0 +1,65 @@
+"""Command 'upcoming' of todopro-cli"""
+
+import json
+
+import typer
+
+from todopro_cli.services.task_service import get_task_service
+from todopro_cli.utils.ui.console import get_console
+from todopro_cli.utils.ui.formatters import render_task_item
+
+from .decorators import command_wrapper
+
+app = typer.Typer()
+console = get_console()
+
+
+@app.command("upcoming")
+@command_wrapper
+async def upcoming_command(
+    days: int = typer.Option(7, "--days", "-d", min=1, help="Days to look ahead"),
+    output: str = typer.Option("pretty", "--output", "-o", help="Output format"),
+    json_opt: bool = typer.Option(
+        False, "--json", help="Output as JSON (alias for --output json)"
+    ),
+) -> None:
+    """Show what is due in the next days, one entry per occurrence.
+
+    Recurring tasks are listed at every occurrence in the window.
+    """
+    if json_opt:
+        output = "json"
+
+    task_service = get_task_service()
+    occurrences = await task_service.list_upcoming(days)
+
+    if output == "json":
+        console.print(
+            json.dumps(
+                [
+                    {"occurs_at": at.isoformat(), "task": task.model_dump(mode="json")}
+                    for at, task in occurrences
+                ],
+                indent=2,
+            )
+        )
+        return
+
+    if not occurrences:
+        console.print(f"[green]Nothing due in the next {days} days.[/green]")
+        return
+
+    current_day = None
+    for at, task in occurrences:
+        if at.date() != current_day:
+            if current_day is not None:
+                console.print()
+            current_day = at.date()
+            console.print(f"[bold]{at:%a %d %b}[/bold]")
+        item = task.model_dump()
+        item.update(due_date=at, next_occurrence=None)
+        for line in render_task_item(item, indent="  "):
+            console.print(line)
+
+    console.print()
+    console.print(f"[bold]Summary:[/bold] {len(occurrences)} due in {days} days")
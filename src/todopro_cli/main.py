@@ -1,5 +1,7 @@
 """Main entry point for TodoPro CLI."""
 
+import os
+
 import typer
 
 # ── Resource command groups ───────────────────────────────────────────────────
@@ -21,8 +23,10 @@ from .commands.github_command import app as github_app
 from .commands.goals import app as goals_app
 from .commands.import_command import app as import_app
 from .commands.labels import app as labels_app
+from .commands.metrics_command import app as metrics_app
 from .commands.projects import app as projects_app
 from .commands.ramble_command import app as ramble_app
+from .commands.reminder_command import app as reminder_app
 from .commands.reopen_command import app as reopen_app
 from .commands.reschedule_command import app as reschedule_command_app
 from .commands.sections import app as sections_app
@@ -31,10 +35,12 @@ from .commands.sync import app as sync_app
 from .commands.tasks_command import app as tasks_app
 from .commands.template_command import app as template_app
 from .commands.today_command import app as today_command_app
+from .commands.upcoming_command import app as upcoming_command_app
 
 # ── General commands ──────────────────────────────────────────────────────────
 from .commands.update_command import app as update_command_app
 from .commands.version_command import app as version_command_app
+from .utils import metrics, profiler
 from .utils.typer_helpers import SuggestingGroup
 
 # Create main app
@@ -55,6 +61,9 @@ app.add_typer(complete_command_app, name="", help="Mark task(s) as completed")
 app.add_typer(reschedule_command_app, name="", help="Reschedule tasks to today")
 app.add_typer(edit_command_app, name="", help="Edit a task interactively or via flags")
 app.add_typer(today_command_app, name="", help="View today's tasks in interactive mode")
+app.add_typer(
+    upcoming_command_app, name="", help="View occurrences due in the next days"
+)
 app.add_typer(reopen_app, name="", help="Reopen a completed task")
 app.add_typer(ramble_app, name="ramble", help="Ramble — voice-to-tasks")
 
@@ -69,6 +78,7 @@ app.add_typer(labels_app, name="label", help="Label operations — list, create,
 app.add_typer(context_app, name="context", help="Context operations — list, use, …")
 app.add_typer(config_app, name="config", help="Configuration — view, get, set, reset")
 app.add_typer(focus_app, name="focus", help="Focus mode — Pomodoro timer")
+app.add_typer(reminder_app, name="reminder", help="Reminders — watch and deliver")
 app.add_typer(goals_app, name="goals", help="Focus goals and progress tracking")
 app.add_typer(stats_app, name="stats", help="Focus stats — today, week, month, …")
 app.add_typer(
@@ -78,6 +88,7 @@ app.add_typer(
     achievements_app, name="achievements", help="Achievements and gamification"
 )
 app.add_typer(sync_app, name="sync", help="Sync — push, pull, status")
+app.add_typer(metrics_app, name="metrics", help="Performance metrics — show, serve")
 app.add_typer(data_app, name="data", help="Data — export and import")
 app.add_typer(encryption_app, name="encryption", help="End-to-end encryption")
 app.add_typer(template_app, name="template", help="Task templates")
@@ -86,6 +97,26 @@ app.add_typer(import_app, name="import", help="Import data — Todoist, JSON, 
 app.add_typer(calendar_app, name="calendar", help="Google Calendar integration")
 
 
+@app.callback()
+def global_options(
+    ctx: typer.Context,
+    profile: bool = typer.Option(
+        False, "--profile", help="Print a timing breakdown of the run to stderr"
+    ),
+) -> None:
+    """Options that apply to every command."""
+    # TODOPRO_TRACE=<path> also writes a Chrome trace of the run to <path>
+    trace_path = os.environ.get("TODOPRO_TRACE")
+    if profile or trace_path:
+        profiler.enable(trace_path=trace_path or None, report=profile)
+        ctx.call_on_close(profiler.finish)
+    # TODOPRO_METRICS_FILE=<path>.prom accumulates performance metrics there
+    metrics_path = os.environ.get(metrics.ENV_VAR)
+    if metrics_path:
+        metrics.enable(metrics_path)
+        ctx.call_on_close(metrics.finish)
+
+
 def main():
     """Main entry point."""
     app()
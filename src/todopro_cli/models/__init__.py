@@ -12,10 +12,12 @@ from .core import (
     LabelCreate,
     LocationContext,
     LocationContextCreate,
+    Page,
     Project,
     ProjectCreate,
     ProjectFilters,
     ProjectUpdate,
+    Reminder,
     Section,
     SectionCreate,
     SectionFilters,
@@ -49,6 +51,10 @@ __all__ = [
     # Context/Location models
     "LocationContext",
     "LocationContextCreate",
+    # Reminder model
+    "Reminder",
+    # Pagination
+    "Page",
     # User model
     "User",
     # Config models
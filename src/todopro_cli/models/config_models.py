@@ -49,6 +49,8 @@ class CacheConfig(BaseModel):
 
     enabled: bool = Field(default=True)
     ttl: int = Field(default=300)
+    mirror: bool = Field(default=False)
+    mirror_ttl: int = Field(default=60)
 
 
 class SyncConfig(BaseModel):
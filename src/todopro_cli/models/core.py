@@ -183,6 +183,7 @@ class Task(BaseModel):
         is_recurring: Whether this is a recurring task
         recurrence_rule: iCalendar RRULE string (e.g., "FREQ=DAILY")
         recurrence_end: Optional date when recurrence stops
+        next_occurrence: Occurrence after the current one (recurring tasks)
         labels: List of label IDs associated with task
         contexts: List of context IDs associated with task
         created_at: Creation timestamp
@@ -202,6 +203,7 @@ class Task(BaseModel):
     is_recurring: bool = False
     recurrence_rule: str | None = None
     recurrence_end: datetime | None = None
+    next_occurrence: datetime | None = None
     labels: list[str] = Field(default_factory=list)
     contexts: list[str] = Field(default_factory=list)
     created_at: datetime
@@ -287,9 +289,11 @@ class TaskFilters(BaseModel):
         search: Full-text search query
         due_before: Tasks due before this date
         due_after: Tasks due after this date
+        updated_after: Tasks modified at or after this timestamp (delta sync)
         limit: Maximum number of results
         offset: Pagination offset
         sort: Sort field and direction (e.g., "due_date:asc", "priority:desc")
+        cursor: Opaque cursor from a previous Page, to continue after it
     """
 
     id_prefix: str | None = None
@@ -303,13 +307,35 @@ class TaskFilters(BaseModel):
     search: str | None = None
     due_before: datetime | None = None
     due_after: datetime | None = None
+    updated_after: datetime | None = None
     limit: int | None = Field(default=None, ge=1)
     offset: int | None = Field(default=None, ge=0)
     sort: str | None = None
+    cursor: str | None = None
+
+
+class Page[T](BaseModel):
+    """One page of a listing.
+
+    Attributes:
+        items: Items on this page
+        next_cursor: Opaque cursor for the following page (None on the last page)
+        has_more: Whether more items follow this page
+        total_estimate: Cheap (possibly capped) count of all matches, if requested
+    """
+
+    items: list[T]
+    next_cursor: str | None = None
+    has_more: bool = False
+    total_estimate: int | None = None
 
 
 class Reminder(BaseModel):
-    """Task reminder model."""
+    """Task reminder model.
+
+    Snoozing keeps the original reminder (``is_snoozed``, ``snoozed_until``)
+    and schedules a new one pointing back at it through ``snoozed_from_id``.
+    """
 
     id: str
     task_id: str
@@ -317,8 +343,10 @@ class Reminder(BaseModel):
     is_sent: bool = False
     sent_at: datetime | None = None
     is_snoozed: bool = False
+    snoozed_until: datetime | None = None
+    snoozed_from_id: str | None = None
     created_at: datetime
-    updated_at: datetime
+    updated_at: datetime | None = None
 
 
 class SavedFilter(BaseModel):
@@ -0,0 +1,44 @@
+"""Bulk construction of domain models from stored rows.
+
+Building models one at a time with ``Task(**row)`` pays pydantic's per-call
+overhead for every row: keyword packing, the round trip into pydantic-core
+and any extra columns the row carries. ``validate_many`` hands a whole page
+of rows to pydantic-core in a single call instead.
+
+Skipping validation altogether with ``model_construct`` was measured and
+rejected: in pydantic 2 it runs in Python and is slower than validating in
+pydantic-core, and it would also leave SQLite's 0/1 booleans and ISO
+strings unconverted. The rows are still fully validated, so a corrupt row
+fails loudly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+
+@cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def validate_many[M: BaseModel](
+    model: type[M], rows: Iterable[dict[str, Any]]
+) -> list[M]:
+    """Build a list of models from row dicts in one validation call.
+
+    Args:
+        model: Pydantic model class (e.g. Task, Project, Label)
+        rows: Field values per model, e.g. SQLite rows as dicts
+
+    Returns:
+        Model instances, in row order
+
+    Raises:
+        pydantic.ValidationError: If any row is invalid
+    """
+    return _list_adapter(model).validate_python(list(rows))
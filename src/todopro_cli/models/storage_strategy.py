@@ -8,17 +8,24 @@ at startup and injects it into services.
 
 from __future__ import annotations
 
+import sqlite3
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import TYPE_CHECKING
 
 from todopro_cli.repositories import (
     AchievementRepository,
     LabelRepository,
     LocationContextRepository,
     ProjectRepository,
+    ReminderRepository,
     SectionRepository,
     TaskRepository,
 )
 
+if TYPE_CHECKING:
+    from todopro_cli.services.api.client import APIClient
+
 
 class StorageStrategy(ABC):
     """
@@ -55,11 +62,32 @@ class StorageStrategy(ABC):
     def get_section_repository(self) -> SectionRepository:
         """Get section repository implementation for this strategy."""
 
+    def get_reminder_repository(self) -> ReminderRepository:
+        """Get reminder repository implementation for this strategy.
+
+        Only local storage delivers reminders itself; the server sends them
+        for remote contexts.
+        """
+        raise NotImplementedError(
+            f"Reminder repository not available for {self.storage_type} storage"
+        )
+
     @property
     @abstractmethod
     def storage_type(self) -> str:
         """Get storage type identifier (for logging/debugging)."""
 
+    def transaction(self) -> AbstractAsyncContextManager:
+        """Group bulk repository writes into one atomic unit (``async with``).
+
+        Backends without transactions (the REST API) return a no-op context.
+        """
+        return nullcontext()
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release resources the strategy was given to own (if any)."""
+
 
 class LocalStorageStrategy(StorageStrategy):
     """
@@ -69,14 +97,17 @@ class LocalStorageStrategy(StorageStrategy):
     This is instantiated once at startup if the active context is 'local'.
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, connection: sqlite3.Connection | None = None):
         """
         Initialize local strategy.
 
         Args:
             db_path: Path to SQLite database file
+            connection: Dedicated connection to the database, closed by close()
+                (defaults to the shared vault connection)
         """
         self.db_path = db_path
+        self._connection = connection
 
         # Import here to avoid circular dependencies
         from todopro_cli.adapters.sqlite.context_repository import (
@@ -86,15 +117,29 @@ class LocalStorageStrategy(StorageStrategy):
         from todopro_cli.adapters.sqlite.project_repository import (
             SqliteProjectRepository,
         )
+        from todopro_cli.adapters.sqlite.reminder_repository import (
+            SqliteReminderRepository,
+        )
         from todopro_cli.adapters.sqlite.task_repository import (
             SqliteTaskRepository,  # pylint: disable
         )
 
         # Instantiate all repositories once
-        self._task_repo = SqliteTaskRepository(db_path=db_path)
-        self._project_repo = SqliteProjectRepository(db_path=db_path)
-        self._label_repo = SqliteLabelRepository(db_path=db_path)
-        self._location_context_repo = SqliteLocationContextRepository(db_path=db_path)
+        self._task_repo = SqliteTaskRepository(
+            db_path=db_path, connection=connection
+        )
+        self._project_repo = SqliteProjectRepository(
+            db_path=db_path, connection=connection
+        )
+        self._label_repo = SqliteLabelRepository(
+            db_path=db_path, connection=connection
+        )
+        self._location_context_repo = SqliteLocationContextRepository(
+            db_path=db_path, connection=connection
+        )
+        self._reminder_repo = SqliteReminderRepository(
+            db_path=db_path, connection=connection
+        )
 
     def get_task_repository(self) -> TaskRepository:
         return self._task_repo
@@ -108,6 +153,9 @@ class LocalStorageStrategy(StorageStrategy):
     def get_location_context_repository(self) -> LocationContextRepository:
         return self._location_context_repo
 
+    def get_reminder_repository(self) -> ReminderRepository:
+        return self._reminder_repo
+
     def get_achievement_repository(self) -> AchievementRepository:
         raise NotImplementedError("Achievement repository not yet implemented for local storage")
 
@@ -118,6 +166,16 @@ class LocalStorageStrategy(StorageStrategy):
     def storage_type(self) -> str:
         return "local"
 
+    def transaction(self) -> AbstractAsyncContextManager:
+        from todopro_cli.adapters.sqlite.worker import transaction
+
+        return transaction(self._task_repo.connection)
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
 
 class RemoteStorageStrategy(StorageStrategy):
     """
@@ -127,10 +185,13 @@ class RemoteStorageStrategy(StorageStrategy):
     This is instantiated once at startup if the active context is 'remote'.
     """
 
-    def __init__(self):
+    def __init__(self, client: APIClient | None = None):
         """
         Initialize remote strategy.
 
+        Args:
+            client: Dedicated API client, closed by close() (defaults to one
+                client per repository for the current context)
         """
 
         from todopro_cli.adapters.rest_api import (
@@ -141,11 +202,12 @@ class RemoteStorageStrategy(StorageStrategy):
             RestApiTaskRepository,
         )  # type: ignore
 
-        self._task_repo = RestApiTaskRepository()
-        self._project_repo = RestApiProjectRepository()
-        self._label_repo = RestApiLabelRepository()
-        self._location_context_repo = RestApiLocationContextRepository()
-        self._section_repo = RestApiSectionRepository()
+        self._client = client
+        self._task_repo = RestApiTaskRepository(client)
+        self._project_repo = RestApiProjectRepository(client)
+        self._label_repo = RestApiLabelRepository(client)
+        self._location_context_repo = RestApiLocationContextRepository(client)
+        self._section_repo = RestApiSectionRepository(client)
 
     def get_task_repository(self) -> TaskRepository:
         return self._task_repo
@@ -169,6 +231,51 @@ class RemoteStorageStrategy(StorageStrategy):
     def storage_type(self) -> str:
         return "remote"
 
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+
+
+class MirroredStorageStrategy(RemoteStorageStrategy):
+    """
+    Remote API storage strategy served through a local SQLite mirror.
+
+    Tasks, projects and labels are read from the mirror and revalidated in the
+    background once it is older than ``max_age``; writes go through to the API.
+    Location contexts and sections use the REST repositories directly.
+    """
+
+    def __init__(
+        self, mirror_path: str, max_age: float, client: APIClient | None = None
+    ):
+        """
+        Initialize mirrored strategy.
+
+        Args:
+            mirror_path: Path to the mirror database file
+            max_age: Seconds a mirror is served without revalidation
+            client: Dedicated API client, closed by close()
+        """
+        super().__init__(client)
+
+        from todopro_cli.adapters.mirror import (
+            MirroredLabelRepository,
+            MirroredProjectRepository,
+            MirroredTaskRepository,
+            MirrorRevalidator,
+            MirrorStore,
+        )
+
+        store = MirrorStore(mirror_path)
+        revalidator = MirrorRevalidator(
+            store, self._task_repo, self._project_repo, self._label_repo, max_age
+        )
+        self._task_repo = MirroredTaskRepository(self._task_repo, store, revalidator)
+        self._project_repo = MirroredProjectRepository(
+            self._project_repo, store, revalidator
+        )
+        self._label_repo = MirroredLabelRepository(self._label_repo, store, revalidator)
+
 
 class StorageStrategyContext:
     """
@@ -221,6 +328,11 @@ class StorageStrategyContext:
         """Get context repository from current strategy."""
         return self._strategy.get_location_context_repository()
 
+    @property
+    def reminder_repository(self) -> ReminderRepository:
+        """Get reminder repository from current strategy."""
+        return self._strategy.get_reminder_repository()
+
     @property
     def achievement_repository(self) -> LocationContextRepository:
         """Get achievement repository (same as context repository for now)."""
@@ -236,6 +348,10 @@ class StorageStrategyContext:
         """Get storage type (for logging/debugging only)."""
         return self._strategy.storage_type
 
+    def transaction(self) -> AbstractAsyncContextManager:
+        """Group bulk repository writes into one atomic unit (if supported)."""
+        return self._strategy.transaction()
+
     @property
     def strategy(self) -> StorageStrategy:
         """Get underlying strategy (for advanced use cases)."""
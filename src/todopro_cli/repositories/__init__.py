@@ -9,19 +9,29 @@ Implementations (Adapters) are in:
 """
 
 from .repository import (
+    DEFAULT_PAGE_SIZE,
+    TOTAL_ESTIMATE_CAP,
     AchievementRepository,
     LabelRepository,
     LocationContextRepository,
     ProjectRepository,
+    ReminderRepository,
     SectionRepository,
     TaskRepository,
+    decode_cursor,
+    encode_cursor,
 )
 
 __all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "TOTAL_ESTIMATE_CAP",
+    "encode_cursor",
+    "decode_cursor",
     "TaskRepository",
     "ProjectRepository",
     "LabelRepository",
     "LocationContextRepository",
     "AchievementRepository",
     "SectionRepository",
+    "ReminderRepository",
 ]
@@ -9,15 +9,23 @@ to remain independent of the underlying storage mechanism (local SQLite, remote
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
 
 from todopro_cli.models import (
     Label,
     LabelCreate,
+    Page,
     Project,
     ProjectCreate,
     ProjectFilters,
     ProjectUpdate,
+    Reminder,
     Section,
     SectionCreate,
     SectionUpdate,
@@ -29,6 +37,34 @@ from todopro_cli.models import (
 from todopro_cli.models.core import LocationContext, LocationContextCreate
 from todopro_cli.models.focus.achievements import Achievement, AchievementCreate
 
+# Default number of rows fetched per page by iter_all()
+DEFAULT_PAGE_SIZE = 200
+
+# Adapters may stop counting a page's total_estimate here
+TOTAL_ESTIMATE_CAP = 10_000
+
+
+def encode_cursor(state: dict[str, Any]) -> str:
+    """Encode adapter-specific pagination state as an opaque cursor string."""
+    raw = json.dumps(state, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """Decode a cursor produced by encode_cursor().
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        state = json.loads(raw)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid page cursor") from e
+    if not isinstance(state, dict):
+        raise ValueError("Invalid page cursor")
+    return state
+
 
 class TaskRepository(ABC):
     """Abstract base class for task persistence operations.
@@ -54,6 +90,85 @@ class TaskRepository(ABC):
             "TaskRepository.list_all() must be implemented by adapter"
         )
 
+    async def iter_all(
+        self, filters: TaskFilters, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[Task]:
+        """Stream tasks matching the filters, one page at a time.
+
+        Tasks are yielded as each page arrives, so callers can process
+        arbitrarily large result sets in constant memory. ``filters.limit``
+        caps the total number of tasks yielded; ``filters.offset`` and
+        ``filters.sort`` are ignored, since each adapter picks the ordering
+        its pagination is stable under.
+
+        The default implementation pages through list_all() by offset;
+        adapters override it with native cursor or keyset pagination.
+
+        Args:
+            filters: TaskFilters object specifying filter criteria
+            page_size: Number of tasks fetched per round trip
+
+        Yields:
+            Task objects matching the filters
+        """
+        remaining = filters.limit
+        offset = 0
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page = await self.list_all(
+                filters.model_copy(update={"limit": size, "offset": offset})
+            )
+            for task in page:
+                yield task
+            if remaining is not None:
+                remaining -= len(page)
+            if len(page) < size:
+                return
+            offset += len(page)
+
+    async def list_page(
+        self,
+        filters: TaskFilters,
+        with_total: bool = False,  # noqa: ARG002 - used by adapters
+    ) -> Page[Task]:
+        """Fetch one page of tasks.
+
+        ``filters.limit`` is the page size and ``filters.cursor`` (from a
+        previous page's ``next_cursor``) selects where the page starts. One
+        extra row is fetched to tell whether more pages follow, so a single
+        query answers both "what is on this page" and "is there more".
+
+        The default implementation pages by offset through list_all();
+        adapters override it with keyset or server-side cursors.
+
+        Args:
+            filters: TaskFilters object specifying filter criteria
+            with_total: Also fill in ``total_estimate`` if the adapter can
+                count cheaply (possibly capped at ``TOTAL_ESTIMATE_CAP``)
+
+        Returns:
+            Page of Task objects
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        size = filters.limit or DEFAULT_PAGE_SIZE
+        offset = filters.offset or 0
+        if filters.cursor:
+            offset = int(decode_cursor(filters.cursor).get("offset", 0))
+
+        rows = await self.list_all(
+            filters.model_copy(
+                update={"limit": size + 1, "offset": offset, "cursor": None}
+            )
+        )
+        has_more = len(rows) > size
+        return Page[Task](
+            items=rows[:size],
+            has_more=has_more,
+            next_cursor=encode_cursor({"offset": offset + size}) if has_more else None,
+        )
+
     @abstractmethod
     async def get(self, task_id: str) -> Task:
         """Get a specific task by ID.
@@ -86,6 +201,20 @@ class TaskRepository(ABC):
         """
         raise NotImplementedError("TaskRepository.add() must be implemented by adapter")
 
+    async def add_many(self, tasks: list[TaskCreate]) -> list[str]:
+        """Create several tasks at once.
+
+        The default implementation calls add() for each task; adapters
+        override it with a single bulk write.
+
+        Args:
+            tasks: TaskCreate objects to insert
+
+        Returns:
+            IDs of the created tasks, in input order
+        """
+        return [(await self.add(task_data)).id for task_data in tasks]
+
     @abstractmethod
     async def update(self, task_id: str, updates: TaskUpdate) -> Task:
         """Update an existing task.
@@ -162,6 +291,44 @@ class TaskRepository(ABC):
             "TaskRepository.bulk_update() must be implemented by adapter"
         )
 
+    async def skip(self, task_id: str) -> Task:
+        """Skip the current occurrence of a recurring task.
+
+        The task moves on to its next occurrence without being completed.
+
+        Args:
+            task_id: Unique identifier for the task
+
+        Returns:
+            Updated Task object
+
+        Raises:
+            NotImplementedError: If the adapter cannot skip occurrences
+            ValueError: If the task is not recurring
+        """
+        raise NotImplementedError("TaskRepository.skip() is not supported by adapter")
+
+    async def list_upcoming(
+        self,
+        start: datetime,  # noqa: ARG002 - used by adapters
+        end: datetime,
+    ) -> list[Task]:
+        """List open tasks that may have an occurrence in ``[start, end)``.
+
+        The result is a superset: callers expand recurring tasks' rules to
+        find the actual occurrences. The default implementation lists every
+        open task due before *end*; adapters with a next-occurrence index
+        narrow it to the window.
+
+        Args:
+            start: Window start
+            end: Window end (exclusive)
+
+        Returns:
+            Candidate Task objects, in no particular order
+        """
+        return await self.list_all(TaskFilters(status="active", due_before=end))
+
 
 class ProjectRepository(ABC):
     """Abstract base class for project persistence operations.
@@ -186,6 +353,26 @@ class ProjectRepository(ABC):
             "ProjectRepository.list_all() must be implemented by adapter"
         )
 
+    async def iter_all(
+        self,
+        filters: ProjectFilters,
+        page_size: int = DEFAULT_PAGE_SIZE,  # noqa: ARG002 - used by adapters
+    ) -> AsyncIterator[Project]:
+        """Stream projects matching the filters, one page at a time.
+
+        The default implementation yields from list_all(); adapters with
+        native pagination override it.
+
+        Args:
+            filters: ProjectFilters object specifying filter criteria
+            page_size: Number of projects fetched per round trip
+
+        Yields:
+            Project objects matching the filters
+        """
+        for project in await self.list_all(filters):
+            yield project
+
     @abstractmethod
     async def get(self, project_id: str) -> Project:
         """Get a specific project by ID.
@@ -222,6 +409,20 @@ class ProjectRepository(ABC):
             "ProjectRepository.create() must be implemented by adapter"
         )
 
+    async def create_many(self, projects: list[ProjectCreate]) -> list[str]:
+        """Create several projects at once.
+
+        The default implementation calls create() for each project; adapters
+        override it with a single bulk write.
+
+        Args:
+            projects: ProjectCreate objects to insert
+
+        Returns:
+            IDs of the created projects, in input order
+        """
+        return [(await self.create(project_data)).id for project_data in projects]
+
     @abstractmethod
     async def update(self, project_id: str, updates: ProjectUpdate) -> Project:
         """Update an existing project.
@@ -314,6 +515,27 @@ class ProjectRepository(ABC):
             "ProjectRepository.get_stats() must be implemented by adapter"
         )
 
+    async def get_stats_many(
+        self, project_ids: list[str] | None = None
+    ) -> dict[str, dict]:
+        """Get statistics for several projects at once.
+
+        The default implementation requests each project's statistics
+        concurrently through get_stats(); adapters that can aggregate every
+        project in one query override it.
+
+        Args:
+            project_ids: Projects to get statistics for (defaults to all)
+
+        Returns:
+            Dictionary mapping each project ID to its statistics, in the
+            format returned by get_stats()
+        """
+        if project_ids is None:
+            project_ids = [p.id for p in await self.list_all(ProjectFilters())]
+        stats = await asyncio.gather(*(self.get_stats(pid) for pid in project_ids))
+        return dict(zip(project_ids, stats, strict=True))
+
 
 class LabelRepository(ABC):
     """Abstract base class for label persistence operations.
@@ -335,6 +557,24 @@ class LabelRepository(ABC):
             "LabelRepository.list_all() must be implemented by adapter"
         )
 
+    async def iter_all(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,  # noqa: ARG002 - used by adapters
+    ) -> AsyncIterator[Label]:
+        """Stream all labels, one page at a time.
+
+        The default implementation yields from list_all(); adapters with
+        native pagination override it.
+
+        Args:
+            page_size: Number of labels fetched per round trip
+
+        Yields:
+            Label objects
+        """
+        for label in await self.list_all():
+            yield label
+
     @abstractmethod
     async def get(self, label_id: str) -> Label:
         """Get a specific label by ID.
@@ -371,6 +611,20 @@ class LabelRepository(ABC):
             "LabelRepository.create() must be implemented by adapter"
         )
 
+    async def create_many(self, labels: list[LabelCreate]) -> list[str]:
+        """Create several labels at once.
+
+        The default implementation calls create() for each label; adapters
+        override it with a single bulk write.
+
+        Args:
+            labels: LabelCreate objects to insert
+
+        Returns:
+            IDs of the created labels, in input order
+        """
+        return [(await self.create(label_data)).id for label_data in labels]
+
     @abstractmethod
     async def delete(self, label_id: str) -> bool:
         """Delete a label.
@@ -677,3 +931,123 @@ class SectionRepository(ABC):
         raise NotImplementedError(
             "SectionRepository.reorder() must be implemented by adapter"
         )
+
+
+class ReminderRepository(ABC):
+    """Abstract base class for task reminder persistence operations.
+
+    A reminder is pending until it is sent (delivered or dismissed) or
+    snoozed; snoozing replaces it with a new pending reminder.
+    """
+
+    @abstractmethod
+    async def list_for_task(self, task_id: str) -> list[Reminder]:
+        """List every reminder of a task, oldest first.
+
+        Args:
+            task_id: Task whose reminders to list
+
+        Returns:
+            List of Reminder objects
+        """
+        raise NotImplementedError(
+            "ReminderRepository.list_for_task() must be implemented by adapter"
+        )
+
+    @abstractmethod
+    async def list_pending(self, before: datetime) -> list[Reminder]:
+        """List pending reminders of open tasks due before a time.
+
+        Args:
+            before: Only reminders due before this time (exclusive)
+
+        Returns:
+            Reminder objects ordered by reminder_date
+        """
+        raise NotImplementedError(
+            "ReminderRepository.list_pending() must be implemented by adapter"
+        )
+
+    @abstractmethod
+    async def get(self, reminder_id: str) -> Reminder:
+        """Get a specific reminder by ID.
+
+        Args:
+            reminder_id: Unique identifier for the reminder
+
+        Returns:
+            Reminder object
+
+        Raises:
+            ValueError: If the reminder does not exist
+        """
+        raise NotImplementedError(
+            "ReminderRepository.get() must be implemented by adapter"
+        )
+
+    @abstractmethod
+    async def add(self, task_id: str, reminder_date: datetime) -> Reminder:
+        """Schedule a reminder for a task.
+
+        Args:
+            task_id: Task to remind about
+            reminder_date: When to remind
+
+        Returns:
+            Created Reminder object
+
+        Raises:
+            ValueError: If the task does not exist
+        """
+        raise NotImplementedError(
+            "ReminderRepository.add() must be implemented by adapter"
+        )
+
+    @abstractmethod
+    async def snooze(self, reminder_id: str, until: datetime) -> Reminder:
+        """Snooze a reminder.
+
+        Args:
+            reminder_id: Reminder to snooze
+            until: When to remind again
+
+        Returns:
+            The new pending Reminder that replaces the snoozed one
+
+        Raises:
+            ValueError: If the reminder does not exist
+        """
+        raise NotImplementedError(
+            "ReminderRepository.snooze() must be implemented by adapter"
+        )
+
+    @abstractmethod
+    async def mark_sent(self, reminder_id: str) -> Reminder:
+        """Mark a reminder as sent, so it is no longer pending.
+
+        Args:
+            reminder_id: Reminder that was delivered or dismissed
+
+        Returns:
+            Updated Reminder object
+
+        Raises:
+            ValueError: If the reminder does not exist
+        """
+        raise NotImplementedError(
+            "ReminderRepository.mark_sent() must be implemented by adapter"
+        )
+
+    @abstractmethod
+    async def delete(self, reminder_id: str) -> bool:
+        """Delete a reminder.
+
+        Args:
+            reminder_id: Reminder to delete
+
+        Returns:
+            True if a reminder was deleted
+        """
+        raise NotImplementedError(
+            "ReminderRepository.delete() must be implemented by adapter"
+        )
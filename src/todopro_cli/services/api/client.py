@@ -1,22 +1,44 @@
 """API client for TodoPro."""
 
 import asyncio
+import time
 from typing import Any
 
 import httpx
 
 from todopro_cli.services.config_service import get_config_service
+from todopro_cli.utils import metrics, profiler
 from todopro_cli.utils.ui.console import get_console
 from todopro_cli.utils.update_checker import get_backend_url
 
 console = get_console()
 
 
+def _observe_request(method: str, started: float, status: int | None) -> None:
+    """Record an API request's latency by method and status class."""
+    if not metrics.is_enabled():
+        return
+    metrics.observe(
+        "todopro_http_request_duration_seconds",
+        time.perf_counter() - started,
+        method=method,
+        code=f"{status // 100}xx" if status else "error",
+    )
+
+
 class APIClient:
-    """HTTP client for TodoPro API."""
+    """HTTP client for TodoPro API.
+
+    Args:
+        context_name: Context whose credentials are used (defaults to the
+            current context)
+    """
 
-    def __init__(self):
+    context_name: str | None = None
+
+    def __init__(self, context_name: str | None = None):
         self.config_manager = get_config_service()
+        self.context_name = context_name
         self.config = self.config_manager.config
         # Use dynamic backend URL with fallback to config
         self.base_url = get_backend_url()
@@ -40,24 +62,37 @@ class APIClient:
 
         # Add authentication token if available and not skipped
         if not skip_auth:
-            # Try to load context-specific credentials first
-            current_context = self.config_manager.get_current_context()
-            if current_context:
-                credentials = self.config_manager.load_context_credentials(
-                    current_context.name
-                )
-            else:
-                credentials = None
-
-            # Fall back to default credentials if context credentials not found
-            if not credentials:
-                credentials = self.config_manager.load_credentials()
-
+            credentials = self._load_credentials()
             if credentials and "token" in credentials:
                 headers["Authorization"] = f"Bearer {credentials['token']}"
 
         return headers
 
+    def _load_credentials(self) -> dict | None:
+        """Credentials sent with requests, falling back to the defaults."""
+        if self.context_name is not None:
+            return self._stored_credentials()
+
+        # Try to load context-specific credentials first
+        current_context = self.config_manager.get_current_context()
+        if current_context:
+            credentials = self.config_manager.load_context_credentials(
+                current_context.name
+            )
+        else:
+            credentials = None
+
+        # Fall back to default credentials if context credentials not found
+        if not credentials:
+            credentials = self.config_manager.load_credentials()
+        return credentials
+
+    def _stored_credentials(self) -> dict | None:
+        """Stored credentials of this client's context, without fallback."""
+        if self.context_name is not None:
+            return self.config_manager.load_context_credentials(self.context_name)
+        return self.config_manager.load_credentials()
+
     async def _get_client(self, skip_auth: bool = False) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
         if self._client is None:
@@ -82,7 +117,7 @@ class APIClient:
         Returns True if successful, False otherwise.
         """
         try:
-            credentials = self.config_manager.load_credentials()
+            credentials = self._stored_credentials()
             if not credentials or "refresh_token" not in credentials:
                 return False
 
@@ -103,7 +138,9 @@ class APIClient:
                     credentials["refresh_token"] = data["refresh_token"]
 
                 self.config_manager.save_credentials(
-                    credentials["token"], credentials.get("refresh_token")
+                    credentials["token"],
+                    credentials.get("refresh_token"),
+                    context_name=self.context_name,
                 )
                 console.print("[dim]Token refreshed automatically[/dim]")
                 return True
@@ -124,6 +161,22 @@ class APIClient:
         skip_auth: bool = False,
     ) -> httpx.Response:
         """Make an HTTP request to the API."""
+        with profiler.span(f"{method} {path}", "http"):
+            return await self._request(
+                method, path, json=json, params=params, retry=retry, skip_auth=skip_auth
+            )
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        retry: int | None,
+        skip_auth: bool,
+    ) -> httpx.Response:
+        """Send a request, retrying failures and refreshing an expired token."""
         if retry is None:
             retry = self.config.api.retry
 
@@ -132,13 +185,16 @@ class APIClient:
 
         last_exception: Exception | None = None
         for attempt in range(retry + 1):
+            started = time.perf_counter()
             try:
+                profiler.count(profiler.HTTP_REQUESTS)
                 response = await client.request(
                     method=method,
                     url=url,
                     json=json,
                     params=params,
                 )
+                _observe_request(method, started, response.status_code)
                 response.raise_for_status()
                 return response
             except httpx.HTTPStatusError as e:
@@ -146,16 +202,23 @@ class APIClient:
                 if e.response.status_code == 401 and not skip_auth:
                     # Try to refresh the token
                     refreshed = await self._try_refresh_token()
+                    metrics.inc(
+                        "todopro_http_token_refreshes",
+                        outcome="success" if refreshed else "failure",
+                    )
                     if refreshed:
                         # Retry the request with new token
                         client = await self._get_client(skip_auth=skip_auth)
                         try:
+                            started = time.perf_counter()
+                            profiler.count(profiler.HTTP_REQUESTS)
                             response = await client.request(
                                 method=method,
                                 url=url,
                                 json=json,
                                 params=params,
                             )
+                            _observe_request(method, started, response.status_code)
                             response.raise_for_status()
                             return response
                         except httpx.HTTPStatusError:
@@ -163,7 +226,7 @@ class APIClient:
                             raise e from None
                     else:
                         # Refresh failed - provide helpful error message
-                        credentials = self.config_manager.load_credentials()
+                        credentials = self._stored_credentials()
                         if not credentials or "refresh_token" not in credentials:
                             # No refresh token available
 
@@ -181,9 +244,11 @@ class APIClient:
                     raise
                 last_exception = e
             except httpx.RequestError as e:
+                _observe_request(method, started, None)
                 last_exception = e
 
             if attempt < retry:
+                metrics.inc("todopro_http_retries", method=method)
                 # Wait before retry (simple exponential backoff)
 
                 await asyncio.sleep(2**attempt)
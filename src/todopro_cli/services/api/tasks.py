@@ -1,5 +1,6 @@
 """Tasks API endpoints."""
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 from todopro_cli.services.api.client import APIClient
@@ -47,6 +48,38 @@ class TasksAPI:
         response = await self.client.get("/v1/tasks", params=params)
         return response.json()
 
+    async def iter_task_pages(
+        self, *, page_size: int = 200, **filters: Any
+    ) -> AsyncIterator[list[dict]]:
+        """Yield pages of tasks, following the server's pagination.
+
+        If the server returns a ``next_cursor`` it is passed back verbatim
+        until it comes back empty; otherwise pages are requested by offset
+        until a short page signals the end.
+        """
+        cursor: str | None = None
+        offset = 0
+        while True:
+            params = dict(filters, limit=page_size)
+            if cursor is not None:
+                params["cursor"] = cursor
+            else:
+                params["offset"] = offset
+
+            result = await self.list_tasks(**params)
+            page = result.get("tasks", []) if isinstance(result, dict) else result
+            if page:
+                yield page
+
+            if isinstance(result, dict) and "next_cursor" in result:
+                cursor = result["next_cursor"]
+                if not cursor:
+                    return
+            elif len(page) < page_size:
+                return
+            else:
+                offset += len(page)
+
     async def get_task(self, task_id: str) -> dict:
         """Get a specific task by ID."""
         response = await self.client.get(f"/v1/tasks/{task_id}")
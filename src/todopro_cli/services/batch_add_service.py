@@ -0,0 +1,315 @@
+"""BatchAddService — create many tasks from text lines in one go.
+
+Backs ``tp add --batch``. Each input line is a task in the quick-add
+syntax ("Pay rent tomorrow #Home @bills p2") or, if it starts with ``{``,
+an NDJSON object whose ``content`` is parsed the same way and whose other
+keys override what was parsed.
+
+Work is split into three passes so each costs one round trip however many
+lines there are:
+  1. parse: every line goes through LocalNLPParser; very large batches are
+     split across a process pool
+  2. resolve: ``#project``/``@label`` names are matched against one index
+     of the existing projects and labels, loaded once
+  3. write: tasks are created with ``add_many`` in chunks, inside a single
+     storage transaction
+
+A bad line is reported with its line number and skipped; it never aborts
+the rest of the batch.
+"""
+
+from __future__ import annotations
+
+import difflib
+import json
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field, ValidationError
+
+from todopro_cli.models import LabelCreate, ProjectCreate, ProjectFilters, TaskCreate
+from todopro_cli.utils.nlp_parser import LocalNLPParser
+
+# Lines parsed in-process below this; process start-up costs more than it saves
+PARALLEL_PARSE_THRESHOLD = 20_000
+
+# Lines handed to a worker process at a time
+_PARSE_CHUNK_SIZE = 2_000
+
+# Tasks written per bulk insert
+_TASK_BATCH_SIZE = 500
+
+# Minimum similarity for a fuzzy project name match (same as single add)
+_PROJECT_MATCH_CUTOFF = 0.6
+
+
+class BatchLineError(BaseModel):
+    """A line that could not be turned into a task."""
+
+    line: int
+    error: str
+
+
+class BatchAddResult(BaseModel):
+    """Summary of a completed batch add."""
+
+    task_ids: list[str] = Field(default_factory=list)
+    projects_created: int = 0
+    labels_created: int = 0
+    errors: list[BatchLineError] = Field(default_factory=list)
+
+    @property
+    def has_errors(self) -> bool:
+        return len(self.errors) > 0
+
+
+def _parse_line(parser: LocalNLPParser, text: str) -> dict[str, Any]:
+    """Parse one input line into task fields.
+
+    Raises:
+        ValueError: If the line is invalid NDJSON or has no content
+    """
+    overrides: dict[str, Any] = {}
+    if text.startswith("{"):
+        overrides = json.loads(text)
+        if not isinstance(overrides, dict):
+            raise ValueError("NDJSON line must be an object")
+        text = str(overrides.pop("content", "") or "").strip()
+    if not text:
+        raise ValueError("task content is empty")
+
+    parsed = parser.parse(text)
+    fields = {
+        "content": parsed["content"] or text,
+        "description": overrides.get("description"),
+        "priority": parsed["priority"],
+        "due_date": parsed["due_date"],
+        "project": parsed["project_name"],
+        "labels": parsed["labels"],
+    }
+    for key in ("priority", "due_date", "project", "labels"):
+        if overrides.get(key) is not None:
+            fields[key] = overrides[key]
+    if isinstance(fields["labels"], str):
+        fields["labels"] = [fields["labels"]]
+    return fields
+
+
+def _parse_chunk(
+    lines: list[tuple[int, str]],
+) -> list[tuple[int, dict[str, Any] | str]]:
+    """Parse numbered lines; errors are returned as strings in place of fields.
+
+    A module-level function so it can run in a worker process.
+    """
+    parser = LocalNLPParser()
+    results: list[tuple[int, dict[str, Any] | str]] = []
+    for number, text in lines:
+        try:
+            results.append((number, _parse_line(parser, text)))
+        except ValueError as e:
+            results.append((number, str(e)))
+    return results
+
+
+def parse_lines(
+    lines: Iterable[str], workers: int | None = None
+) -> list[tuple[int, dict[str, Any] | str]]:
+    """Parse batch input, skipping blank lines.
+
+    Args:
+        lines: Raw input lines
+        workers: Worker processes for large inputs (default: CPU count)
+
+    Returns:
+        (line number, task fields or error message) per non-blank line,
+        in input order
+    """
+    numbered = [
+        (number, line.strip())
+        for number, line in enumerate(lines, 1)
+        if line.strip()
+    ]
+    workers = workers or os.cpu_count() or 1
+    if len(numbered) < PARALLEL_PARSE_THRESHOLD or workers < 2:
+        return _parse_chunk(numbered)
+
+    chunks = [
+        numbered[i : i + _PARSE_CHUNK_SIZE]
+        for i in range(0, len(numbered), _PARSE_CHUNK_SIZE)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [item for chunk in executor.map(_parse_chunk, chunks) for item in chunk]
+
+
+class BatchAddService:
+    """Creates the tasks of parsed batch lines.
+
+    Args:
+        storage: Storage strategy context providing repository access
+    """
+
+    def __init__(self, storage) -> None:
+        self._storage = storage
+        self._projects: dict[str, str] = {}
+        self._project_ids: set[str] = set()
+        self._labels: dict[str, str] = {}
+
+    async def add_all(
+        self,
+        parsed: list[tuple[int, dict[str, Any] | str]],
+        *,
+        default_project: str | None = None,
+        create_missing: bool = False,
+    ) -> BatchAddResult:
+        """Create a task for every successfully parsed line.
+
+        Args:
+            parsed: Output of parse_lines()
+            default_project: Project name or ID for lines without ``#project``
+            create_missing: Create unknown projects and labels instead of
+                reporting the lines that use them
+
+        Returns:
+            BatchAddResult with the created task IDs and per-line errors
+        """
+        result = BatchAddResult()
+        await self._load_index()
+
+        rows: list[tuple[int, dict[str, Any]]] = []
+        for number, fields in parsed:
+            if isinstance(fields, str):
+                result.errors.append(BatchLineError(line=number, error=fields))
+                continue
+            if default_project and not fields["project"]:
+                fields["project"] = default_project
+            rows.append((number, fields))
+
+        async with self._storage.transaction():
+            if create_missing:
+                await self._create_missing(rows, result)
+
+            batch: list[tuple[int, TaskCreate]] = []
+            for number, fields in rows:
+                try:
+                    batch.append((number, self._task_create(fields)))
+                except (ValueError, ValidationError) as e:
+                    result.errors.append(BatchLineError(line=number, error=_short(e)))
+
+            for i in range(0, len(batch), _TASK_BATCH_SIZE):
+                await self._write(batch[i : i + _TASK_BATCH_SIZE], result)
+
+        result.errors.sort(key=lambda e: e.line)
+        return result
+
+    async def _load_index(self) -> None:
+        """Load every project and label once, keyed by lowercased name."""
+        projects = await self._storage.project_repository.list_all(ProjectFilters())
+        self._projects = {p.name.lower(): p.id for p in projects}
+        self._project_ids = {p.id for p in projects}
+        labels = await self._storage.label_repository.list_all()
+        self._labels = {label.name.lower(): label.id for label in labels}
+
+    def _project_id(self, name: str) -> str | None:
+        key = name.lower()
+        if key in self._projects:
+            return self._projects[key]
+        if name in self._project_ids:
+            return name
+        matches = difflib.get_close_matches(
+            key, list(self._projects), n=1, cutoff=_PROJECT_MATCH_CUTOFF
+        )
+        if matches:
+            # Remember the match so repeated names skip the fuzzy search
+            self._projects[key] = self._projects[matches[0]]
+            return self._projects[key]
+        return None
+
+    async def _create_missing(
+        self, rows: list[tuple[int, dict[str, Any]]], result: BatchAddResult
+    ) -> None:
+        """Create every unknown project and label in one bulk write each."""
+        projects: dict[str, str] = {}
+        labels: dict[str, str] = {}
+        for _, fields in rows:
+            project = fields["project"]
+            if project and self._project_id(project) is None:
+                projects.setdefault(project.lower(), project)
+            for label in fields["labels"]:
+                if label.lower() not in self._labels:
+                    labels.setdefault(label.lower(), label)
+
+        if projects:
+            ids = await self._storage.project_repository.create_many(
+                [ProjectCreate(name=name) for name in projects.values()]
+            )
+            self._projects.update(zip(projects, ids, strict=True))
+            result.projects_created = len(ids)
+        if labels:
+            ids = await self._storage.label_repository.create_many(
+                [LabelCreate(name=name) for name in labels.values()]
+            )
+            self._labels.update(zip(labels, ids, strict=True))
+            result.labels_created = len(ids)
+
+    def _task_create(self, fields: dict[str, Any]) -> TaskCreate:
+        """Build the TaskCreate of a line, resolving names against the index.
+
+        Raises:
+            ValueError: If a project or label does not exist
+        """
+        project_id = None
+        if fields["project"]:
+            project_id = self._project_id(fields["project"])
+            if project_id is None:
+                raise ValueError(f"project '{fields['project']}' not found")
+
+        label_ids = []
+        for label in fields["labels"]:
+            label_id = self._labels.get(label.lower())
+            if label_id is None:
+                raise ValueError(f"label '{label}' not found")
+            label_ids.append(label_id)
+
+        due_date = fields["due_date"]
+        if isinstance(due_date, str):
+            due_date = datetime.fromisoformat(due_date.replace("Z", "+00:00"))
+
+        return TaskCreate(
+            content=fields["content"],
+            description=fields["description"],
+            priority=fields["priority"] or 4,
+            due_date=due_date,
+            project_id=project_id,
+            labels=label_ids,
+        )
+
+    async def _write(
+        self, batch: list[tuple[int, TaskCreate]], result: BatchAddResult
+    ) -> None:
+        """Write one chunk with a single bulk insert."""
+        if not batch:
+            return
+        try:
+            ids = await self._storage.task_repository.add_many(
+                [task for _, task in batch]
+            )
+        except Exception as e:  # noqa: BLE001
+            result.errors.extend(
+                BatchLineError(line=number, error=f"not created: {e}")
+                for number, _ in batch
+            )
+            return
+        result.task_ids.extend(ids)
+
+
+def _short(error: Exception) -> str:
+    """One-line message for a per-line error."""
+    if isinstance(error, ValidationError):
+        first = error.errors()[0]
+        location = ".".join(str(part) for part in first["loc"])
+        return f"{location}: {first['msg']}" if location else first["msg"]
+    return str(error)
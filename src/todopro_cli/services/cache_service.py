@@ -13,8 +13,10 @@ SUFFIX_MAPPING_FILE = CACHE_DIR / "suffix_mapping.json"
 PROJECT_SUFFIX_MAPPING_FILE = CACHE_DIR / "project_suffix_mapping.json"
 LABEL_SUFFIX_MAPPING_FILE = CACHE_DIR / "label_suffix_mapping.json"
 SECTION_SUFFIX_MAPPING_FILE = CACHE_DIR / "section_suffix_mapping.json"
+LIST_CURSOR_FILE = CACHE_DIR / "list_cursor.json"
 CACHE_TTL = 30  # 30 seconds
 SUFFIX_MAPPING_TTL = 300  # 5 minutes for suffix mappings
+LIST_CURSOR_TTL = 600  # 10 minutes to ask for the next page
 
 
 class BackgroundTaskCache:
@@ -230,3 +232,66 @@ def save_section_suffix_mapping(suffix_map: dict[str, str]) -> None:
 def get_section_suffix_mapping() -> dict[str, str]:
     """Get cached suffix → section ID mapping (empty if expired/missing)."""
     return _load_suffix_file(SECTION_SUFFIX_MAPPING_FILE)
+
+
+def _current_context_name() -> str:
+    from todopro_cli.services.config_service import get_config_service
+
+    return get_config_service().get_current_context().name
+
+
+def _list_cursor_key(listing: dict) -> str:
+    """Key of a listing's cursor: the current context plus the listing itself."""
+    return json.dumps(
+        {"context": _current_context_name(), "listing": listing}, sort_keys=True
+    )
+
+
+def _load_list_cursors() -> dict[str, dict]:
+    """Load the saved cursors that have not expired yet."""
+    if not LIST_CURSOR_FILE.exists():
+        return {}
+    try:
+        cursors = json.loads(LIST_CURSOR_FILE.read_text())
+    except Exception:
+        return {}
+    if not isinstance(cursors, dict):
+        return {}
+    now = time.time()
+    return {
+        key: entry
+        for key, entry in cursors.items()
+        if isinstance(entry, dict)
+        and now - entry.get("timestamp", 0) <= LIST_CURSOR_TTL
+    }
+
+
+def save_list_cursor(listing: dict, cursor: str | None) -> None:
+    """Remember where a task listing stopped, for ``--next-page``.
+
+    Cursors are kept per context and listing, so switching contexts never
+    resumes another context's listing.
+
+    Args:
+        listing: Parameters identifying the listing (filters and page size)
+        cursor: The page's next_cursor, or None if it was the last page
+    """
+    try:
+        cursors = _load_list_cursors()
+        cursors[_list_cursor_key(listing)] = {"timestamp": time.time(), "cursor": cursor}
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        LIST_CURSOR_FILE.write_text(json.dumps(cursors))
+    except Exception:
+        pass
+
+
+def get_list_cursor(listing: dict) -> str | None:
+    """Get the cursor saved for the same listing in the current context.
+
+    Returns None if there is none or it has expired.
+    """
+    try:
+        entry = _load_list_cursors().get(_list_cursor_key(listing))
+    except Exception:
+        return None
+    return entry.get("cursor") if entry else None
@@ -21,9 +21,12 @@ from platformdirs import user_config_dir, user_data_dir
 from todopro_cli.models.config_models import AppConfig, Context
 from todopro_cli.models.storage_strategy import (
     LocalStorageStrategy,
+    MirroredStorageStrategy,
     RemoteStorageStrategy,
+    StorageStrategy,
     StorageStrategyContext,
 )
+from todopro_cli.utils import profiler
 
 
 class ConfigService:
@@ -67,6 +70,7 @@ class ConfigService:
         )
         return self._storage_strategy_context
 
+    @profiler.traced("config.load", "config")
     def load_config(self) -> AppConfig:
         """Load configuration from storage."""
         if self._config is not None:
@@ -78,11 +82,9 @@ class ConfigService:
 
                 # After loading config, initialize the storage strategy context
                 context = self.get_current_context()
-                if context.type == "remote":
-                    strategy = RemoteStorageStrategy()
-                else:
-                    strategy = LocalStorageStrategy(db_path=context.source)
-                self._storage_strategy_context = StorageStrategyContext(strategy)
+                self._storage_strategy_context = StorageStrategyContext(
+                    self._build_strategy(context)
+                )
 
         except FileNotFoundError:
             # Config file doesn't exist yet - create default config
@@ -125,11 +127,73 @@ class ConfigService:
         # Recreate default config and storage context
         self.create_default_cloud_config()
         context = self.get_current_context()
-        if context.type == "remote":
-            strategy = RemoteStorageStrategy()
-        else:
-            strategy = LocalStorageStrategy(db_path=context.source)
-        self._storage_strategy_context = StorageStrategyContext(strategy)
+        self._storage_strategy_context = StorageStrategyContext(
+            self._build_strategy(context)
+        )
+
+    def _build_strategy(
+        self, context: Context, isolated: bool = False
+    ) -> StorageStrategy:
+        """Build the storage strategy for a context.
+
+        Remote contexts are served through a local mirror when
+        ``cache.mirror`` is enabled.
+
+        Args:
+            context: Context to build the strategy for
+            isolated: Give the strategy its own database connection or API
+                client for this context, instead of the shared vault
+                connection and current-context credentials
+
+        Raises:
+            ValueError: If an isolated local context's vault does not exist
+        """
+        if context.type != "remote":
+            connection = None
+            if isolated:
+                from todopro_cli.adapters.sqlite.connection import open_connection
+
+                # Opening would create an empty vault in its place
+                if not Path(context.source).exists():
+                    raise ValueError(f"Vault not found: {context.source}")
+
+                connection = open_connection(context.source)
+            return LocalStorageStrategy(db_path=context.source, connection=connection)
+        client = None
+        if isolated:
+            # Import here to avoid a circular import (the client reads config)
+            from todopro_cli.services.api.client import APIClient
+
+            client = APIClient(context_name=context.name)
+        cache = self.config.cache
+        if cache.enabled and cache.mirror:
+            return MirroredStorageStrategy(
+                mirror_path=str(self.get_mirror_path(context.name)),
+                max_age=cache.mirror_ttl,
+                client=client,
+            )
+        return RemoteStorageStrategy(client=client)
+
+    def build_storage_context(self, context_name: str) -> StorageStrategyContext:
+        """Build storage for any context, independent of the current one.
+
+        The storage has its own connection or API client; release it with
+        ``await storage.strategy.close()``.
+
+        Raises:
+            ValueError: If no context has this name, or its local vault does
+                not exist
+        """
+        context = self.config.get_context(context_name)
+        return StorageStrategyContext(self._build_strategy(context, isolated=True))
+
+    def get_mirror_path(self, context_name: str) -> Path:
+        """Get the local mirror database path for a remote context."""
+        return self.data_dir / "mirrors" / f"{context_name}.db"
+
+    def get_github_sync_path(self, context_name: str) -> Path:
+        """Get the GitHub sync state database path for a context."""
+        return self.data_dir / "github" / f"{context_name}.db"
 
     def create_default_cloud_config(self) -> AppConfig:
         """Create a default configuration with local context.
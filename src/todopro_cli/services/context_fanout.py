@@ -0,0 +1,140 @@
+"""Query every configured context at once (``--all-contexts``).
+
+Each context gets its own storage (a dedicated vault connection, or an API
+client with that context's credentials), and the same query runs against
+all of them concurrently. A context that fails, whose local vault is
+missing, or that does not answer within its timeout is reported instead of
+holding up the rest. The per-context results, each sorted, are then combined
+with a k-way merge that tags every item with the context it came from.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from todopro_cli.models import Task
+from todopro_cli.models.storage_strategy import StorageStrategyContext
+from todopro_cli.services.config_service import ConfigService
+
+# Seconds each context gets to answer
+DEFAULT_TIMEOUT = 10.0
+
+type Query[T] = Callable[[StorageStrategyContext], Awaitable[list[T]]]
+
+
+@dataclass
+class ContextResult[T]:
+    """Outcome of a fan-out query for one context."""
+
+    context: str
+    items: list[T] = field(default_factory=list)
+    error: str | None = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the context answered."""
+        return self.error is None
+
+
+# Sort of each context's task query: its first N tasks are then exactly the
+# ones task_sort_key merges first
+TASK_SORT = "priority:asc,created_at:desc"
+
+
+def task_sort_key(task: Task) -> tuple:
+    """Order of merged task listings: priority, then newest (``TASK_SORT``)."""
+    created = task.created_at.timestamp() if task.created_at else 0.0
+    return (task.priority, -created, task.id)
+
+
+def _tagged[T](context: str, items: list[T], key: Callable[[T], Any]):
+    for item in sorted(items, key=key):
+        yield context, item
+
+
+def merge[T](
+    results: Iterable[ContextResult[T]], key: Callable[[T], Any]
+) -> Iterator[tuple[str, T]]:
+    """Merge per-context results into one sorted stream of (context, item).
+
+    Each context's items are sorted once and the runs are merged lazily, so
+    producing the first item never sorts the combined listing.
+    """
+    runs = [_tagged(result.context, result.items, key) for result in results]
+    return heapq.merge(*runs, key=lambda pair: key(pair[1]))
+
+
+class ContextFanout:
+    """Storage for several contexts, queried concurrently.
+
+    Args:
+        config_service: Configuration the contexts come from
+        names: Contexts to query (defaults to every configured context)
+        timeout: Seconds each context gets to answer a query
+
+    Raises:
+        ValueError: If a name does not match a configured context
+    """
+
+    def __init__(
+        self,
+        config_service: ConfigService,
+        names: list[str] | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self.config_service = config_service
+        if names is None:
+            names = [context.name for context in config_service.list_contexts()]
+        for name in names:
+            config_service.config.get_context(name)
+        self.names = names
+        self.timeout = timeout
+        self._storages: dict[str, StorageStrategyContext] = {}
+
+    def storage(self, name: str) -> StorageStrategyContext:
+        """The storage of one context, built on first use."""
+        if name not in self._storages:
+            self._storages[name] = self.config_service.build_storage_context(name)
+        return self._storages[name]
+
+    async def _query_one[T](self, name: str, query: Query[T]) -> ContextResult[T]:
+        started = time.perf_counter()
+        result: ContextResult[T] = ContextResult(name)
+        try:
+            result.items = await asyncio.wait_for(
+                query(self.storage(name)), self.timeout
+            )
+        except TimeoutError:
+            result.error = f"no answer within {self.timeout:g}s"
+        except Exception as e:
+            result.error = str(e) or type(e).__name__
+        result.duration = time.perf_counter() - started
+        return result
+
+    async def gather[T](self, query: Query[T]) -> list[ContextResult[T]]:
+        """Run *query* against every context concurrently.
+
+        Returns:
+            One result per context, in the order of ``names``
+        """
+        return list(
+            await asyncio.gather(*(self._query_one(name, query) for name in self.names))
+        )
+
+    async def close(self) -> None:
+        """Close the connections and clients opened for the contexts."""
+        storages, self._storages = self._storages, {}
+        for storage in storages.values():
+            await storage.strategy.close()
+
+    async def __aenter__(self) -> ContextFanout:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
@@ -0,0 +1,280 @@
+"""Streaming NDJSON archives for `todopro data export/import`.
+
+An archive is a sequence of JSON objects, one per line::
+
+    {"type": "header", "version": 1, "encryption": {"enabled": false}}
+    {"type": "project", "data": {...}}
+    {"type": "label", "data": {...}}
+    {"type": "context", "data": {...}}
+    {"type": "task", "data": {...}}
+    {"type": "stats", "data": {"tasks_count": 1, ...}}
+
+Records are written as they are read from the repositories and parsed one
+line at a time on import, so memory use does not grow with archive size.
+Archives may be gzip (``.gz``) or zstd (``.zst``, needs the optional
+``zstandard`` package) compressed. The legacy single-document JSON export is
+still readable through the same record interface.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import io
+import itertools
+import json
+import os
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import IO, Any
+
+from rich.progress import ProgressColumn, Task
+from rich.text import Text
+
+ZSTD_AVAILABLE = False
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    pass
+
+ARCHIVE_VERSION = 1
+
+# Record types, in the order an archive is written (dependencies first)
+RECORD_TYPES = ("project", "label", "context", "task")
+
+COMPRESSIONS = ("gzip", "zstd")
+
+# Lines handed to a worker per task when parsing in parallel
+PARSE_BATCH_LINES = 5000
+
+_COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+_NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+
+def detect_compression(path: Path) -> str | None:
+    """Infer the compression of an archive from its file suffix."""
+    return _COMPRESSION_SUFFIXES.get(path.suffix)
+
+
+def is_ndjson_path(path: Path) -> bool:
+    """Whether a file name asks for the NDJSON format (e.g. ``backup.ndjson.gz``)."""
+    suffixes = path.suffixes
+    if suffixes and suffixes[-1] in _COMPRESSION_SUFFIXES:
+        suffixes = suffixes[:-1]
+    return bool(suffixes) and suffixes[-1] in _NDJSON_SUFFIXES
+
+
+def _require_zstd() -> None:
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError(
+            "zstd compression requires the 'zstandard' package "
+            "(pip install zstandard)"
+        )
+
+
+def open_archive(path: Path, mode: str, compression: str | None = None) -> IO[str]:
+    """Open an archive as a text stream, transparently (de)compressing.
+
+    Args:
+        path: Archive file path
+        mode: "r" to read or "w" to write
+        compression: "gzip", "zstd" or None; inferred from the suffix if None
+
+    Returns:
+        Text stream over the decompressed archive contents
+    """
+    compression = compression or detect_compression(path)
+    if compression == "gzip":
+        return gzip.open(path, f"{mode}t", encoding="utf-8")
+    if compression == "zstd":
+        _require_zstd()
+        raw = path.open(f"{mode}b")
+        if mode == "w":
+            stream = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
+
+
+class ArchiveWriter:
+    """Writes NDJSON archive records to a text stream.
+
+    Usage:
+        with ArchiveWriter(open_archive(path, "w")) as writer:
+            writer.write_header(encryption_enabled=False)
+            writer.write("task", task.model_dump(mode="json"))
+    """
+
+    def __init__(self, stream: IO[str]):
+        """Initialize the writer.
+
+        Args:
+            stream: Text stream to write to; closed together with the writer
+        """
+        self.stream = stream
+        self.counts: dict[str, int] = dict.fromkeys(RECORD_TYPES, 0)
+
+    def __enter__(self) -> ArchiveWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.write_stats()
+        self.stream.close()
+
+    def _write_line(self, obj: dict[str, Any]) -> None:
+        self.stream.write(json.dumps(obj, separators=(",", ":")))
+        self.stream.write("\n")
+
+    def write_header(self, encryption_enabled: bool) -> None:
+        """Write the archive header."""
+        self._write_line(
+            {
+                "type": "header",
+                "version": ARCHIVE_VERSION,
+                "encryption": {"enabled": encryption_enabled},
+            }
+        )
+
+    def write(self, record_type: str, data: dict[str, Any]) -> None:
+        """Write a single record.
+
+        Args:
+            record_type: One of RECORD_TYPES
+            data: JSON-serializable record payload
+        """
+        self._write_line({"type": record_type, "data": data})
+        self.counts[record_type] += 1
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Record counts in the export summary format."""
+        return {f"{record_type}s_count": n for record_type, n in self.counts.items()}
+
+    def write_stats(self) -> None:
+        """Write the trailing stats record."""
+        self._write_line({"type": "stats", "data": self.stats})
+
+
+def iter_document_records(document: dict[str, Any]) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield records from a legacy single-document JSON export."""
+    yield "header", {"encryption": document.get("encryption", {"enabled": False})}
+    payload = document.get("data", {})
+    for record_type in RECORD_TYPES:
+        for item in payload.get(f"{record_type}s", []):
+            yield record_type, item
+    if "stats" in document:
+        yield "stats", document["stats"]
+
+
+def _parse_lines(lines: list[str]) -> list[tuple[str, dict[str, Any]]]:
+    """Parse a batch of NDJSON record lines (runs in worker processes)."""
+    records = []
+    for line in lines:
+        if line.strip():
+            record = json.loads(line)
+            records.append((record["type"], record.get("data", {})))
+    return records
+
+
+def _iter_parallel(
+    stream: IO[str], workers: int
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Parse record lines on a process pool, preserving archive order.
+
+    At most ``2 * workers`` batches are in flight, which bounds memory while
+    keeping every worker busy; the main process only reads and decompresses.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        while batch := list(itertools.islice(stream, PARSE_BATCH_LINES)):
+            pending.append(pool.submit(_parse_lines, batch))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def iter_records(
+    path: Path, parallel: bool = False, workers: int | None = None
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Iterate over the records of an archive.
+
+    NDJSON archives are parsed one line at a time. A legacy JSON export is
+    recognized by its first line not being a complete header record and is
+    loaded whole, as before.
+
+    Args:
+        path: Archive file path
+        parallel: Parse NDJSON lines on a process pool (for huge archives)
+        workers: Worker processes for parallel parsing (default: CPU count)
+
+    Yields:
+        (record_type, data) tuples; the header's data is the header itself
+
+    Raises:
+        json.JSONDecodeError: If a record is not valid JSON
+    """
+    with open_archive(path, "r") as stream:
+        first = stream.readline()
+        header = None
+        with contextlib.suppress(json.JSONDecodeError):
+            header = json.loads(first)
+
+        if not isinstance(header, dict) or header.get("type") != "header":
+            document = json.loads(first + stream.read())
+            yield from iter_document_records(document)
+            return
+
+        yield "header", header
+        if parallel:
+            yield from _iter_parallel(stream, workers or os.cpu_count() or 1)
+            return
+        for line in stream:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield record["type"], record.get("data", {})
+
+
+def is_ndjson_archive(path: Path) -> bool:
+    """Whether an existing file is an NDJSON archive (rather than legacy JSON)."""
+    with open_archive(path, "r") as stream:
+        first = stream.readline()
+    try:
+        header = json.loads(first)
+    except json.JSONDecodeError:
+        return False
+    return isinstance(header, dict) and header.get("type") == "header"
+
+
+def count_records(path: Path) -> dict[str, int]:
+    """Count the records of an NDJSON archive without parsing them.
+
+    Relies on every record line starting with its type, which ArchiveWriter
+    guarantees; this keeps the import preview cheap even for huge archives.
+    """
+    prefixes = {rt: f'{{"type":"{rt}"' for rt in RECORD_TYPES}
+    counts = dict.fromkeys(RECORD_TYPES, 0)
+    with open_archive(path, "r") as stream:
+        for line in stream:
+            for record_type, prefix in prefixes.items():
+                if line.startswith(prefix):
+                    counts[record_type] += 1
+                    break
+    return counts
+
+
+class ThroughputColumn(ProgressColumn):
+    """Progress column rendering the processing rate in records per second."""
+
+    def render(self, task: Task) -> Text:
+        speed = task.finished_speed or task.speed
+        if speed is None:
+            return Text("-- rec/s", style="progress.data.speed")
+        return Text(f"{speed:,.0f} rec/s", style="progress.data.speed")
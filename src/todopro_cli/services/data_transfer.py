@@ -0,0 +1,435 @@
+"""Export and import of archive records through the storage repositories.
+
+The exporter streams entities out of the active repositories into an
+ArchiveWriter; the importers consume (record_type, data) tuples produced by
+``data_archive.iter_records`` and write them back in chunks. Neither side
+holds more than one chunk of tasks in memory.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+from todopro_cli.models import (
+    LabelCreate,
+    ProjectCreate,
+    ProjectFilters,
+    TaskCreate,
+    TaskFilters,
+)
+from todopro_cli.models.storage_strategy import StorageStrategyContext
+from todopro_cli.services.data_archive import ArchiveWriter
+
+# Number of task records buffered before a bulk write
+IMPORT_CHUNK_SIZE = 1000
+
+# Error messages kept per entity type; further errors are only counted
+MAX_REPORTED_ERRORS = 100
+
+
+class ArchiveExporter:
+    """Streams the contents of a storage context into an archive."""
+
+    def __init__(self, storage: StorageStrategyContext):
+        """Initialize the exporter.
+
+        Args:
+            storage: Storage context to read from
+        """
+        self.storage = storage
+
+    async def export(
+        self,
+        writer: ArchiveWriter,
+        contexts: list,
+        on_record: Callable[[], None] | None = None,
+    ) -> None:
+        """Write every project, label, context and task to the archive.
+
+        Args:
+            writer: Archive writer (header already written)
+            contexts: Configured contexts to include
+            on_record: Called after each record, e.g. to advance a progress bar
+        """
+
+        def written(record_type: str, data: dict[str, Any]) -> None:
+            writer.write(record_type, data)
+            if on_record is not None:
+                on_record()
+
+        async for project in self.storage.project_repository.iter_all(ProjectFilters()):
+            written("project", project.model_dump(mode="json"))
+        async for label in self.storage.label_repository.iter_all():
+            written("label", label.model_dump(mode="json"))
+        for context in contexts:
+            written("context", context.model_dump(mode="json"))
+        async for task in self.storage.task_repository.iter_all(TaskFilters(status="all")):
+            written("task", task.model_dump(mode="json"))
+
+
+class _Tally:
+    """Created/skipped/error counters for one entity type."""
+
+    def __init__(self):
+        self.created = 0
+        self.skipped = 0
+        self.errors: list[str] = []
+        self.error_count = 0
+
+    def error(self, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+    @property
+    def summary(self) -> str:
+        return f"{self.created} created, {self.skipped} skipped"
+
+
+class ArchiveImporter:
+    """Index-driven bulk importer of archive records into a storage context.
+
+    Existing project names, label names and task contents are loaded into
+    hash maps once, up front; every duplicate check and reference lookup is
+    then an in-memory probe instead of a query. Projects and labels are
+    matched by name (project names case-insensitively, like the vault
+    enforces) and tasks by content; existing items are skipped. Archive IDs
+    of projects and labels are remapped to the IDs they have (or get) in the
+    target, so task references survive the round trip.
+
+    New entities are buffered per type and written with the repositories'
+    bulk methods, tasks in chunks. Run the import inside
+    ``async with storage.transaction()`` to make the whole restore a single
+    transaction.
+    """
+
+    def __init__(
+        self, storage: StorageStrategyContext, chunk_size: int = IMPORT_CHUNK_SIZE
+    ):
+        """Initialize the importer.
+
+        Args:
+            storage: Storage context to write to
+            chunk_size: Number of tasks written per bulk insert
+        """
+        self.storage = storage
+        self.chunk_size = chunk_size
+        self.tallies = {kind: _Tally() for kind in ("projects", "labels", "tasks")}
+        self._indexed = False
+
+        # Natural key -> ID in the target storage
+        self._projects_by_name: dict[str, str] = {}
+        self._labels_by_name: dict[str, str] = {}
+        self._task_contents: set[str] = set()
+
+        # Archive ID -> ID in the target storage
+        self._project_ids: dict[str, str] = {}
+        self._label_ids: dict[str, str] = {}
+
+        # Buffered new entities: (archive ID, create model)
+        self._new_projects: list[tuple[str | None, ProjectCreate]] = []
+        self._new_labels: list[tuple[str | None, LabelCreate]] = []
+        self._new_tasks: list[TaskCreate] = []
+
+    async def _load_indexes(self) -> None:
+        """Load the natural keys of everything already in storage."""
+        projects = await self.storage.project_repository.list_all(ProjectFilters())
+        self._projects_by_name = {p.name.lower(): p.id for p in projects}
+        labels = await self.storage.label_repository.list_all()
+        self._labels_by_name = {lbl.name: lbl.id for lbl in labels}
+        async for task in self.storage.task_repository.iter_all(TaskFilters(status="all")):
+            self._task_contents.add(task.content)
+        self._indexed = True
+
+    async def import_record(self, record_type: str, data: dict[str, Any]) -> None:
+        """Import a single archive record.
+
+        Args:
+            record_type: Record type ("project", "label", "task", ...)
+            data: Record payload
+        """
+        if not self._indexed:
+            await self._load_indexes()
+
+        if record_type == "project":
+            self._import_project(data)
+        elif record_type == "label":
+            self._import_label(data)
+        elif record_type == "task":
+            await self._import_task(data)
+        # Contexts live in the config file and are not imported into a vault
+
+    async def flush(self) -> None:
+        """Write all buffered entities."""
+        await self._flush_projects()
+        await self._flush_labels()
+        await self._flush_tasks()
+
+    def result(self) -> dict[str, Any]:
+        """Import results in the remote API's response format."""
+        summary = {kind: tally.summary for kind, tally in self.tallies.items()}
+        summary["contexts"] = "N/A (contexts not imported to local)"
+        return {
+            "summary": summary,
+            "details": {
+                kind: {"errors": tally.errors, "error_count": tally.error_count}
+                for kind, tally in self.tallies.items()
+            },
+        }
+
+    def _import_project(self, data: dict[str, Any]) -> None:
+        tally = self.tallies["projects"]
+        name = data.get("name")
+        if not name:
+            tally.error("Unknown: project has no name")
+            return
+
+        existing_id = self._projects_by_name.get(name.lower())
+        if existing_id is not None:
+            tally.skipped += 1
+            if data.get("id"):
+                self._project_ids[data["id"]] = existing_id
+            return
+
+        try:
+            project = ProjectCreate(
+                name=name,
+                color=data.get("color"),
+                is_favorite=data.get("is_favorite", False),
+            )
+        except Exception as e:
+            tally.error(f"{name}: {e}")
+            return
+        # Reserve the name so later duplicates in the archive are skipped
+        self._projects_by_name[name.lower()] = ""
+        self._new_projects.append((data.get("id"), project))
+
+    def _import_label(self, data: dict[str, Any]) -> None:
+        tally = self.tallies["labels"]
+        name = data.get("name")
+        if not name:
+            tally.error("Unknown: label has no name")
+            return
+
+        existing_id = self._labels_by_name.get(name)
+        if existing_id is not None:
+            tally.skipped += 1
+            if data.get("id"):
+                self._label_ids[data["id"]] = existing_id
+            return
+
+        try:
+            label = LabelCreate(name=name, color=data.get("color"))
+        except Exception as e:
+            tally.error(f"{name}: {e}")
+            return
+        self._labels_by_name[name] = ""
+        self._new_labels.append((data.get("id"), label))
+
+    async def _import_task(self, data: dict[str, Any]) -> None:
+        # Tasks may reference projects and labels that are still buffered
+        if self._new_projects or self._new_labels:
+            await self._flush_projects()
+            await self._flush_labels()
+
+        tally = self.tallies["tasks"]
+        content = data.get("content")
+        if content in self._task_contents:
+            tally.skipped += 1
+            return
+
+        try:
+            task = TaskCreate(
+                content=data["content"],
+                description=data.get("description"),
+                priority=data.get("priority", 4),
+                due_date=data.get("due_date"),
+                project_id=self._resolve_project_id(data),
+                labels=[
+                    self._label_ids[label_id]
+                    for label_id in data.get("labels", [])
+                    if label_id in self._label_ids
+                ],
+            )
+        except Exception as e:
+            tally.error(f"{(content or 'Unknown')[:30]}: {e}")
+            return
+
+        self._task_contents.add(content)
+        self._new_tasks.append(task)
+        if len(self._new_tasks) >= self.chunk_size:
+            await self._flush_tasks()
+
+    def _resolve_project_id(self, data: dict[str, Any]) -> str | None:
+        project_id = self._project_ids.get(data.get("project_id") or "")
+        if project_id is None and data.get("project_name"):
+            project_id = self._projects_by_name.get(data["project_name"].lower())
+        return project_id or None
+
+    async def _flush_projects(self) -> None:
+        if not self._new_projects:
+            return
+        batch, self._new_projects = self._new_projects, []
+        tally = self.tallies["projects"]
+        try:
+            ids = await self.storage.project_repository.create_many(
+                [project for _, project in batch]
+            )
+        except Exception as e:
+            for _, project in batch:
+                self._projects_by_name.pop(project.name.lower(), None)
+            tally.error(f"{len(batch)} projects starting with {batch[0][1].name!r}: {e}")
+            return
+        tally.created += len(batch)
+        for (archive_id, project), new_id in zip(batch, ids, strict=True):
+            self._projects_by_name[project.name.lower()] = new_id
+            if archive_id:
+                self._project_ids[archive_id] = new_id
+
+    async def _flush_labels(self) -> None:
+        if not self._new_labels:
+            return
+        batch, self._new_labels = self._new_labels, []
+        tally = self.tallies["labels"]
+        try:
+            ids = await self.storage.label_repository.create_many(
+                [label for _, label in batch]
+            )
+        except Exception as e:
+            for _, label in batch:
+                self._labels_by_name.pop(label.name, None)
+            tally.error(f"{len(batch)} labels starting with {batch[0][1].name!r}: {e}")
+            return
+        tally.created += len(batch)
+        for (archive_id, label), new_id in zip(batch, ids, strict=True):
+            self._labels_by_name[label.name] = new_id
+            if archive_id:
+                self._label_ids[archive_id] = new_id
+
+    async def _flush_tasks(self) -> None:
+        if not self._new_tasks:
+            return
+        batch, self._new_tasks = self._new_tasks, []
+        tally = self.tallies["tasks"]
+        try:
+            await self.storage.task_repository.add_many(batch)
+        except Exception as e:
+            tally.error(f"{len(batch)} tasks starting with {batch[0].content[:30]!r}: {e}")
+            return
+        tally.created += len(batch)
+
+
+_SUMMARY_PATTERN = re.compile(r"(\d+) created, (\d+) skipped")
+
+
+class ApiArchiveImporter:
+    """Imports archive records into a remote account in chunks.
+
+    Tasks are batched into payloads for the ``/api/import/data`` endpoint,
+    so arbitrarily large archives are uploaded with bounded memory; the
+    per-chunk results are merged into a single response. Projects, labels
+    and contexts are held back and sent ahead of the first task chunk.
+
+    The server maps archive IDs to its own only within one request, so each
+    task chunk also carries the projects and labels its tasks refer to. The
+    server matches those to the entities it already created by name and
+    skips them, as it does when the same archive is imported twice; their
+    counts are therefore left out of the merged summary.
+    """
+
+    def __init__(self, client, chunk_size: int = IMPORT_CHUNK_SIZE):
+        """Initialize the importer.
+
+        Args:
+            client: API client
+            chunk_size: Number of tasks sent per request
+        """
+        self.client = client
+        self.chunk_size = chunk_size
+        self.encryption: dict[str, Any] = {"enabled": False}
+        self._entities: dict[str, list[dict[str, Any]]] = {}
+        # Archive ID -> record, for the entities task chunks refer to
+        self._projects: dict[str, dict[str, Any]] = {}
+        self._labels: dict[str, dict[str, Any]] = {}
+        self._tasks: list[dict[str, Any]] = []
+        self._totals: dict[str, list[int]] = {}
+        self._details: dict[str, dict[str, list[str]]] = {}
+
+    async def import_record(self, record_type: str, data: dict[str, Any]) -> None:
+        """Queue a record, sending the queued tasks once a chunk is full."""
+        if record_type == "header":
+            self.encryption = data.get("encryption", self.encryption)
+            return
+        if record_type == "stats":
+            return
+        if record_type != "task":
+            self._entities.setdefault(f"{record_type}s", []).append(data)
+            if record_type == "project" and data.get("id"):
+                self._projects[data["id"]] = data
+            elif record_type == "label" and data.get("id"):
+                self._labels[data["id"]] = data
+            return
+        self._tasks.append(data)
+        if len(self._tasks) >= self.chunk_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Send the queued entities, then the queued tasks."""
+        if self._entities:
+            entities, self._entities = self._entities, {}
+            await self._send(entities)
+        if self._tasks:
+            tasks, self._tasks = self._tasks, []
+            await self._send(self._task_chunk(tasks), kinds={"tasks"})
+
+    def _task_chunk(self, tasks: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+        """Payload data for a task chunk, with the entities its tasks refer to."""
+        project_ids = dict.fromkeys(task.get("project_id") for task in tasks)
+        label_ids = dict.fromkeys(
+            label for task in tasks for label in task.get("labels") or []
+        )
+        data: dict[str, list[dict[str, Any]]] = {
+            "projects": [self._projects[i] for i in project_ids if i in self._projects],
+            "labels": [self._labels[i] for i in label_ids if i in self._labels],
+        }
+        data = {kind: items for kind, items in data.items() if items}
+        data["tasks"] = tasks
+        return data
+
+    async def _send(
+        self, data: dict[str, list[dict[str, Any]]], kinds: set[str] | None = None
+    ) -> None:
+        payload = {"encryption": self.encryption, "data": data}
+        response = await self.client.request("POST", "/api/import/data", json=payload)
+        if isinstance(response, dict):
+            self._merge(response, kinds)
+
+    def _merge(self, response: dict[str, Any], kinds: set[str] | None = None) -> None:
+        """Add a chunk's results, limited to *kinds* (default: all)."""
+        for kind, text in response.get("summary", {}).items():
+            if kinds is not None and kind not in kinds:
+                continue
+            match = _SUMMARY_PATTERN.search(str(text))
+            if match:
+                created, skipped = self._totals.setdefault(kind, [0, 0])
+                self._totals[kind] = [
+                    created + int(match.group(1)),
+                    skipped + int(match.group(2)),
+                ]
+        for kind, detail in response.get("details", {}).items():
+            if kinds is not None and kind not in kinds:
+                continue
+            errors = self._details.setdefault(kind, {"errors": []})["errors"]
+            errors.extend(detail.get("errors", [])[: MAX_REPORTED_ERRORS - len(errors)])
+
+    def result(self) -> dict[str, Any]:
+        """Merged import results in the remote API's response format."""
+        return {
+            "summary": {
+                kind: f"{created} created, {skipped} skipped"
+                for kind, (created, skipped) in self._totals.items()
+            },
+            "details": self._details,
+        }
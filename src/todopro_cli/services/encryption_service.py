@@ -13,6 +13,7 @@ from todopro_cli.models.crypto.exceptions import (
 )
 from todopro_cli.models.crypto.manager import EncryptionManager
 from todopro_cli.models.crypto.storage import KeyStorage
+from todopro_cli.utils import profiler
 
 
 @dataclass
@@ -58,6 +59,7 @@ class EncryptionService:
         self.storage = KeyStorage(config_dir)
         self._manager: EncryptionManager | None = None
 
+    @profiler.traced("e2ee.load_key", "e2ee")
     def _get_manager(self) -> EncryptionManager:
         """
         Get or load encryption manager.
@@ -195,6 +197,7 @@ class EncryptionService:
                 f"Failed to recover key from phrase: {str(e)}"
             ) from e
 
+    @profiler.traced("e2ee.encrypt", "e2ee")
     def encrypt(self, plaintext: str) -> dict[str, str]:
         """
         Encrypt plaintext data.
@@ -212,6 +215,7 @@ class EncryptionService:
         encrypted = manager.encrypt(plaintext)
         return encrypted.to_dict()
 
+    @profiler.traced("e2ee.decrypt", "e2ee")
     def decrypt(self, encrypted_dict: dict[str, str]) -> str:
         """
         Decrypt encrypted data.
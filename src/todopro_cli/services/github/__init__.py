@@ -0,0 +1,15 @@
+"""GitHub integration service package."""
+
+from .client import GitHubClient
+from .models import GitHubIssueBatch, GitHubSyncResult
+from .store import GitHubSyncStore
+from .sync import GitHubSyncEngine, priority_from_labels
+
+__all__ = [
+    "GitHubClient",
+    "GitHubIssueBatch",
+    "GitHubSyncEngine",
+    "GitHubSyncResult",
+    "GitHubSyncStore",
+    "priority_from_labels",
+]
@@ -0,0 +1,165 @@
+"""GitHub REST API client for listing repository issues.
+
+Listings follow GitHub's ``Link`` pagination: the first page is fetched on
+its own (it carries the ETag and the number of the last page), then the
+remaining pages are fetched concurrently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import re
+from typing import Any
+
+import httpx
+
+from .models import GitHubIssueBatch
+
+_BASE_URL = "https://api.github.com"
+_DEFAULT_TIMEOUT = 30.0
+_MAX_PER_PAGE = 100  # API page cap
+_DEFAULT_CONCURRENCY = 4
+_MAX_RATE_LIMIT_RETRIES = 3
+_DEFAULT_RETRY_AFTER = 1.0  # seconds; doubled per retry when no Retry-After header
+
+_LAST_PAGE_PATTERN = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+def last_page(link_header: str | None) -> int:
+    """Return the page number of the ``rel="last"`` link, or 1 if absent."""
+    if not link_header:
+        return 1
+    match = _LAST_PAGE_PATTERN.search(link_header)
+    return int(match.group(1)) if match else 1
+
+
+class GitHubClient:
+    """GitHub REST client using httpx.
+
+    Args:
+        token: GitHub personal access token.
+        base_url: Override API base URL (useful for testing).
+        timeout: HTTP request timeout in seconds.
+        max_concurrency: Maximum page requests in flight at once.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        base_url: str = _BASE_URL,
+        timeout: float = _DEFAULT_TIMEOUT,
+        max_concurrency: int = _DEFAULT_CONCURRENCY,
+    ) -> None:
+        self._headers = {
+            "Authorization": f"token {token}",
+            "User-Agent": "todopro-cli",
+        }
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._max_concurrency = max_concurrency
+
+    async def fetch_issues(
+        self,
+        repo: str,
+        *,
+        state: str = "open",
+        limit: int | None = None,
+        since: str | None = None,
+        etag: str | None = None,
+        sort: str | None = None,
+        direction: str | None = None,
+    ) -> GitHubIssueBatch:
+        """List issues (and pull requests, as GitHub does) of a repository.
+
+        Args:
+            repo: Repository as ``owner/repo``
+            state: "open", "closed" or "all"
+            limit: Maximum number of items to return (None for all)
+            since: Only items updated at or after this ISO 8601 timestamp
+            etag: ETag of a previous identical listing; if the first page is
+                unchanged the server answers 304 and nothing is downloaded
+            sort: "created", "updated" or "comments"
+            direction: "asc" or "desc"
+
+        Returns:
+            The issues, the first page's ETag, and whether it was not modified
+
+        Raises:
+            ValueError: If the token is invalid
+            LookupError: If the repository does not exist
+        """
+        per_page = min(limit or _MAX_PER_PAGE, _MAX_PER_PAGE)
+        params: dict[str, Any] = {"state": state, "per_page": per_page}
+        if since:
+            params["since"] = since
+        if sort:
+            params["sort"] = sort
+        if direction:
+            params["direction"] = direction
+        url = f"{self._base_url}/repos/{repo}/issues"
+
+        async with httpx.AsyncClient(timeout=self._timeout) as client:
+            headers = {**self._headers, "If-None-Match": etag} if etag else self._headers
+            first = await self._get(client, url, repo, params, headers)
+            if first.status_code == 304:
+                return GitHubIssueBatch(etag=etag, not_modified=True)
+
+            issues = list(first.json())
+            pages = last_page(first.headers.get("Link"))
+            if limit is not None:
+                pages = min(pages, math.ceil(limit / per_page))
+
+            if pages > 1:
+                semaphore = asyncio.Semaphore(self._max_concurrency)
+
+                async def fetch_page(page: int) -> list[dict[str, Any]]:
+                    async with semaphore:
+                        response = await self._get(
+                            client, url, repo, {**params, "page": page}, self._headers
+                        )
+                        return response.json()
+
+                for items in await asyncio.gather(
+                    *(fetch_page(page) for page in range(2, pages + 1))
+                ):
+                    issues.extend(items)
+
+        if limit is not None:
+            issues = issues[:limit]
+        return GitHubIssueBatch(issues=issues, etag=first.headers.get("ETag"))
+
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        repo: str,
+        params: dict[str, Any],
+        headers: dict[str, str],
+    ) -> httpx.Response:
+        """Execute a GET request, retrying rate-limited ones."""
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            response = await client.get(url, headers=headers, params=params)
+            rate_limited = response.status_code == 429 or (
+                response.status_code == 403 and "Retry-After" in response.headers
+            )
+            if not rate_limited or attempt == _MAX_RATE_LIMIT_RETRIES:
+                break
+            await asyncio.sleep(self._retry_after(response, attempt))
+
+        if response.status_code == 401:
+            raise ValueError("Invalid GitHub token")
+        if response.status_code == 404:
+            raise LookupError(f"Repository not found: {repo}")
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    @staticmethod
+    def _retry_after(response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a rate-limited request."""
+        try:
+            return max(float(response.headers.get("Retry-After")), 0.0)
+        except (TypeError, ValueError):
+            return _DEFAULT_RETRY_AFTER * 2**attempt
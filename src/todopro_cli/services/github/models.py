@@ -0,0 +1,29 @@
+"""Pydantic models for the GitHub issues sync."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class GitHubIssueBatch(BaseModel):
+    """Issues returned by one (possibly multi-page) issues listing."""
+
+    issues: list[dict[str, Any]] = Field(default_factory=list)
+    etag: str | None = None
+    not_modified: bool = False
+
+
+class GitHubSyncResult(BaseModel):
+    """Summary of a completed GitHub issues sync."""
+
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    not_modified: bool = False
+    errors: list[str] = Field(default_factory=list)
+
+    @property
+    def has_errors(self) -> bool:
+        return len(self.errors) > 0
@@ -0,0 +1,101 @@
+"""Persistent GitHub sync state: issue → task mappings and sync cursors.
+
+Kept in a small SQLite database per context, next to the context's other
+local data, so re-running an import upserts instead of duplicating tasks.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from todopro_cli.adapters.sqlite.connection import transaction
+
+CREATE_ISSUE_MAP_TABLE = """
+CREATE TABLE IF NOT EXISTS github_issue_map (
+    repo TEXT NOT NULL,
+    issue_number INTEGER NOT NULL,
+    task_id TEXT NOT NULL,
+    issue_updated_at TEXT,
+    PRIMARY KEY (repo, issue_number)
+)
+"""
+
+CREATE_SYNC_STATE_TABLE = """
+CREATE TABLE IF NOT EXISTS github_sync_state (
+    repo TEXT NOT NULL,
+    state TEXT NOT NULL,
+    since TEXT,
+    etag TEXT,
+    PRIMARY KEY (repo, state)
+)
+"""
+
+
+class GitHubSyncStore:
+    """SQLite-backed mapping table and per-repository sync cursors."""
+
+    def __init__(self, db_path: str | Path):
+        """Initialize the store.
+
+        Args:
+            db_path: Path of the sync state database file
+        """
+        self.db_path = Path(db_path)
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get or open the store's own connection."""
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self.db_path))
+            self._connection.execute(CREATE_ISSUE_MAP_TABLE)
+            self._connection.execute(CREATE_SYNC_STATE_TABLE)
+            self._connection.commit()
+        return self._connection
+
+    def close(self) -> None:
+        """Close the connection, if open."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def get_mappings(self, repo: str) -> dict[int, tuple[str, str | None]]:
+        """Return issue number → (task ID, issue updated_at) for a repository."""
+        rows = self.connection.execute(
+            "SELECT issue_number, task_id, issue_updated_at FROM github_issue_map "
+            "WHERE repo = ?",
+            (repo,),
+        )
+        return {number: (task_id, updated_at) for number, task_id, updated_at in rows}
+
+    def save_mappings(
+        self, repo: str, mappings: list[tuple[int, str, str | None]]
+    ) -> None:
+        """Insert or replace (issue number, task ID, issue updated_at) rows."""
+        with transaction(self.connection):
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO github_issue_map "
+                "(repo, issue_number, task_id, issue_updated_at) VALUES (?, ?, ?, ?)",
+                [(repo, *mapping) for mapping in mappings],
+            )
+
+    def get_cursor(self, repo: str, state: str) -> tuple[str | None, str | None]:
+        """Return the (since, etag) cursor of the last sync, if any."""
+        row = self.connection.execute(
+            "SELECT since, etag FROM github_sync_state WHERE repo = ? AND state = ?",
+            (repo, state),
+        ).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def save_cursor(
+        self, repo: str, state: str, since: str | None, etag: str | None
+    ) -> None:
+        """Record where the next incremental sync should start."""
+        with transaction(self.connection):
+            self.connection.execute(
+                "INSERT OR REPLACE INTO github_sync_state (repo, state, since, etag) "
+                "VALUES (?, ?, ?, ?)",
+                (repo, state, since, etag),
+            )
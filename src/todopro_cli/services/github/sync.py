@@ -0,0 +1,205 @@
+"""GitHubSyncEngine — incremental GitHub issues → TodoPro tasks sync.
+
+Each run lists only issues updated since the previous run (oldest change
+first), sending the previous listing's ETag so an unchanged repository costs
+a single ``304 Not Modified``. Issues already mapped to a task are updated in
+place; new ones are created with one bulk insert and recorded in the mapping
+table once the vault transaction has committed.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from todopro_cli.models import TaskCreate, TaskFilters, TaskUpdate
+
+from .client import GitHubClient
+from .models import GitHubSyncResult
+from .store import GitHubSyncStore
+
+
+def priority_from_labels(labels: list[dict]) -> int:
+    """Map GitHub issue labels to TodoPro priority (1-4)."""
+    label_names = {lbl.get("name", "").lower() for lbl in labels}
+    if "bug" in label_names:
+        return 4
+    if "enhancement" in label_names or "feature" in label_names:
+        return 2
+    if "docs" in label_names or "documentation" in label_names:
+        return 1
+    return 1
+
+
+def issue_content(issue: dict[str, Any]) -> str:
+    """Task content for an issue."""
+    return f"[GitHub #{issue['number']}] {issue['title']}"
+
+
+def issue_description(issue: dict[str, Any]) -> str:
+    """Task description for an issue (truncated body)."""
+    return (issue.get("body") or "")[:500]
+
+
+class GitHubSyncEngine:
+    """Syncs the issues of a GitHub repository into a TodoPro storage backend.
+
+    Args:
+        client: GitHub API client.
+        storage: TodoPro storage strategy context providing repository access.
+        store: Mapping table and sync cursors.
+    """
+
+    def __init__(
+        self, client: GitHubClient, storage, store: GitHubSyncStore
+    ) -> None:
+        self._client = client
+        self._storage = storage
+        self._store = store
+
+    async def sync(
+        self,
+        repo: str,
+        *,
+        state: str = "open",
+        limit: int | None = None,
+        full: bool = False,
+    ) -> GitHubSyncResult:
+        """Run one sync of *repo*.
+
+        Args:
+            repo: Repository as ``owner/repo``
+            state: Issue state to import ("open", "closed" or "all")
+            limit: Maximum issues processed in this run (None for all); the
+                cursor only advances past processed issues, so the next run
+                resumes where this one stopped
+            full: Ignore the cursor and list every issue again
+
+        Returns:
+            :class:`GitHubSyncResult` summarising what changed.
+        """
+        result = GitHubSyncResult()
+        since, etag = (None, None) if full else self._store.get_cursor(repo, state)
+
+        # Incremental runs list every state so closed issues complete their tasks
+        batch = await self._client.fetch_issues(
+            repo,
+            state="all" if since else state,
+            limit=limit,
+            since=since,
+            etag=etag,
+            sort="updated",
+            direction="asc",
+        )
+        if batch.not_modified:
+            result.not_modified = True
+            return result
+
+        mappings = self._store.get_mappings(repo)
+        issues = [i for i in batch.issues if i.get("pull_request") is None]
+        new_issues: list[dict[str, Any]] = []
+        saved: list[tuple[int, str, str | None]] = []
+
+        async with self._storage.transaction():
+            for issue in issues:
+                mapped = mappings.get(issue["number"])
+                if mapped is None:
+                    if state in ("all", issue.get("state")):
+                        new_issues.append(issue)
+                    continue
+
+                task_id, updated_at = mapped
+                if updated_at == issue.get("updated_at"):
+                    result.unchanged += 1
+                    continue
+                try:
+                    await self._storage.task_repository.update(
+                        task_id,
+                        TaskUpdate(
+                            content=issue_content(issue),
+                            description=issue_description(issue),
+                            priority=priority_from_labels(issue.get("labels", [])),
+                            is_completed=issue.get("state") == "closed",
+                        ),
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    result.errors.append(f"Issue #{issue['number']}: {exc}")
+                    continue
+                saved.append((issue["number"], task_id, issue.get("updated_at")))
+                result.updated += 1
+
+            if new_issues:
+                new_issues = await self._adopt_unmapped_tasks(
+                    new_issues, mappings, saved, result
+                )
+            if new_issues:
+                try:
+                    task_ids = await self._storage.task_repository.add_many(
+                        [
+                            TaskCreate(
+                                content=issue_content(issue),
+                                description=issue_description(issue),
+                                priority=priority_from_labels(issue.get("labels", [])),
+                            )
+                            for issue in new_issues
+                        ]
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    result.errors.append(f"{len(new_issues)} new issues: {exc}")
+                else:
+                    for issue, task_id in zip(new_issues, task_ids, strict=True):
+                        saved.append((issue["number"], task_id, issue.get("updated_at")))
+                    result.created += len(new_issues)
+
+        # The mapping table lives outside the vault, so it is only written once
+        # the vault transaction above has committed
+        self._store.save_mappings(repo, saved)
+        if result.has_errors:
+            # Keep the cursor so the failed issues are listed again next time
+            return result
+
+        # GitHub's `since` is inclusive, so resuming at the newest timestamp
+        # seen re-lists only the boundary issues, which are then unchanged.
+        # The ETag is only valid for the `since` it was listed with.
+        newest = max(
+            (i["updated_at"] for i in batch.issues if i.get("updated_at")),
+            default=since,
+        )
+        self._store.save_cursor(
+            repo, state, newest, batch.etag if newest == since else None
+        )
+        return result
+
+    async def _adopt_unmapped_tasks(
+        self,
+        new_issues: list[dict[str, Any]],
+        mappings: dict[int, tuple[str, str | None]],
+        saved: list[tuple[int, str, str | None]],
+        result: GitHubSyncResult,
+    ) -> list[dict[str, Any]]:
+        """Map new issues onto existing, unmapped tasks for the same issue.
+
+        A run that stops after the vault commit but before its mappings are
+        saved leaves such tasks behind; adopting them keeps the next run from
+        creating duplicates.
+
+        Returns:
+            The issues that still need a task.
+        """
+        mapped_ids = {task_id for task_id, _ in mappings.values()}
+        unmapped = {
+            task.content: task.id
+            async for task in self._storage.task_repository.iter_all(
+                TaskFilters(status="all")
+            )
+            if task.content.startswith("[GitHub #") and task.id not in mapped_ids
+        }
+
+        remaining = []
+        for issue in new_issues:
+            task_id = unmapped.pop(issue_content(issue), None)
+            if task_id is None:
+                remaining.append(issue)
+                continue
+            saved.append((issue["number"], task_id, issue.get("updated_at")))
+            result.unchanged += 1
+        return remaining
@@ -1,11 +1,146 @@
-"""Service for handling application logs, especially error logs."""
+"""Service for handling application logs, especially error logs.
+
+Errors are appended to ``errors.jsonl``, which is rotated (to
+``errors.1.jsonl`` … ``errors.N.jsonl``) once it grows past a size limit or
+its oldest entry passes an age limit, so no single file grows without bound.
+
+Which errors the user has seen is kept in a read cursor
+(``errors.cursor.json``) rather than by rewriting entries: the byte offset
+read up to, the file it points into, and an acknowledged watermark. Unread
+errors are read forward from the cursor, so the ``tp today`` banner costs
+O(new entries); "latest N" lookups read files backwards from the end.
+"""
 
 import json
+import os
 import platform
+from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+# Rotate the active log once it reaches this size ...
+MAX_LOG_BYTES = 1024 * 1024
+# ... or once its oldest entry is this old
+MAX_LOG_AGE = timedelta(days=7)
+# Number of rotated files kept besides the active one
+BACKUP_COUNT = 4
+
+# Errors older than this are never reported as unread
+UNREAD_WINDOW = timedelta(hours=24)
+# Most unread errors returned at once
+UNREAD_LIMIT = 50
+
+# Block size of backward reads
+_READ_BLOCK = 8192
+
+
+def _now() -> datetime:
+    return _as_utc(datetime.now(UTC))
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC, so every comparison is aware."""
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def _format_timestamp(value: datetime) -> str:
+    return _as_utc(value).isoformat().replace("+00:00", "Z")
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    """Parse an entry timestamp ("...Z", "+00:00" or the legacy "+00:00Z")."""
+    if not isinstance(value, str):
+        return None
+    if value.endswith("Z"):
+        value = value[:-1]
+        if value[-6:] != "+00:00":
+            value += "+00:00"
+    try:
+        return _as_utc(datetime.fromisoformat(value))
+    except ValueError:
+        return None
+
+
+def _parse_line(line: bytes) -> dict[str, Any] | None:
+    try:
+        entry = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _entry_time(entry: dict[str, Any]) -> datetime | None:
+    return _parse_timestamp(entry.get("timestamp"))
+
+
+def _read_forward(path: Path, start: int = 0) -> tuple[list[dict[str, Any]], int]:
+    """Read the entries of *path* from byte offset *start*.
+
+    A trailing line without a newline is still being written and is left
+    for the next read.
+
+    Returns:
+        The entries in file order and the offset just past the last one read
+    """
+    entries = []
+    with open(path, "rb") as f:
+        f.seek(start)
+        end = start
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            end += len(line)
+            entry = _parse_line(line)
+            if entry is not None:
+                entries.append(entry)
+    return entries, end
+
+
+def _read_backwards(path: Path, end: int | None = None) -> Iterator[dict[str, Any]]:
+    """Yield the entries of *path* newest first, reading blocks from the end."""
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END) if end is None else end
+        tail = b""
+        while position > 0:
+            size = min(_READ_BLOCK, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + tail).split(b"\n")
+            # The first piece may be the end of a line in an earlier block
+            tail = lines.pop(0)
+            for line in reversed(lines):
+                entry = _parse_line(line) if line.strip() else None
+                if entry is not None:
+                    yield entry
+        entry = _parse_line(tail) if tail.strip() else None
+        if entry is not None:
+            yield entry
+
+
+def _complete_length(path: Path) -> int:
+    """Length of *path* up to its last newline, leaving out a line being written."""
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        while position > 0:
+            size = min(_READ_BLOCK, position)
+            position -= size
+            f.seek(position)
+            index = f.read(size).rfind(b"\n")
+            if index >= 0:
+                return position + index + 1
+    return 0
+
+
+def _first_entry_time(path: Path) -> datetime | None:
+    """Timestamp of the oldest entry, found without reading the whole file."""
+    with open(path, "rb") as f:
+        for line in f:
+            entry = _parse_line(line) if line.strip() else None
+            if entry is not None:
+                return _entry_time(entry)
+    return None
+
 
 class LogService:
     """Service for handling application logs, especially error logs."""
@@ -40,61 +175,157 @@ class LogService:
         log_dir = LogService.get_log_directory()
         return log_dir / "errors.jsonl"
 
+    @staticmethod
+    def get_error_log_paths() -> list[Path]:
+        """Get the existing error log files, newest first.
+
+        The active file comes first, followed by its rotated predecessors.
+        """
+        log_file = LogService.get_error_log_path()
+        paths = [log_file] + [
+            LogService._rotated_path(log_file, i) for i in range(1, BACKUP_COUNT + 1)
+        ]
+        return [path for path in paths if path.exists()]
+
+    @staticmethod
+    def _rotated_path(log_file: Path, generation: int) -> Path:
+        return log_file.with_name(f"{log_file.stem}.{generation}{log_file.suffix}")
+
+    @staticmethod
+    def _cursor_path() -> Path:
+        return LogService.get_log_directory() / "errors.cursor.json"
+
+    @staticmethod
+    def _read_cursor() -> dict[str, Any]:
+        try:
+            cursor = json.loads(LogService._cursor_path().read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return cursor if isinstance(cursor, dict) else {}
+
+    @staticmethod
+    def _write_cursor(
+        path: Path, offset: int, acknowledged_at: datetime | None
+    ) -> None:
+        """Point the read cursor at *offset* in *path* (written atomically)."""
+        cursor_path = LogService._cursor_path()
+        cursor = {
+            "inode": path.stat().st_ino,
+            "offset": offset,
+            "acknowledged_at": acknowledged_at and _format_timestamp(acknowledged_at),
+        }
+        tmp = cursor_path.with_name(f"{cursor_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(cursor), encoding="utf-8")
+        os.replace(tmp, cursor_path)
+
     @staticmethod
     def get_recent_errors(
         limit: int = 10, since_hours: int | None = None
     ) -> list[dict[str, Any]]:
         """
-        Get recent errors from the log file.
+        Get recent errors from the log files.
+
+        Files are read backwards from the end, so only the tail holding the
+        latest *limit* entries is read.
 
         Args:
             limit: Maximum number of errors to return
             since_hours: Only return errors from the last N hours
 
         Returns:
-            List of error entries
+            List of error entries, most recent first
         """
-        log_file = LogService.get_error_log_path()
-
-        if not log_file.exists():
-            return []
-
-        errors = []
         cutoff_time = None
-
         if since_hours:
-            cutoff_time = datetime.now(UTC) - timedelta(hours=since_hours)
+            cutoff_time = _now() - timedelta(hours=since_hours)
+
+        errors: list[dict[str, Any]] = []
+        if limit <= 0:
+            return errors
+        for path in LogService.get_error_log_paths():
+            # A rotated file last written before the cutoff has nothing newer
+            if (
+                cutoff_time
+                and path != LogService.get_error_log_path()
+                and path.stat().st_mtime < cutoff_time.timestamp()
+            ):
+                break
+            for entry in _read_backwards(path):
+                if cutoff_time:
+                    entry_time = _entry_time(entry)
+                    if entry_time is None or entry_time < cutoff_time:
+                        continue
+                errors.append(entry)
+                if len(errors) >= limit:
+                    return errors
+        return errors
 
-        with open(log_file, encoding="utf-8") as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-
-                    # Filter by time if specified
-                    if cutoff_time:
-                        entry_time = datetime.fromisoformat(
-                            entry["timestamp"].replace("Z", "+00:00")
-                        )
-                        if entry_time.replace(tzinfo=None) < cutoff_time:
-                            continue
-
-                    errors.append(entry)
-                except (json.JSONDecodeError, KeyError):
-                    continue
+    @staticmethod
+    def _scan_unread() -> tuple[list[dict[str, Any]], int]:
+        """Collect the unread errors, oldest first.
 
-        # Return most recent errors first
-        errors.reverse()
-        return errors[:limit]
+        Reads forward from the cursor; without a usable cursor, reads the
+        active file backwards until entries fall out of the unread window.
+
+        Returns:
+            The unread entries and the offset in the active file read up to
+        """
+        log_file = LogService.get_error_log_path()
+        if not log_file.exists():
+            return [], 0
+
+        cursor = LogService._read_cursor()
+        watermark = _parse_timestamp(cursor.get("acknowledged_at"))
+        cutoff = _now() - UNREAD_WINDOW
+        if watermark is not None and watermark > cutoff:
+            cutoff = watermark
+
+        def is_unread(entry: dict[str, Any]) -> bool:
+            entry_time = _entry_time(entry)
+            return (
+                entry_time is not None
+                and entry_time >= cutoff
+                and (watermark is None or entry_time > watermark)
+                and not entry.get("acknowledged", False)
+            )
+
+        # Locate the file the cursor points into; rotation keeps its inode
+        paths = LogService.get_error_log_paths()
+        inodes = [path.stat().st_ino for path in paths]
+        offset = cursor.get("offset")
+        if cursor.get("inode") in inodes and isinstance(offset, int):
+            index = inodes.index(cursor["inode"])
+            if offset <= paths[index].stat().st_size:
+                unread: list[dict[str, Any]] = []
+                end = 0
+                for path in reversed(paths[: index + 1]):
+                    entries, end = _read_forward(path, offset)
+                    unread.extend(e for e in entries if is_unread(e))
+                    offset = 0
+                return unread, end
+
+        end = _complete_length(log_file)
+        unread = []
+        for entry in _read_backwards(log_file, end):
+            entry_time = _entry_time(entry)
+            if entry_time is not None and entry_time < cutoff:
+                break
+            if is_unread(entry):
+                unread.append(entry)
+        unread.reverse()
+        return unread, end
 
     @staticmethod
     def get_unread_errors() -> list[dict[str, Any]]:
         """
         Get errors that haven't been acknowledged.
 
-        Returns errors from the last 24 hours that don't have an 'acknowledged' flag.
+        Returns errors from the last 24 hours logged after the read cursor
+        (and without an 'acknowledged' flag), most recent first.
         """
-        errors = LogService.get_recent_errors(limit=50, since_hours=24)
-        return [e for e in errors if not e.get("acknowledged", False)]
+        unread, _ = LogService._scan_unread()
+        unread.reverse()
+        return unread[:UNREAD_LIMIT]
 
     @staticmethod
     def log_error(
@@ -104,7 +335,7 @@ class LogService:
         retries: int = 0,
     ) -> None:
         """
-        Log an error to the error log file.
+        Log an error to the error log file, rotating it first if it is due.
 
         Args:
             command: The command that failed (e.g., "complete", "add")
@@ -113,9 +344,11 @@ class LogService:
             retries: Number of retries attempted
         """
         log_file = LogService.get_error_log_path()
+        now = _now()
+        LogService._rotate_if_needed(log_file, now)
 
         log_entry = {
-            "timestamp": datetime.now(UTC).isoformat() + "Z",
+            "timestamp": _format_timestamp(now),
             "command": command,
             "error": error,
             "retries": retries,
@@ -126,10 +359,44 @@ class LogService:
         with open(log_file, "a", encoding="utf-8") as f:
             f.write(json.dumps(log_entry) + "\n")
 
+    @staticmethod
+    def _rotate_if_needed(log_file: Path, now: datetime) -> bool:
+        """Rotate the active log if it is too large or too old.
+
+        The read cursor needs no update: renaming keeps the inode it
+        points at.
+
+        Returns:
+            True if the log was rotated
+        """
+        try:
+            size = log_file.stat().st_size
+        except FileNotFoundError:
+            return False
+        if size < MAX_LOG_BYTES:
+            first = _first_entry_time(log_file)
+            if first is None or now - first < MAX_LOG_AGE:
+                return False
+
+        LogService._rotated_path(log_file, BACKUP_COUNT).unlink(missing_ok=True)
+        for generation in range(BACKUP_COUNT - 1, 0, -1):
+            rotated = LogService._rotated_path(log_file, generation)
+            if rotated.exists():
+                os.replace(
+                    rotated, LogService._rotated_path(log_file, generation + 1)
+                )
+        try:
+            os.replace(log_file, LogService._rotated_path(log_file, 1))
+        except FileNotFoundError:
+            return False  # rotated concurrently by another process
+        return True
+
     @staticmethod
     def mark_errors_as_read() -> int:
         """
-        Mark all current errors as read by setting acknowledged flag.
+        Mark all current errors as read by advancing the read cursor.
+
+        The log itself is not rewritten.
 
         Returns:
             Number of errors marked as read
@@ -139,39 +406,24 @@ class LogService:
         if not log_file.exists():
             return 0
 
-        # Read all entries
-        entries = []
-        with open(log_file, encoding="utf-8") as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    # Only mark recent errors (last 24 hours)
-                    entry_time = datetime.fromisoformat(
-                        entry["timestamp"].replace("Z", "+00:00")
-                    )
-                    age_hours = (
-                        datetime.now(UTC) - entry_time.replace(tzinfo=None)
-                    ).total_seconds() / 3600
-
-                    if age_hours <= 24 and not entry.get("acknowledged"):
-                        entry["acknowledged"] = True
-
-                    entries.append(entry)
-                except (json.JSONDecodeError, KeyError):
-                    continue
-
-        # Write back
-        with open(log_file, "w", encoding="utf-8") as f:
-            for entry in entries:
-                f.write(json.dumps(entry) + "\n")
-
-        return len([e for e in entries if e.get("acknowledged")])
+        unread, end = LogService._scan_unread()
+        # The watermark is the newest error seen, not the current time, so
+        # errors logged meanwhile by other processes stay unread
+        watermark = _parse_timestamp(LogService._read_cursor().get("acknowledged_at"))
+        if unread:
+            newest = max(map(_entry_time, unread))
+            watermark = newest if watermark is None else max(watermark, newest)
+        LogService._write_cursor(log_file, end, watermark)
+        return len(unread)
 
     @staticmethod
     def clear_old_errors(days: int = 30) -> int:
         """
         Remove errors older than specified days.
 
+        Rotated files are removed whole once their newest entry is past the
+        cutoff; the active file is only rewritten if it holds such entries.
+
         Args:
             days: Remove errors older than this many days
 
@@ -179,34 +431,58 @@ class LogService:
             Number of errors removed
         """
         log_file = LogService.get_error_log_path()
-
-        if not log_file.exists():
-            return 0
-
-        cutoff_time = datetime.now(UTC) - timedelta(days=days)
-
-        # Read and filter entries
-        kept_entries = []
+        cutoff_time = _now() - timedelta(days=days)
         removed_count = 0
 
-        with open(log_file, encoding="utf-8") as f:
+        # Oldest rotated files first; once one is kept, newer ones are too
+        for generation in range(BACKUP_COUNT, 0, -1):
+            rotated = LogService._rotated_path(log_file, generation)
+            if not rotated.exists():
+                continue
+            newest = next(
+                filter(None, map(_entry_time, _read_backwards(rotated))), None
+            )
+            if newest is not None and newest >= cutoff_time:
+                break
+            removed_count += len(_read_forward(rotated)[0])
+            rotated.unlink()
+
+        if not log_file.exists():
+            return removed_count
+        first = _first_entry_time(log_file)
+        if first is not None and first >= cutoff_time:
+            return removed_count
+
+        # Rewrite the active file, keeping the cursor on the same entry
+        cursor = LogService._read_cursor()
+        old_offset = cursor.get("offset", 0)
+        if cursor.get("inode") != log_file.stat().st_ino:
+            old_offset = None
+        kept_lines: list[bytes] = []
+        new_offset = 0
+        position = 0
+        with open(log_file, "rb") as f:
             for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    entry_time = datetime.fromisoformat(
-                        entry["timestamp"].replace("Z", "+00:00")
-                    )
-
-                    if entry_time.replace(tzinfo=None) >= cutoff_time:
-                        kept_entries.append(entry)
-                    else:
-                        removed_count += 1
-                except (json.JSONDecodeError, KeyError):
+                start = position
+                position += len(line)
+                entry = _parse_line(line) if line.strip() else None
+                if entry is None:
                     continue
-
-        # Write back kept entries
-        with open(log_file, "w", encoding="utf-8") as f:
-            for entry in kept_entries:
-                f.write(json.dumps(entry) + "\n")
+                entry_time = _entry_time(entry)
+                if entry_time is not None and entry_time < cutoff_time:
+                    removed_count += 1
+                    continue
+                if not line.endswith(b"\n"):
+                    line += b"\n"
+                kept_lines.append(line)
+                if old_offset is not None and start < old_offset:
+                    new_offset += len(line)
+
+        tmp = log_file.with_name(f"{log_file.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(b"".join(kept_lines))
+        os.replace(tmp, log_file)
+        if old_offset is not None:
+            acknowledged_at = _parse_timestamp(cursor.get("acknowledged_at"))
+            LogService._write_cursor(log_file, new_offset, acknowledged_at)
 
         return removed_count
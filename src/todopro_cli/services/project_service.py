@@ -196,6 +196,19 @@ class ProjectService:
         """
         return await self.repository.get_stats(project_id)
 
+    async def get_projects_stats(
+        self, project_ids: list[str] | None = None
+    ) -> dict[str, dict]:
+        """Get statistics for several projects at once.
+
+        Args:
+            project_ids: Project IDs to get stats for (defaults to all projects)
+
+        Returns:
+            Dictionary mapping each project ID to its statistics
+        """
+        return await self.repository.get_stats_many(project_ids)
+
 
 def get_project_service():
     """Factory function to get a ProjectService instance."""
@@ -0,0 +1,196 @@
+"""ReminderScheduler — deliver local reminders at their due time.
+
+Backs ``tp reminder watch`` and can run inside any long-lived process
+(``asyncio.create_task(scheduler.run())``).
+
+Pending reminders due within a horizon are loaded with one indexed query
+into a min-heap keyed by due time. The scheduler sleeps until the earliest
+deadline, so an idle watcher costs nothing between deadlines:
+  - reminders added, snoozed, completed or deleted through the scheduler
+    re-arm the heap in place and wake the loop only if the earliest
+    deadline moved earlier
+  - superseded heap entries are not searched for and removed; they are
+    dropped when they reach the top (lazy deletion)
+  - the heap is reloaded every ``refresh`` seconds, which picks up the
+    next stretch of the horizon and reminders written by other processes
+
+A reminder is marked sent before it is delivered, so a crash during
+delivery loses that notification rather than repeating it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+
+from todopro_cli.models import Reminder
+from todopro_cli.repositories import ReminderRepository
+
+# How far ahead pending reminders are loaded into the heap
+DEFAULT_HORIZON = timedelta(days=1)
+
+# Seconds between reloads of the heap from storage
+DEFAULT_REFRESH = 60.0
+
+Deliver = Callable[[Reminder], Awaitable[None]]
+
+
+def _utc(value: datetime) -> datetime:
+    """Normalize a due time so heap entries compare (naive means local)."""
+    return value.astimezone(UTC)
+
+
+class ReminderScheduler:
+    """Fires pending reminders from a timing heap.
+
+    Args:
+        repository: Reminder storage
+        deliver: Called with each reminder as it falls due
+        horizon: How far ahead reminders are loaded into the heap
+        refresh: Seconds between reloads from storage
+        clock: Current time (UTC-aware); injectable for tests
+    """
+
+    def __init__(
+        self,
+        repository: ReminderRepository,
+        deliver: Deliver,
+        *,
+        horizon: timedelta = DEFAULT_HORIZON,
+        refresh: float = DEFAULT_REFRESH,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._repository = repository
+        self._deliver = deliver
+        self._horizon = horizon
+        self._refresh = timedelta(seconds=refresh)
+        self._clock = clock or (lambda: datetime.now(UTC))
+        self._heap: list[tuple[datetime, str]] = []
+        # Reminder ID -> the deadline it is currently armed for
+        self._armed: dict[str, datetime] = {}
+        self._loaded_until: datetime | None = None
+        self._reload_at: datetime | None = None
+        self._wakeup = asyncio.Event()
+        self._stopped = False
+
+    @property
+    def next_deadline(self) -> datetime | None:
+        """The earliest armed deadline, or None if nothing is armed."""
+        heap = self._heap
+        while heap and self._armed.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def __len__(self) -> int:
+        return len(self._armed)
+
+    async def load(self) -> None:
+        """(Re)load the pending reminders due within the horizon."""
+        now = self._clock()
+        until = now + self._horizon
+        reminders = await self._repository.list_pending(before=until)
+        self._armed = {r.id: _utc(r.reminder_date) for r in reminders}
+        self._heap = [(when, r_id) for r_id, when in self._armed.items()]
+        heapq.heapify(self._heap)
+        self._loaded_until = until
+        self._reload_at = now + self._refresh
+
+    def arm(self, reminder: Reminder) -> None:
+        """Schedule a reminder (again) without touching storage.
+
+        Reminders beyond the loaded horizon are left to the reload that
+        reaches them; sent or snoozed ones are disarmed.
+        """
+        if reminder.is_sent or reminder.is_snoozed:
+            self.disarm(reminder.id)
+            return
+        when = _utc(reminder.reminder_date)
+        if self._loaded_until is not None and when >= self._loaded_until:
+            self.disarm(reminder.id)
+            return
+
+        current = self.next_deadline
+        self._armed[reminder.id] = when
+        heapq.heappush(self._heap, (when, reminder.id))
+        if current is None or when < current:
+            self._wakeup.set()
+
+    def disarm(self, reminder_id: str) -> None:
+        """Stop a reminder from firing; its heap entry is dropped lazily."""
+        self._armed.pop(reminder_id, None)
+
+    async def add(self, task_id: str, when: datetime) -> Reminder:
+        """Create a reminder and arm it."""
+        reminder = await self._repository.add(task_id, when)
+        self.arm(reminder)
+        return reminder
+
+    async def snooze(self, reminder_id: str, until: datetime) -> Reminder:
+        """Snooze a reminder and arm its replacement."""
+        reminder = await self._repository.snooze(reminder_id, until)
+        self.disarm(reminder_id)
+        self.arm(reminder)
+        return reminder
+
+    async def complete(self, reminder_id: str) -> Reminder:
+        """Dismiss a reminder before it fires."""
+        reminder = await self._repository.mark_sent(reminder_id)
+        self.disarm(reminder_id)
+        return reminder
+
+    async def delete(self, reminder_id: str) -> bool:
+        """Delete a reminder and disarm it."""
+        deleted = await self._repository.delete(reminder_id)
+        self.disarm(reminder_id)
+        return deleted
+
+    async def fire_due(self) -> list[Reminder]:
+        """Deliver every armed reminder whose deadline has passed.
+
+        Returns:
+            The delivered reminders, in deadline order
+        """
+        now = self._clock()
+        fired: list[Reminder] = []
+        while (deadline := self.next_deadline) is not None and deadline <= now:
+            _, reminder_id = heapq.heappop(self._heap)
+            del self._armed[reminder_id]
+            try:
+                reminder = await self._repository.get(reminder_id)
+            except ValueError:
+                continue  # deleted since it was loaded
+            if reminder.is_sent or reminder.is_snoozed:
+                continue  # handled by another process since it was loaded
+            reminder = await self._repository.mark_sent(reminder_id)
+            await self._deliver(reminder)
+            fired.append(reminder)
+        return fired
+
+    async def run(self) -> None:
+        """Deliver reminders until stop() is called."""
+        self._stopped = False
+        await self.load()
+        while not self._stopped:
+            await self.fire_due()
+            now = self._clock()
+            if now >= self._reload_at:
+                await self.load()
+                continue
+
+            wake_at = self._reload_at
+            deadline = self.next_deadline
+            if deadline is not None and deadline < wake_at:
+                wake_at = deadline
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._wakeup.wait(), (wake_at - now).total_seconds()
+                )
+            self._wakeup.clear()
+
+    def stop(self) -> None:
+        """Make run() return at its next wake-up, which happens right away."""
+        self._stopped = True
+        self._wakeup.set()
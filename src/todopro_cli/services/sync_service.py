@@ -5,6 +5,9 @@ Handles pull and push operations with conflict detection and resolution.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any, Literal
 
@@ -31,6 +34,43 @@ from todopro_cli.repositories import (
 )
 from todopro_cli.services.sync_conflicts import SyncConflict, SyncConflictTracker
 from todopro_cli.services.sync_state import SyncState
+from todopro_cli.utils import metrics
+
+# Items fetched ahead of the ones being applied while streaming a pull
+READ_AHEAD = 500
+
+_DONE = object()
+
+
+async def _read_ahead[T](
+    items: AsyncIterator[T], size: int = READ_AHEAD
+) -> AsyncIterator[T]:
+    """Iterate *items* from a background task that stays up to *size* ahead.
+
+    Lets the source fetch its next page while the consumer is still busy
+    with the current one, e.g. applying local upserts during a pull.
+    """
+    buffer: asyncio.Queue[Any] = asyncio.Queue(maxsize=size)
+
+    async def produce() -> None:
+        try:
+            async for item in items:
+                await buffer.put(item)
+        except Exception as e:
+            await buffer.put(e)
+        else:
+            await buffer.put(_DONE)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (item := await buffer.get()) is not _DONE:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
 
 
 class SyncResult:
@@ -218,19 +258,7 @@ class SyncPullService(SyncService):
                 result.labels_fetched = len(labels)
                 progress.update(task, completed=True)
 
-                # Pull tasks
-                task = progress.add_task("Fetching tasks...", total=None)
-                filters = TaskFilters()
-                tasks = await self.source_task_repo.list_all(filters)
-                result.tasks_fetched = len(tasks)
-                progress.update(task, completed=True)
-
-                if dry_run:
-                    # Preview mode - just count what would change
-                    self.console.print(
-                        "\n[yellow]Dry run - no changes applied[/yellow]"
-                    )
-                else:
+                if not dry_run:
                     # Sync projects
                     task = progress.add_task("Syncing projects...", total=len(projects))
                     for project in projects:
@@ -243,12 +271,25 @@ class SyncPullService(SyncService):
                         await self._sync_label(label, result, strategy)
                         progress.advance(task)
 
-                    # Sync tasks
-                    task = progress.add_task("Syncing tasks...", total=len(tasks))
-                    for task_item in tasks:
+                # Stream tasks: the next remote page is fetched while the
+                # current one is being written locally
+                task = progress.add_task(
+                    "Fetching tasks..." if dry_run else "Syncing tasks...", total=None
+                )
+                tasks = self.source_task_repo.iter_all(TaskFilters())
+                async for task_item in _read_ahead(tasks):
+                    result.tasks_fetched += 1
+                    if not dry_run:
                         await self._sync_task(task_item, result, strategy)
-                        progress.advance(task)
+                    progress.advance(task)
+                progress.update(task, completed=True)
 
+                if dry_run:
+                    # Preview mode - just count what would change
+                    self.console.print(
+                        "\n[yellow]Dry run - no changes applied[/yellow]"
+                    )
+                else:
                     # Update last sync time
                     self.sync_state.set_last_sync(context_key)
 
@@ -266,6 +307,8 @@ class SyncPullService(SyncService):
             result.error = f"{type(e).__name__}: {str(e)}\n\nTraceback:\n{''.join(traceback.format_tb(e.__traceback__))}"
             result.duration = (datetime.now() - start_time).total_seconds()
 
+        if not dry_run:
+            metrics.record_sync("pull", result)
         return result
 
     async def _sync_project(
@@ -481,6 +524,8 @@ class SyncPushService(SyncService):
             result.error = f"{type(e).__name__}: {str(e)}\n\nTraceback:\n{''.join(traceback.format_tb(e.__traceback__))}"
             result.duration = (datetime.now() - start_time).total_seconds()
 
+        if not dry_run:
+            metrics.record_sync("push", result)
         return result
 
     async def _sync_project(
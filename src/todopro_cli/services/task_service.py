@@ -6,10 +6,12 @@ a clean API for task-related business logic.
 
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
 
-from todopro_cli.models import Task, TaskCreate, TaskFilters, TaskUpdate
-from todopro_cli.repositories import TaskRepository
+from todopro_cli.models import Page, Task, TaskCreate, TaskFilters, TaskUpdate
+from todopro_cli.repositories import DEFAULT_PAGE_SIZE, TaskRepository
+from todopro_cli.utils.recurrence import occurrences_between
 
 
 class TaskService:
@@ -72,6 +74,126 @@ class TaskService:
         )
         return await self.repository.list_all(filters)
 
+    async def list_task_page(
+        self,
+        *,
+        status: str | None = None,
+        project_id: str | None = None,
+        priority: int | None = None,
+        search: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[Task]:
+        """Fetch one page of tasks.
+
+        Args:
+            status: Filter by status ("active", "completed", "all")
+            project_id: Filter by project ID
+            priority: Filter by priority level
+            search: Full-text search query
+            limit: Page size
+            offset: Offset of the first page (ignored when a cursor is given)
+            cursor: next_cursor of the previous page
+            with_total: Also estimate the total number of matching tasks
+
+        Returns:
+            Page of Task objects
+        """
+        filters = TaskFilters(
+            status=status,
+            project_id=project_id,
+            priority=priority,
+            search=search,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+        return await self.repository.list_page(filters, with_total=with_total)
+
+    async def iter_task_pages(
+        self,
+        *,
+        status: str | None = None,
+        project_id: str | None = None,
+        priority: int | None = None,
+        search: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        cursor: str | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[list[Task]]:
+        """Stream tasks in listing order, a page at a time.
+
+        Pages are chained through their cursors, so output can start as soon
+        as the first page arrives.
+
+        Args:
+            status: Filter by status ("active", "completed", "all")
+            project_id: Filter by project ID
+            priority: Filter by priority level
+            search: Full-text search query
+            limit: Maximum number of tasks in total (None for all)
+            offset: Offset of the first task (ignored when a cursor is given)
+            cursor: next_cursor of a page to continue after
+            page_size: Tasks fetched per repository call
+
+        Yields:
+            Non-empty lists of Task objects
+        """
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page = await self.list_task_page(
+                status=status,
+                project_id=project_id,
+                priority=priority,
+                search=search,
+                limit=size,
+                offset=offset,
+                cursor=cursor,
+            )
+            if page.items:
+                yield page.items
+            if remaining is not None:
+                remaining -= len(page.items)
+            if not page.has_more:
+                return
+            cursor = page.next_cursor
+
+    async def iter_tasks(
+        self,
+        *,
+        status: str | None = None,
+        project_id: str | None = None,
+        priority: int | None = None,
+        search: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        cursor: str | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[Task]:
+        """Stream tasks in listing order, one page in memory at a time.
+
+        Takes the same arguments as iter_task_pages.
+
+        Yields:
+            Task objects
+        """
+        async for tasks in self.iter_task_pages(
+            status=status,
+            project_id=project_id,
+            priority=priority,
+            search=search,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            page_size=page_size,
+        ):
+            for task in tasks:
+                yield task
+
     async def get_task(self, task_id: str) -> Task:
         """Get a specific task by ID.
 
@@ -210,6 +332,55 @@ class TaskService:
         """
         return await self.repository.complete(task_id)
 
+    async def skip_task(self, task_id: str) -> Task:
+        """Skip the current occurrence of a recurring task.
+
+        Args:
+            task_id: Task ID to skip
+
+        Returns:
+            Updated Task object, due at its next occurrence
+        """
+        return await self.repository.skip(task_id)
+
+    async def list_upcoming(
+        self, days: int = 7, *, now: datetime | None = None
+    ) -> list[tuple[datetime, Task]]:
+        """List task occurrences in the next *days* days.
+
+        Recurring tasks appear once per occurrence in the window. Only the
+        tasks the repository returns as candidates are expanded, each
+        lazily and only up to the end of the window.
+
+        Args:
+            days: Length of the window, starting now
+            now: Window start (default: the current local time)
+
+        Returns:
+            (occurrence time, task) pairs in chronological order
+        """
+        start = now or datetime.now()
+        end = start + timedelta(days=days)
+
+        occurrences: list[tuple[datetime, Task]] = []
+        for task in await self.repository.list_upcoming(start, end):
+            if task.due_date is None:
+                continue
+            rule = task.recurrence_rule if task.is_recurring else None
+            try:
+                times = list(
+                    occurrences_between(
+                        rule, task.due_date, start, end, task.recurrence_end
+                    )
+                )
+            except ValueError:
+                # Unparseable rule: show the pending occurrence only
+                times = list(occurrences_between(None, task.due_date, start, end))
+            occurrences.extend((at, task) for at in times)
+
+        occurrences.sort(key=lambda item: item[0])
+        return occurrences
+
     async def reopen_task(self, task_id: str) -> Task:
         """Reopen a completed task.
 
@@ -6,6 +6,7 @@ concrete implementation backed by httpx.
 
 from __future__ import annotations
 
+import asyncio
 from typing import Protocol, runtime_checkable
 
 import httpx
@@ -15,6 +16,8 @@ from .models import TodoistLabel, TodoistProject, TodoistTask
 _BASE_URL = "https://api.todoist.com/api/v1"
 _DEFAULT_TIMEOUT = 30.0
 _MAX_LABEL_LIMIT = 200  # Todoist labels endpoint paginates incorrectly; use max
+_MAX_RATE_LIMIT_RETRIES = 5
+_DEFAULT_RETRY_AFTER = 1.0  # seconds; doubled per retry when no Retry-After header
 
 
 @runtime_checkable
@@ -116,10 +119,19 @@ class TodoistClient:
         path: str,
         params: dict | None = None,
     ) -> list | dict:
-        """Execute a GET request, raising descriptive errors on failure."""
+        """Execute a GET request, raising descriptive errors on failure.
+
+        HTTP 429 responses are retried after the server's ``Retry-After``
+        delay (or an exponential backoff), so concurrent fetches stay within
+        Todoist's rate limits instead of failing the import.
+        """
         url = f"{self._base_url}{path}"
         async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.get(url, headers=self._headers, params=params)
+            for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+                response = await client.get(url, headers=self._headers, params=params)
+                if response.status_code != 429 or attempt == _MAX_RATE_LIMIT_RETRIES:
+                    break
+                await asyncio.sleep(self._retry_after(response, attempt))
 
         if response.status_code == 401:
             raise ValueError("Invalid Todoist API key — check your credentials.")
@@ -127,3 +139,12 @@ class TodoistClient:
             raise PermissionError("Insufficient permissions for the requested resource.")
         response.raise_for_status()
         return response.json()
+
+    @staticmethod
+    def _retry_after(response, attempt: int) -> float:
+        """Seconds to wait before retrying a rate-limited request."""
+        header = response.headers.get("Retry-After")
+        try:
+            return max(float(header), 0.0)
+        except (TypeError, ValueError):
+            return _DEFAULT_RETRY_AFTER * 2**attempt
@@ -10,6 +10,7 @@ Design follows SOLID:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 
 from todopro_cli.models import (
@@ -29,6 +30,9 @@ from .models import (
     TodoistTask,
 )
 
+# Tasks written per bulk insert
+_TASK_BATCH_SIZE = 500
+
 
 class TodoistImportService:
     """Fetches data from Todoist and imports it into a TodoPro storage backend.
@@ -55,9 +59,9 @@ class TodoistImportService:
 
         projects = await self._client.get_projects()
         labels = await self._client.get_labels()
-        project_name_map = await self._import_projects(projects, options, result)
+        project_id_map = await self._import_projects(projects, options, result)
         label_name_map = await self._import_labels(labels, options, result)
-        await self._import_tasks(projects, project_name_map, label_name_map, options, result)
+        await self._import_tasks(projects, project_id_map, label_name_map, options, result)
 
         return result
 
@@ -71,37 +75,45 @@ class TodoistImportService:
         options: TodoistImportOptions,
         result: TodoistImportResult,
     ) -> dict[str, str]:
-        """Import projects; return mapping todoist_id → todopro_name."""
-        id_to_name: dict[str, str] = {}
+        """Import projects; return mapping todoist_id → todopro_project_id.
+
+        Existing projects are looked up once and matched by name
+        (case-insensitively, as the vault enforces unique names).
+        """
+        id_map: dict[str, str] = {}
+
+        if options.dry_run:
+            result.projects_created = len(projects)
+            return id_map
+
+        existing_projects = await self._storage.project_repository.list_all(
+            ProjectFilters()
+        )
+        existing_ids = {p.name.lower(): p.id for p in existing_projects}
 
         for project in projects:
             prefixed_name = f"{options.project_name_prefix} {project.name}".strip()
-            id_to_name[project.id] = prefixed_name
-
-            if options.dry_run:
-                result.projects_created += 1
+            existing_id = existing_ids.get(prefixed_name.lower())
+            if existing_id is not None:
+                id_map[project.id] = existing_id
+                result.projects_skipped += 1
                 continue
 
             try:
-                existing = await self._storage.project_repository.list_all(
-                    ProjectFilters(search=prefixed_name)
-                )
-                if any(p.name == prefixed_name for p in existing):
-                    result.projects_skipped += 1
-                    continue
-
-                await self._storage.project_repository.create(
+                created = await self._storage.project_repository.create(
                     ProjectCreate(
                         name=prefixed_name,
                         color=project.color,
                         archived=project.is_archived,
                     )
                 )
+                id_map[project.id] = created.id
+                existing_ids[prefixed_name.lower()] = created.id
                 result.projects_created += 1
             except Exception as exc:  # noqa: BLE001
                 result.errors.append(f"Project '{prefixed_name}': {exc}")
 
-        return id_to_name
+        return id_map
 
     async def _import_labels(
         self,
@@ -140,76 +152,97 @@ class TodoistImportService:
     async def _import_tasks(
         self,
         projects: list[TodoistProject],
-        project_name_map: dict[str, str],
+        project_id_map: dict[str, str],
         label_name_map: dict[str, str],
         options: TodoistImportOptions,
         result: TodoistImportResult,
     ) -> None:
-        """Fetch and import tasks for every project."""
-        for project in projects:
-            tasks = await self._client.get_tasks(
-                project.id, limit=options.max_tasks_per_project
-            )
+        """Fetch tasks for every project concurrently, then import them.
+
+        At most ``options.max_concurrent_fetches`` requests are in flight;
+        the client retries rate-limited requests on its own.
+        """
+        semaphore = asyncio.Semaphore(options.max_concurrent_fetches)
+
+        async def fetch(project: TodoistProject) -> list[TodoistTask]:
+            async with semaphore:
+                return await self._client.get_tasks(
+                    project.id, limit=options.max_tasks_per_project
+                )
+
+        task_lists = await asyncio.gather(*(fetch(p) for p in projects))
+        tasks = [task for project_tasks in task_lists for task in project_tasks]
+
+        if options.dry_run:
+            result.tasks_created += len(tasks)
+            return
+
+        async with self._storage.transaction():
             await self._import_project_tasks(
-                tasks, project_name_map, label_name_map, options, result
+                tasks, project_id_map, label_name_map, result
+            )
+
+    async def _load_content_index(self) -> set[str]:
+        """Return the contents of all existing tasks, for deduplication."""
+        return {
+            task.content
+            async for task in self._storage.task_repository.iter_all(
+                TaskFilters(status="all")
             )
+        }
 
     async def _import_project_tasks(
         self,
         tasks: list[TodoistTask],
-        project_name_map: dict[str, str],
+        project_id_map: dict[str, str],
         label_name_map: dict[str, str],
-        options: TodoistImportOptions,
         result: TodoistImportResult,
     ) -> None:
-        """Persist a batch of tasks, resolving project/label references."""
+        """Persist tasks in bulk, resolving project/label references."""
+        contents = await self._load_content_index()
+        batch: list[TaskCreate] = []
+
         for task in tasks:
-            if options.dry_run:
-                result.tasks_created += 1
+            # Skip if a task with identical content already exists
+            if task.content in contents:
+                result.tasks_skipped += 1
                 continue
 
             try:
-                # Skip if a task with identical content already exists
-                existing = await self._storage.task_repository.list_all(
-                    TaskFilters(search=task.content)
-                )
-                if any(t.content == task.content for t in existing):
-                    result.tasks_skipped += 1
-                    continue
-
-                project_id = await self._resolve_project_id(
-                    task.project_id, project_name_map
-                )
-                label_ids = self._resolve_label_ids(task.labels, label_name_map)
-                due_date = self._parse_due_date(task)
-
-                await self._storage.task_repository.add(
+                batch.append(
                     TaskCreate(
                         content=task.content,
                         description=task.description or None,
-                        project_id=project_id,
-                        due_date=due_date,
+                        project_id=project_id_map.get(task.project_id),
+                        due_date=self._parse_due_date(task),
                         priority=task.priority,
-                        labels=label_ids,
+                        labels=self._resolve_label_ids(task.labels, label_name_map),
                     )
                 )
-                result.tasks_created += 1
             except Exception as exc:  # noqa: BLE001
                 result.errors.append(f"Task '{task.content[:40]}': {exc}")
+                continue
+            contents.add(task.content)
 
-    async def _resolve_project_id(
-        self, todoist_project_id: str, project_name_map: dict[str, str]
-    ) -> str | None:
-        """Resolve Todoist project ID to the corresponding TodoPro project ID."""
-        prefixed_name = project_name_map.get(todoist_project_id)
-        if not prefixed_name:
-            return None
+            if len(batch) >= _TASK_BATCH_SIZE:
+                await self._write_tasks(batch, result)
+                batch = []
 
-        projects = await self._storage.project_repository.list_all(
-            ProjectFilters(search=prefixed_name)
-        )
-        match = next((p for p in projects if p.name == prefixed_name), None)
-        return match.id if match else None
+        await self._write_tasks(batch, result)
+
+    async def _write_tasks(
+        self, batch: list[TaskCreate], result: TodoistImportResult
+    ) -> None:
+        """Write one batch of tasks with a single bulk insert."""
+        if not batch:
+            return
+        try:
+            await self._storage.task_repository.add_many(batch)
+            result.tasks_created += len(batch)
+        except Exception as exc:  # noqa: BLE001
+            result.errors.append(
+                f"{len(batch)} tasks starting with '{batch[0].content[:40]}': {exc}"
+            )
 
     @staticmethod
     def _resolve_label_ids(
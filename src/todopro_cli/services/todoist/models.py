@@ -64,6 +64,7 @@ class TodoistImportOptions(BaseModel):
 
     project_name_prefix: str = "[Todoist]"
     max_tasks_per_project: int = Field(default=500, ge=1)
+    max_concurrent_fetches: int = Field(default=4, ge=1)
     dry_run: bool = False
     include_completed: bool = False
 
@@ -0,0 +1,80 @@
+"""Deferred work that runs alongside a command and is drained before exit.
+
+Commands print their output as soon as it is ready; anything that only keeps
+caches warm for the *next* invocation (mirror revalidation, metadata refresh)
+is scheduled here instead of on the critical path.  ``command_wrapper`` drains
+the pending work once the command body has returned.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Coroutine
+from typing import Any
+
+# Upper bound on how long a finished command waits for deferred work
+DEFAULT_DRAIN_TIMEOUT = 10.0
+
+_pending: dict[str, asyncio.Task] = {}
+
+
+def defer(key: str, coro: Coroutine[Any, Any, Any]) -> asyncio.Task | None:
+    """Schedule a coroutine on the running loop, coalescing by key.
+
+    If work with the same key is already pending the new coroutine is
+    discarded, so concurrent callers share a single refresh.
+
+    Args:
+        key: Identifier used to coalesce duplicate work
+        coro: Coroutine to run in the background
+
+    Returns:
+        The scheduled (or already pending) task, or None if no loop is running
+    """
+    existing = _pending.get(key)
+    if existing is not None and not existing.done():
+        coro.close()
+        return existing
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        coro.close()
+        return None
+
+    task = loop.create_task(coro)
+    _pending[key] = task
+    task.add_done_callback(lambda t: _pending.pop(key, None) if _pending.get(key) is t else None)
+    return task
+
+
+def is_pending(key: str) -> bool:
+    """Check whether deferred work for a key is still running."""
+    task = _pending.get(key)
+    return task is not None and not task.done()
+
+
+async def drain(timeout: float | None = DEFAULT_DRAIN_TIMEOUT) -> None:
+    """Wait for all pending deferred work, cancelling whatever overruns.
+
+    Errors raised by deferred work are swallowed: it is best-effort by design
+    and must never turn a successful command into a failure.
+
+    Args:
+        timeout: Maximum seconds to wait (None waits indefinitely)
+    """
+    tasks = [t for t in _pending.values() if not t.done()]
+    if not tasks:
+        return
+
+    _done, still_running = await asyncio.wait(tasks, timeout=timeout)
+    for task in still_running:
+        task.cancel()
+    for task in still_running:
+        with contextlib.suppress(BaseException):
+            await task
+    for task in tasks:
+        if task.done() and not task.cancelled():
+            task.exception()  # Mark retrieved so asyncio doesn't log it
+    _pending.clear()
@@ -0,0 +1,431 @@
+"""Performance metrics in the OpenMetrics text format.
+
+Sync runs, the HTTP client, the short-ID caches and commands feed counters
+and histograms. Metrics are collected per run and, when the run ends,
+merged into a cumulative state file and rendered as OpenMetrics text. The
+output can be read by node_exporter's textfile collector or served by
+``tp metrics serve``.
+
+Collection is switched on with ``TODOPRO_METRICS_FILE=<path>.prom``, e.g.
+from cron::
+
+    TODOPRO_METRICS_FILE=/var/lib/node_exporter/textfile/todopro.prom tp sync pull
+
+The cumulative state sits next to the output as ``<path>.json``. The
+textfile collector only reads ``*.prom`` files, so it skips the state file.
+
+While collection is off, every hook costs one global lookup. ``timed()``
+returns a shared no-op context manager, and ``inc()``/``observe()`` return
+immediately.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import math
+import os
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from todopro_cli.services.sync_service import SyncResult
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+ENV_VAR = "TODOPRO_METRICS_FILE"
+
+# The exposition is valid Prometheus text format (``# EOF`` reads as a comment)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+STATE_VERSION = 1
+
+# Bucket upper bounds in seconds
+FAST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SLOW_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+MetricType = Literal["counter", "gauge", "histogram"]
+
+
+@dataclass(frozen=True)
+class Metric:
+    """A metric family: its type, help text and, for histograms, buckets."""
+
+    name: str
+    type: MetricType
+    help: str
+    buckets: tuple[float, ...] = ()
+
+
+METRICS: dict[str, Metric] = {
+    metric.name: metric
+    for metric in (
+        Metric("todopro_sync_runs", "counter", "Sync runs by direction and outcome."),
+        Metric(
+            "todopro_sync_duration_seconds",
+            "histogram",
+            "Duration of sync runs.",
+            SLOW_BUCKETS,
+        ),
+        Metric(
+            "todopro_sync_items",
+            "counter",
+            "Items handled by sync runs, by entity and change.",
+        ),
+        Metric("todopro_sync_conflicts", "counter", "Task conflicts detected by sync."),
+        Metric(
+            "todopro_sync_last_success_timestamp_seconds",
+            "gauge",
+            "Unix time of the last successful sync run.",
+        ),
+        Metric(
+            "todopro_http_request_duration_seconds",
+            "histogram",
+            "Latency of API requests, by method and status class.",
+            FAST_BUCKETS,
+        ),
+        Metric("todopro_http_retries", "counter", "API requests retried."),
+        Metric(
+            "todopro_http_token_refreshes",
+            "counter",
+            "Access token refreshes after a 401, by outcome.",
+        ),
+        Metric(
+            "todopro_cache_requests",
+            "counter",
+            "Cache lookups by cache and result (hit, miss or stale).",
+        ),
+        Metric(
+            "todopro_command_duration_seconds",
+            "histogram",
+            "Duration of CLI commands, by command.",
+            SLOW_BUCKETS,
+        ),
+    )
+}
+
+Labels = tuple[tuple[str, str], ...]
+
+_NULL_TIMER = nullcontext()
+
+
+class Registry:
+    """Metric values recorded during one run."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, dict[Labels, Any]] = {}
+
+    def _series(self, name: str, labels: dict[str, str]) -> tuple[dict, Labels]:
+        if name not in METRICS:
+            raise KeyError(f"Unknown metric: {name}")
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        return self.values.setdefault(name, {}), key
+
+    def inc(self, name: str, value: float, labels: dict[str, str]) -> None:
+        series, key = self._series(name, labels)
+        series[key] = series.get(key, 0) + value
+
+    def set(self, name: str, value: float, labels: dict[str, str]) -> None:
+        series, key = self._series(name, labels)
+        series[key] = value
+
+    def observe(self, name: str, value: float, labels: dict[str, str]) -> None:
+        series, key = self._series(name, labels)
+        buckets = METRICS[name].buckets
+        hist = series.setdefault(
+            key, {"buckets": [0] * len(buckets), "sum": 0.0, "count": 0}
+        )
+        for index, bound in enumerate(buckets):
+            if value <= bound:
+                hist["buckets"][index] += 1
+        hist["sum"] += value
+        hist["count"] += 1
+
+
+_registry: Registry | None = None
+_output: Path | None = None
+
+
+def enable(path: str | Path) -> Registry:
+    """Start collecting metrics for this run, to be written to *path*."""
+    global _registry, _output
+    _registry = Registry()
+    _output = Path(path).expanduser()
+    return _registry
+
+
+def disable() -> Registry | None:
+    """Stop collecting and return what this run recorded."""
+    global _registry, _output
+    registry, _registry, _output = _registry, None, None
+    return registry
+
+
+def is_enabled() -> bool:
+    """Whether this run collects metrics."""
+    return _registry is not None
+
+
+def inc(name: str, value: float = 1, **labels: str) -> None:
+    """Add to a counter (a no-op unless collecting)."""
+    if _registry is not None:
+        _registry.inc(name, value, labels)
+
+
+def set_gauge(name: str, value: float, **labels: str) -> None:
+    """Set a gauge (a no-op unless collecting)."""
+    if _registry is not None:
+        _registry.set(name, value, labels)
+
+
+def observe(name: str, value: float, **labels: str) -> None:
+    """Record a histogram observation (a no-op unless collecting)."""
+    if _registry is not None:
+        _registry.observe(name, value, labels)
+
+
+def timed(name: str, **labels: str) -> AbstractContextManager:
+    """Observe how long a block takes, in seconds, in histogram *name*."""
+    if _registry is None:
+        return _NULL_TIMER
+    return _timed(_registry, name, labels)
+
+
+@contextmanager
+def _timed(registry: Registry, name: str, labels: dict[str, str]) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        registry.observe(name, time.perf_counter() - start, labels)
+
+
+def cache_lookup(cache: str, hit: bool | None) -> None:
+    """Count a cache lookup: a hit, a miss, or (None) a stale hit."""
+    if _registry is not None:
+        result = "stale" if hit is None else "hit" if hit else "miss"
+        _registry.inc("todopro_cache_requests", 1, {"cache": cache, "result": result})
+
+
+def record_sync(direction: str, result: SyncResult) -> None:
+    """Record the outcome and counts of a finished sync run."""
+    registry = _registry
+    if registry is None:
+        return
+    outcome = "success" if result.success else "failure"
+    registry.inc("todopro_sync_runs", 1, {"direction": direction, "outcome": outcome})
+    registry.observe(
+        "todopro_sync_duration_seconds", result.duration, {"direction": direction}
+    )
+    for entity in ("tasks", "projects", "labels", "contexts"):
+        for change in ("fetched", "new", "updated", "unchanged"):
+            count = getattr(result, f"{entity}_{change}", 0)
+            if count:
+                registry.inc(
+                    "todopro_sync_items",
+                    count,
+                    {"direction": direction, "entity": entity, "change": change},
+                )
+    registry.inc(
+        "todopro_sync_conflicts", result.tasks_conflicts, {"direction": direction}
+    )
+    if result.success:
+        registry.set(
+            "todopro_sync_last_success_timestamp_seconds",
+            time.time(),
+            {"direction": direction},
+        )
+
+
+# -- State and exposition --------------------------------------------------
+
+
+def state_path(path: Path) -> Path:
+    """Where the cumulative state behind an OpenMetrics file is kept."""
+    return path.with_name(f"{path.name}.json")
+
+
+def load_state(path: Path) -> dict[str, dict[Labels, Any]]:
+    """Read the cumulative values behind an OpenMetrics file ({} if none)."""
+    try:
+        data = json.loads(state_path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != STATE_VERSION:
+        return {}
+    values: dict[str, dict[Labels, Any]] = {}
+    for name, series in data.get("metrics", {}).items():
+        if name in METRICS:
+            values[name] = {
+                tuple((k, v) for k, v in entry["labels"]): entry["value"]
+                for entry in series
+            }
+    return values
+
+
+def merge(
+    state: dict[str, dict[Labels, Any]], registry: Registry
+) -> dict[str, dict[Labels, Any]]:
+    """Fold one run's values into the cumulative state (in place).
+
+    Counters and histograms add up; gauges take the run's value.
+    """
+    for name, series in registry.values.items():
+        kind = METRICS[name].type
+        target = state.setdefault(name, {})
+        for key, value in series.items():
+            previous = target.get(key)
+            if previous is None or kind == "gauge":
+                target[key] = value
+            elif kind == "counter":
+                target[key] = previous + value
+            elif len(previous["buckets"]) == len(value["buckets"]):
+                target[key] = {
+                    "buckets": [
+                        a + b
+                        for a, b in zip(
+                            previous["buckets"], value["buckets"], strict=True
+                        )
+                    ],
+                    "sum": previous["sum"] + value["sum"],
+                    "count": previous["count"] + value["count"],
+                }
+            else:
+                target[key] = value  # Buckets changed: start the series over
+    return state
+
+
+def _labels(labels: Labels, extra: tuple[str, str] | None = None) -> str:
+    items = [*labels, extra] if extra else list(labels)
+    if not items:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for k, v in items
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render(state: dict[str, dict[Labels, Any]]) -> str:
+    """Render cumulative values as OpenMetrics text."""
+    lines: list[str] = []
+    for name, metric in METRICS.items():
+        series = state.get(name)
+        if not series:
+            continue
+        # Counter families carry the _total suffix, as node_exporter's
+        # (Prometheus text format) parser requires; OpenMetrics parsers
+        # accept it too
+        family = f"{name}_total" if metric.type == "counter" else name
+        lines.append(f"# HELP {family} {metric.help}")
+        lines.append(f"# TYPE {family} {metric.type}")
+        for key in sorted(series):
+            value = series[key]
+            if metric.type != "histogram":
+                lines.append(f"{family}{_labels(key)} {_number(value)}")
+            elif len(value["buckets"]) == len(metric.buckets):
+                # A series written with other buckets is dropped until the
+                # next write starts it over
+                bounds = [*metric.buckets, math.inf]
+                counts = [*value["buckets"], value["count"]]
+                for bound, count in zip(bounds, counts, strict=True):
+                    le = ("le", _number(bound))
+                    lines.append(f"{name}_bucket{_labels(key, le)} {count}")
+                lines.append(f"{name}_count{_labels(key)} {value['count']}")
+                lines.append(f"{name}_sum{_labels(key)} {_number(value['sum'])}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+@contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """Serialize read-merge-write cycles of concurrent runs (POSIX only)."""
+    if fcntl is None:
+        yield
+        return
+    with open(path.with_name(f".{path.name}.lock"), "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def write(path: Path, registry: Registry) -> None:
+    """Merge a run's values into *path* and its state file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _locked(path):
+        state = merge(load_state(path), registry)
+        document = {
+            "version": STATE_VERSION,
+            "metrics": {
+                name: [
+                    {"labels": [list(item) for item in key], "value": value}
+                    for key, value in series.items()
+                ]
+                for name, series in state.items()
+            },
+        }
+        _write_atomic(state_path(path), json.dumps(document))
+        _write_atomic(path, render(state))
+
+
+def finish() -> Registry | None:
+    """Stop collecting and write this run's values out.
+
+    A metrics file that cannot be written never fails the command.
+    """
+    path = _output
+    registry = disable()
+    if registry is None or path is None or not registry.values:
+        return registry
+    with contextlib.suppress(OSError):
+        write(path, registry)
+    return registry
+
+
+def make_server(path: Path, host: str, port: int) -> ThreadingHTTPServer:
+    """HTTP server exposing the metrics behind *path* at ``/metrics``.
+
+    Every scrape re-reads the state file, so it reflects runs that finished
+    since the server started.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = render(load_state(path)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass  # Scrapes are not worth a line on stderr each
+
+    return ThreadingHTTPServer((host, port), Handler)
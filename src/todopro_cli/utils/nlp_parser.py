@@ -2,20 +2,247 @@
 
 Provides date parsing, priority extraction, project/label detection
 without requiring backend API.
+
+Dates in the common forms (today, tomorrow, weekdays, "next week",
+"in N units", month names, numeric dates and times) are read by a small
+precompiled grammar. The phrase found in a task is turned into a _DateSpec
+that does not depend on the current time, and specs are memoized, so
+parsing thousands of lines re-reads each distinct phrase once.
+``dateparser``, which takes a few hundred milliseconds to import, is only
+imported for phrases the grammar does not know.
 """
 
 from __future__ import annotations
 
+import calendar
+import importlib.util
 import re
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
-try:
-    import dateparser
+# Imported on first use by _dateparser(); most tasks never need it
+dateparser = None
+HAS_DATEPARSER = importlib.util.find_spec("dateparser") is not None
+
+PRIORITY_PATTERNS = {
+    re.compile(r"\bp1\b|!!1|!!!|urgent", re.IGNORECASE): 4,
+    re.compile(r"\bp2\b|!!2|high", re.IGNORECASE): 3,
+    re.compile(r"\bp3\b|!!3|medium", re.IGNORECASE): 2,
+    re.compile(r"\bp4\b|!!4|low", re.IGNORECASE): 1,
+}
+
+_PROJECT_RE = re.compile(r"#(\w+)")
+_LABEL_RE = re.compile(r"@(\w+)")
+
+_WEEKDAYS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+_MONTHS = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+# Full month names and their three-letter forms ("sept" too), e.g. "Jan." or "March"
+_MONTH_NAMES = sorted(
+    {*_MONTHS, *(month[:3] for month in _MONTHS), "sept"}, key=len, reverse=True
+)
+_MONTH = "(?:" + "|".join(_MONTH_NAMES) + r")\.?"
+
+# One alternative per date or time form; each match is one token of a phrase
+_DATE_TOKEN_RE = re.compile(
+    rf"""
+    \b(?:
+        (?P<today>today)
+      | (?P<tomorrow>tomorrow)
+      | next\s+(?P<next_unit>week|month|year)
+      | in\s+(?P<count>\d+)\s+(?P<unit>minute|min|hour|hr|day|week|month|year)s?
+      | (?:next\s+|this\s+)?(?P<weekday>{"|".join(_WEEKDAYS)})s?
+      | (?P<iso>\d{{4}}-\d{{2}}-\d{{2}})
+      | (?P<md_month>{_MONTH})\s+(?P<md_day>\d{{1,2}})(?:st|nd|rd|th)?
+        (?:,?\s+(?P<md_year>\d{{4}}))?
+      | (?P<dm_day>\d{{1,2}})(?:st|nd|rd|th)?\s+(?P<dm_month>{_MONTH})
+        (?:,?\s+(?P<dm_year>\d{{4}}))?
+      | (?P<num_month>\d{{1,2}})[/-](?P<num_day>\d{{1,2}})
+        (?:[/-](?P<num_year>\d{{2,4}}))?
+      | (?:at\s+)?(?P<hour>\d{{1,2}})(?::(?P<minute>\d{{2}}))?\s*(?P<meridiem>am|pm)
+      | at\s+(?P<at_hour>\d{{1,2}})(?::(?P<at_minute>\d{{2}}))?
+    )\b
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+# Phrases handed to dateparser when the grammar finds nothing
+_FRAGMENT_PATTERNS = (
+    re.compile(r"\bnext \w+\b", re.IGNORECASE),
+    re.compile(r"\bin \d+ \w+\b", re.IGNORECASE),
+    re.compile(
+        r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*"
+        r"\s+\d{1,2}(?:st|nd|rd|th)?\b",
+        re.IGNORECASE,
+    ),
+    re.compile(r"\b\d{1,2}[/-]\d{1,2}(?:[/-]\d{2,4})?\b", re.IGNORECASE),
+    re.compile(r"\bat \d{1,2}(?::\d{2})?\s*(?:am|pm)?\b", re.IGNORECASE),
+)
+
+_UNIT_MINUTES = {"minute": 1, "min": 1, "hour": 60, "hr": 60}
+_UNIT_DAYS = {"day": 1, "week": 7}
+_UNIT_MONTHS = {"month": 1, "year": 12}
+
+
+@dataclass(frozen=True)
+class _DateSpec:
+    """A parsed date phrase, resolved against the current time on use."""
+
+    days: int = 0
+    months: int = 0
+    minutes: int | None = None
+    weekday: int | None = None
+    calendar_date: tuple[int, int, int | None] | None = None  # month, day, year
+    time: tuple[int, int] | None = None
+
+    def resolve(self, now: datetime) -> datetime:
+        """Get the due datetime this phrase means at *now*."""
+        if self.minutes is not None:
+            return (now + timedelta(minutes=self.minutes)).replace(microsecond=0)
+
+        if self.calendar_date is not None:
+            month, day, year = self.calendar_date
+            target = date(year or now.year, month, day)
+            if year is None and target < now.date():
+                target = _add_months(target, 12)
+        elif self.weekday is not None:
+            # Next occurrence; a week ahead if it is today
+            days_ahead = (self.weekday - now.weekday() - 1) % 7 + 1
+            target = now.date() + timedelta(days=days_ahead)
+        else:
+            target = _add_months(now.date() + timedelta(days=self.days), self.months)
+
+        hour, minute, second = (*self.time, 0) if self.time else (23, 59, 59)
+        return datetime.combine(target, datetime.min.time()).replace(
+            hour=hour, minute=minute, second=second, tzinfo=now.tzinfo
+        )
+
+
+def _add_months(day: date, months: int) -> date:
+    """Shift a date by whole months, clamping to the end of shorter months."""
+    if not months:
+        return day
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    return day.replace(
+        year=year, month=month, day=min(day.day, calendar.monthrange(year, month)[1])
+    )
+
+
+def _month_number(name: str) -> int:
+    prefix = name[:3].lower()
+    return next(i for i, month in enumerate(_MONTHS, 1) if month.startswith(prefix))
+
+
+def _token_time(match: re.Match) -> tuple[int, int] | None:
+    if match["hour"] is not None:
+        hour, minute = int(match["hour"]), int(match["minute"] or 0)
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if match["meridiem"].lower() == "pm" else 0)
+    else:
+        hour, minute = int(match["at_hour"]), int(match["at_minute"] or 0)
+    if hour > 23 or minute > 59:
+        return None
+    return hour, minute
+
+
+def _token_date(match: re.Match) -> dict[str, Any] | None:
+    """Get the _DateSpec fields a date token sets, or None if invalid."""
+    if match["today"]:
+        return {}
+    if match["tomorrow"]:
+        return {"days": 1}
+    if match["next_unit"]:
+        unit = match["next_unit"].lower()
+        return {"days": 7} if unit == "week" else {"months": _UNIT_MONTHS[unit]}
+    if match["unit"]:
+        count, unit = int(match["count"]), match["unit"].lower()
+        if unit in _UNIT_MINUTES:
+            return {"minutes": count * _UNIT_MINUTES[unit]}
+        if unit in _UNIT_DAYS:
+            return {"days": count * _UNIT_DAYS[unit]}
+        return {"months": count * _UNIT_MONTHS[unit]}
+    if match["weekday"]:
+        return {"weekday": _WEEKDAYS.index(match["weekday"].lower())}
+
+    if match["iso"]:
+        year, month, day = (int(part) for part in match["iso"].split("-"))
+    elif match["md_month"]:
+        month = _month_number(match["md_month"])
+        day, year = int(match["md_day"]), match["md_year"] and int(match["md_year"])
+    elif match["dm_month"]:
+        month = _month_number(match["dm_month"])
+        day, year = int(match["dm_day"]), match["dm_year"] and int(match["dm_year"])
+    else:
+        month, day = int(match["num_month"]), int(match["num_day"])
+        year = match["num_year"] and int(match["num_year"])
+        if year is not None and year < 100:
+            year += 2000
+    try:
+        date(year or 2000, month, day)  # 2000 is a leap year, so Feb 29 passes
+    except ValueError:
+        return None
+    return {"calendar_date": (month, day, year or None)}
+
+
+@lru_cache(maxsize=4096)
+def _phrase_spec(phrase: str) -> _DateSpec | None:
+    """Parse a date phrase (the date tokens of a task, lowercased).
+
+    The first date token and the first time token win; a time on its own
+    means today.
+    """
+    fields: dict[str, Any] | None = None
+    time = None
+    for match in _DATE_TOKEN_RE.finditer(phrase):
+        if match["hour"] is not None or match["at_hour"] is not None:
+            time = time or _token_time(match)
+        elif fields is None:
+            fields = _token_date(match)
+    if fields is None and time is None:
+        return None
+    return _DateSpec(**(fields or {}), time=time)
+
+
+@lru_cache(maxsize=1024)
+def _dateparser_parse(fragment: str, relative_base: datetime) -> datetime | None:
+    return _dateparser().parse(
+        fragment,
+        settings={"PREFER_DATES_FROM": "future", "RELATIVE_BASE": relative_base},
+    )
+
+
+def _dateparser():
+    """Import dateparser on first use."""
+    global dateparser
+    if dateparser is None:
+        import dateparser as module
 
-    HAS_DATEPARSER = True
-except ImportError:
-    HAS_DATEPARSER = False
+        dateparser = module
+    return dateparser
 
 
 class LocalNLPParser:
@@ -23,12 +250,7 @@ class LocalNLPParser:
 
     def __init__(self):
         """Initialize the parser."""
-        self.priority_patterns = {
-            r"\bp1\b|!!1|!!!|urgent": 4,
-            r"\bp2\b|!!2|high": 3,
-            r"\bp3\b|!!3|medium": 2,
-            r"\bp4\b|!!4|low": 1,
-        }
+        self.priority_patterns = PRIORITY_PATTERNS
 
     def parse(self, text: str) -> dict[str, Any]:
         """Parse task text for metadata.
@@ -54,24 +276,24 @@ class LocalNLPParser:
 
         # Extract priority
         for pattern, priority in self.priority_patterns.items():
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern.search(text):
                 result["priority"] = priority
                 # Remove priority marker from text
-                text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+                text = pattern.sub("", text)
                 break
 
         # Extract project (#ProjectName)
-        project_match = re.search(r"#(\w+)", text)
+        project_match = _PROJECT_RE.search(text)
         if project_match:
             result["project_name"] = project_match.group(1)
             text = text.replace(project_match.group(0), "")
 
         # Extract labels (@label)
-        label_matches = re.findall(r"@(\w+)", text)
+        label_matches = _LABEL_RE.findall(text)
         if label_matches:
             result["labels"] = label_matches
             # Remove labels from text
-            text = re.sub(r"@\w+", "", text)
+            text = _LABEL_RE.sub("", text)
 
         # Parse date
         result["due_date"] = self._parse_date(text)
@@ -93,7 +315,7 @@ class LocalNLPParser:
         Returns:
             Parsed datetime or None
         """
-        # Always try simple pattern matching first — reliable for full sentences
+        # The grammar covers the common forms and is reliable for full sentences
         simple_result = self._simple_date_parse(text)
         if simple_result:
             return simple_result
@@ -102,33 +324,20 @@ class LocalNLPParser:
             # Extract date-related tokens and pass only those to dateparser
             fragment = self._extract_date_fragment(text)
             if fragment:
-                return dateparser.parse(
-                    fragment,
-                    settings={
-                        "PREFER_DATES_FROM": "future",
-                        "RELATIVE_BASE": datetime.now(),
-                    },
-                )
+                now = datetime.now().replace(second=0, microsecond=0)
+                return _dateparser_parse(fragment.lower(), now)
 
         return None
 
     def _extract_date_fragment(self, text: str) -> str | None:
         """Extract date-related tokens from text for dateparser."""
-        patterns = [
-            r"\bnext \w+\b",
-            r"\bin \d+ \w+\b",
-            r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d{1,2}(?:st|nd|rd|th)?\b",
-            r"\b\d{1,2}[/-]\d{1,2}(?:[/-]\d{2,4})?\b",
-            r"\bat \d{1,2}(?::\d{2})?\s*(?:am|pm)?\b",
-        ]
         fragments = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            fragments.extend(matches)
+        for pattern in _FRAGMENT_PATTERNS:
+            fragments.extend(pattern.findall(text))
         return " ".join(fragments) if fragments else None
 
     def _simple_date_parse(self, text: str) -> datetime | None:
-        """Simple date parsing fallback without dateparser.
+        """Parse the date forms known to the grammar, without dateparser.
 
         Args:
             text: Text to parse
@@ -136,75 +345,16 @@ class LocalNLPParser:
         Returns:
             Parsed datetime or None
         """
-        now = datetime.now()
-        text_lower = text.lower()
-
-        # Extract time component: "at HH", "at HH:MM", "at HHam/pm"
-        time_hour: int | None = None
-        time_minute: int = 0
-        time_match = re.search(r"\bat (\d{1,2})(?::(\d{2}))?\s*(am|pm)?\b", text_lower)
-        if time_match:
-            time_hour = int(time_match.group(1))
-            time_minute = int(time_match.group(2)) if time_match.group(2) else 0
-            meridiem = time_match.group(3)
-            if meridiem == "pm" and time_hour < 12:
-                time_hour += 12
-            elif meridiem == "am" and time_hour == 12:
-                time_hour = 0
-
-        def _apply_time(dt: datetime) -> datetime:
-            if time_hour is not None:
-                return dt.replace(
-                    hour=time_hour, minute=time_minute, second=0, microsecond=0
-                )
-            return dt.replace(hour=23, minute=59, second=59)
-
-        # Today
-        if "today" in text_lower:
-            return _apply_time(now)
-
-        # Tomorrow
-        if "tomorrow" in text_lower:
-            return _apply_time(now + timedelta(days=1))
-
-        # Next week
-        if "next week" in text_lower:
-            return _apply_time(now + timedelta(days=7))
-
-        # In N days
-        match = re.search(r"in (\d+) days?", text_lower)
-        if match:
-            days = int(match.group(1))
-            return _apply_time(now + timedelta(days=days))
-
-        # Weekdays
-        weekdays = {
-            "monday": 0,
-            "tuesday": 1,
-            "wednesday": 2,
-            "thursday": 3,
-            "friday": 4,
-            "saturday": 5,
-            "sunday": 6,
-        }
-        for day_name, day_num in weekdays.items():
-            if day_name in text_lower:
-                # Find next occurrence of this weekday
-                current_weekday = now.weekday()
-                days_ahead = (day_num - current_weekday) % 7
-                if days_ahead == 0:
-                    days_ahead = 7  # Next week if today
-                target = now + timedelta(days=days_ahead)
-                return _apply_time(target)
-
-        # Time only (e.g. "at 22") with no date keyword — assume today
-        if time_hour is not None:
-            return _apply_time(now)
-
-        return None
+        phrase = " ".join(
+            match.group(0).lower() for match in _DATE_TOKEN_RE.finditer(text)
+        )
+        if not phrase:
+            return None
+        spec = _phrase_spec(phrase)
+        return spec.resolve(datetime.now()) if spec else None
 
     def _remove_date_phrases(self, text: str) -> str:
-        """Remove common date phrases from text.
+        """Remove date phrases from text.
 
         Args:
             text: Text with date phrases
@@ -212,28 +362,7 @@ class LocalNLPParser:
         Returns:
             Text with date phrases removed
         """
-        date_phrases = [
-            r"\btoday\b",
-            r"\btomorrow\b",
-            r"\bnext week\b",
-            r"\bin \d+ days?\b",
-            r"\bmonday\b",
-            r"\btuesday\b",
-            r"\bwednesday\b",
-            r"\bthursday\b",
-            r"\bfriday\b",
-            r"\bsaturday\b",
-            r"\bsunday\b",
-            r"\bat \d{1,2}:\d{2}\s*[ap]m\b",
-            r"\bat \d{1,2}\s*[ap]m\b",
-            r"\bat \d{1,2}:\d{2}\b",
-            r"\bat \d{1,2}\b",
-        ]
-
-        for pattern in date_phrases:
-            text = re.sub(pattern, "", text, flags=re.IGNORECASE)
-
-        return text
+        return _DATE_TOKEN_RE.sub("", text)
 
 
 def parse_natural_language(text: str) -> dict[str, Any]:
@@ -0,0 +1,311 @@
+"""Phase profiler for a single ``tp`` invocation.
+
+Spans mark the phases of a run (imports, config loading, migrations,
+repository calls, HTTP requests, rendering) and nest into a tree; counters
+tally SQL statements and HTTP requests.
+
+Profiling is switched on per run:
+  - ``tp --profile <command>`` prints the timing tree to stderr
+  - ``TODOPRO_TRACE=<path>`` writes Chrome trace-event JSON to *path*, to be
+    opened in ``chrome://tracing`` or https://ui.perfetto.dev
+
+While it is off, every hook costs one global lookup: ``span()`` returns a
+shared no-op context manager and traced functions call straight through.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, TypeVar
+
+from rich.console import Console
+
+import todopro_cli
+
+F = TypeVar("F", bound=Callable[..., Any])
+C = TypeVar("C", bound=type)
+
+SQL_STATEMENTS = "sql.statements"
+HTTP_REQUESTS = "http.requests"
+
+_NULL_SPAN = nullcontext()
+
+
+class Span:
+    """One timed phase; ``end`` is None while it is running."""
+
+    __slots__ = ("name", "category", "start", "end", "args", "thread", "children")
+
+    def __init__(
+        self, name: str, category: str, start: float, args: dict[str, Any]
+    ) -> None:
+        self.name = name
+        self.category = category
+        self.start = start
+        self.end: float | None = None
+        self.args = args
+        self.thread = threading.get_ident()
+        self.children: list[Span] = []
+
+    @property
+    def duration(self) -> float:
+        """Seconds spent in the span (so far, if still running)."""
+        return (self.end or time.perf_counter()) - self.start
+
+
+class Profile:
+    """Spans and counters recorded during one run.
+
+    Args:
+        started: perf_counter() value the root span starts at
+        trace_path: Where to write the Chrome trace, if anywhere
+        report: Whether finish() prints the timing tree
+    """
+
+    def __init__(
+        self, started: float, trace_path: str | None = None, report: bool = True
+    ) -> None:
+        self.root = Span("tp", "process", started, {})
+        self.counters: Counter[str] = Counter()
+        self.trace_path = trace_path
+        self.report = report
+        self._current: ContextVar[Span] = ContextVar("profiler_span", default=self.root)
+
+    @contextmanager
+    def span(self, name: str, category: str, args: dict[str, Any]) -> Iterator[Span]:
+        """Time a block as a child of the innermost running span."""
+        parent = self._current.get()
+        span = Span(name, category, time.perf_counter(), args)
+        parent.children.append(span)
+        token = self._current.set(span)
+        try:
+            yield span
+        finally:
+            span.end = time.perf_counter()
+            self._current.reset(token)
+
+    def add_span(self, name: str, category: str, start: float, end: float) -> Span:
+        """Record a phase that has already finished."""
+        span = Span(name, category, start, {})
+        span.end = end
+        self._current.get().children.append(span)
+        return span
+
+    def walk(self) -> Iterator[tuple[Span, int]]:
+        """Yield every span with its depth, parents first."""
+        stack = [(self.root, 0)]
+        while stack:
+            span, depth = stack.pop()
+            yield span, depth
+            stack.extend((child, depth + 1) for child in reversed(span.children))
+
+
+_profile: Profile | None = None
+
+
+def enable(*, trace_path: str | None = None, report: bool = True) -> Profile:
+    """Start profiling this run.
+
+    The run is taken to have started when the ``todopro_cli`` package began
+    importing, and the time until now is recorded as the ``import`` phase.
+    """
+    global _profile
+    started = todopro_cli.IMPORT_STARTED
+    _profile = Profile(started, trace_path=trace_path, report=report)
+    _profile.add_span("import", "import", started, time.perf_counter())
+    return _profile
+
+
+def disable() -> Profile | None:
+    """Stop profiling and return what was recorded."""
+    global _profile
+    profile, _profile = _profile, None
+    if profile is not None:
+        profile.root.end = time.perf_counter()
+    return profile
+
+
+def is_enabled() -> bool:
+    """Whether the current run is being profiled."""
+    return _profile is not None
+
+
+def span(name: str, category: str = "app", **args: Any) -> AbstractContextManager:
+    """Time a block as a phase of the run (a no-op unless profiling)."""
+    if _profile is None:
+        return _NULL_SPAN
+    return _profile.span(name, category, args)
+
+
+def count(name: str, n: int = 1) -> None:
+    """Add *n* to a per-run counter (a no-op unless profiling)."""
+    if _profile is not None:
+        _profile.counters[name] += n
+
+
+def count_sql(_statement: str) -> None:
+    """sqlite3 trace callback that counts executed statements."""
+    if _profile is not None:
+        _profile.counters[SQL_STATEMENTS] += 1
+
+
+def traced(name: str | None = None, category: str = "app") -> Callable[[F], F]:
+    """Decorate a function, coroutine function or async generator as a phase.
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+        category: Span category, used to group phases in the trace
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        if inspect.isasyncgenfunction(func):
+
+            @functools.wraps(func)
+            async def agen_wrapper(*args, **kwargs):
+                profile = _profile
+                if profile is None:
+                    async for item in func(*args, **kwargs):
+                        yield item
+                    return
+                # Recorded as a leaf: the consumer runs between items, and
+                # may close the generator from another context
+                start = time.perf_counter()
+                try:
+                    async for item in func(*args, **kwargs):
+                        yield item
+                finally:
+                    profile.add_span(span_name, category, start, time.perf_counter())
+
+            return agen_wrapper  # type: ignore[return-value]
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _profile is None:
+                    return await func(*args, **kwargs)
+                with _profile.span(span_name, category, {}):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _profile is None:
+                return func(*args, **kwargs)
+            with _profile.span(span_name, category, {}):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def traced_methods(category: str) -> Callable[[C], C]:
+    """Class decorator tracing the public async methods a class defines.
+
+    Used on repository adapters, so every storage call shows up as a phase
+    named ``<Class>.<method>``.
+    """
+
+    def decorator(cls: C) -> C:
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not (
+                inspect.iscoroutinefunction(value) or inspect.isasyncgenfunction(value)
+            ):
+                continue
+            setattr(cls, attr, traced(f"{cls.__name__}.{attr}", category)(value))
+        return cls
+
+    return decorator
+
+
+def chrome_trace(profile: Profile) -> dict[str, Any]:
+    """Convert a profile to Chrome trace-event JSON (complete "X" events)."""
+    pid = os.getpid()
+    origin = profile.root.start
+    events: list[dict[str, Any]] = []
+    for span, _ in profile.walk():
+        events.append(
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": round((span.start - origin) * 1e6, 3),
+                "dur": round(span.duration * 1e6, 3),
+                "pid": pid,
+                "tid": span.thread,
+                "args": span.args,
+            }
+        )
+    end = round(profile.root.duration * 1e6, 3)
+    for name, value in sorted(profile.counters.items()):
+        events.append(
+            {"name": name, "ph": "C", "ts": end, "pid": pid, "args": {name: value}}
+        )
+    return {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "otherData": dict(profile.counters),
+    }
+
+
+def format_tree(profile: Profile) -> list[str]:
+    """Render the timing tree, one line per phase.
+
+    Sibling phases with the same name are merged (``×n``), so a loop of
+    repository calls reads as one line.
+    """
+    lines: list[str] = []
+
+    def visit(spans: list[Span], prefix: str) -> None:
+        merged: dict[str, list[Span]] = {}
+        for child in spans:
+            merged.setdefault(child.name, []).append(child)
+        groups = list(merged.values())
+        for index, group in enumerate(groups):
+            last = index == len(groups) - 1
+            total = sum(s.duration for s in group)
+            times = f"  ×{len(group)}" if len(group) > 1 else ""
+            label = f"{prefix}{'└── ' if last else '├── '}{group[0].name}"
+            lines.append(f"{label:<56} {total * 1000:9.1f} ms{times}")
+            children = [c for s in group for c in s.children]
+            visit(children, prefix + ("    " if last else "│   "))
+
+    root = profile.root
+    lines.append(f"{root.name:<56} {root.duration * 1000:9.1f} ms")
+    visit(root.children, "")
+    counters = profile.counters
+    lines.append(
+        f"SQL statements: {counters[SQL_STATEMENTS]} · "
+        f"HTTP requests: {counters[HTTP_REQUESTS]}"
+    )
+    return lines
+
+
+def finish() -> Profile | None:
+    """Stop profiling, then print the report and write the trace as asked."""
+    profile = disable()
+    if profile is None:
+        return None
+    if profile.report:
+        console = Console(stderr=True)
+        for line in format_tree(profile):
+            console.print(line, markup=False, highlight=False)
+    if profile.trace_path:
+        path = Path(profile.trace_path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(chrome_trace(profile)), encoding="utf-8")
+    return profile
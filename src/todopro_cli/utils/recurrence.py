@@ -1,4 +1,28 @@
-"""Recurrence utility functions for the TodoPro CLI."""
+"""Recurrence utility functions for the TodoPro CLI.
+
+Besides mapping pattern names to RRULE strings, this module expands RRULEs
+locally so vault contexts can schedule recurring tasks without the server.
+
+A recurring task stores the series from its current instance onwards: its
+``due_date`` is the pending occurrence (the series start, DTSTART) and its
+``next_occurrence`` the one after it. Completing or skipping the task moves
+both forward with advance(), which also rewrites ``COUNT=`` so the rule
+keeps describing the remainder of the series.
+
+Expansion is lazy: occurrences are generated only as far as a caller
+iterates, and compiled rules are memoized per (rule, start), with dateutil
+caching the occurrences each one has produced.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from datetime import datetime
+from functools import lru_cache
+from itertools import takewhile
+
+from dateutil.rrule import rrulebase, rrulestr
 
 # Maps human-friendly names to iCalendar RRULE strings.
 # These match the backend's RECURRENCE_TEMPLATES in
@@ -13,6 +37,8 @@ RECURRENCE_PATTERNS: dict[str, str] = {
 
 VALID_PATTERNS = list(RECURRENCE_PATTERNS.keys())
 
+_COUNT_RE = re.compile(r"(?<![A-Z])COUNT=(\d+)", re.IGNORECASE)
+
 
 def resolve_rrule(pattern: str) -> str | None:
     """Convert a human-friendly recurrence pattern name to an RRULE string.
@@ -37,3 +63,155 @@ def describe_rrule(rrule: str) -> str:
     """
     reverse = {v: k for k, v in RECURRENCE_PATTERNS.items()}
     return reverse.get(rrule, rrule)
+
+
+def align(value: datetime, like: datetime) -> datetime:
+    """Express *value* the way *like* is expressed, so the two compare.
+
+    Naive datetimes are taken to be local time.
+    """
+    if like.tzinfo is None:
+        if value.tzinfo is None:
+            return value
+        return value.astimezone().replace(tzinfo=None)
+    return value.astimezone(like.tzinfo)
+
+
+@lru_cache(maxsize=512)
+def _compile(rule: str, start: datetime) -> rrulebase:
+    """Compile an RRULE for a series starting at *start*.
+
+    Raises:
+        ValueError: If the rule cannot be parsed
+    """
+    try:
+        return rrulestr(rule, dtstart=start, cache=True)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid recurrence rule '{rule}': {e}") from e
+
+
+def iter_occurrences(
+    rule: str,
+    start: datetime,
+    *,
+    after: datetime | None = None,
+    inclusive: bool = False,
+    until: datetime | None = None,
+) -> Iterator[datetime]:
+    """Lazily generate the occurrences of a series.
+
+    Args:
+        rule: iCalendar RRULE string
+        start: Series start (DTSTART)
+        after: Only occurrences after this time (default: from the start)
+        inclusive: Whether an occurrence exactly at *after* is included
+        until: Stop after this time, e.g. the task's recurrence_end
+
+    Yields:
+        Occurrences in chronological order
+
+    Raises:
+        ValueError: If the rule cannot be parsed
+    """
+    compiled = _compile(rule, start)
+    if after is None:
+        occurrences = iter(compiled)
+    else:
+        occurrences = compiled.xafter(align(after, start), inc=inclusive)
+    if until is None:
+        return occurrences
+    end = align(until, start)
+    return takewhile(lambda occurrence: occurrence <= end, occurrences)
+
+
+def next_occurrence(
+    rule: str, start: datetime, until: datetime | None = None
+) -> datetime | None:
+    """The occurrence following *start*, or None if the series ends there."""
+    return next(iter_occurrences(rule, start, after=start, until=until), None)
+
+
+def first_occurrence(
+    rule: str, start: datetime, until: datetime | None = None
+) -> datetime | None:
+    """The first occurrence at or after *start*.
+
+    Used on creation, where the requested due date may not itself match the
+    rule (e.g. a weekdays task created on a Sunday).
+    """
+    return next(
+        iter_occurrences(rule, start, after=start, inclusive=True, until=until), None
+    )
+
+
+def advance(
+    rule: str,
+    current: datetime,
+    *,
+    after: datetime | None = None,
+    until: datetime | None = None,
+) -> tuple[datetime, str] | None:
+    """Move a series on from its current occurrence.
+
+    Args:
+        rule: iCalendar RRULE string of the series from *current*
+        current: The pending occurrence being completed or skipped
+        after: Skip every occurrence up to this time as well (e.g. now, so
+            completing an overdue daily task does not leave it overdue)
+        until: The task's recurrence_end
+
+    Returns:
+        (new current occurrence, rule for the series from it), or None if
+        the series has no further occurrences
+    """
+    threshold = current if after is None else max(current, align(after, current))
+    for index, occurrence in enumerate(iter_occurrences(rule, current, until=until)):
+        if occurrence > threshold:
+            return occurrence, _shift_count(rule, index)
+    return None
+
+
+def _shift_count(rule: str, consumed: int) -> str:
+    """Rewrite ``COUNT=n`` after *consumed* occurrences have passed."""
+    return _COUNT_RE.sub(
+        lambda match: f"COUNT={max(int(match.group(1)) - consumed, 1)}", rule
+    )
+
+
+def occurrences_between(
+    rule: str | None,
+    due: datetime,
+    start: datetime,
+    end: datetime,
+    until: datetime | None = None,
+) -> Iterator[datetime]:
+    """Occurrences of a task in ``[start, end)``, in the frame of *start*.
+
+    Args:
+        rule: The task's RRULE, or None for a one-off task
+        due: The task's due date (its pending occurrence)
+        start: Window start
+        end: Window end (exclusive)
+        until: The task's recurrence_end
+
+    Yields:
+        Occurrences in chronological order
+
+    Raises:
+        ValueError: If the rule cannot be parsed
+    """
+    due_start, due_end = align(start, due), align(end, due)
+    if due >= due_end:
+        return
+    if due >= due_start:
+        yield align(due, start)
+    if rule is None:
+        return
+
+    after = max(due, due_start)
+    for occurrence in iter_occurrences(
+        rule, due, after=after, inclusive=after > due, until=until
+    ):
+        if occurrence >= due_end:
+            return
+        yield align(occurrence, start)
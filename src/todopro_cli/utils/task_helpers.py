@@ -1,6 +1,7 @@
 """Task helper utilities."""
 
 from todopro_cli.services.task_service import TaskService
+from todopro_cli.utils import metrics
 
 
 def _find_shortest_unique_suffix(task_ids: list[str], target_id: str) -> str:
@@ -44,7 +45,9 @@ async def resolve_task_id(task_service: TaskService, task_id_or_suffix: str) ->
     from .task_cache import get_suffix_mapping
 
     suffix_mapping = get_suffix_mapping()
-    if task_id_or_suffix in suffix_mapping:
+    hit = task_id_or_suffix in suffix_mapping
+    metrics.cache_lookup("task_ids", hit)
+    if hit:
         return suffix_mapping[task_id_or_suffix]
 
     # Second, try to get the task directly (maybe it's already a full ID)
@@ -1,7 +1,14 @@
-"""Textual TUI for displaying tasks in a kanban board view."""
+"""Textual TUI for displaying tasks in a kanban board view.
+
+Each section's column mounts only the task cards in view (plus a few
+above and below) and stands in for the rest with spacers, so opening and
+scrolling a project costs the same with 50 tasks as with 50,000. Tasks
+are loaded in the background a page at a time after the board is shown,
+and reloading updates only the cards whose tasks changed.
+"""
 
-import asyncio
 import contextlib
+from collections.abc import AsyncIterator, Callable, Iterator, MutableMapping
 from datetime import datetime
 
 from textual import events
@@ -23,8 +30,19 @@ from todopro_cli.utils.ui.console import get_console
 
 DEBUG = False
 
+# Rows per task card; must match the .task-card height in board_view.tcss
+CARD_HEIGHT = 5
+
+# Cards kept mounted above and below the visible ones
+OVERSCAN = 5
+
+# Cards mounted before a column knows its height
+INITIAL_WINDOW = 20
+
 console = get_console()
 
+TaskLoader = Callable[[], AsyncIterator[list[dict]]]
+
 
 class TaskViewModel:
     """View model for a task."""
@@ -49,6 +67,22 @@ class TaskViewModel:
         assert self.section is not None
         return self.section
 
+    def apply(self, task_data: dict) -> bool:
+        """Take the displayed fields from task data.
+
+        Returns:
+            True if any of them changed
+        """
+        values = (
+            task_data["content"],
+            _format_due_date(task_data.get("due_date")),
+            task_data.get("is_completed", False),
+        )
+        if values == (self.content, self.due_date, self.is_completed):
+            return False
+        self.content, self.due_date, self.is_completed = values
+        return True
+
 
 class SectionViewModel:
     """View model for a section."""
@@ -66,6 +100,12 @@ class SectionViewModel:
         self.tasks = tasks or []
 
 
+def _format_due_date(value: str | None) -> str | None:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime("%Y-%m-%d")
+
+
 class TaskCheckbox(Static):
     """A simple checkbox widget for tasks."""
 
@@ -98,8 +138,15 @@ class TaskCardContainer(Vertical):
         self.model = task
 
     def compose(self) -> ComposeResult:
-        yield Static(f"{self.model.content}")
-        yield Static(f"\u1f4c5: {self.model.due_date or 'N/A'}")
+        yield Static(f"{self.model.content}", classes="task-content")
+        yield Static(f"\u1f4c5: {self.model.due_date or 'N/A'}", classes="task-due")
+
+    def refresh_model(self) -> None:
+        """Show the model's current content and due date."""
+        self.query_one(".task-content", Static).update(f"{self.model.content}")
+        self.query_one(".task-due", Static).update(
+            f"\u1f4c5: {self.model.due_date or 'N/A'}"
+        )
 
     def on_click(self, _event):
         # select the task card when clicked
@@ -118,6 +165,65 @@ class TaskCard(Horizontal):
         yield TaskCheckbox(self.model)
         yield TaskCardContainer(self.model)
 
+    def refresh_model(self) -> None:
+        """Update the mounted card in place after its model changed."""
+        if not self.is_mounted:
+            return
+        checkbox = self.query_one(TaskCheckbox)
+        checkbox.checked = self.model.is_completed
+        checkbox.update_checkbox()
+        self.query_one(TaskCardContainer).refresh_model()
+
+
+class TaskCardMap(MutableMapping[str, TaskCard]):
+    """Task cards by task ID, built the first time each one is needed.
+
+    Every task has an entry, but only cards that are looked up (the ones
+    in view, or the target of a navigation key) are ever constructed. A
+    column releases the cards it unmounts, and a fresh card is built if
+    the task scrolls back into view.
+    """
+
+    def __init__(self):
+        self.models: dict[str, TaskViewModel] = {}
+        self._cards: dict[str, TaskCard] = {}
+
+    def add(self, model: TaskViewModel) -> None:
+        """Register a task without building its card."""
+        self.models[model.id] = model
+
+    def cached(self, task_id: str) -> TaskCard | None:
+        """Get the task's card if it has been built."""
+        return self._cards.get(task_id)
+
+    def release(self, card: TaskCard) -> None:
+        """Forget a card that has been unmounted."""
+        if self._cards.get(card.model.id) is card:
+            del self._cards[card.model.id]
+
+    def __getitem__(self, task_id: str) -> TaskCard:
+        card = self._cards.get(task_id)
+        if card is None:
+            card = self._cards[task_id] = TaskCard(self.models[task_id])
+        return card
+
+    def __setitem__(self, task_id: str, card: TaskCard) -> None:
+        self.models[task_id] = card.model
+        self._cards[task_id] = card
+
+    def __delitem__(self, task_id: str) -> None:
+        del self.models[task_id]
+        self._cards.pop(task_id, None)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self.models
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.models)
+
+    def __len__(self) -> int:
+        return len(self.models)
+
 
 class AddTaskButton(Button):
     """A button to add a new task."""
@@ -127,7 +233,11 @@ class AddTaskButton(Button):
     def __init__(self, section: SectionViewModel):
         super().__init__(label="+ Add Task", classes="add-task-button")
         self.section = section
-        self.display_order = len(section.tasks)
+
+    @property
+    def display_order(self) -> int:
+        """Navigation position: just below the section's last task."""
+        return len(self.section.tasks)
 
     def on_click(self) -> None:
         """Handle the button click to add a new task."""
@@ -205,6 +315,116 @@ class SectionTitle(Container):
             event.stop()
 
 
+class ColumnSpacer(Widget):
+    """Empty space standing in for the cards scrolled out of view."""
+
+    DEFAULT_CSS = """
+    ColumnSpacer {
+        height: 0;
+    }
+    """
+
+
+class TaskColumn(VerticalScroll):
+    """A section's scrollable task list that only mounts the cards in view.
+
+    Cards have a fixed height, so the cards to show follow directly from
+    the scroll offset; spacers above and below them take up the height of
+    the rest and keep the scrollbar true to the whole section.
+    """
+
+    app: "BoardViewApp"
+
+    def __init__(self, model: SectionViewModel):
+        super().__init__(classes="section-tasks")
+        self.model = model
+        self.window: list[TaskCard] = []
+        self._top = ColumnSpacer()
+        self._bottom = ColumnSpacer()
+
+    def compose(self) -> ComposeResult:
+        yield self._top
+        self.window = [
+            self.app.task_card_map[task.id]
+            for task in self.model.tasks[:INITIAL_WINDOW]
+        ]
+        yield from self.window
+        yield self._bottom
+        yield AddTaskButton(self.model)
+        self._resize_spacers(0, len(self.window))
+
+    def visible_range(self) -> tuple[int, int]:
+        """Indexes of the first and past-the-last task to mount."""
+        count = len(self.model.tasks)
+        height = self.scrollable_content_region.height
+        if not height:
+            return 0, min(count, INITIAL_WINDOW)
+        first = int(self.scroll_y) // CARD_HEIGHT
+        start = max(0, first - OVERSCAN)
+        end = min(count, first + height // CARD_HEIGHT + 1 + OVERSCAN)
+        return start, end
+
+    def sync(self, reveal: int | None = None) -> None:
+        """Mount the cards now in view and unmount the ones that left it.
+
+        Cards that stay in view are kept as they are. Call this after
+        scrolling and after tasks were added to or removed from the section.
+
+        Args:
+            reveal: Index of a task to include even if it is out of view,
+                e.g. the one a navigation key moves to
+        """
+        count = len(self.model.tasks)
+        start, end = self.visible_range()
+        if reveal is not None and not start <= reveal < end:
+            span = max(end - start, 1)
+            start = max(0, reveal - span // 2)
+            end = min(count, max(start + span, reveal + 1))
+
+        wanted = [task.id for task in self.model.tasks[start:end]]
+        if [card.model.id for card in self.window] == wanted:
+            self._resize_spacers(start, end)
+            return
+
+        cards = self.app.task_card_map
+        wanted_ids = set(wanted)
+        kept = []
+        for card in self.window:
+            if card.model.id in wanted_ids:
+                kept.append(card)
+            else:
+                card.remove()
+                cards.release(card)
+
+        # The kept cards are still in task order, so the rest of the window
+        # goes before and after them
+        offset = wanted.index(kept[0].model.id) if kept else len(wanted)
+        above = [cards[task_id] for task_id in wanted[:offset]]
+        below = [cards[task_id] for task_id in wanted[offset + len(kept) :]]
+
+        with self.app.batch_update():
+            if above:
+                self.mount(*above, after=self._top)
+            if below:
+                self.mount(*below, before=self._bottom)
+            self._resize_spacers(start, end)
+        self.window = [*above, *kept, *below]
+        self.app.restore_selection(above + below)
+
+    def _resize_spacers(self, start: int, end: int) -> None:
+        self._top.styles.height = start * CARD_HEIGHT
+        self._bottom.styles.height = (len(self.model.tasks) - end) * CARD_HEIGHT
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if self.is_mounted:
+            self.sync()
+
+    def on_resize(self, _: events.Resize) -> None:
+        """Mount more cards when the column grows."""
+        self.sync()
+
+
 class Section(Vertical):
     """A section to group related tasks."""
 
@@ -216,11 +436,7 @@ class Section(Vertical):
 
     def compose(self) -> ComposeResult:
         yield SectionTitle(model=self.model)
-        display_list: list[TaskCard | AddTaskButton] = [
-            self.app.task_card_map[task.id] for task in self.model.tasks
-        ]
-        display_list.append(AddTaskButton(self.model))
-        yield VerticalScroll(*display_list, classes="section-tasks")
+        yield TaskColumn(self.model)
 
     def get_right_separator(self) -> "SectionSeparator | None":
         """Get the right separator of this section, if any."""
@@ -286,6 +502,7 @@ class BoardViewApp(App):
     CSS_PATH = "board_view.tcss"
     BINDINGS = [
         ("d", "toggle_dark", "Toggle dark mode"),
+        ("r", "reload", "Reload tasks"),
         ("q", "quit", "Quit the app"),
     ]
 
@@ -293,13 +510,23 @@ class BoardViewApp(App):
         self,
         project_code: str,
         tasks_list: list | None = None,
+        loader: TaskLoader | None = None,
     ):
+        """Initialize the board.
+
+        Args:
+            project_code: Project shown on the board
+            tasks_list: Tasks to show right away
+            loader: Yields the project's tasks a page at a time; run in the
+                background once the board is on screen, and again on reload
+        """
         super().__init__()
         self.project_code = project_code
         self.mode: str = "normal"
+        self.loader = loader
 
         self.tasks: list[TaskViewModel] = []
-        self.task_card_map: dict[str, TaskCard] = {}
+        self.task_card_map = TaskCardMap()
         self.sections: list[SectionViewModel] = []
         self.section_component_map: dict[str, Section] = {}
 
@@ -323,43 +550,130 @@ class BoardViewApp(App):
         )
         self.sections.append(no_section)
 
-        # Convert API tasks to view models
-        for idx, task_data in enumerate(tasks_list):
-            # Format due date
-            due_date = None
-            if task_data.get("due_date"):
-                dt = datetime.fromisoformat(
-                    task_data["due_date"].replace("Z", "+00:00")
-                )
-                due_date = dt.strftime("%Y-%m-%d")
+        # Create section component
+        no_section_component = Section(no_section)
+        self.section_component_map[no_section.id] = no_section_component
+
+        self.add_tasks(tasks_list)
 
+    def add_tasks(self, tasks_list: list) -> None:
+        """Append tasks to the board, e.g. a page from the loader.
+
+        Only the column's spacer and, if the new tasks are in view, their
+        cards are updated; nothing else is re-rendered.
+        """
+        section = self.sections[0]
+        for task_data in tasks_list:
             task = TaskViewModel(
                 id=task_data["id"],
                 content=task_data["content"],
-                due_date=due_date,
-                display_order=idx,
-                section=no_section,
+                due_date=_format_due_date(task_data.get("due_date")),
+                display_order=len(section.tasks),
+                section=section,
                 is_completed=task_data.get("is_completed", False),
             )
+            section.tasks.append(task)
+            self.task_card_map.add(task)
 
-            no_section.tasks.append(task)
-            task_card = TaskCard(task)
-            self.task_card_map[task.id] = task_card
-
-        # Create section component
-        no_section_component = Section(no_section)
-        self.section_component_map[no_section.id] = no_section_component
+        self._sync_column(section)
 
         # Set initial selected component
-        if len(no_section.tasks) > 0:
-            self.selected_component = self.task_card_map[no_section.tasks[0].id]
-            self.last_display_order = 0
+        if self.selected_component is None and section.tasks:
+            first_card = self.task_card_map[section.tasks[0].id]
+            if self.is_running:
+                self.go_to_component(first_card)
+            else:
+                self.selected_component = first_card
+                self.last_display_order = 0
+
+    def apply_tasks(self, tasks_list: list) -> None:
+        """Bring the board in line with a fresh copy of its tasks.
+
+        Cards of changed tasks are updated in place, removed tasks are
+        dropped and new ones appended. Unchanged cards are left alone.
+        """
+        section = self.sections[0]
+        fresh = {task_data["id"]: task_data for task_data in tasks_list}
+
+        changed = [
+            task
+            for task in section.tasks
+            if task.id in fresh and task.apply(fresh[task.id])
+        ]
+        for task in changed:
+            card = self.task_card_map.cached(task.id)
+            if card is not None:
+                card.refresh_model()
+
+        removed = {task.id for task in section.tasks if task.id not in fresh}
+        if removed:
+            section.tasks = [task for task in section.tasks if task.id not in removed]
+            for display_order, task in enumerate(section.tasks):
+                task.display_order = display_order
+            for task_id in removed:
+                del self.task_card_map[task_id]
+            selected = self.selected_component
+            if isinstance(selected, TaskCard) and selected.model.id in removed:
+                self.selected_component = None
+
+        self.add_tasks(
+            [
+                task_data
+                for task_id, task_data in fresh.items()
+                if task_id not in self.task_card_map
+            ]
+        )
+        self.log_debug(f"Reloaded: {len(changed)} changed, {len(removed)} removed")
+
+    def _sync_column(self, section: SectionViewModel) -> None:
+        """Re-window a section's column after its task list changed."""
+        with contextlib.suppress(QueryError):
+            column = self.section_component_map[section.id].query_one(TaskColumn)
+            if column.is_mounted:
+                column.sync()
+
+    def restore_selection(self, cards: list[TaskCard]) -> None:
+        """Move the highlight to a remounted card of the selected task.
+
+        The selected card is released like any other when it scrolls out of
+        view; when its task comes back, the new card takes over.
+        """
+        selected = self.selected_component
+        if not isinstance(selected, TaskCard):
+            return
+        for card in cards:
+            if card.model is selected.model and card is not selected:
+                card.add_class("highlighted")
+                self.selected_component = card
+
+    async def _load_tasks(self) -> None:
+        """Show the loader's pages as they arrive."""
+        assert self.loader is not None
+        self.sub_title = "Loading..."
+        async for tasks_list in self.loader():
+            self.add_tasks(tasks_list)
+        self.sub_title = f"{len(self.task_card_map)} tasks"
+
+    async def _reload_tasks(self) -> None:
+        assert self.loader is not None
+        tasks_list = [
+            task_data async for page in self.loader() for task_data in page
+        ]
+        self.apply_tasks(tasks_list)
+        self.sub_title = f"{len(self.task_card_map)} tasks"
 
     def on_mount(self) -> None:
         """Called when app starts."""
         # Highlight the initially selected component
         if self.selected_component:
             self.go_to_component(self.selected_component)
+        if self.loader is not None:
+            self.run_worker(self._load_tasks(), group="load", exclusive=True)
+
+    def action_reload(self) -> None:
+        """Reload the tasks and update the cards that changed."""
+        if self.loader is not None:
+            self.run_worker(self._reload_tasks(), group="load", exclusive=True)
 
     def go_to_component(self, component: Widget):
         """Highlight the selected component."""
@@ -388,7 +702,16 @@ class BoardViewApp(App):
             self.last_display_order = 0
 
         with contextlib.suppress(QueryError):
-            self.app.query_one(Body).scroll_to_widget(component, immediate=True)
+            if isinstance(component, TaskCard) and not component.is_mounted:
+                # Out of its column's window: mount it, and scroll to it once
+                # it has been laid out
+                column = self.section_component_map[
+                    component.model.get_section().id
+                ].query_one(TaskColumn)
+                column.sync(reveal=component.model.display_order)
+                self.call_after_refresh(self._scroll_to, component)
+            else:
+                self._scroll_to(component)
 
         if isinstance(component, TaskCard):
             self.log_debug(
@@ -401,6 +724,10 @@ class BoardViewApp(App):
         elif isinstance(component, AddTaskButton):
             self.log_debug(f"Add Task Button - section: {component.section.name}")
 
+    def _scroll_to(self, component: Widget) -> None:
+        with contextlib.suppress(QueryError):
+            self.app.query_one(Body).scroll_to_widget(component, immediate=True)
+
     def get_current_section(self) -> SectionViewModel:
         """Get the current section based on the selected component."""
         if isinstance(self.selected_component, TaskCard):
@@ -672,19 +999,22 @@ def run_board_view(project_code: str):
     config_svc = get_config_service()
     current_context = config_svc.get_current_context()
 
-    async def preload_data():
-        """Preload task data before app starts."""
+    async def load_tasks() -> AsyncIterator[list[dict]]:
+        """Yield the project's tasks a page at a time."""
         if current_context.type == "local":
             from todopro_cli.services.task_service import get_task_service
 
             task_service = get_task_service()
 
             if project_code.lower() == "inbox":
-                tasks = await task_service.list_tasks(status="active")
+                pages = task_service.iter_task_pages(status="active")
             else:
-                tasks = await task_service.list_tasks(project_id=project_code)
+                pages = task_service.iter_task_pages(project_id=project_code)
+
+            async for tasks in pages:
+                yield [t.model_dump() for t in tasks]
+            return
 
-            return [t.model_dump() for t in tasks]
         client = get_client()
         tasks_api = TasksAPI(client)
 
@@ -696,13 +1026,11 @@ def run_board_view(project_code: str):
 
             # Handle both list and dict responses
             if isinstance(tasks_data, dict):
-                return tasks_data.get("tasks", [])
-            return tasks_data
+                tasks_data = tasks_data.get("tasks", [])
+            yield tasks_data
         finally:
             await client.close()
 
-    # Load tasks before starting the app
-    tasks_list = asyncio.run(preload_data())
-
-    app = BoardViewApp(project_code, tasks_list)
+    # Tasks are loaded by the app, so the board shows up right away
+    app = BoardViewApp(project_code, loader=load_tasks)
     app.run()
@@ -9,6 +9,8 @@ import yaml
 from rich.table import Table
 from rich.text import Text
 
+from todopro_cli.utils import profiler
+
 from .console import get_console
 
 console = get_console()
@@ -59,6 +61,7 @@ def calculate_unique_suffixes(task_ids: list[str]) -> dict[str, int]:
     return result
 
 
+@profiler.traced("render", "render")
 def format_output(
     data: Any,
     output_format: str = "pretty",
@@ -82,11 +85,32 @@ def format_output(
         format_pretty(data, compact=compact, all_task_ids=all_task_ids)
     elif output_format == "quiet":
         format_quiet(data)
+    elif output_format in ("ndjson", "csv", "tsv"):
+        format_rows(data, output_format)
     else:
         # Default to pretty
         format_pretty(data, compact=compact, all_task_ids=all_task_ids)
 
 
+def format_rows(data: Any, output_format: str) -> None:
+    """Format items one per line as NDJSON, CSV or TSV."""
+    import sys
+
+    from .streaming import RowWriter
+
+    if isinstance(data, dict):
+        keys = ("items", "tasks", "projects", "labels", "sections")
+        items = next((data[key] for key in keys if key in data), [data])
+    else:
+        items = data if isinstance(data, list) else [data]
+    if not items:
+        return
+    columns = tuple(items[0]) if isinstance(items[0], dict) else ("value",)
+    writer = RowWriter(output_format, sys.stdout, columns=columns)
+    for item in items:
+        writer.write(item if isinstance(item, dict) else {"value": item})
+
+
 def format_table(data: Any) -> None:
     """Format data as a table."""
     if not data:
@@ -394,6 +418,17 @@ def format_task_item(
     _compact: bool = False,
 ) -> None:
     """Format a single task item."""
+    for line in render_task_item(task, indent, suffix_map):
+        console.print(line)
+
+
+def render_task_item(
+    task: dict,
+    indent: str = "",
+    suffix_map: dict[str, int] | None = None,
+) -> list[Text]:
+    """Render a single task item as its content line and metadata line."""
+    lines = []
     # Status icon
     is_completed = task.get("is_completed", False)
     is_recurring = task.get("is_recurring", False)
@@ -419,7 +454,7 @@ def format_task_item(
             label_name = label.get("name", "") if isinstance(label, dict) else label
             line.append(f"#{label_name} ", style="blue")
 
-    console.print(line)
+    lines.append(line)
 
     # Metadata line
     meta = []
@@ -443,6 +478,10 @@ def format_task_item(
     if task.get("project_name"):
         meta.append((f"Project: {task['project_name']}", "blue"))
 
+    # Set by listings that span several contexts (--all-contexts)
+    if task.get("context"):
+        meta.append((f"Context: {task['context']}", "cyan"))
+
     # Add task ID suffix with dynamic length
     if task.get("id"):
         task_id = task["id"]
@@ -466,7 +505,8 @@ def format_task_item(
             if i > 0:
                 meta_line.append(" \u00b7 ", style="dim")
             meta_line.append(text, style=style)
-        console.print(meta_line)
+        lines.append(meta_line)
+    return lines
 
 
 def format_labels_pretty(labels: list[dict], compact: bool = False) -> None:
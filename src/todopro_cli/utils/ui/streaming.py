@@ -0,0 +1,192 @@
+"""Streaming output for large result sets.
+
+``format_output`` renders a complete result at once, which is fine for a
+screenful of tasks but means ``tp list --limit 100000 | grep`` prints
+nothing until every task has been loaded and rendered. The writers here
+consume an async iterator of items instead and emit each one as it
+arrives, so the first line appears as soon as the first page is read and
+memory stays flat however long the list is.
+
+Formats:
+    ndjson: One JSON object per line
+    csv/tsv: A header row of TASK_COLUMNS, then one row per task
+    pretty: The usual task lines, without the priority/overdue grouping
+        (which needs the whole list) and with six-character ID suffixes;
+        piped through ``$PAGER`` on a TTY
+
+In the pager, rendering is pulled by the reader: once the pager's pipe is
+full, writes block and no further pages are fetched until the user
+scrolls, and quitting the pager ends the listing.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+from collections.abc import AsyncIterable
+from typing import IO, Any
+
+from rich.console import Console
+
+from .formatters import render_task_item
+
+STREAM_FORMATS = ("ndjson", "csv", "tsv")
+
+# Columns of the csv/tsv formats, in order
+TASK_COLUMNS = (
+    "id",
+    "content",
+    "description",
+    "project_id",
+    "due_date",
+    "priority",
+    "is_completed",
+    "is_recurring",
+    "labels",
+    "created_at",
+    "updated_at",
+    "completed_at",
+)
+
+# Items written between flushes, so pipes see output promptly
+FLUSH_EVERY = 100
+
+DEFAULT_PAGER = "less -FRX"
+
+
+class RowWriter:
+    """Writes one item per line in a machine-readable format.
+
+    Usage:
+        writer = RowWriter("csv", sys.stdout)
+        for task in tasks:
+            writer.write(task.model_dump(mode="json"))
+    """
+
+    def __init__(
+        self,
+        output_format: str,
+        stream: IO[str],
+        columns: tuple[str, ...] = TASK_COLUMNS,
+    ):
+        """Initialize the writer.
+
+        Args:
+            output_format: One of STREAM_FORMATS
+            stream: Text stream to write to
+            columns: csv/tsv columns; ignored for ndjson
+        """
+        self.stream = stream
+        self.columns = columns
+        self._csv = None
+        if output_format in ("csv", "tsv"):
+            self._csv = csv.writer(
+                stream,
+                delimiter="," if output_format == "csv" else "\t",
+                lineterminator="\n",
+            )
+            self._csv.writerow(columns)
+
+    def write(self, item: dict[str, Any]) -> None:
+        """Write a single item."""
+        if self._csv is None:
+            self.stream.write(json.dumps(item, default=str, separators=(",", ":")))
+            self.stream.write("\n")
+            return
+        self._csv.writerow([_cell(item.get(column)) for column in self.columns])
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ",".join(str(v) for v in value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _open_pager() -> subprocess.Popen | None:
+    """Start the user's pager if stdout is an interactive terminal."""
+    if not sys.stdout.isatty():
+        return None
+    command = (
+        os.environ.get("TODOPRO_PAGER") or os.environ.get("PAGER") or DEFAULT_PAGER
+    )
+    args = shlex.split(command)
+    if not args or shutil.which(args[0]) is None:
+        return None
+    return subprocess.Popen(
+        args, stdin=subprocess.PIPE, text=True, encoding="utf-8"
+    )
+
+
+def _silence_stdout() -> None:
+    """Point stdout at /dev/null after the reader went away (e.g. ``| head``).
+
+    Without this the interpreter reports the broken pipe again when it
+    flushes stdout on exit.
+    """
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.close(devnull)
+
+
+async def stream_items(
+    items: AsyncIterable[dict[str, Any]],
+    output_format: str,
+    stream: IO[str] | None = None,
+) -> int:
+    """Write items as they arrive.
+
+    Args:
+        items: Items to write, e.g. ``task.model_dump(mode="json")`` per task
+        output_format: One of STREAM_FORMATS, or "pretty"
+        stream: Destination (default: stdout, or the pager for "pretty")
+
+    Returns:
+        Number of items written; stops early if the reader goes away
+    """
+    pager = None
+    if stream is None:
+        if output_format == "pretty":
+            pager = _open_pager()
+        stream = pager.stdin if pager is not None else sys.stdout
+
+    if output_format == "pretty":
+        console = Console(
+            file=stream,
+            force_terminal=pager is not None or None,
+            width=shutil.get_terminal_size().columns,
+        )
+
+        def write(item: dict[str, Any]) -> None:
+            for line in render_task_item(item):
+                console.print(line)
+
+    else:
+        write = RowWriter(output_format, stream).write
+
+    count = 0
+    try:
+        async for item in items:
+            write(item)
+            count += 1
+            if count % FLUSH_EVERY == 0:
+                stream.flush()
+        stream.flush()
+    except BrokenPipeError:
+        if stream is sys.stdout:
+            _silence_stdout()
+    finally:
+        if pager is not None:
+            with contextlib.suppress(BrokenPipeError):
+                pager.stdin.close()
+            pager.wait()
+    return count
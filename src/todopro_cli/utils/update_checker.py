@@ -1,9 +1,21 @@
-"""Automatic update checker for TodoPro CLI."""
+"""Automatic update checker for TodoPro CLI.
 
-import contextlib
+Also the source of the backend URL, which is published in the package's
+PyPI metadata. Both come from one cached copy of that metadata, served
+stale-while-revalidate: lookups always answer straight from the cache,
+even an expired one, and an expired cache is refreshed off the critical
+path (as deferred work inside a command, or on a daemon thread otherwise).
+Concurrent refreshes in a process share a single PyPI request.
+
+Only ``tp update`` waits for PyPI, since it must act on the latest version.
+"""
+
+import asyncio
 import json
 import os
+import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
 
 import httpx
@@ -11,6 +23,7 @@ from packaging import version
 from platformdirs import user_cache_dir
 
 from todopro_cli import __version__
+from todopro_cli.utils import deferred, metrics
 
 CACHE_DIR = Path(user_cache_dir("todopro"))
 CACHE_FILE = CACHE_DIR / "update_check.json"
@@ -18,46 +31,112 @@ CACHE_FILE = CACHE_DIR / "update_check.json"
 CHECK_INTERVAL = 3600  # 1 hour in seconds
 DEFAULT_BACKEND_URL = "https://todopro.minhdq.dev/api"
 
+PYPI_URL = "https://pypi.org/pypi/todopro-cli/json"
+
+# Timeout of a metadata request (it never blocks a command)
+FETCH_TIMEOUT = 2.0
+
+_REFRESH_KEY = "update_checker.refresh"
+
+# Held while a refresh is in flight, to coalesce concurrent refreshes
+_refresh_lock = threading.Lock()
+
+
+def _read_cache() -> dict:
+    """Read the metadata cache ({} if missing or corrupt)."""
+    try:
+        data = json.loads(CACHE_FILE.read_text())
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_cache(data: dict) -> None:
+    """Replace the metadata cache atomically, so readers never see a torn file."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, CACHE_FILE)
+
+
+def _is_stale(data: dict, max_age: float = CHECK_INTERVAL) -> bool:
+    return time.time() - data.get("last_check_timestamp", 0) >= max_age
+
+
+def _fetch_metadata(timeout: float) -> dict | None:
+    """Fetch version and backend URL from PyPI and cache them."""
+    try:
+        response = httpx.get(PYPI_URL, timeout=timeout)
+        if response.status_code != 200:
+            return None
+        info = response.json()["info"]
+        data = _read_cache()
+        data["latest_version"] = info["version"]
+        data["last_check_timestamp"] = time.time()
+        backend_url = (info.get("project_urls") or {}).get("Backend")
+        if backend_url:
+            data["backend_url"] = backend_url
+        _write_cache(data)
+        return data
+    except Exception:
+        # Silently fail on network errors
+        return None
+
+
+def refresh_metadata(timeout: float = FETCH_TIMEOUT) -> dict | None:
+    """Fetch PyPI metadata into the cache, blocking until it is done.
+
+    A call made while another refresh is in flight waits for that one and
+    returns the cache it left instead of sending a second request.
+
+    Returns:
+        The refreshed cache data, or None if PyPI could not be reached
+    """
+    if not _refresh_lock.acquire(blocking=False):
+        with _refresh_lock:
+            data = _read_cache()
+            return None if _is_stale(data) else data
+    try:
+        return _fetch_metadata(timeout)
+    finally:
+        _refresh_lock.release()
+
+
+def _spawn(target: Callable[[], object]) -> None:
+    """Run a refresh on a daemon thread (outside any event loop)."""
+    threading.Thread(target=target, name="todopro-metadata", daemon=True).start()
+
+
+def schedule_refresh() -> None:
+    """Refresh the metadata cache in the background, unless already doing so.
+
+    Inside a command the refresh is deferred work, drained once the command
+    has printed its output; elsewhere it runs on a daemon thread.
+    """
+    if _refresh_lock.locked() or deferred.is_pending(_REFRESH_KEY):
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        _spawn(refresh_metadata)
+        return
+    deferred.defer(_REFRESH_KEY, asyncio.to_thread(refresh_metadata))
+
 
 def check_for_updates() -> None:
-    """Check for updates from PyPI and display notification if available.
+    """Check for updates and display notification if available.
 
     This function:
-    - Checks cache to avoid frequent API calls (max 1 check per hour)
-    - Makes a quick PyPI API call with 0.5s timeout
-    - Fails silently on network errors to not disrupt user experience
+    - Answers from the cache without waiting for the network
+    - Refreshes an expired or missing cache in the background
     - Displays update notification if newer version is available
     """
-    now = time.time()
-    latest_version = None
-
-    # 1. Try reading from cache first
-    if CACHE_FILE.exists():
-        try:
-            data = json.loads(CACHE_FILE.read_text())
-            if now - data.get("last_check_timestamp", 0) < CHECK_INTERVAL:
-                latest_version = data.get("latest_version")
-        except Exception:
-            pass
-
-    # 2. If cache expired or missing, fetch from PyPI
-    if not latest_version:
-        try:
-            response = httpx.get("https://pypi.org/pypi/todopro-cli/json", timeout=0.5)
-            if response.status_code == 200:
-                latest_version = response.json()["info"]["version"]
-                # Save to cache
-                CACHE_DIR.mkdir(parents=True, exist_ok=True)
-                CACHE_FILE.write_text(
-                    json.dumps(
-                        {"latest_version": latest_version, "last_check_timestamp": now}
-                    )
-                )
-        except Exception:
-            # Silently fail on network errors
-            pass
-
-    # 3. Display notification if newer version available
+    data = _read_cache()
+    if _is_stale(data):
+        schedule_refresh()
+    latest_version = data.get("latest_version")
+
+    # Display notification if newer version available
     if latest_version and version.parse(latest_version) > version.parse(__version__):
         pass
 
@@ -65,37 +144,19 @@ def check_for_updates() -> None:
 def get_latest_version() -> str | None:
     """Get the latest version from PyPI.
 
+    Unlike the other lookups this waits for PyPI when the cache is more
+    than 5 minutes old: it backs ``tp update``, which must not act on a
+    stale answer.
+
     Returns:
         Latest version string or None if unable to fetch
     """
-    now = time.time()
-
-    # Check cache first
-    if CACHE_FILE.exists():
-        try:
-            data = json.loads(CACHE_FILE.read_text())
-            # Use cache if it's less than 5 minutes old for update command
-            if now - data.get("last_check_timestamp", 0) < 300:
-                return data.get("latest_version")
-        except Exception:
-            pass
-
-    # Fetch from PyPI
-    try:
-        response = httpx.get("https://pypi.org/pypi/todopro-cli/json", timeout=2)
-        if response.status_code == 200:
-            latest_version = response.json()["info"]["version"]
-            # Cache the result
-            CACHE_DIR.mkdir(parents=True, exist_ok=True)
-            CACHE_FILE.write_text(
-                json.dumps(
-                    {"latest_version": latest_version, "last_check_timestamp": now}
-                )
-            )
-            return latest_version
-    except Exception:
-        pass
-    return None
+    data = _read_cache()
+    if not _is_stale(data, max_age=300) and data.get("latest_version"):
+        return data["latest_version"]
+
+    data = refresh_metadata()
+    return data.get("latest_version") if data else None
 
 
 def is_update_available() -> tuple[bool, str | None]:
@@ -111,13 +172,15 @@ def is_update_available() -> tuple[bool, str | None]:
 
 
 def get_backend_url() -> str:
-    """Get backend URL with priority: env var > cache > PyPI > default.
+    """Get backend URL with priority: env var > cache > default.
 
     Priority hierarchy:
     1. Environment variable (TODOPRO_BACKEND_URL) - highest priority for dev/testing
-    2. Local cache - if PyPI was fetched within last hour
-    3. PyPI metadata - fetch from project_urls.Backend
-    4. Hard-coded fallback - default URL
+    2. Local cache of the PyPI metadata (project_urls.Backend), even if expired
+    3. Hard-coded fallback - default URL
+
+    Never waits for the network: an expired or missing cache is refreshed
+    in the background for the next call.
 
     Returns:
         Backend URL string
@@ -127,47 +190,18 @@ def get_backend_url() -> str:
     if env_url:
         return env_url.rstrip("/")
 
-    # Priority 2: Check cache
-    if CACHE_FILE.exists():
-        try:
-            data = json.loads(CACHE_FILE.read_text())
-            # If cache is fresh (less than 1 hour old), use cached backend URL
-            if time.time() - data.get("last_check_timestamp", 0) < CHECK_INTERVAL:
-                backend_url = data.get("backend_url")
-                if backend_url:
-                    return backend_url.rstrip("/")
-        except Exception:
-            pass
-
-    # Priority 3: Fetch from PyPI metadata
-    try:
-        response = httpx.get("https://pypi.org/pypi/todopro-cli/json", timeout=2)
-        if response.status_code == 200:
-            data = response.json()
-            backend_url = data.get("info", {}).get("project_urls", {}).get("Backend")
-            if backend_url:
-                # Cache it
-                cache_data = {}
-                if CACHE_FILE.exists():
-                    with contextlib.suppress(Exception):
-                        cache_data = json.loads(CACHE_FILE.read_text())
-                cache_data["backend_url"] = backend_url
-                cache_data["last_check_timestamp"] = time.time()
-                CACHE_DIR.mkdir(parents=True, exist_ok=True)
-                CACHE_FILE.write_text(json.dumps(cache_data))
-                return backend_url.rstrip("/")
-    except Exception:
-        pass
+    data = _read_cache()
+    stale = _is_stale(data)
+    if stale:
+        schedule_refresh()
 
-    # Priority 4: Try to use cached backend URL even if expired
-    if CACHE_FILE.exists():
-        try:
-            data = json.loads(CACHE_FILE.read_text())
-            backend_url = data.get("backend_url")
-            if backend_url:
-                return backend_url.rstrip("/")
-        except Exception:
-            pass
+    # Priority 2: Cached backend URL
+    backend_url = data.get("backend_url")
+    if isinstance(backend_url, str) and backend_url:
+        metrics.cache_lookup("backend_url", None if stale else True)
+        return backend_url.rstrip("/")
 
     # Final fallback: Hard-coded default
+    metrics.cache_lookup("backend_url", False)
     return DEFAULT_BACKEND_URL
+
@@ -8,6 +8,8 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING
 
+from todopro_cli.utils import metrics
+
 if TYPE_CHECKING:
     from .core.repository import ProjectRepository, TaskRepository
 
@@ -160,7 +162,9 @@ async def resolve_project_uuid(
     from todopro_cli.services.cache_service import get_project_suffix_mapping
 
     suffix_mapping = get_project_suffix_mapping()
-    if short_or_full_id_stripped in suffix_mapping:
+    hit = short_or_full_id_stripped in suffix_mapping
+    metrics.cache_lookup("project_ids", hit)
+    if hit:
         return suffix_mapping[short_or_full_id_stripped]
 
     # Looks like a UUID prefix (only hex digits and dashes) — try prefix search
@@ -262,7 +266,9 @@ async def resolve_label_id(label_id_or_suffix: str, label_repository) -> str:
 
     # Check cached suffix mapping first
     suffix_mapping = get_label_suffix_mapping()
-    if stripped in suffix_mapping:
+    hit = stripped in suffix_mapping
+    metrics.cache_lookup("label_ids", hit)
+    if hit:
         return suffix_mapping[stripped]
 
     # Full UUID — direct lookup
@@ -315,7 +321,9 @@ async def resolve_section_id(
 
     # Check cached suffix mapping first
     suffix_mapping = get_section_suffix_mapping()
-    if stripped in suffix_mapping:
+    hit = stripped in suffix_mapping
+    metrics.cache_lookup("section_ids", hit)
+    if hit:
         return suffix_mapping[stripped]
 
     # Full UUID — accept as-is
@@ -9,7 +9,9 @@ import pytest
 
 from todopro_cli.adapters.sqlite.connection import (
     DatabaseConnection,
+    commit,
     get_connection,
+    transaction,
 )
 
 # ---------------------------------------------------------------------------
@@ -253,3 +255,58 @@ class TestModuleLevelGetConnection:
             DatabaseConnection.execute_with_retry(
                 mock_conn, "SELECT 1", max_retries=0
             )
+
+
+# ---------------------------------------------------------------------------
+# transaction()
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def kv(tmp_path):
+    conn = DatabaseConnection.open(tmp_path / "tx.db")
+    conn.execute("CREATE TABLE kv (k TEXT PRIMARY KEY)")
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def _keys(conn):
+    return [row[0] for row in conn.execute("SELECT k FROM kv ORDER BY k")]
+
+
+class TestTransaction:
+    def test_commits_on_success(self, kv):
+        with transaction(kv):
+            kv.execute("INSERT INTO kv VALUES ('a')")
+        assert not kv.in_transaction
+        assert _keys(kv) == ["a"]
+
+    def test_rolls_back_on_error(self, kv):
+        with pytest.raises(RuntimeError), transaction(kv):
+            kv.execute("INSERT INTO kv VALUES ('a')")
+            raise RuntimeError("boom")
+        assert _keys(kv) == []
+
+    def test_nested_failure_only_undoes_inner_block(self, kv):
+        with transaction(kv):
+            kv.execute("INSERT INTO kv VALUES ('outer')")
+            with pytest.raises(sqlite3.IntegrityError), transaction(kv):
+                kv.execute("INSERT INTO kv VALUES ('inner')")
+                kv.execute("INSERT INTO kv VALUES ('outer')")
+            assert kv.in_transaction
+        assert _keys(kv) == ["outer"]
+
+    def test_commit_inside_block_is_deferred(self, kv):
+        with pytest.raises(RuntimeError), transaction(kv):
+            kv.execute("INSERT INTO kv VALUES ('a')")
+            commit(kv)
+            assert kv.in_transaction
+            raise RuntimeError("boom")
+        assert _keys(kv) == []
+
+    def test_commit_outside_block_commits(self, kv):
+        kv.execute("INSERT INTO kv VALUES ('a')")
+        commit(kv)
+        assert not kv.in_transaction
+        assert _keys(kv) == ["a"]
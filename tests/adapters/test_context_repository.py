@@ -360,3 +360,97 @@ class TestGetAvailable:
 
         result = await repo.get_available(NEARBY_LAT, NEARBY_LON)
         assert len(result) == 1
+
+
+# ---------------------------------------------------------------------------
+# get_available with the spatial index (migration 007)
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def spatial_repo(db: sqlite3.Connection) -> SqliteLocationContextRepository:
+    from todopro_cli.adapters.sqlite.migrations.m007_context_spatial_index import (
+        ContextSpatialIndexMigration,
+    )
+
+    ContextSpatialIndexMigration().up(db)
+    return _make_repo(db)
+
+
+class TestGetAvailableSpatialIndex:
+    @pytest.mark.asyncio
+    async def test_create_indexes_context(self, spatial_repo, db):
+        await spatial_repo.create(
+            LocationContextCreate(
+                name="London", latitude=LONDON_LAT, longitude=LONDON_LON, radius=500.0
+            )
+        )
+        assert db.execute("SELECT COUNT(*) FROM contexts_rtree").fetchone()[0] == 1
+
+        result = await spatial_repo.get_available(NEARBY_LAT, NEARBY_LON)
+        assert [c.name for c in result] == ["London"]
+        assert await spatial_repo.get_available(FAR_LAT, FAR_LON) == []
+
+    @pytest.mark.asyncio
+    async def test_migration_backfills_existing_contexts(self, db):
+        from todopro_cli.adapters.sqlite.migrations.m007_context_spatial_index import (
+            ContextSpatialIndexMigration,
+        )
+
+        _insert_context(db, "london", "London", LONDON_LAT, LONDON_LON, radius=500.0)
+        ContextSpatialIndexMigration().up(db)
+        repo = _make_repo(db)
+
+        result = await repo.get_available(NEARBY_LAT, NEARBY_LON)
+        assert [c.id for c in result] == ["london"]
+
+    @pytest.mark.asyncio
+    async def test_excludes_deleted_contexts(self, spatial_repo, db):
+        created = await spatial_repo.create(
+            LocationContextCreate(
+                name="London", latitude=LONDON_LAT, longitude=LONDON_LON, radius=500.0
+            )
+        )
+        db.execute(
+            "UPDATE contexts SET deleted_at = '2024-01-02' WHERE id = ?", (created.id,)
+        )
+        assert await spatial_repo.get_available(LONDON_LAT, LONDON_LON) == []
+
+        await spatial_repo.delete(created.id)
+        assert db.execute("SELECT COUNT(*) FROM contexts_rtree").fetchone()[0] == 0
+
+    @pytest.mark.asyncio
+    async def test_matches_full_scan(self, spatial_repo, db):
+        import random
+
+        rng = random.Random(7)
+        for i in range(300):
+            await spatial_repo.create(
+                LocationContextCreate(
+                    name=f"ctx-{i}",
+                    latitude=rng.uniform(51.0, 52.0),
+                    longitude=rng.uniform(-1.0, 1.0),
+                    radius=rng.uniform(100.0, 20_000.0),
+                )
+            )
+        scan_repo = _make_repo(db)
+        scan_repo._spatial_index = False
+
+        for _ in range(20):
+            lat, lon = rng.uniform(51.0, 52.0), rng.uniform(-1.0, 1.0)
+            indexed = {c.id for c in await spatial_repo.get_available(lat, lon)}
+            scanned = {c.id for c in await scan_repo.get_available(lat, lon)}
+            assert indexed == scanned
+
+    @pytest.mark.asyncio
+    async def test_lookup_uses_rtree(self, spatial_repo, db):
+        statements = []
+        db.set_trace_callback(statements.append)
+        await spatial_repo.get_available(LONDON_LAT, LONDON_LON)
+        db.set_trace_callback(None)
+
+        query = next(s for s in statements if "JOIN contexts" in s)
+        plan = " ".join(
+            row[3] for row in db.execute(f"EXPLAIN QUERY PLAN {query}").fetchall()
+        )
+        assert "VIRTUAL TABLE INDEX" in plan
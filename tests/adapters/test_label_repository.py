@@ -374,3 +374,23 @@ class TestSearch:
         result = await repo.search("Z")
         names = [lbl.name for lbl in result]
         assert names == sorted(names)
+
+
+# ---------------------------------------------------------------------------
+# create_many
+# ---------------------------------------------------------------------------
+
+
+class TestCreateMany:
+    @pytest.mark.asyncio
+    async def test_creates_all_labels(self, repo):
+        ids = await repo.create_many([LabelCreate(name="a"), LabelCreate(name="b")])
+        assert len(ids) == 2
+        assert [lbl.name for lbl in await repo.list_all()] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_rolls_back_whole_batch(self, repo):
+        await repo.create(LabelCreate(name="a"))
+        with pytest.raises(ValueError, match="already exists"):
+            await repo.create_many([LabelCreate(name="b"), LabelCreate(name="a")])
+        assert [lbl.name for lbl in await repo.list_all()] == ["a"]
@@ -0,0 +1,52 @@
+"""Tests for m004_task_list_index.py (TaskListIndexMigration)."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from todopro_cli.adapters.sqlite import schema as db_schema
+from todopro_cli.adapters.sqlite.migrations.m004_task_list_index import (
+    TaskListIndexMigration,
+)
+
+LIST_QUERY = (
+    "SELECT t.* FROM tasks t WHERE t.user_id = ? AND t.deleted_at IS NULL "
+    "ORDER BY COALESCE(t.priority, 0) ASC, COALESCE(t.project_id, '') ASC, "
+    "t.created_at DESC, t.id ASC LIMIT 31"
+)
+
+
+def _make_connection() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.execute(db_schema.CREATE_USERS_TABLE)
+    conn.execute(db_schema.CREATE_PROJECTS_TABLE)
+    conn.execute(db_schema.CREATE_TASKS_TABLE)
+    return conn
+
+
+class TestTaskListIndexMigration:
+    def test_version(self):
+        assert TaskListIndexMigration().version == 4
+
+    def test_creates_index(self):
+        conn = _make_connection()
+        TaskListIndexMigration().up(conn)
+        names = {
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        }
+        assert "idx_tasks_list_order" in names
+
+    def test_is_idempotent(self):
+        conn = _make_connection()
+        TaskListIndexMigration().up(conn)
+        TaskListIndexMigration().up(conn)
+
+    def test_default_listing_order_needs_no_sort(self):
+        conn = _make_connection()
+        TaskListIndexMigration().up(conn)
+        plan = " ".join(
+            row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {LIST_QUERY}", ["u"])
+        )
+        assert "idx_tasks_list_order" in plan
+        assert "TEMP B-TREE" not in plan
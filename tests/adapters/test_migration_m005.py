@@ -0,0 +1,78 @@
+"""Tests for m005_next_occurrence_index.py (NextOccurrenceIndexMigration)."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from todopro_cli.adapters.sqlite import schema as db_schema
+from todopro_cli.adapters.sqlite.migrations.m005_next_occurrence_index import (
+    NextOccurrenceIndexMigration,
+)
+
+
+def _make_connection() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.execute(db_schema.CREATE_USERS_TABLE)
+    conn.execute(db_schema.CREATE_PROJECTS_TABLE)
+    conn.execute(db_schema.CREATE_TASKS_TABLE)
+    return conn
+
+
+def _insert(conn, task_id, rule, due="2099-10-18T09:00:00", **extra):
+    columns = {
+        "id": task_id,
+        "content": task_id,
+        "user_id": "u",
+        "created_at": "2024-01-01",
+        "updated_at": "2024-01-01",
+        "is_recurring": rule is not None,
+        "recurrence_rule": rule,
+        "due_date": due,
+        **extra,
+    }
+    conn.execute(
+        f"INSERT INTO tasks ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' * len(columns))})",
+        list(columns.values()),
+    )
+
+
+def _next_occurrences(conn) -> dict[str, str | None]:
+    return dict(conn.execute("SELECT id, next_occurrence FROM tasks"))
+
+
+class TestNextOccurrenceIndexMigration:
+    def test_version(self):
+        assert NextOccurrenceIndexMigration().version == 5
+
+    def test_creates_index(self):
+        conn = _make_connection()
+        NextOccurrenceIndexMigration().up(conn)
+        names = {
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        }
+        assert "idx_tasks_next_occurrence" in names
+
+    def test_is_idempotent(self):
+        conn = _make_connection()
+        NextOccurrenceIndexMigration().up(conn)
+        NextOccurrenceIndexMigration().up(conn)
+
+    def test_backfills_open_recurring_tasks(self):
+        conn = _make_connection()
+        _insert(conn, "daily", "FREQ=DAILY")
+        _insert(conn, "one-off", None)
+        _insert(conn, "done", "FREQ=DAILY", is_completed=1)
+        _insert(conn, "broken", "FREQ=SOMETIMES")
+        _insert(conn, "last", "FREQ=DAILY;COUNT=1")
+
+        NextOccurrenceIndexMigration().up(conn)
+
+        assert _next_occurrences(conn) == {
+            "daily": "2099-10-19T09:00:00",
+            "one-off": None,
+            "done": None,
+            "broken": None,
+            "last": None,
+        }
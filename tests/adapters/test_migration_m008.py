@@ -0,0 +1,100 @@
+"""Tests for m008_project_counters.py (ProjectCountersMigration)."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from todopro_cli.adapters.sqlite import schema as db_schema
+from todopro_cli.adapters.sqlite.migrations.m008_project_counters import (
+    ProjectCountersMigration,
+)
+
+AGGREGATE = (
+    "SELECT user_id, project_id, COUNT(*), SUM(is_completed = 1), "
+    "SUM(is_completed = 0) FROM tasks "
+    "WHERE project_id IS NOT NULL AND deleted_at IS NULL "
+    "GROUP BY user_id, project_id"
+)
+
+
+def _make_connection() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.execute(db_schema.CREATE_USERS_TABLE)
+    conn.execute(db_schema.CREATE_PROJECTS_TABLE)
+    conn.execute(db_schema.CREATE_TASKS_TABLE)
+    for project_id in ("p1", "p2"):
+        conn.execute(
+            "INSERT INTO projects (id, name, user_id, created_at, updated_at) "
+            "VALUES (?, ?, 'u', '2024-01-01', '2024-01-01')",
+            (project_id, project_id),
+        )
+    return conn
+
+
+def _add_task(conn, task_id, project_id, completed=0):
+    conn.execute(
+        "INSERT INTO tasks (id, content, is_completed, user_id, project_id, "
+        "created_at, updated_at) VALUES (?, ?, ?, 'u', ?, '2024-01-01', '2024-01-01')",
+        (task_id, task_id, completed, project_id),
+    )
+
+
+def _counters(conn) -> dict:
+    rows = conn.execute(
+        "SELECT user_id, project_id, total, completed, pending "
+        "FROM project_counters WHERE total > 0"
+    )
+    return {(row[0], row[1]): row[2:] for row in rows}
+
+
+def _aggregate(conn) -> dict:
+    return {(row[0], row[1]): row[2:] for row in conn.execute(AGGREGATE)}
+
+
+class TestProjectCountersMigration:
+    def test_version(self):
+        assert ProjectCountersMigration().version == 8
+
+    def test_backfills_existing_tasks(self):
+        conn = _make_connection()
+        _add_task(conn, "a", "p1", completed=1)
+        _add_task(conn, "b", "p1")
+        _add_task(conn, "c", "p2")
+        ProjectCountersMigration().up(conn)
+        assert _counters(conn) == {("u", "p1"): (2, 1, 1), ("u", "p2"): (1, 0, 1)}
+
+    def test_is_idempotent(self):
+        conn = _make_connection()
+        _add_task(conn, "a", "p1")
+        ProjectCountersMigration().up(conn)
+        ProjectCountersMigration().up(conn)
+        assert _counters(conn) == {("u", "p1"): (1, 0, 1)}
+
+    def test_triggers_follow_every_change(self):
+        conn = _make_connection()
+        ProjectCountersMigration().up(conn)
+        changes = [
+            lambda: _add_task(conn, "a", "p1"),
+            lambda: _add_task(conn, "b", "p1"),
+            lambda: _add_task(conn, "c", None),
+            "UPDATE tasks SET is_completed = 1 WHERE id = 'a'",
+            "UPDATE tasks SET project_id = 'p2' WHERE id = 'b'",
+            "UPDATE tasks SET project_id = 'p1' WHERE id = 'c'",
+            "UPDATE tasks SET deleted_at = '2024-01-02' WHERE id = 'a'",
+            "UPDATE tasks SET content = 'renamed' WHERE id = 'b'",
+            "UPDATE tasks SET deleted_at = NULL WHERE id = 'a'",
+            "DELETE FROM tasks WHERE id = 'c'",
+        ]
+        for change in changes:
+            if callable(change):
+                change()
+            else:
+                conn.execute(change)
+            assert _counters(conn) == _aggregate(conn), change
+
+    def test_project_delete_drops_its_counters(self):
+        conn = _make_connection()
+        ProjectCountersMigration().up(conn)
+        _add_task(conn, "a", "p1")
+        conn.execute("DELETE FROM projects WHERE id = 'p1'")
+        assert conn.execute("SELECT COUNT(*) FROM project_counters").fetchone()[0] == 0
@@ -0,0 +1,281 @@
+"""Unit tests for the local mirror of remote contexts.
+
+The mirror lives in a temporary vault database; the remote repositories are
+AsyncMocks standing in for the REST adapters.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from todopro_cli.adapters.mirror import (
+    FULL_REVALIDATE_INTERVAL,
+    MirroredLabelRepository,
+    MirroredProjectRepository,
+    MirroredTaskRepository,
+    MirrorRevalidator,
+    MirrorStore,
+)
+from todopro_cli.models import (
+    Label,
+    Project,
+    ProjectFilters,
+    Task,
+    TaskCreate,
+    TaskFilters,
+)
+from todopro_cli.utils import deferred
+
+NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _project(project_id: str = "proj-1", name: str = "Work") -> Project:
+    return Project(id=project_id, name=name, created_at=NOW, updated_at=NOW)
+
+
+def _task(task_id: str, content: str = "Task", **kwargs) -> Task:
+    return Task(id=task_id, content=content, created_at=NOW, updated_at=NOW, **kwargs)
+
+
+def _stream(*items):
+    """Mock of an ``iter_all`` that yields ``items``; exceptions are raised."""
+
+    async def iter_all(*_args, **_kwargs):
+        for item in items:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    return MagicMock(side_effect=iter_all)
+
+
+@pytest.fixture
+def store(tmp_path) -> MirrorStore:
+    s = MirrorStore(str(tmp_path / "mirror.db"))
+    e2ee_mock = MagicMock()
+    e2ee_mock.enabled = False
+    e2ee_mock.prepare_task_for_storage.side_effect = lambda c, d: (c, None, d, None)
+    e2ee_mock.extract_task_content.side_effect = lambda c, _ce, d, _de: (c, d)
+    s._e2ee_handler = e2ee_mock
+    yield s
+    s.connection.close()
+
+
+@pytest.fixture
+def remote():
+    tasks = AsyncMock()
+    projects = AsyncMock()
+    labels = AsyncMock()
+    projects.list_all.return_value = [_project()]
+    labels.list_all.return_value = [Label(id="lbl-1", name="urgent")]
+    tasks.iter_all = _stream(
+        _task("task-1", "Write report", project_id="proj-1", labels=["lbl-1"]),
+        _task("task-2", "Call Bob"),
+    )
+    return tasks, projects, labels
+
+
+@pytest.fixture
+def revalidator(store, remote) -> MirrorRevalidator:
+    tasks, projects, labels = remote
+    return MirrorRevalidator(store, tasks, projects, labels, max_age=60)
+
+
+@pytest.fixture(autouse=True)
+def _clear_deferred():
+    yield
+    deferred._pending.clear()
+
+
+class TestMirrorStore:
+    @pytest.mark.asyncio
+    async def test_upsert_tasks_keeps_server_ids_and_links(self, store):
+        await store.upsert_projects([_project()])
+        await store.upsert_labels([Label(id="lbl-1", name="urgent")])
+        await store.upsert_tasks([_task("task-1", project_id="proj-1", labels=["lbl-1"])])
+
+        row = store.connection.execute(
+            "SELECT project_id, user_id FROM tasks WHERE id = 'task-1'"
+        ).fetchone()
+        assert row["project_id"] == "proj-1"
+        assert row["user_id"] == store.user_id
+        links = store.connection.execute("SELECT label_id FROM task_labels").fetchall()
+        assert [r[0] for r in links] == ["lbl-1"]
+
+    @pytest.mark.asyncio
+    async def test_upsert_tasks_drops_unknown_references(self, store):
+        await store.upsert_tasks([_task("task-1", project_id="missing", labels=["nope"])])
+
+        row = store.connection.execute("SELECT project_id FROM tasks").fetchone()
+        assert row["project_id"] is None
+        assert store.connection.execute("SELECT COUNT(*) FROM task_labels").fetchone()[0] == 0
+
+    @pytest.mark.asyncio
+    async def test_upsert_tasks_updates_existing_row(self, store):
+        await store.upsert_tasks([_task("task-1", "Old")])
+        await store.upsert_tasks([_task("task-1", "New", is_completed=True)])
+
+        rows = store.connection.execute("SELECT content, is_completed FROM tasks").fetchall()
+        assert len(rows) == 1
+        assert rows[0]["content"] == "New"
+        assert rows[0]["is_completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_prune_soft_deletes_missing_tasks(self, store):
+        await store.upsert_tasks([_task("task-1"), _task("task-2")])
+        await store.upsert_tasks([_task("task-2")], prune=True)
+
+        deleted = store.connection.execute(
+            "SELECT id FROM tasks WHERE deleted_at IS NOT NULL"
+        ).fetchall()
+        assert [r[0] for r in deleted] == ["task-1"]
+
+    @pytest.mark.asyncio
+    async def test_freshness(self, store):
+        assert not await store.is_primed()
+        assert not await store.is_fresh(60)
+        assert await store.needs_full_revalidation()
+
+        await store.mark_revalidated(datetime.now(UTC), full=True)
+
+        assert await store.is_primed()
+        assert await store.is_fresh(60)
+        assert not await store.needs_full_revalidation()
+
+    @pytest.mark.asyncio
+    async def test_full_revalidation_due_after_interval(self, store):
+        await store.mark_revalidated(datetime.now(UTC) - FULL_REVALIDATE_INTERVAL, full=True)
+        assert await store.needs_full_revalidation()
+
+
+class TestMirrorRevalidator:
+    @pytest.mark.asyncio
+    async def test_first_revalidation_is_full(self, store, remote, revalidator):
+        tasks, _projects, _labels = remote
+        await revalidator.revalidate()
+
+        filters = tasks.iter_all.call_args.args[0]
+        assert filters.status == "all"
+        assert filters.updated_after is None
+        assert await store.is_primed()
+
+    @pytest.mark.asyncio
+    async def test_later_revalidation_is_delta(self, store, remote, revalidator):
+        tasks, _projects, _labels = remote
+        await revalidator.revalidate()
+        await revalidator.revalidate()
+
+        filters = tasks.iter_all.call_args.args[0]
+        assert filters.updated_after is not None
+        assert filters.updated_after < await store.last_revalidated()
+
+    @pytest.mark.asyncio
+    async def test_full_pull_streams_pages_then_prunes(
+        self, store, remote, revalidator, monkeypatch
+    ):
+        tasks, _projects, _labels = remote
+        monkeypatch.setattr("todopro_cli.adapters.mirror.DEFAULT_PAGE_SIZE", 2)
+        await store.upsert_tasks([_task("gone")])
+        tasks.iter_all = _stream(*(_task(f"task-{i}") for i in range(5)))
+
+        await revalidator.revalidate()
+
+        live = store.connection.execute(
+            "SELECT id FROM tasks WHERE deleted_at IS NULL ORDER BY id"
+        ).fetchall()
+        assert [row[0] for row in live] == [f"task-{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_interrupted_pull_prunes_nothing(self, store, remote, revalidator):
+        tasks, _projects, _labels = remote
+        await store.upsert_tasks([_task("kept")])
+        tasks.iter_all = _stream(_task("task-1"), ConnectionError("reset"))
+
+        with pytest.raises(ConnectionError):
+            await revalidator.revalidate()
+
+        live = store.connection.execute(
+            "SELECT id FROM tasks WHERE deleted_at IS NULL"
+        ).fetchall()
+        assert {row[0] for row in live} == {"kept"}
+        assert not await store.is_primed()
+
+    @pytest.mark.asyncio
+    async def test_schedule_skips_fresh_mirror(self, store, revalidator):
+        await store.mark_revalidated(datetime.now(UTC), full=True)
+        await revalidator.schedule()
+        assert not deferred.is_pending(revalidator.key)
+
+    @pytest.mark.asyncio
+    async def test_schedule_defers_stale_mirror(self, store, revalidator):
+        await store.mark_revalidated(datetime.now(UTC) - timedelta(minutes=5), full=True)
+        await revalidator.schedule()
+        assert deferred.is_pending(revalidator.key)
+        await deferred.drain()
+        assert await store.is_fresh(60)
+
+
+class TestMirroredTaskRepository:
+    @pytest.mark.asyncio
+    async def test_cold_start_primes_then_reads_locally(self, store, remote, revalidator):
+        tasks, _projects, _labels = remote
+        repo = MirroredTaskRepository(tasks, store, revalidator)
+
+        result = await repo.list_all(TaskFilters())
+        assert sorted(t.id for t in result) == ["task-1", "task-2"]
+
+        await repo.list_all(TaskFilters())
+        assert tasks.iter_all.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_id_suffix_miss_falls_back_to_remote(self, store, remote, revalidator):
+        tasks, _projects, _labels = remote
+        repo = MirroredTaskRepository(tasks, store, revalidator)
+        await revalidator.revalidate()
+
+        tasks.list_all.return_value = [_task("task-new")]
+        result = await repo.list_all(TaskFilters(id_suffix="new"))
+
+        assert [t.id for t in result] == ["task-new"]
+        assert (await repo.get("task-new")).id == "task-new"
+
+    @pytest.mark.asyncio
+    async def test_add_writes_through(self, store, remote, revalidator):
+        tasks, _projects, _labels = remote
+        repo = MirroredTaskRepository(tasks, store, revalidator)
+        tasks.add.return_value = _task("task-3", "Created")
+
+        created = await repo.add(TaskCreate(content="Created"))
+
+        tasks.add.assert_awaited_once()
+        assert (await repo.local.get(created.id)).content == "Created"
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_from_mirror(self, store, remote, revalidator):
+        tasks, _projects, _labels = remote
+        repo = MirroredTaskRepository(tasks, store, revalidator)
+        await revalidator.revalidate()
+        tasks.delete.return_value = True
+
+        assert await repo.delete("task-2") is True
+        assert [t.id for t in await repo.list_all(TaskFilters())] == ["task-1"]
+
+
+class TestMirroredProjectAndLabelRepositories:
+    @pytest.mark.asyncio
+    async def test_projects_read_from_mirror(self, store, remote, revalidator):
+        _tasks, projects, _labels = remote
+        repo = MirroredProjectRepository(projects, store, revalidator)
+
+        result = await repo.list_all(ProjectFilters())
+        assert [p.name for p in result] == ["Work"]
+
+    @pytest.mark.asyncio
+    async def test_labels_read_from_mirror(self, store, remote, revalidator):
+        _tasks, _projects, labels = remote
+        repo = MirroredLabelRepository(labels, store, revalidator)
+
+        assert [lbl.name for lbl in await repo.search("urg")] == ["urgent"]
@@ -11,7 +11,11 @@ import sqlite3
 
 import pytest
 
+from todopro_cli.adapters.sqlite import project_repository
 from todopro_cli.adapters.sqlite import schema as db_schema
+from todopro_cli.adapters.sqlite.migrations.m008_project_counters import (
+    ProjectCountersMigration,
+)
 from todopro_cli.adapters.sqlite.project_repository import (
     SqliteProjectRepository,
 )
@@ -202,6 +206,26 @@ class TestCreate:
         assert p1.id != p2.id
 
 
+class TestCreateMany:
+    @pytest.mark.asyncio
+    async def test_creates_all_and_returns_ids_in_order(self, repo):
+        ids = await repo.create_many([ProjectCreate(name="Alpha"), ProjectCreate(name="Beta")])
+        assert [(await repo.get(i)).name for i in ids] == ["Alpha", "Beta"]
+
+    @pytest.mark.asyncio
+    async def test_existing_name_raises_and_writes_nothing(self, repo):
+        await repo.create(ProjectCreate(name="Alpha"))
+        with pytest.raises(ValueError, match="already exists"):
+            await repo.create_many([ProjectCreate(name="Beta"), ProjectCreate(name="alpha")])
+        names = [p.name for p in await repo.list_all(ProjectFilters())]
+        assert "Beta" not in names
+
+    @pytest.mark.asyncio
+    async def test_duplicate_within_batch_raises(self, repo):
+        with pytest.raises(ValueError, match="already exists"):
+            await repo.create_many([ProjectCreate(name="Same"), ProjectCreate(name="SAME")])
+
+
 # ---------------------------------------------------------------------------
 # get
 # ---------------------------------------------------------------------------
@@ -422,3 +446,122 @@ class TestGetStats:
         assert isinstance(stats, dict)
         assert "total_tasks" in stats
         assert "completion_rate" in stats
+
+
+def _add_task(conn, user_id, task_id, project_id, completed=0, due=None, deleted=None):
+    conn.execute(
+        "INSERT INTO tasks (id, content, is_completed, user_id, project_id, due_date, "
+        "deleted_at, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, '2024-01-01', '2024-01-01')",
+        (task_id, task_id, completed, user_id, project_id, due, deleted),
+    )
+
+
+@pytest.fixture(params=["group_by", "counters"])
+def stats_repo(request, db):
+    """Repo reading counts by aggregating tasks, or from project_counters."""
+    conn, user_id = db
+    if request.param == "counters":
+        ProjectCountersMigration().up(conn)
+    return _make_repo(conn, user_id)
+
+
+class TestGetStatsMany:
+    @pytest.mark.asyncio
+    async def test_counts_every_project_at_once(self, stats_repo, db):
+        conn, user_id = db
+        work = await stats_repo.create(ProjectCreate(name="Work"))
+        home = await stats_repo.create(ProjectCreate(name="Home"))
+        empty = await stats_repo.create(ProjectCreate(name="Empty"))
+        _add_task(conn, user_id, "w1", work.id, completed=1)
+        _add_task(conn, user_id, "w2", work.id, due="2000-01-01")
+        _add_task(conn, user_id, "w3", work.id, completed=1, due="2000-01-01")
+        _add_task(conn, user_id, "w4", work.id, due="2999-01-01")
+        _add_task(conn, user_id, "h1", home.id, due="2000-01-01")
+        _add_task(conn, user_id, "h2", home.id, deleted="2024-01-02")
+        conn.commit()
+
+        stats = await stats_repo.get_stats_many([work.id, home.id, empty.id])
+
+        assert stats[work.id] == {
+            "total_tasks": 4,
+            "completed_tasks": 2,
+            "pending_tasks": 2,
+            "overdue_tasks": 1,
+            "completion_rate": 50,
+        }
+        assert stats[home.id]["total_tasks"] == 1
+        assert stats[home.id]["overdue_tasks"] == 1
+        assert stats[empty.id]["total_tasks"] == 0
+        assert await stats_repo.get_stats(work.id) == stats[work.id]
+
+    @pytest.mark.asyncio
+    async def test_defaults_to_all_projects(self, stats_repo, db):
+        conn, user_id = db
+        project = await stats_repo.create(ProjectCreate(name="Only"))
+        _add_task(conn, user_id, "t1", project.id)
+        conn.commit()
+
+        stats = await stats_repo.get_stats_many()
+
+        assert project.id in stats
+        assert stats[project.id]["pending_tasks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_projects_are_queried_in_chunks(self, stats_repo, db, monkeypatch):
+        conn, user_id = db
+        monkeypatch.setattr(project_repository, "_STATS_CHUNK_SIZE", 2)
+        projects = [
+            await stats_repo.create(ProjectCreate(name=f"P{i}")) for i in range(5)
+        ]
+        for i, project in enumerate(projects):
+            _add_task(conn, user_id, f"t{i}", project.id, due="2000-01-01")
+        conn.commit()
+
+        stats = await stats_repo.get_stats_many([p.id for p in projects])
+
+        assert all(stats[p.id]["total_tasks"] == 1 for p in projects)
+        assert all(stats[p.id]["overdue_tasks"] == 1 for p in projects)
+
+    @pytest.mark.asyncio
+    async def test_overdue_scan_uses_due_date_index(self, stats_repo, db):
+        conn, user_id = db
+        project = await stats_repo.create(ProjectCreate(name="Planned"))
+        statements = []
+        conn.set_trace_callback(statements.append)
+        await stats_repo.get_stats(project.id)
+        conn.set_trace_callback(None)
+
+        overdue_sql = next(sql for sql in statements if "due_date <" in sql)
+        plan = " ".join(
+            row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {overdue_sql}")
+        )
+        assert "idx_tasks_due_date" in plan
+
+    @pytest.mark.asyncio
+    async def test_overdue_without_due_date_index(self, stats_repo, db):
+        conn, user_id = db
+        conn.execute("DROP INDEX idx_tasks_due_date")
+        project = await stats_repo.create(ProjectCreate(name="Unindexed"))
+        _add_task(conn, user_id, "t1", project.id, due="2000-01-01")
+        conn.commit()
+
+        assert (await stats_repo.get_stats(project.id))["overdue_tasks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_list(self, stats_repo):
+        assert await stats_repo.get_stats_many([]) == {}
+
+    @pytest.mark.asyncio
+    async def test_reads_counters_instead_of_tasks(self, db):
+        conn, user_id = db
+        ProjectCountersMigration().up(conn)
+        repo = _make_repo(conn, user_id)
+        project = await repo.create(ProjectCreate(name="Counted"))
+        _add_task(conn, user_id, "t1", project.id)
+        conn.execute("UPDATE project_counters SET total = 10, completed = 5")
+        conn.commit()
+
+        stats = await repo.get_stats(project.id)
+        assert stats["total_tasks"] == 10
+        assert stats["completion_rate"] == 50
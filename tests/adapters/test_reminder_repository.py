@@ -0,0 +1,139 @@
+"""Unit tests for SqliteReminderRepository and the reminder indexes migration."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from todopro_cli.adapters.sqlite import schema as db_schema
+from todopro_cli.adapters.sqlite.migrations.m006_reminder_indexes import (
+    ReminderIndexesMigration,
+)
+from todopro_cli.adapters.sqlite.reminder_repository import SqliteReminderRepository
+
+USER_ID = "user-reminder-001"
+NOW = datetime(2026, 10, 18, 9, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def db() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute(db_schema.CREATE_USERS_TABLE)
+    conn.execute(db_schema.CREATE_PROJECTS_TABLE)
+    conn.execute(db_schema.CREATE_TASKS_TABLE)
+    conn.execute(db_schema.CREATE_REMINDERS_TABLE)
+    ReminderIndexesMigration().up(conn)
+    for user_id in (USER_ID, "nobody"):
+        conn.execute(
+            "INSERT INTO users (id, email, name, timezone, created_at, updated_at) "
+            "VALUES (?, ?, 'A', 'UTC', '2024-01-01', '2024-01-01')",
+            (user_id, f"{user_id}@example.com"),
+        )
+    for task_id, user_id in (("t1", USER_ID), ("t2", USER_ID), ("other", "nobody")):
+        conn.execute(
+            "INSERT INTO tasks (id, content, user_id, created_at, updated_at) "
+            "VALUES (?, ?, ?, '2024-01-01', '2024-01-01')",
+            (task_id, task_id, user_id),
+        )
+    conn.commit()
+    return conn
+
+
+@pytest.fixture
+def repo(db) -> SqliteReminderRepository:
+    repository = SqliteReminderRepository(connection=db)
+    repository._user_id = USER_ID
+    return repository
+
+
+class TestReminderIndexesMigration:
+    def test_version(self):
+        assert ReminderIndexesMigration().version == 6
+
+    def test_creates_indexes(self, db):
+        names = {
+            row[0]
+            for row in db.execute(
+                "SELECT name FROM sqlite_master WHERE tbl_name = 'reminders'"
+            )
+        }
+        assert {"idx_reminders_pending", "idx_reminders_task"} <= names
+
+    def test_is_idempotent(self, db):
+        ReminderIndexesMigration().up(db)
+
+
+class TestSqliteReminderRepository:
+    @pytest.mark.asyncio
+    async def test_add_stores_utc(self, repo, db):
+        local = datetime(2026, 10, 18, 12, 0, tzinfo=UTC).astimezone()
+        reminder = await repo.add("t1", local)
+        stored = db.execute(
+            "SELECT reminder_date FROM reminders WHERE id = ?", (reminder.id,)
+        ).fetchone()[0]
+        assert stored == "2026-10-18T12:00:00+00:00"
+        assert reminder.reminder_date == local
+        assert reminder.is_sent is False
+
+    @pytest.mark.asyncio
+    async def test_add_rejects_unknown_task(self, repo):
+        with pytest.raises(ValueError, match="Task not found"):
+            await repo.add("other", NOW)
+
+    @pytest.mark.asyncio
+    async def test_list_pending_orders_and_filters(self, repo, db):
+        late = await repo.add("t1", NOW + timedelta(hours=2))
+        early = await repo.add("t2", NOW + timedelta(hours=1))
+        sent = await repo.add("t1", NOW + timedelta(minutes=30))
+        await repo.mark_sent(sent.id)
+        beyond = await repo.add("t1", NOW + timedelta(days=2))
+
+        pending = await repo.list_pending(before=NOW + timedelta(days=1))
+        assert [r.id for r in pending] == [early.id, late.id]
+        assert beyond.id not in {r.id for r in pending}
+
+        db.execute("UPDATE tasks SET is_completed = 1 WHERE id = 't2'")
+        pending = await repo.list_pending(before=NOW + timedelta(days=1))
+        assert [r.id for r in pending] == [late.id]
+
+    @pytest.mark.asyncio
+    async def test_list_pending_uses_pending_index(self, repo, db):
+        await repo.add("t1", NOW)
+        statements = []
+        db.set_trace_callback(statements.append)
+        await repo.list_pending(before=NOW + timedelta(days=1))
+        db.set_trace_callback(None)
+
+        query = next(s for s in statements if s.lstrip().startswith("SELECT r.*"))
+        plan = " ".join(
+            row[3] for row in db.execute(f"EXPLAIN QUERY PLAN {query}").fetchall()
+        )
+        assert "idx_reminders_pending" in plan
+        assert "TEMP B-TREE" not in plan
+
+    @pytest.mark.asyncio
+    async def test_snooze_replaces_reminder(self, repo):
+        original = await repo.add("t1", NOW)
+        until = NOW + timedelta(minutes=10)
+        snoozed = await repo.snooze(original.id, until)
+
+        assert snoozed.snoozed_from_id == original.id
+        assert snoozed.reminder_date == until
+        assert (await repo.get(original.id)).is_snoozed is True
+        pending = await repo.list_pending(before=NOW + timedelta(days=1))
+        assert [r.id for r in pending] == [snoozed.id]
+
+    @pytest.mark.asyncio
+    async def test_list_for_task_and_delete(self, repo):
+        first = await repo.add("t1", NOW)
+        await repo.add("t2", NOW)
+        assert [r.id for r in await repo.list_for_task("t1")] == [first.id]
+
+        assert await repo.delete(first.id) is True
+        assert await repo.delete(first.id) is False
+        with pytest.raises(ValueError, match="Reminder not found"):
+            await repo.get(first.id)
@@ -10,12 +10,14 @@ Tests cover the four adapter classes:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from todopro_cli.adapters.rest_api import (
+    MAX_CONCURRENT_WRITES,
     RestApiLabelRepository,
     RestApiLocationContextRepository,
     RestApiProjectRepository,
@@ -35,6 +37,7 @@ from todopro_cli.models import (
     TaskFilters,
     TaskUpdate,
 )
+from todopro_cli.services.api.tasks import TasksAPI
 
 # ---------------------------------------------------------------------------
 # Shared test data factories
@@ -177,6 +180,93 @@ class TestRestApiTaskRepositoryListAll:
         assert tasks[0].content == "decrypted content"
 
 
+class TestRestApiTaskRepositoryIterAll:
+    """Tests for RestApiTaskRepository.iter_all pagination."""
+
+    def _make_repo(self, responses):
+        repo = RestApiTaskRepository()
+        mock_api = MagicMock()
+        mock_api.list_tasks = AsyncMock(side_effect=responses)
+        mock_api.iter_task_pages = lambda **kw: TasksAPI.iter_task_pages(mock_api, **kw)
+        repo._tasks_api = mock_api
+        repo._e2ee_handler = _disabled_e2ee()
+        return repo
+
+    @pytest.mark.asyncio
+    async def test_iter_all_follows_offsets_until_short_page(self):
+        repo = self._make_repo([
+            {"tasks": [_task_dict(id="t1"), _task_dict(id="t2")]},
+            {"tasks": [_task_dict(id="t3")]},
+        ])
+        ids = [t.id async for t in repo.iter_all(TaskFilters(status="all"), page_size=2)]
+        assert ids == ["t1", "t2", "t3"]
+        offsets = [c.kwargs["offset"] for c in repo._tasks_api.list_tasks.call_args_list]
+        assert offsets == [0, 2]
+        assert repo._tasks_api.list_tasks.call_args.kwargs["status"] == "all"
+
+    @pytest.mark.asyncio
+    async def test_iter_all_follows_server_cursor(self):
+        repo = self._make_repo([
+            {"tasks": [_task_dict(id="t1")], "next_cursor": "abc"},
+            {"tasks": [_task_dict(id="t2")], "next_cursor": None},
+        ])
+        ids = [t.id async for t in repo.iter_all(TaskFilters(), page_size=1)]
+        assert ids == ["t1", "t2"]
+        assert repo._tasks_api.list_tasks.call_args.kwargs["cursor"] == "abc"
+
+    @pytest.mark.asyncio
+    async def test_list_all_suffix_scans_pages(self):
+        repo = self._make_repo([
+            {"tasks": [_task_dict(id=f"task-{i:03d}") for i in range(200)]},
+            {"tasks": [_task_dict(id="task-abc")]},
+        ])
+        tasks = await repo.list_all(TaskFilters(id_suffix="abc"))
+        assert [t.id for t in tasks] == ["task-abc"]
+        assert repo._tasks_api.list_tasks.await_count == 2
+
+
+class TestRestApiTaskRepositoryListPage:
+    """Tests for RestApiTaskRepository.list_page."""
+
+    def _make_repo(self, responses):
+        repo = RestApiTaskRepository()
+        mock_api = MagicMock()
+        mock_api.list_tasks = AsyncMock(side_effect=responses)
+        repo._tasks_api = mock_api
+        repo._e2ee_handler = _disabled_e2ee()
+        return repo
+
+    @pytest.mark.asyncio
+    async def test_offset_pages_fetch_one_extra_row(self):
+        repo = self._make_repo([
+            {"tasks": [_task_dict(id="t1"), _task_dict(id="t2"), _task_dict(id="t3")], "total": 5},
+            {"tasks": [_task_dict(id="t3")]},
+        ])
+        first = await repo.list_page(TaskFilters(limit=2), with_total=True)
+        second = await repo.list_page(TaskFilters(limit=2, cursor=first.next_cursor))
+
+        assert [t.id for t in first.items] == ["t1", "t2"]
+        assert first.has_more and first.total_estimate == 5
+        assert [t.id for t in second.items] == ["t3"]
+        assert not second.has_more and second.next_cursor is None
+        calls = repo._tasks_api.list_tasks.call_args_list
+        assert [(c.kwargs["limit"], c.kwargs["offset"]) for c in calls] == [(3, 0), (3, 2)]
+
+    @pytest.mark.asyncio
+    async def test_server_cursor_is_passed_back(self):
+        repo = self._make_repo([
+            {"tasks": [_task_dict(id="t1")], "next_cursor": "abc"},
+            {"tasks": [_task_dict(id="t2")], "next_cursor": None},
+        ])
+        first = await repo.list_page(TaskFilters(limit=1))
+        second = await repo.list_page(TaskFilters(limit=1, cursor=first.next_cursor))
+
+        assert first.has_more
+        assert repo._tasks_api.list_tasks.call_args.kwargs["cursor"] == "abc"
+        assert [t.id for t in second.items] == ["t2"]
+        assert not second.has_more
+
+
 class TestRestApiTaskRepositoryGet:
     @pytest.mark.asyncio
     async def test_get_returns_task(self):
@@ -236,6 +326,31 @@ class TestRestApiTaskRepositoryAdd:
         assert isinstance(call_kwargs.get("due_date"), str)
 
 
+class TestRestApiTaskRepositoryAddMany:
+    @pytest.mark.asyncio
+    async def test_add_many_returns_ids_in_order_with_bounded_concurrency(self):
+        repo = RestApiTaskRepository()
+        in_flight = peak = 0
+
+        async def create_task(**data):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return _task_dict(id=data["content"], content=data["content"])
+
+        mock_api = MagicMock()
+        mock_api.create_task = AsyncMock(side_effect=create_task)
+        repo._tasks_api = mock_api
+        repo._e2ee_handler = _disabled_e2ee()
+
+        ids = await repo.add_many([TaskCreate(content=f"t{i}") for i in range(20)])
+
+        assert ids == [f"t{i}" for i in range(20)]
+        assert 1 < peak <= MAX_CONCURRENT_WRITES
+
+
 class TestRestApiTaskRepositoryUpdate:
     @pytest.mark.asyncio
     async def test_update_task(self):
@@ -292,6 +407,22 @@ class TestRestApiTaskRepositoryComplete:
         assert task.content == "decrypted content"
 
 
+class TestRestApiTaskRepositorySkip:
+    @pytest.mark.asyncio
+    async def test_skip_calls_api_and_refetches(self):
+        repo = RestApiTaskRepository()
+        mock_api = MagicMock()
+        mock_api.skip_task = AsyncMock(return_value={"detail": "skipped"})
+        mock_api.get_task = AsyncMock(return_value=_task_dict(is_recurring=True))
+        repo._tasks_api = mock_api
+        repo._e2ee_handler = _disabled_e2ee()
+
+        task = await repo.skip("task-001")
+
+        mock_api.skip_task.assert_awaited_once_with("task-001")
+        assert task.is_recurring is True
+
+
 class TestRestApiTaskRepositoryBulkUpdate:
     @pytest.mark.asyncio
     async def test_bulk_update_via_batch_complete(self):
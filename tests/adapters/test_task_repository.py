@@ -6,14 +6,18 @@ schema applied, so we test the real SQL without touching production data.
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import sqlite3
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from todopro_cli.adapters.sqlite import schema as db_schema
+from todopro_cli.adapters.sqlite.migrations.m005_next_occurrence_index import (
+    NextOccurrenceIndexMigration,
+)
 from todopro_cli.adapters.sqlite.task_repository import SqliteTaskRepository
 from todopro_cli.models import Task, TaskCreate, TaskFilters, TaskUpdate
 
@@ -301,6 +305,15 @@ class TestListAll:
         tasks = await repo.list_all(TaskFilters(sort="priority:asc"))
         assert tasks[0].priority <= tasks[-1].priority
 
+    @pytest.mark.asyncio
+    async def test_list_with_multi_field_sort(self, repo):
+        for content, priority in (("a", 2), ("b", 1), ("c", 2), ("d", 1)):
+            await repo.add(_task_create(content, priority=priority))
+        tasks = await repo.list_all(TaskFilters(sort="priority:desc,created_at:asc"))
+        keys = [(t.priority, t.created_at, t.id) for t in tasks]
+        assert [t.priority for t in tasks] == [2, 2, 1, 1]
+        assert keys == sorted(keys, key=lambda k: (-k[0], k[1], k[2]))
+
     @pytest.mark.asyncio
     async def test_list_excludes_deleted(self, repo):
         t = await repo.add(_task_create("Will be deleted"))
@@ -322,6 +335,145 @@ class TestListAll:
         tasks = await repo.list_all(TaskFilters(project_id="proj-1"))
         assert all(t.project_id == "proj-1" for t in tasks)
 
+    @pytest.mark.asyncio
+    async def test_list_attaches_labels_in_bulk(self, repo, db, monkeypatch):
+        conn, user_id = db
+        for i in range(2):
+            conn.execute(
+                "INSERT INTO labels (id, name, user_id, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (f"lbl-{i}", f"tag{i}", user_id, "2024-01-01", "2024-01-01"),
+            )
+        conn.commit()
+        a = await repo.add(_task_create("A", labels=["lbl-0", "lbl-1"]))
+        b = await repo.add(_task_create("B", labels=["lbl-1"]))
+        c = await repo.add(_task_create("C"))
+        monkeypatch.setattr(
+            repo, "_get_task_labels", MagicMock(side_effect=AssertionError("per-row query"))
+        )
+
+        tasks = {t.id: t for t in await repo.list_all(TaskFilters())}
+
+        assert sorted(tasks[a.id].labels) == ["lbl-0", "lbl-1"]
+        assert tasks[b.id].labels == ["lbl-1"]
+        assert tasks[c.id].labels == []
+
+
+# ---------------------------------------------------------------------------
+# add_many
+# ---------------------------------------------------------------------------
+
+
+class TestAddMany:
+    @pytest.mark.asyncio
+    async def test_add_many_inserts_all_tasks(self, repo):
+        ids = await repo.add_many([_task_create(f"Bulk {i}") for i in range(3)])
+        assert len(ids) == 3
+        tasks = await repo.list_all(TaskFilters())
+        assert sorted(t.content for t in tasks) == ["Bulk 0", "Bulk 1", "Bulk 2"]
+
+    @pytest.mark.asyncio
+    async def test_add_many_is_atomic(self, repo):
+        bad = _task_create("Bad")
+        bad.labels = ["missing-label"]
+        with pytest.raises(sqlite3.IntegrityError):
+            await repo.add_many([_task_create("Good"), bad])
+        assert await repo.list_all(TaskFilters()) == []
+
+
+# ---------------------------------------------------------------------------
+# iter_all
+# ---------------------------------------------------------------------------
+
+
+class TestIterAll:
+    @pytest.mark.asyncio
+    async def test_iter_all_yields_every_task_across_pages(self, repo):
+        created = [await repo.add(_task_create(f"Task {i}")) for i in range(7)]
+        ids = [t.id async for t in repo.iter_all(TaskFilters(), page_size=3)]
+        assert ids == sorted(t.id for t in created)
+
+    @pytest.mark.asyncio
+    async def test_iter_all_applies_filters(self, repo):
+        await repo.add(_task_create("Urgent", priority=1))
+        await repo.add(_task_create("Later", priority=4))
+        tasks = [t async for t in repo.iter_all(TaskFilters(priority=1), page_size=1)]
+        assert [t.content for t in tasks] == ["Urgent"]
+
+    @pytest.mark.asyncio
+    async def test_iter_all_respects_limit(self, repo):
+        for i in range(5):
+            await repo.add(_task_create(f"Task {i}"))
+        tasks = [t async for t in repo.iter_all(TaskFilters(limit=4), page_size=3)]
+        assert len(tasks) == 4
+
+
+# ---------------------------------------------------------------------------
+# list_page
+# ---------------------------------------------------------------------------
+
+
+class TestListPage:
+    @pytest.mark.asyncio
+    async def test_pages_cover_every_task_once_in_list_order(self, repo, db):
+        conn, user_id = db
+        conn.execute(
+            "INSERT INTO projects (id, name, user_id, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            ("p", "Work", user_id, "2024-01-01T00:00:00", "2024-01-01T00:00:00"),
+        )
+        for i in range(7):
+            await repo.add(
+                _task_create(f"Task {i}", priority=1 + i % 3, project_id=None if i % 2 else "p")
+            )
+        expected = [t.id for t in await repo.list_all(TaskFilters())]
+
+        seen, cursor = [], None
+        while True:
+            page = await repo.list_page(TaskFilters(limit=3, cursor=cursor))
+            seen.extend(t.id for t in page.items)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        assert seen == expected
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_custom_sort_pages_descending(self, repo):
+        for i in range(5):
+            await repo.add(_task_create(f"Task {i}", priority=i % 4 + 1))
+        filters = TaskFilters(limit=2, sort="priority:desc")
+
+        first = await repo.list_page(filters)
+        second = await repo.list_page(filters.model_copy(update={"cursor": first.next_cursor}))
+
+        priorities = [t.priority for t in first.items + second.items]
+        assert priorities == sorted(priorities, reverse=True)
+        assert not {t.id for t in first.items} & {t.id for t in second.items}
+
+    @pytest.mark.asyncio
+    async def test_total_estimate_is_optional(self, repo):
+        for i in range(4):
+            await repo.add(_task_create(f"Task {i}"))
+
+        assert (await repo.list_page(TaskFilters(limit=2))).total_estimate is None
+        page = await repo.list_page(TaskFilters(limit=2), with_total=True)
+        assert page.total_estimate == 4
+        assert page.has_more
+
+    @pytest.mark.asyncio
+    async def test_cursor_from_other_sort_is_rejected(self, repo):
+        for i in range(3):
+            await repo.add(_task_create(f"Task {i}"))
+        page = await repo.list_page(TaskFilters(limit=1))
+
+        with pytest.raises(ValueError, match="sort order"):
+            await repo.list_page(TaskFilters(limit=1, sort="due_date", cursor=page.next_cursor))
+
+    @pytest.mark.asyncio
+    async def test_malformed_cursor_is_rejected(self, repo):
+        with pytest.raises(ValueError, match="Invalid page cursor"):
+            await repo.list_page(TaskFilters(cursor="not-a-cursor"))
+
 
 # ---------------------------------------------------------------------------
 # update
@@ -883,3 +1035,156 @@ class TestBulkUpdateRollback:
                 [t.id, "nonexistent-task-id-that-will-fail"],
                 TaskUpdate(priority=2),
             )
+
+
+# ---------------------------------------------------------------------------
+# Recurring tasks – next_occurrence maintenance
+# ---------------------------------------------------------------------------
+
+# A Sunday, far enough ahead that "now" never passes it in these tests
+_SUNDAY = datetime(2099, 10, 18, 9, 0)
+
+
+def _recurring(rule: str = "FREQ=DAILY", due: datetime | None = _SUNDAY, **kwargs):
+    return TaskCreate(content="Recurring", due_date=due, recurrence_rule=rule, **kwargs)
+
+
+class TestRecurringTasks:
+    @pytest.mark.asyncio
+    async def test_add_snaps_due_date_and_sets_next_occurrence(self, repo):
+        task = await repo.add(_recurring("FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR"))
+
+        assert task.is_recurring is True
+        assert task.due_date == datetime(2099, 10, 19, 9, 0)
+        assert task.next_occurrence == datetime(2099, 10, 20, 9, 0)
+
+    @pytest.mark.asyncio
+    async def test_add_many_schedules_recurring_tasks(self, repo):
+        (task_id,) = await repo.add_many([_recurring()])
+
+        task = await repo.get(task_id)
+        assert task.next_occurrence == datetime(2099, 10, 19, 9, 0)
+
+    @pytest.mark.asyncio
+    async def test_add_rejects_invalid_rule(self, repo):
+        with pytest.raises(ValueError, match="Invalid recurrence rule"):
+            await repo.add(_recurring("FREQ=SOMETIMES"))
+
+    @pytest.mark.asyncio
+    async def test_complete_advances_instead_of_completing(self, repo):
+        task = await repo.add(_recurring("FREQ=DAILY;COUNT=3"))
+
+        done = await repo.complete(task.id)
+
+        assert done.is_completed is False
+        assert done.due_date == datetime(2099, 10, 19, 9, 0)
+        assert done.next_occurrence == datetime(2099, 10, 20, 9, 0)
+        assert done.recurrence_rule == "FREQ=DAILY;COUNT=2"
+
+    @pytest.mark.asyncio
+    async def test_complete_overdue_task_moves_past_now(self, repo):
+        task = await repo.add(_recurring(due=datetime(2020, 1, 1, 9, 0)))
+
+        done = await repo.complete(task.id)
+
+        assert done.due_date > datetime.now()
+
+    @pytest.mark.asyncio
+    async def test_complete_last_occurrence_completes_task(self, repo):
+        task = await repo.add(_recurring("FREQ=DAILY;COUNT=1"))
+        assert task.next_occurrence is None
+
+        done = await repo.complete(task.id)
+
+        assert done.is_completed is True
+
+    @pytest.mark.asyncio
+    async def test_bulk_complete_advances_recurring_tasks(self, repo):
+        recurring = await repo.add(_recurring())
+        one_off = await repo.add(_task_create("One-off"))
+
+        tasks = await repo.bulk_update(
+            [recurring.id, one_off.id], TaskUpdate(is_completed=True)
+        )
+
+        assert [t.is_completed for t in tasks] == [False, True]
+        assert tasks[0].due_date == datetime(2099, 10, 19, 9, 0)
+
+    @pytest.mark.asyncio
+    async def test_skip_moves_one_occurrence_and_records_it(self, repo, db):
+        conn, _ = db
+        task = await repo.add(_recurring())
+
+        skipped = await repo.skip(task.id)
+
+        assert skipped.due_date == datetime(2099, 10, 19, 9, 0)
+        assert skipped.next_occurrence == datetime(2099, 10, 20, 9, 0)
+        row = conn.execute(
+            "SELECT skipped_at FROM tasks WHERE id = ?", (task.id,)
+        ).fetchone()
+        assert row["skipped_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_skip_rejects_non_recurring_task(self, repo):
+        task = await repo.add(_task_create())
+
+        with pytest.raises(ValueError, match="not recurring"):
+            await repo.skip(task.id)
+
+    @pytest.mark.asyncio
+    async def test_update_recomputes_next_occurrence(self, repo):
+        task = await repo.add(_recurring())
+
+        updated = await repo.update(
+            task.id, TaskUpdate(recurrence_rule="FREQ=WEEKLY")
+        )
+        assert updated.next_occurrence == datetime(2099, 10, 25, 9, 0)
+
+        updated = await repo.update(task.id, TaskUpdate(is_recurring=False))
+        assert updated.next_occurrence is None
+
+    @pytest.mark.asyncio
+    async def test_update_with_invalid_rule_changes_nothing(self, repo):
+        task = await repo.add(_recurring())
+
+        with pytest.raises(ValueError):
+            await repo.update(task.id, TaskUpdate(recurrence_rule="FREQ=SOMETIMES"))
+
+        assert (await repo.get(task.id)).recurrence_rule == "FREQ=DAILY"
+
+
+class TestListUpcoming:
+    @pytest.mark.asyncio
+    async def test_returns_tasks_due_in_window_and_recurring_candidates(self, repo):
+        in_window = await repo.add(TaskCreate(content="Soon", due_date=_SUNDAY))
+        await repo.add(TaskCreate(content="Later", due_date=datetime(2100, 1, 1)))
+        await repo.add(TaskCreate(content="Undated"))
+        overdue_daily = await repo.add(_recurring(due=datetime(2099, 10, 1, 8, 0)))
+        monthly = await repo.add(_recurring("FREQ=MONTHLY", due=datetime(2099, 9, 1)))
+
+        tasks = await repo.list_upcoming(
+            datetime(2099, 10, 18), datetime(2099, 10, 25)
+        )
+
+        assert {t.id for t in tasks} == {in_window.id, overdue_daily.id, monthly.id}
+
+    @pytest.mark.asyncio
+    async def test_skips_completed_tasks(self, repo):
+        task = await repo.add(TaskCreate(content="Soon", due_date=_SUNDAY))
+        await repo.complete(task.id)
+
+        assert await repo.list_upcoming(_SUNDAY, _SUNDAY + timedelta(days=1)) == []
+
+    def test_query_uses_date_indexes(self, repo, db):
+        conn, _ = db
+        NextOccurrenceIndexMigration().up(conn)
+        statements = []
+        conn.set_trace_callback(statements.append)
+        asyncio.run(repo.list_upcoming(_SUNDAY, _SUNDAY + timedelta(days=7)))
+        conn.set_trace_callback(None)
+
+        plan = " ".join(
+            row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {statements[0]}")
+        )
+        assert "idx_tasks_due_date" in plan
+        assert "idx_tasks_next_occurrence" in plan
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import math
 import sqlite3
 from datetime import UTC, datetime
 
 import pytest
 
 from todopro_cli.adapters.sqlite.utils import (
+    EARTH_RADIUS_M,
+    bounding_box,
     build_update_clause,
     build_where_clause,
     generate_uuid,
@@ -79,6 +82,45 @@ class TestHaversineDistance:
         assert 110_000 < dist < 112_000
 
 
+class TestBoundingBox:
+    @staticmethod
+    def _destination(lat, lon, bearing, distance):
+        """Point *distance* meters from (lat, lon) along *bearing* degrees."""
+        angle = distance / EARTH_RADIUS_M
+        lat1, lon1, theta = map(math.radians, (lat, lon, bearing))
+        lat2 = math.asin(
+            math.sin(lat1) * math.cos(angle)
+            + math.cos(lat1) * math.sin(angle) * math.cos(theta)
+        )
+        lon2 = lon1 + math.atan2(
+            math.sin(theta) * math.sin(angle) * math.cos(lat1),
+            math.cos(angle) - math.sin(lat1) * math.sin(lat2),
+        )
+        return math.degrees(lat2), math.degrees(lon2)
+
+    @pytest.mark.parametrize("lat", [0.0, 51.5, -33.9, 78.2])
+    def test_contains_every_point_on_the_geofence(self, lat):
+        radius = 5_000.0
+        min_lat, max_lat, min_lon, max_lon = bounding_box(lat, 10.0, radius)
+        for bearing in range(0, 360, 5):
+            p_lat, p_lon = self._destination(lat, 10.0, bearing, radius * 0.999999)
+            assert min_lat <= p_lat <= max_lat
+            assert min_lon <= p_lon <= max_lon
+
+    def test_is_tight(self):
+        min_lat, max_lat, min_lon, max_lon = bounding_box(51.5, -0.1, 1_000.0)
+        assert haversine_distance(51.5, -0.1, max_lat, -0.1) == pytest.approx(1_000.0)
+        assert (max_lon - min_lon) < 0.03
+
+    def test_polar_geofence_spans_all_longitudes(self):
+        box = bounding_box(89.99, 0.0, 5_000.0)
+        assert box[1] == 90.0
+        assert box[2:] == (-180.0, 180.0)
+
+    def test_antimeridian_geofence_spans_all_longitudes(self):
+        assert bounding_box(0.0, 179.99, 5_000.0)[2:] == (-180.0, 180.0)
+
+
 class TestRowToDict:
     def test_none_returns_empty_dict(self):
         assert row_to_dict(None) == {}
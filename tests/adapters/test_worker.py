@@ -0,0 +1,150 @@
+"""Unit tests for the SQLite worker thread (worker.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from todopro_cli.adapters.sqlite.worker import offloaded, run, transaction
+
+# Never finishes on its own; only an interrupt stops it
+ENDLESS_QUERY = (
+    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) "
+    "SELECT COUNT(*) FROM n"
+)
+
+
+@pytest.fixture
+def conn():
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    connection.execute("CREATE TABLE notes (body TEXT)")
+    connection.commit()
+    yield connection
+    connection.close()
+
+
+class _Repo:
+    def __init__(self, connection):
+        self.connection = connection
+
+    @offloaded
+    def thread_name(self) -> str:
+        return threading.current_thread().name
+
+    @offloaded
+    def slow_count(self, seconds: float) -> int:
+        time.sleep(seconds)
+        return self.connection.execute("SELECT COUNT(*) FROM notes").fetchone()[0]
+
+
+class TestOffloaded:
+    @pytest.mark.asyncio
+    async def test_runs_on_the_worker_thread(self, conn):
+        name = await _Repo(conn).thread_name()
+        assert name.startswith("todopro-sqlite")
+        assert name != threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_event_loop_keeps_running(self, conn):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        assert await _Repo(conn).slow_count(0.2) == 0
+        ticking.cancel()
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_calls_keep_submission_order(self, conn):
+        def insert(body):
+            conn.execute("INSERT INTO notes VALUES (?)", (body,))
+            conn.commit()
+
+        await asyncio.gather(*(run(conn, insert, str(i)) for i in range(20)))
+        rows = conn.execute("SELECT body FROM notes ORDER BY rowid").fetchall()
+        assert [row[0] for row in rows] == [str(i) for i in range(20)]
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self, conn):
+        with pytest.raises(sqlite3.OperationalError):
+            await run(conn, conn.execute, "SELECT * FROM missing")
+
+
+class TestTransaction:
+    @pytest.mark.asyncio
+    async def test_commits_block_on_the_worker(self, conn):
+        threads = []
+        conn.set_trace_callback(
+            lambda sql: threads.append((sql, threading.current_thread().name))
+        )
+        async with transaction(conn):
+            await run(conn, conn.execute, "INSERT INTO notes VALUES ('a')")
+        conn.set_trace_callback(None)
+
+        assert [sql for sql, _ in threads] == [
+            "BEGIN",
+            "INSERT INTO notes VALUES ('a')",
+            "COMMIT",
+        ]
+        assert all(name.startswith("todopro-sqlite") for _, name in threads)
+        assert await _Repo(conn).slow_count(0) == 1
+
+    @pytest.mark.asyncio
+    async def test_error_rolls_back_block(self, conn):
+        with pytest.raises(RuntimeError):
+            async with transaction(conn):
+                await run(conn, conn.execute, "INSERT INTO notes VALUES ('a')")
+                raise RuntimeError("boom")
+
+        assert not conn.in_transaction
+        assert await _Repo(conn).slow_count(0) == 0
+
+
+class TestCancellation:
+    @pytest.mark.asyncio
+    async def test_cancel_interrupts_running_statement(self, conn):
+        def endless():
+            conn.execute("INSERT INTO notes VALUES ('partial')")
+            return conn.execute(ENDLESS_QUERY).fetchone()
+
+        call = asyncio.create_task(run(conn, endless))
+        await asyncio.sleep(0.1)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+        # The interrupted call's transaction was rolled back
+        assert await _Repo(conn).slow_count(0) == 0
+        assert not conn.in_transaction
+
+    @pytest.mark.asyncio
+    async def test_cancel_skips_queued_call(self, conn):
+        started = threading.Event()
+        release = threading.Event()
+        ran = []
+
+        def blocker():
+            started.set()
+            release.wait(5)
+
+        first = asyncio.create_task(run(conn, blocker))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        queued = asyncio.create_task(run(conn, ran.append, "queued"))
+        await asyncio.sleep(0)
+        queued.cancel()
+        await asyncio.sleep(0.01)
+        release.set()
+        await first
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        await run(conn, ran.append, "after")
+        assert ran == ["after"]
@@ -721,3 +721,40 @@ async def test_request_empty_retry_range_raises_runtime_error(mock_config_manage
         with pytest.raises(RuntimeError, match="Request failed after all retries"):
             await client.request("GET", "/test", retry=-1)
         await client.close()
+
+
+@pytest.mark.asyncio
+async def test_request_records_metrics(mock_config_manager, tmp_path):
+    """Retried 5xx responses show up as latency observations and retries."""
+    from todopro_cli.utils import metrics
+
+    error_response = httpx.Response(503, request=httpx.Request("GET", "http://x"))
+    ok_response = httpx.Response(200, request=httpx.Request("GET", "http://x"))
+
+    registry = metrics.enable(tmp_path / "todopro.prom")
+    try:
+        with (
+            patch(
+                "todopro_cli.services.api.client.get_config_service",
+                return_value=mock_config_manager,
+            ),
+            patch(
+                "todopro_cli.services.api.client.asyncio.sleep", new_callable=AsyncMock
+            ),
+        ):
+            client = APIClient()
+            with patch.object(
+                httpx.AsyncClient,
+                "request",
+                new_callable=AsyncMock,
+                side_effect=[error_response, ok_response],
+            ):
+                await client.request("GET", "/test", retry=2)
+            await client.close()
+    finally:
+        metrics.disable()
+
+    latency = registry.values["todopro_http_request_duration_seconds"]
+    assert latency[(("code", "5xx"), ("method", "GET"))]["count"] == 1
+    assert latency[(("code", "2xx"), ("method", "GET"))]["count"] == 1
+    assert registry.values["todopro_http_retries"] == {(("method", "GET"),): 1}
@@ -1,5 +1,7 @@
 """Unit tests for add command: output flags, --project override."""
 
+import json
+from contextlib import nullcontext
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -786,3 +788,63 @@ class TestCreateLocalTaskException:
             result = runner.invoke(app, ["failing task"])
         assert result.exit_code == 1
         assert "Failed" in result.output or "error" in result.output.lower()
+
+
+class TestAddBatch:
+    """--batch creates one task per input line through BatchAddService."""
+
+    def _strategy(self):
+        strategy = _make_strategy(projects=[INBOX_PROJECT, ROUTINES_PROJECT])
+        strategy.transaction.side_effect = nullcontext
+        strategy.label_repository.list_all = AsyncMock(return_value=[])
+        strategy.task_repository.add_many = AsyncMock(
+            side_effect=lambda tasks: [f"t{i}" for i in range(len(tasks))]
+        )
+        return strategy
+
+    def _run_batch(self, args, input_text, strategy):
+        with patch(
+            "todopro_cli.commands.add_command.get_storage_strategy_context",
+            return_value=strategy,
+        ):
+            return runner.invoke(app, ["--batch", *args], input=input_text)
+
+    def test_batch_from_stdin_json_output(self):
+        strategy = self._strategy()
+        result = self._run_batch(
+            ["--json"], "Stretch #Routines\n\nWater plants\n", strategy
+        )
+
+        assert result.exit_code == 0
+        payload = json.loads(result.output)
+        assert payload["created"] == 2
+        assert payload["errors"] == []
+        tasks = strategy.task_repository.add_many.call_args.args[0]
+        assert [t.project_id for t in tasks] == ["proj-routines", None]
+
+    def test_batch_from_file_with_default_project(self, tmp_path):
+        strategy = self._strategy()
+        batch_file = tmp_path / "tasks.txt"
+        batch_file.write_text("One\nTwo\n")
+
+        result = self._run_batch(
+            ["--file", str(batch_file), "--project", "Routines"], "", strategy
+        )
+
+        assert result.exit_code == 0
+        assert "Created 2 of 2 tasks" in result.output
+        tasks = strategy.task_repository.add_many.call_args.args[0]
+        assert {t.project_id for t in tasks} == {"proj-routines"}
+
+    def test_batch_reports_bad_lines_and_exits_1(self):
+        strategy = self._strategy()
+        result = self._run_batch([], "Good\nBad @missing\n", strategy)
+
+        assert result.exit_code == 1
+        assert "Created 1 of 2 tasks" in result.output
+        assert "line 2: label 'missing' not found" in result.output
+
+    def test_batch_without_lines_exits_1(self):
+        result = self._run_batch([], "\n\n", self._strategy())
+
+        assert result.exit_code == 1
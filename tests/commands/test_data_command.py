@@ -51,6 +51,11 @@ def _export_response(tasks=5, projects=2, labels=3, contexts=1, encrypted=False)
     }
 
 
+async def _agen(items):
+    for item in items:
+        yield item
+
+
 def _import_response(errors=None):
     return {
         "summary": {
@@ -702,9 +707,13 @@ class TestImportIsLocalFallback:
         storage.task_repository.list_all = AsyncMock(return_value=[])
         storage.project_repository.list_all = AsyncMock(return_value=[])
         storage.label_repository.list_all = AsyncMock(return_value=[])
+        storage.task_repository.iter_all = MagicMock(side_effect=lambda *_a, **_kw: _agen([]))
         storage.task_repository.add = AsyncMock()
+        storage.task_repository.add_many = AsyncMock()
         storage.project_repository.create = AsyncMock()
+        storage.project_repository.create_many = AsyncMock(return_value=["new-project"])
         storage.label_repository.create = AsyncMock()
+        storage.label_repository.create_many = AsyncMock(return_value=["new-label"])
 
         with patch("todopro_cli.commands.data_command.get_config_service", return_value=svc), \
              patch("todopro_cli.commands.data_command.get_storage_strategy_context",
@@ -725,9 +734,13 @@ class TestImportIsLocalFallback:
         storage.task_repository.list_all = AsyncMock(return_value=[])
         storage.project_repository.list_all = AsyncMock(return_value=[])
         storage.label_repository.list_all = AsyncMock(return_value=[])
+        storage.task_repository.iter_all = MagicMock(side_effect=lambda *_a, **_kw: _agen([]))
         storage.task_repository.add = AsyncMock()
+        storage.task_repository.add_many = AsyncMock()
         storage.project_repository.create = AsyncMock()
+        storage.project_repository.create_many = AsyncMock(return_value=["new-project"])
         storage.label_repository.create = AsyncMock()
+        storage.label_repository.create_many = AsyncMock(return_value=["new-label"])
 
         with patch("todopro_cli.commands.data_command.get_config_service", return_value=svc), \
              patch("todopro_cli.commands.data_command.get_storage_strategy_context",
@@ -750,9 +763,13 @@ class TestLocalImport:
         storage.task_repository.list_all = AsyncMock(return_value=[])
         storage.project_repository.list_all = AsyncMock(return_value=[])
         storage.label_repository.list_all = AsyncMock(return_value=[])
+        storage.task_repository.iter_all = MagicMock(side_effect=lambda *_a, **_kw: _agen([]))
         storage.task_repository.add = AsyncMock()
+        storage.task_repository.add_many = AsyncMock()
         storage.project_repository.create = AsyncMock()
+        storage.project_repository.create_many = AsyncMock(return_value=["new-project"])
         storage.label_repository.create = AsyncMock()
+        storage.label_repository.create_many = AsyncMock(return_value=["new-label"])
         return storage
 
     def _invoke_local_import(self, tmp_path, payload, extra_args=None):
@@ -793,7 +810,9 @@ class TestLocalImport:
         }
         result, storage = self._invoke_local_import(tmp_path, payload)
         assert result.exit_code == 0
-        storage.project_repository.create.assert_awaited_once()
+        storage.project_repository.create_many.assert_awaited_once()
+        (created,) = storage.project_repository.create_many.call_args.args[0]
+        assert created.name == "NewProject"
 
     def test_local_import_skips_existing_project(self, tmp_path):
         """Local import skips projects that already exist."""
@@ -819,7 +838,7 @@ class TestLocalImport:
             result = runner.invoke(app, ["import", str(good_file), "--yes"])
 
         assert result.exit_code == 0
-        storage.project_repository.create.assert_not_awaited()
+        storage.project_repository.create_many.assert_not_awaited()
 
     def test_local_import_new_label_creates_it(self, tmp_path):
         """Local import creates new labels."""
@@ -832,7 +851,9 @@ class TestLocalImport:
         }
         result, storage = self._invoke_local_import(tmp_path, payload)
         assert result.exit_code == 0
-        storage.label_repository.create.assert_awaited_once()
+        storage.label_repository.create_many.assert_awaited_once()
+        (created,) = storage.label_repository.create_many.call_args.args[0]
+        assert created.name == "urgent"
 
     def test_local_import_skips_existing_label(self, tmp_path):
         """Local import skips labels that already exist."""
@@ -858,7 +879,7 @@ class TestLocalImport:
             result = runner.invoke(app, ["import", str(good_file), "--yes"])
 
         assert result.exit_code == 0
-        storage.label_repository.create.assert_not_awaited()
+        storage.label_repository.create_many.assert_not_awaited()
 
     def test_local_import_new_task_creates_it(self, tmp_path):
         """Local import creates new tasks."""
@@ -871,7 +892,10 @@ class TestLocalImport:
         }
         result, storage = self._invoke_local_import(tmp_path, payload)
         assert result.exit_code == 0
-        storage.task_repository.add.assert_awaited_once()
+        storage.task_repository.add_many.assert_awaited_once()
+        (created,) = storage.task_repository.add_many.call_args.args[0]
+        assert created.content == "Brand new task"
+        assert created.priority == 2
 
     def test_local_import_skips_existing_task(self, tmp_path):
         """Local import skips tasks with matching content."""
@@ -889,7 +913,9 @@ class TestLocalImport:
         good_file.write_text(json.dumps(payload), encoding="utf-8")
         svc = _mock_config_svc("local")
         storage = self._make_storage()
-        storage.task_repository.list_all = AsyncMock(return_value=[existing_task])
+        storage.task_repository.iter_all = MagicMock(
+            side_effect=lambda *_a, **_kw: _agen([existing_task])
+        )
 
         with patch("todopro_cli.commands.data_command.get_config_service", return_value=svc), \
              patch("todopro_cli.commands.data_command.get_storage_strategy_context",
@@ -897,7 +923,7 @@ class TestLocalImport:
             result = runner.invoke(app, ["import", str(good_file), "--yes"])
 
         assert result.exit_code == 0
-        storage.task_repository.add.assert_not_awaited()
+        storage.task_repository.add_many.assert_not_awaited()
 
     def test_local_import_task_with_project_name_resolves_id(self, tmp_path):
         """Local import resolves project_id from project_name for tasks."""
@@ -926,7 +952,9 @@ class TestLocalImport:
             result = runner.invoke(app, ["import", str(good_file), "--yes"])
 
         assert result.exit_code == 0
-        storage.task_repository.add.assert_awaited_once()
+        storage.task_repository.add_many.assert_awaited_once()
+        (created,) = storage.task_repository.add_many.call_args.args[0]
+        assert created.project_id == "proj-123"
 
     def test_local_import_project_error_continues(self, tmp_path):
         """Local import handles individual project errors gracefully."""
@@ -942,7 +970,7 @@ class TestLocalImport:
         svc = _mock_config_svc("local")
         storage = self._make_storage()
         storage.project_repository.list_all = AsyncMock(return_value=[])
-        storage.project_repository.create = AsyncMock(side_effect=Exception("DB error"))
+        storage.project_repository.create_many = AsyncMock(side_effect=Exception("DB error"))
 
         with patch("todopro_cli.commands.data_command.get_config_service", return_value=svc), \
              patch("todopro_cli.commands.data_command.get_storage_strategy_context",
@@ -973,7 +1001,7 @@ class TestLocalImport:
         svc = _mock_config_svc("local")
         storage = self._make_storage()
         storage.label_repository.list_all = AsyncMock(return_value=[])
-        storage.label_repository.create = AsyncMock(side_effect=Exception("label DB error"))
+        storage.label_repository.create_many = AsyncMock(side_effect=Exception("label DB error"))
 
         with patch("todopro_cli.commands.data_command.get_config_service", return_value=svc), \
              patch("todopro_cli.commands.data_command.get_storage_strategy_context",
@@ -996,7 +1024,7 @@ class TestLocalImport:
         svc = _mock_config_svc("local")
         storage = self._make_storage()
         storage.task_repository.list_all = AsyncMock(return_value=[])
-        storage.task_repository.add = AsyncMock(side_effect=Exception("task DB error"))
+        storage.task_repository.add_many = AsyncMock(side_effect=Exception("task DB error"))
 
         with patch("todopro_cli.commands.data_command.get_config_service", return_value=svc), \
              patch("todopro_cli.commands.data_command.get_storage_strategy_context",
@@ -1004,3 +1032,79 @@ class TestLocalImport:
             result = runner.invoke(app, ["import", str(good_file), "--yes"])
 
         assert result.exit_code == 0
+
+
+# ===========================================================================
+# NDJSON archives
+# ===========================================================================
+
+class TestNdjsonArchive:
+    """Streaming export/import through NDJSON archives."""
+
+    def _storage(self):
+        from datetime import datetime
+
+        from todopro_cli.models import Task
+
+        now = datetime(2024, 1, 1)
+        storage = MagicMock()
+        storage.project_repository.iter_all = lambda _filters: _agen([])
+        storage.label_repository.iter_all = lambda: _agen([])
+        storage.task_repository.iter_all = lambda _filters: _agen(
+            [Task(id=f"t{i}", content=f"Task {i}", created_at=now, updated_at=now) for i in range(3)]
+        )
+        storage.project_repository.list_all = AsyncMock(return_value=[])
+        storage.label_repository.list_all = AsyncMock(return_value=[])
+        storage.task_repository.add_many = AsyncMock()
+        return storage
+
+    def _svc(self):
+        svc = _mock_config_svc("local")
+        svc.config.contexts = []
+        svc.config.e2ee = None
+        return svc
+
+    def test_export_ndjson_by_file_name(self, tmp_path):
+        out = tmp_path / "backup.ndjson.gz"
+        with patch("todopro_cli.commands.data_command.get_config_service", return_value=self._svc()), \
+             patch("todopro_cli.commands.data_command.get_storage_strategy_context",
+                   return_value=self._storage()):
+            result = runner.invoke(app, ["export", "--output", str(out)])
+
+        assert result.exit_code == 0, result.output
+        with gzip.open(out, "rt") as f:
+            lines = [json.loads(line) for line in f]
+        assert [r["type"] for r in lines] == ["header", "task", "task", "task", "stats"]
+        assert lines[-1]["data"]["tasks_count"] == 3
+
+    def test_import_ndjson_streams_into_bulk_writes(self, tmp_path):
+        out = tmp_path / "backup.ndjson"
+        source, target = self._storage(), self._storage()
+        target.task_repository.iter_all = lambda _filters: _agen([])
+        with patch("todopro_cli.commands.data_command.get_config_service", return_value=self._svc()), \
+             patch("todopro_cli.commands.data_command.get_storage_strategy_context",
+                   side_effect=[source, target]):
+            runner.invoke(app, ["export", "--format", "ndjson", "--output", str(out)])
+            result = runner.invoke(app, ["import", str(out), "--yes"])
+
+        assert result.exit_code == 0, result.output
+        assert "3 created" in result.output
+        (chunk,) = [c.args[0] for c in target.task_repository.add_many.call_args_list]
+        assert [t.content for t in chunk] == ["Task 0", "Task 1", "Task 2"]
+
+    def test_import_skips_tasks_already_in_target(self, tmp_path):
+        out = tmp_path / "backup.ndjson"
+        storage = self._storage()
+        with patch("todopro_cli.commands.data_command.get_config_service", return_value=self._svc()), \
+             patch("todopro_cli.commands.data_command.get_storage_strategy_context",
+                   return_value=storage):
+            runner.invoke(app, ["export", "--format", "ndjson", "--output", str(out)])
+            result = runner.invoke(app, ["import", str(out), "--yes"])
+
+        assert result.exit_code == 0, result.output
+        assert "0 created, 3 skipped" in result.output
+        storage.task_repository.add_many.assert_not_awaited()
+
+    def test_export_rejects_unknown_compression(self):
+        result = runner.invoke(app, ["export", "--compression", "bz2"])
+        assert result.exit_code == 2
@@ -3,6 +3,7 @@
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 from todopro_cli.commands.github_command import app
@@ -34,6 +35,7 @@ def _make_mock_client(status_code: int, json_data):
     mock_response = MagicMock()
     mock_response.status_code = status_code
     mock_response.json.return_value = json_data
+    mock_response.headers = {}
     if status_code < 400:
         mock_response.raise_for_status = MagicMock()
     else:
@@ -52,6 +54,24 @@ def _make_mock_client(status_code: int, json_data):
     return mock_client_instance
 
 
+@pytest.fixture(autouse=True)
+def storage(tmp_path):
+    """Patch the storage context and the sync state location."""
+    storage = MagicMock()
+    storage.task_repository.add_many = AsyncMock(
+        side_effect=lambda tasks: [f"task-{i}" for i in range(len(tasks))]
+    )
+    storage.task_repository.update = AsyncMock()
+    config_service = MagicMock()
+    config_service.get_current_context.return_value.name = "local"
+    config_service.get_github_sync_path.return_value = tmp_path / "github.db"
+    with (
+        patch("todopro_cli.commands.github_command.get_config_service", return_value=config_service),
+        patch("todopro_cli.commands.github_command.get_storage_strategy_context", return_value=storage),
+    ):
+        yield storage
+
+
 def test_import_help():
     """Test that --help works for the import command."""
     result = runner.invoke(app, ["import", "--help"])
@@ -67,23 +87,13 @@ def test_import_missing_token():
     assert "token" in result.output.lower()
 
 
-def test_import_success():
+def test_import_success(storage):
     """Test successful import of GitHub issues."""
     mock_client = _make_mock_client(200, SAMPLE_ISSUES)
-    mock_tasks_api = MagicMock()
-    mock_tasks_api.create_task = AsyncMock(return_value={"id": "task-1"})
-    mock_api_client = MagicMock()
-    mock_api_client.close = AsyncMock()
 
     with patch(
         "todopro_cli.commands.github_command.httpx.AsyncClient",
         return_value=mock_client,
-    ), patch(
-        "todopro_cli.commands.github_command.get_client",
-        return_value=mock_api_client,
-    ), patch(
-        "todopro_cli.commands.github_command.TasksAPI",
-        return_value=mock_tasks_api,
     ):
         result = runner.invoke(
             app,
@@ -91,26 +101,34 @@ def test_import_success():
         )
 
     assert result.exit_code == 0
-    assert "Imported" in result.output
+    assert "Imported 2 tasks" in result.output
+    storage.task_repository.add_many.assert_awaited_once()
+
+
+def test_import_rerun_updates_instead_of_duplicating(storage):
+    """A second run upserts changed issues through the mapping table."""
+    changed = [{**SAMPLE_ISSUES[0], "updated_at": "2024-02-01T00:00:00Z"}]
+
+    with patch(
+        "todopro_cli.commands.github_command.httpx.AsyncClient",
+        side_effect=[_make_mock_client(200, SAMPLE_ISSUES), _make_mock_client(200, changed)],
+    ):
+        runner.invoke(app, ["import", "--repo", "owner/repo", "--token", "tok"])
+        result = runner.invoke(app, ["import", "--repo", "owner/repo", "--token", "tok"])
 
+    assert result.exit_code == 0, result.output
+    assert "1 updated" in result.output
+    assert storage.task_repository.add_many.await_count == 1
+    assert storage.task_repository.update.call_args.args[0] == "task-0"
 
-def test_import_dry_run():
+
+def test_import_dry_run(storage):
     """Test dry run does not create tasks."""
     mock_client = _make_mock_client(200, SAMPLE_ISSUES)
-    mock_tasks_api = MagicMock()
-    mock_tasks_api.create_task = AsyncMock(return_value={"id": "task-1"})
-    mock_api_client = MagicMock()
-    mock_api_client.close = AsyncMock()
 
     with patch(
         "todopro_cli.commands.github_command.httpx.AsyncClient",
         return_value=mock_client,
-    ), patch(
-        "todopro_cli.commands.github_command.get_client",
-        return_value=mock_api_client,
-    ), patch(
-        "todopro_cli.commands.github_command.TasksAPI",
-        return_value=mock_tasks_api,
     ):
         result = runner.invoke(
             app,
@@ -127,7 +145,7 @@ def test_import_dry_run():
     assert result.exit_code == 0
     # dry run output should mention the issues or "dry"
     assert "dry" in result.output.lower() or "Bug in login" in result.output
-    mock_tasks_api.create_task.assert_not_called()
+    storage.task_repository.add_many.assert_not_called()
 
 
 def test_import_repo_not_found():
@@ -199,30 +217,30 @@ def test_list_issues_success():
 
 import httpx  # noqa: E402
 
-from todopro_cli.commands.github_command import _get_priority_from_labels  # noqa: E402
+from todopro_cli.services.github import priority_from_labels  # noqa: E402
 
 
 class TestGetPriorityFromLabels:
     def test_bug_label_returns_4(self):
-        assert _get_priority_from_labels([{"name": "bug"}]) == 4
+        assert priority_from_labels([{"name": "bug"}]) == 4
 
     def test_enhancement_label_returns_2(self):
-        assert _get_priority_from_labels([{"name": "enhancement"}]) == 2
+        assert priority_from_labels([{"name": "enhancement"}]) == 2
 
     def test_feature_label_returns_2(self):
-        assert _get_priority_from_labels([{"name": "feature"}]) == 2
+        assert priority_from_labels([{"name": "feature"}]) == 2
 
     def test_docs_label_returns_1(self):
-        assert _get_priority_from_labels([{"name": "docs"}]) == 1
+        assert priority_from_labels([{"name": "docs"}]) == 1
 
     def test_documentation_label_returns_1(self):
-        assert _get_priority_from_labels([{"name": "documentation"}]) == 1
+        assert priority_from_labels([{"name": "documentation"}]) == 1
 
     def test_no_known_labels_returns_1(self):
-        assert _get_priority_from_labels([{"name": "triage"}]) == 1
+        assert priority_from_labels([{"name": "triage"}]) == 1
 
     def test_empty_labels(self):
-        assert _get_priority_from_labels([]) == 1
+        assert priority_from_labels([]) == 1
 
 
 class TestFetchIssuesErrorHandling:
@@ -259,41 +277,30 @@ class TestFetchIssuesErrorHandling:
 class TestImportDoImport:
     """Lines 148-168: _do_import function."""
 
-    def test_import_filters_pull_requests(self):
+    def test_import_filters_pull_requests(self, storage):
         """PRs (with pull_request key) are filtered out."""
         issues_with_pr = [
             {"number": 1, "title": "Real issue", "body": "", "labels": [], "state": "open", "pull_request": None},
             {"number": 2, "title": "PR", "body": "", "labels": [], "state": "open", "pull_request": {"url": "..."}},
         ]
         mock_http_client = _make_mock_client(200, issues_with_pr)
-        mock_tasks_api = MagicMock()
-        mock_tasks_api.create_task = AsyncMock(return_value={"id": "t1"})
-        mock_api_client = MagicMock()
-        mock_api_client.close = AsyncMock()
-
-        with (
-            patch("todopro_cli.commands.github_command.httpx.AsyncClient", return_value=mock_http_client),
-            patch("todopro_cli.commands.github_command.get_client", return_value=mock_api_client),
-            patch("todopro_cli.commands.github_command.TasksAPI", return_value=mock_tasks_api),
-        ):
+
+        with patch("todopro_cli.commands.github_command.httpx.AsyncClient", return_value=mock_http_client):
             result = runner.invoke(app, ["import", "--repo", "o/r", "--token", "tok"])
         assert result.exit_code == 0
         # Only 1 real issue imported (PR filtered)
-        assert mock_tasks_api.create_task.call_count == 1
+        (tasks,) = storage.task_repository.add_many.call_args.args
+        assert len(tasks) == 1
 
-    def test_import_exception_in_do_import(self):
-        """Exception in _do_import → exit 1 with error message."""
+    def test_import_exception_in_do_import(self, storage):
+        """Storage failure during import → exit 1 with error message."""
         mock_http_client = _make_mock_client(200, SAMPLE_ISSUES)
-        mock_api_client = MagicMock()
-        mock_api_client.close = AsyncMock()
-
-        with (
-            patch("todopro_cli.commands.github_command.httpx.AsyncClient", return_value=mock_http_client),
-            patch("todopro_cli.commands.github_command.get_client", return_value=mock_api_client),
-            patch("todopro_cli.commands.github_command.TasksAPI", side_effect=Exception("api down")),
-        ):
+        storage.task_repository.add_many = AsyncMock(side_effect=Exception("api down"))
+
+        with patch("todopro_cli.commands.github_command.httpx.AsyncClient", return_value=mock_http_client):
             result = runner.invoke(app, ["import", "--repo", "o/r", "--token", "tok"])
         assert result.exit_code == 1
+        assert "api down" in result.output
 
     def test_list_issues_no_token(self):
         """Missing token on list-issues → exit 1."""
@@ -9,7 +9,8 @@ import pytest
 from typer.testing import CliRunner
 
 from todopro_cli.commands.list_command import app
-from todopro_cli.models import Label, Project, Task
+from todopro_cli.models import Label, Page, Project, Task
+from todopro_cli.repositories import TOTAL_ESTIMATE_CAP
 
 runner = CliRunner()
 
@@ -71,6 +72,37 @@ def _make_task(id_="task-1", content="Test task", is_recurring=False):
     return t
 
 
+def _page(tasks, has_more=False, next_cursor=None, total_estimate=None):
+    return Page[Task].model_construct(
+        items=tasks,
+        next_cursor=next_cursor,
+        has_more=has_more,
+        total_estimate=total_estimate,
+    )
+
+
+@pytest.fixture(autouse=True)
+def list_cursor_store():
+    """Keep --next-page cursors in memory instead of the cache directory."""
+    saved = {}
+    with (
+        patch(
+            "todopro_cli.commands.list_command.save_list_cursor",
+            side_effect=lambda _listing, cursor: saved.update(cursor=cursor),
+        ),
+        patch(
+            "todopro_cli.commands.list_command.get_list_cursor",
+            side_effect=lambda _listing: saved.get("cursor"),
+        ),
+    ):
+        yield saved
+
+
+async def _agen(items):
+    for item in items:
+        yield item
+
+
 def _make_project(id_="proj-1", name="Work"):
     p = MagicMock()
     p.id = id_
@@ -93,8 +125,7 @@ class TestListTasksCommand:
     def _run(self, args, tasks=None, completing=None):
         tasks = tasks or []
         svc = MagicMock()
-        # list_tasks is called twice (count check + actual)
-        svc.list_tasks = AsyncMock(return_value=tasks)
+        svc.list_task_page = AsyncMock(return_value=_page(tasks))
         cache = MagicMock()
         cache.get_completing_tasks.return_value = completing or []
 
@@ -177,6 +208,72 @@ class TestListTasksCommand:
         result = self._run(["--limit", "5", "--offset", "10"])
         assert result.exit_code == 0, result.output
 
+    def test_list_tasks_json_includes_next_cursor(self):
+        """JSON output carries the cursor of the following page."""
+        svc = MagicMock()
+        svc.list_task_page = AsyncMock(
+            return_value=_page([_make_task()], has_more=True, next_cursor="abc")
+        )
+        with (
+            patch("todopro_cli.commands.list_command.get_task_service", return_value=svc),
+            patch("todopro_cli.commands.list_command.get_background_cache"),
+        ):
+            result = runner.invoke(app, ["tasks", "--json"], catch_exceptions=False)
+
+        assert '"next_cursor": "abc"' in result.output
+        assert svc.list_task_page.call_args.kwargs["with_total"] is False
+
+    def test_ndjson_streams_from_task_iterator(self):
+        """Streaming formats read tasks through iter_tasks, not one page."""
+        svc = MagicMock()
+        svc.iter_tasks = MagicMock(return_value=_agen([_make_task("t1"), _make_task("t2")]))
+        with (
+            patch("todopro_cli.commands.list_command.get_task_service", return_value=svc),
+            patch("todopro_cli.commands.list_command.get_background_cache"),
+            patch("todopro_cli.commands.list_command.stream_items", new=AsyncMock()) as stream,
+        ):
+            result = runner.invoke(app, ["tasks", "-o", "ndjson"], catch_exceptions=False)
+
+        assert result.exit_code == 0
+        svc.list_task_page.assert_not_called()
+        rows, output_format = stream.await_args.args
+        assert output_format == "ndjson"
+
+    def test_large_pretty_listing_is_streamed(self):
+        """Pretty output above the threshold is streamed as well."""
+        svc = MagicMock()
+        svc.iter_tasks = MagicMock(return_value=_agen([]))
+        with (
+            patch("todopro_cli.commands.list_command.get_task_service", return_value=svc),
+            patch("todopro_cli.commands.list_command.get_background_cache"),
+            patch("todopro_cli.commands.list_command.stream_items", new=AsyncMock()) as stream,
+        ):
+            runner.invoke(app, ["tasks", "--limit", "100000"], catch_exceptions=False)
+
+        assert svc.iter_tasks.call_args.kwargs["limit"] == 100000
+        assert stream.await_args.args[1] == "pretty"
+
+    def test_next_page_resumes_from_saved_cursor(self):
+        """--next-page continues from the cursor saved by the previous listing."""
+        svc = MagicMock()
+        svc.list_task_page = AsyncMock(
+            side_effect=[
+                _page([_make_task("t1")], has_more=True, next_cursor="c1"),
+                _page([_make_task("t2")]),
+            ]
+        )
+        with (
+            patch("todopro_cli.commands.list_command.get_task_service", return_value=svc),
+            patch("todopro_cli.commands.list_command.get_background_cache"),
+        ):
+            runner.invoke(app, ["tasks"], catch_exceptions=False)
+            runner.invoke(app, ["tasks", "--next-page"], catch_exceptions=False)
+            result = runner.invoke(app, ["tasks", "--next-page"], catch_exceptions=False)
+
+        cursors = [c.kwargs["cursor"] for c in svc.list_task_page.call_args_list]
+        assert cursors == [None, "c1"]
+        assert "No further page" in result.output
+
 
 class TestListProjectsCommand:
     """Tests for 'list projects' command body."""
@@ -523,7 +620,9 @@ class TestListTasksBigThresholdWarning:
         """When >100 tasks exist and stdout is a tty, shows warning."""
         tasks = [_make_task(f"task-{i}") for i in range(102)]
         svc = MagicMock()
-        svc.list_tasks = AsyncMock(return_value=tasks)
+        svc.list_task_page = AsyncMock(
+            return_value=_page(tasks[:30], has_more=True, next_cursor="c1", total_estimate=102)
+        )
         cache = MagicMock()
         cache.get_completing_tasks.return_value = []
 
@@ -541,7 +640,9 @@ class TestListTasksBigThresholdWarning:
         """JSON output suppresses the big-task warning."""
         tasks = [_make_task(f"task-{i}") for i in range(102)]
         svc = MagicMock()
-        svc.list_tasks = AsyncMock(return_value=tasks)
+        svc.list_task_page = AsyncMock(
+            return_value=_page(tasks[:30], has_more=True, next_cursor="c1", total_estimate=102)
+        )
         cache = MagicMock()
         cache.get_completing_tasks.return_value = []
 
@@ -556,6 +657,36 @@ class TestListTasksBigThresholdWarning:
         assert "Found" not in result.output or '"tasks"' in result.output
 
 
+class TestListTasksTotalEstimate:
+    """The "Found N tasks" hint shows a capped estimate as a lower bound."""
+
+    def _found(self, total_estimate):
+        tasks = [_make_task(f"task-{i}") for i in range(3)]
+        svc = MagicMock()
+        svc.list_task_page = AsyncMock(
+            return_value=_page(tasks, has_more=True, next_cursor="c1", total_estimate=total_estimate)
+        )
+        cache = MagicMock()
+        cache.get_completing_tasks.return_value = []
+
+        with (
+            patch("todopro_cli.commands.list_command.get_task_service", return_value=svc),
+            patch("todopro_cli.commands.list_command.get_background_cache", return_value=cache),
+            patch("todopro_cli.commands.list_command.save_list_cursor"),
+            patch("click.testing._NamedTextIOWrapper.isatty", return_value=True),
+        ):
+            result = runner.invoke(app, ["tasks"])
+
+        assert result.exit_code == 0
+        return result.output
+
+    def test_exact_estimate_is_shown(self):
+        assert "Found 102 tasks. Showing 3." in self._found(102)
+
+    def test_capped_estimate_is_shown_as_lower_bound(self):
+        assert f"Found {TOTAL_ESTIMATE_CAP}+ tasks. Showing 3." in self._found(TOTAL_ESTIMATE_CAP)
+
+
 class TestListContextsJsonFix:
     """Lines 200-208: list contexts with JSON output - fix the patch target."""
 
@@ -621,7 +752,9 @@ class TestListTasksBigThresholdFixed:
         """When >100 tasks and isatty returns True, warning is shown."""
         tasks = [_make_task(f"task-{i}") for i in range(102)]
         svc = MagicMock()
-        svc.list_tasks = AsyncMock(return_value=tasks)
+        svc.list_task_page = AsyncMock(
+            return_value=_page(tasks[:30], has_more=True, next_cursor="c1", total_estimate=102)
+        )
         cache = MagicMock()
         cache.get_completing_tasks.return_value = []
 
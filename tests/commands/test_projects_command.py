@@ -65,6 +65,7 @@ def mock_project_service():
     service_mock.delete_project = AsyncMock()
     service_mock.archive_project = AsyncMock()
     service_mock.unarchive_project = AsyncMock()
+    service_mock.get_projects_stats = AsyncMock()
 
     async def _passthrough_uuid(project_id, _repo, **_kwargs):
         return project_id
@@ -126,6 +127,41 @@ class TestListProjects:
 
         assert result.exit_code == 0
 
+    def test_list_projects_with_stats(self, mock_project_service, mock_project):
+        """Test list command with --stats fetches all stats in one call."""
+        other = mock_project.model_copy(update={"id": "proj-456", "name": "Other"})
+        mock_project_service.list_projects.return_value = [mock_project, other]
+        mock_project_service.get_projects_stats.return_value = {
+            "proj-123": {
+                "total_tasks": 4,
+                "completed_tasks": 1,
+                "pending_tasks": 3,
+                "overdue_tasks": 2,
+                "completion_rate": 25,
+            },
+            "proj-456": {},
+        }
+
+        result = runner.invoke(app, ["list", "--stats", "--json"])
+
+        assert result.exit_code == 0
+        mock_project_service.get_projects_stats.assert_awaited_once_with(
+            ["proj-123", "proj-456"]
+        )
+        output = strip_ansi(result.stdout)
+        assert '"tasks_active": 3' in output
+        assert '"overdue_count": 2' in output
+        assert '"completion_percentage": 25' in output
+
+    def test_list_projects_without_stats(self, mock_project_service, mock_project):
+        """Test list command skips stats unless asked."""
+        mock_project_service.list_projects.return_value = [mock_project]
+
+        result = runner.invoke(app, ["list"])
+
+        assert result.exit_code == 0
+        mock_project_service.get_projects_stats.assert_not_called()
+
 
 class TestGetProject:
     """Tests for get project command."""
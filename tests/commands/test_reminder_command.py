@@ -1,4 +1,4 @@
-"""Unit tests for reminder management in set_command and delete_command."""
+"""Unit tests for reminder management in set, delete and reminder commands."""
 
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -183,3 +183,50 @@ class TestDeleteReminder:
                 delete_app, ["reminder", "task-3", "rem-3"], input="n\n"
             )
         mock_api.delete_reminder.assert_not_awaited()
+
+
+class TestWatchReminders:
+    """Tests for 'todopro reminder watch'."""
+
+    def test_remote_context_is_rejected(self):
+        from todopro_cli.main import app
+
+        storage = MagicMock()
+        type(storage).reminder_repository = property(
+            lambda _: (_ for _ in ()).throw(NotImplementedError())
+        )
+        with patch(
+            "todopro_cli.commands.reminder_command.get_storage_strategy_context",
+            return_value=storage,
+        ):
+            result = CliRunner().invoke(app, ["reminder", "watch", "--once"])
+        assert result.exit_code == 1
+        assert "server" in result.output
+
+    def test_once_delivers_due_reminders(self):
+        from todopro_cli.main import app
+        from todopro_cli.models import Reminder
+
+        due = Reminder(
+            id="rem-1",
+            task_id="task-1",
+            reminder_date=datetime(2020, 1, 1, tzinfo=UTC),
+            created_at=datetime(2020, 1, 1, tzinfo=UTC),
+        )
+        repository = MagicMock()
+        repository.list_pending = AsyncMock(return_value=[due])
+        repository.get = AsyncMock(return_value=due)
+        repository.mark_sent = AsyncMock(return_value=due)
+        storage = MagicMock()
+        storage.reminder_repository = repository
+        storage.task_repository.get = AsyncMock(
+            return_value=MagicMock(content="Call the bank")
+        )
+        with patch(
+            "todopro_cli.commands.reminder_command.get_storage_strategy_context",
+            return_value=storage,
+        ):
+            result = CliRunner().invoke(app, ["reminder", "watch", "--once"])
+        assert result.exit_code == 0
+        assert "Call the bank" in result.output
+        repository.mark_sent.assert_awaited_once_with("rem-1")
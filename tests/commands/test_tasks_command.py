@@ -333,46 +333,40 @@ class TestFocusStatusCommand:
 
 
 class TestSkipCommand:
-    """Lines 301-341: skip command uses API client."""
-
-    def _make_api(self, skip_result=None):
-        mock_client = MagicMock()
-        mock_client.close = AsyncMock()
-        mock_api = MagicMock()
-        mock_api.skip_task = AsyncMock(
-            return_value=skip_result or {"id": "task-123", "content": "test"}
-        )
-        return mock_client, mock_api
+    """skip goes through the task service, so it works in every context."""
 
-    def test_skip_success(self):
-        mock_client, mock_api = self._make_api()
-        with (
-            patch(
-                "todopro_cli.services.api.client.get_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "todopro_cli.services.api.tasks.TasksAPI", return_value=mock_api
-            ),
+    def test_skip_success(self, mock_task_service, mock_task):
+        mock_task_service.skip_task = AsyncMock(return_value=mock_task)
+        with patch(
+            "todopro_cli.commands.tasks_command.resolve_task_id",
+            AsyncMock(return_value="task-123"),
         ):
-            result = runner.invoke(app, ["skip", "task-123"])
+            result = runner.invoke(app, ["skip", "123"])
         assert result.exit_code == 0
         assert "Skipped" in result.output
+        mock_task_service.skip_task.assert_awaited_once_with("task-123")
 
-    def test_skip_with_json_output(self):
-        mock_client, mock_api = self._make_api()
-        with (
-            patch(
-                "todopro_cli.services.api.client.get_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "todopro_cli.services.api.tasks.TasksAPI", return_value=mock_api
-            ),
+    def test_skip_with_json_output(self, mock_task_service, mock_task):
+        mock_task_service.skip_task = AsyncMock(return_value=mock_task)
+        with patch(
+            "todopro_cli.commands.tasks_command.resolve_task_id",
+            AsyncMock(return_value="task-123"),
         ):
             result = runner.invoke(app, ["skip", "task-123", "--output", "json"])
         assert result.exit_code == 0
 
+    def test_skip_non_recurring_task_exits_1(self, mock_task_service):
+        mock_task_service.skip_task = AsyncMock(
+            side_effect=ValueError("Task is not recurring: task-123")
+        )
+        with patch(
+            "todopro_cli.commands.tasks_command.resolve_task_id",
+            AsyncMock(return_value="task-123"),
+        ):
+            result = runner.invoke(app, ["skip", "task-123"])
+        assert result.exit_code == 1
+        assert "not recurring" in result.output
+
 
 class TestNextTaskCommand:
     """Lines 352-363: next command."""
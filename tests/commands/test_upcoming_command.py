@@ -0,0 +1,68 @@
+"""Unit tests for the 'upcoming' command."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from typer.testing import CliRunner
+
+from todopro_cli.commands.upcoming_command import app
+from todopro_cli.models import Task
+
+runner = CliRunner()
+
+_NOW = datetime(2026, 10, 18, 8, 0)
+
+_DAILY = Task(
+    id="task-daily-0001",
+    content="Water plants",
+    due_date=datetime(2026, 10, 18, 9, 0),
+    is_recurring=True,
+    recurrence_rule="FREQ=DAILY",
+    next_occurrence=datetime(2026, 10, 19, 9, 0),
+    created_at=_NOW,
+    updated_at=_NOW,
+)
+
+
+def _run(args: list[str] | None = None, occurrences=None):
+    task_svc = MagicMock()
+    task_svc.list_upcoming = AsyncMock(return_value=occurrences or [])
+    with patch(
+        "todopro_cli.commands.upcoming_command.get_task_service",
+        return_value=task_svc,
+    ):
+        result = runner.invoke(app, args or [], catch_exceptions=False)
+    return result, task_svc
+
+
+class TestUpcomingCommand:
+    def test_empty_window(self):
+        result, task_svc = _run()
+        assert result.exit_code == 0
+        assert "Nothing due in the next 7 days" in result.output
+        task_svc.list_upcoming.assert_awaited_once_with(7)
+
+    def test_groups_occurrences_by_day(self):
+        occurrences = [
+            (datetime(2026, 10, 18, 9, 0), _DAILY),
+            (datetime(2026, 10, 19, 9, 0), _DAILY),
+        ]
+        result, task_svc = _run(["--days", "2"], occurrences)
+
+        assert result.exit_code == 0
+        assert "Sun 18 Oct" in result.output
+        assert "Mon 19 Oct" in result.output
+        assert result.output.count("Water plants") == 2
+        assert "2 due in 2 days" in result.output
+        task_svc.list_upcoming.assert_awaited_once_with(2)
+
+    def test_json_output(self):
+        occurrences = [(datetime(2026, 10, 19, 9, 0), _DAILY)]
+        result, _ = _run(["--json"], occurrences)
+
+        payload = json.loads(result.output)
+        assert payload[0]["occurs_at"] == "2026-10-19T09:00:00"
+        assert payload[0]["task"]["id"] == "task-daily-0001"
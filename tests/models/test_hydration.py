@@ -0,0 +1,50 @@
+"""Unit tests for bulk model construction."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import ValidationError
+
+from todopro_cli.models import Label, Task
+from todopro_cli.models.hydration import validate_many
+
+
+def _task_row(**overrides) -> dict:
+    row = {
+        "id": "t1",
+        "content": "Write report",
+        "due_date": "2024-03-01T09:00:00Z",
+        "priority": 2,
+        "is_completed": 0,
+        "is_recurring": 1,
+        "labels": ["l1"],
+        "contexts": [],
+        "created_at": "2024-01-01T00:00:00",
+        "updated_at": "2024-01-02 08:30:00",
+        "user_id": "u1",
+    }
+    row.update(overrides)
+    return row
+
+
+class TestValidateMany:
+    def test_matches_per_row_construction(self):
+        rows = [_task_row(id="t1"), _task_row(id="t2", priority=4)]
+        assert validate_many(Task, rows) == [Task(**row) for row in rows]
+
+    def test_converts_stored_types(self):
+        (task,) = validate_many(Task, [_task_row()])
+
+        assert task.due_date == datetime(2024, 3, 1, 9, 0, tzinfo=UTC)
+        assert task.is_completed is False
+        assert task.is_recurring is True
+
+    def test_accepts_any_iterable(self):
+        labels = validate_many(Label, ({"id": f"l{i}", "name": "x"} for i in range(3)))
+        assert [label.id for label in labels] == ["l0", "l1", "l2"]
+
+    def test_invalid_row_raises(self):
+        with pytest.raises(ValidationError):
+            validate_many(Task, [_task_row(), _task_row(priority=9)])
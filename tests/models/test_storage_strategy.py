@@ -49,6 +49,9 @@ class _MockStrategy(StorageStrategy):
     def storage_type(self) -> str:
         return "mock"
 
+    async def close(self) -> None:
+        pass
+
 
 # ---------------------------------------------------------------------------
 # StorageStrategy abstract interface
@@ -256,6 +256,15 @@ class TestProjectRepositoryAbstractMethods:
         with pytest.raises(NotImplementedError, match="get_stats"):
             await project_repo.get_stats("p-id")
 
+    @pytest.mark.asyncio
+    async def test_get_stats_many_defaults_to_get_stats(self, project_repo):
+        async def get_stats(project_id):
+            return {"total_tasks": len(project_id)}
+
+        project_repo.get_stats = get_stats
+        stats = await project_repo.get_stats_many(["a", "bb"])
+        assert stats == {"a": {"total_tasks": 1}, "bb": {"total_tasks": 2}}
+
 
 # ---------------------------------------------------------------------------
 # LabelRepository
@@ -0,0 +1,215 @@
+"""Unit tests for BatchAddService and batch line parsing.
+
+Repositories are mocks; the storage transaction is a no-op context.
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import nullcontext
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from todopro_cli.models import Label, Project
+from todopro_cli.services import batch_add_service
+from todopro_cli.services.batch_add_service import BatchAddService, parse_lines
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+def _project(id_: str, name: str) -> Project:
+    now = datetime(2024, 1, 1)
+    return Project(id=id_, name=name, created_at=now, updated_at=now)
+
+
+def _make_storage(*, projects=None, labels=None, add_many=None) -> MagicMock:
+    storage = MagicMock()
+    storage.transaction.side_effect = nullcontext
+    storage.project_repository.list_all = AsyncMock(
+        return_value=projects or [_project("p-work", "Work")]
+    )
+    storage.project_repository.create_many = AsyncMock(
+        side_effect=lambda items: [f"new-p-{p.name}" for p in items]
+    )
+    storage.label_repository.list_all = AsyncMock(
+        return_value=labels or [Label(id="l-errand", name="errand")]
+    )
+    storage.label_repository.create_many = AsyncMock(
+        side_effect=lambda items: [f"new-l-{label.name}" for label in items]
+    )
+    storage.task_repository.add_many = AsyncMock(
+        side_effect=add_many or (lambda tasks: [f"t{i}" for i in range(len(tasks))])
+    )
+    return storage
+
+
+def _written(storage) -> list:
+    return [
+        task
+        for call in storage.task_repository.add_many.call_args_list
+        for task in call.args[0]
+    ]
+
+
+# ---------------------------------------------------------------------------
+# parse_lines
+# ---------------------------------------------------------------------------
+
+
+class TestParseLines:
+    def test_text_lines_parsed_with_nlp(self):
+        ((number, fields),) = parse_lines(["Review PR tomorrow #Work @errand p2"])
+        assert number == 1
+        assert fields["content"] == "Review PR"
+        assert fields["priority"] == 3
+        assert fields["project"] == "Work"
+        assert fields["labels"] == ["errand"]
+        assert fields["due_date"] is not None
+
+    def test_blank_lines_skipped_but_counted(self):
+        parsed = parse_lines(["First", "", "   ", "Second"])
+        assert [number for number, _ in parsed] == [1, 4]
+
+    def test_ndjson_fields_override_parsed_ones(self):
+        line = json.dumps(
+            {"content": "Pay rent #Home", "project": "Work", "labels": "bills"}
+        )
+        ((_, fields),) = parse_lines([line])
+        assert fields["content"] == "Pay rent"
+        assert fields["project"] == "Work"
+        assert fields["labels"] == ["bills"]
+
+    def test_bad_lines_become_error_messages(self):
+        parsed = dict(parse_lines(['{"content": ""}', "{not json", '{"x": 1}', "ok"]))
+        assert parsed[1] == "task content is empty"
+        assert isinstance(parsed[2], str)
+        assert parsed[3] == "task content is empty"
+        assert isinstance(parsed[4], dict)
+
+    def test_large_input_split_across_workers(self):
+        lines = [f"Task {i} tomorrow" for i in range(10)]
+        with (
+            patch.object(batch_add_service, "PARALLEL_PARSE_THRESHOLD", 5),
+            patch.object(batch_add_service, "_PARSE_CHUNK_SIZE", 3),
+            patch.object(batch_add_service, "ProcessPoolExecutor") as pool,
+        ):
+            executor = pool.return_value.__enter__.return_value
+            executor.map.side_effect = map
+            parsed = parse_lines(lines, workers=2)
+
+        assert [number for number, _ in parsed] == list(range(1, 11))
+        chunks = list(executor.map.call_args.args[1])
+        assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+
+
+# ---------------------------------------------------------------------------
+# BatchAddService
+# ---------------------------------------------------------------------------
+
+
+class TestBatchAddService:
+    @pytest.mark.asyncio
+    async def test_resolves_names_against_index_loaded_once(self):
+        storage = _make_storage()
+        parsed = parse_lines(["A #work @Errand", "B #Wrok", "C"])
+
+        result = await BatchAddService(storage).add_all(parsed)
+
+        assert result.task_ids == ["t0", "t1", "t2"]
+        assert not result.has_errors
+        tasks = _written(storage)
+        assert [t.project_id for t in tasks] == ["p-work", "p-work", None]
+        assert tasks[0].labels == ["l-errand"]
+        storage.project_repository.list_all.assert_awaited_once()
+        storage.label_repository.list_all.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_bad_lines_reported_without_aborting(self):
+        storage = _make_storage()
+        parsed = parse_lines(
+            ["Good", "Bad #Unknownproject", "Bad @nolabel", '{"content": ""}', "Good"]
+        )
+
+        result = await BatchAddService(storage).add_all(parsed)
+
+        assert len(result.task_ids) == 2
+        assert [(e.line, e.error) for e in result.errors] == [
+            (2, "project 'Unknownproject' not found"),
+            (3, "label 'nolabel' not found"),
+            (4, "task content is empty"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalid_ndjson_values_reported(self):
+        storage = _make_storage()
+        parsed = parse_lines(
+            ['{"content": "x", "priority": 9}', '{"content": "y", "due_date": "soon"}']
+        )
+
+        result = await BatchAddService(storage).add_all(parsed)
+
+        assert result.task_ids == []
+        assert [e.line for e in result.errors] == [1, 2]
+        assert result.errors[0].error.startswith("priority:")
+
+    @pytest.mark.asyncio
+    async def test_create_missing_creates_each_name_once(self):
+        storage = _make_storage()
+        parsed = parse_lines(["A #Home @bills", "B #home @Bills", "C #Work @errand"])
+
+        result = await BatchAddService(storage).add_all(parsed, create_missing=True)
+
+        assert (result.projects_created, result.labels_created) == (1, 1)
+        storage.project_repository.create_many.assert_awaited_once()
+        tasks = _written(storage)
+        assert [t.project_id for t in tasks] == ["new-p-Home", "new-p-Home", "p-work"]
+        assert [t.labels for t in tasks] == [["new-l-bills"]] * 2 + [["l-errand"]]
+
+    @pytest.mark.asyncio
+    async def test_default_project_for_lines_without_one(self):
+        storage = _make_storage()
+        parsed = parse_lines(["A", "B #Work"])
+
+        await BatchAddService(storage).add_all(parsed, default_project="work")
+
+        assert [t.project_id for t in _written(storage)] == ["p-work", "p-work"]
+
+    @pytest.mark.asyncio
+    async def test_writes_in_chunks_inside_one_transaction(self):
+        storage = _make_storage()
+        parsed = parse_lines([f"Task {i}" for i in range(5)])
+
+        with patch.object(batch_add_service, "_TASK_BATCH_SIZE", 2):
+            result = await BatchAddService(storage).add_all(parsed)
+
+        calls = storage.task_repository.add_many.call_args_list
+        sizes = [len(call.args[0]) for call in calls]
+        assert sizes == [2, 2, 1]
+        assert len(result.task_ids) == 5
+        storage.transaction.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_reported_per_line(self):
+        calls = []
+
+        def add_many(tasks):
+            calls.append(tasks)
+            if len(calls) == 1:
+                raise RuntimeError("disk full")
+            return ["t"] * len(tasks)
+
+        storage = _make_storage(add_many=add_many)
+        parsed = parse_lines([f"Task {i}" for i in range(3)])
+
+        with patch.object(batch_add_service, "_TASK_BATCH_SIZE", 2):
+            result = await BatchAddService(storage).add_all(parsed)
+
+        assert len(result.task_ids) == 1
+        assert [(e.line, e.error) for e in result.errors] == [
+            (1, "not created: disk full"),
+            (2, "not created: disk full"),
+        ]
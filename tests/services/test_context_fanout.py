@@ -0,0 +1,203 @@
+"""Tests for querying several contexts at once (context_fanout.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from todopro_cli.adapters.sqlite.connection import open_connection
+from todopro_cli.commands.tasks_command import _list_all_contexts
+from todopro_cli.models import ProjectCreate, TaskCreate, TaskFilters
+from todopro_cli.models.config_models import Context
+from todopro_cli.models.storage_strategy import RemoteStorageStrategy
+from todopro_cli.services.context_fanout import (
+    ContextFanout,
+    ContextResult,
+    merge,
+    task_sort_key,
+)
+
+
+@pytest.fixture
+def vaults(tmp_config, tmp_path):
+    """Two local contexts with a few tasks each."""
+    for name in ("home", "work"):
+        source = tmp_path / f"{name}.db"
+        open_connection(source).close()
+        tmp_config.add_context(Context(name=name, type="local", source=str(source)))
+    tasks = {
+        "home": [("water plants", 3, "2024-05-02"), ("call mum", 1, None)],
+        "work": [("ship release", 1, "2024-05-01"), ("tidy inbox", 4, None)],
+    }
+
+    async def seed():
+        async with ContextFanout(tmp_config, names=list(tasks)) as fanout:
+            for name, items in tasks.items():
+                repo = fanout.storage(name).task_repository
+                for content, priority, due in items:
+                    await repo.add(
+                        TaskCreate(
+                            content=content,
+                            priority=priority,
+                            due_date=datetime.fromisoformat(due) if due else None,
+                        )
+                    )
+
+    asyncio.run(seed())
+    return tmp_config
+
+
+async def _list(storage):
+    return await storage.task_repository.list_all(TaskFilters())
+
+
+class TestMerge:
+    def test_k_way_merge_tags_and_orders(self):
+        results = [
+            ContextResult("a", items=[3, 1, 5]),
+            ContextResult("b", items=[4, 2]),
+            ContextResult("c", error="down"),
+        ]
+        merged = list(merge(results, key=lambda n: n))
+        assert merged == [("a", 1), ("b", 2), ("a", 3), ("b", 4), ("a", 5)]
+
+
+class TestContextFanout:
+    @pytest.mark.asyncio
+    async def test_queries_every_context(self, vaults):
+        async with ContextFanout(vaults, names=["home", "work"]) as fanout:
+            results = await fanout.gather(_list)
+
+        assert [result.context for result in results] == ["home", "work"]
+        assert all(result.ok for result in results)
+        merged = [
+            (context, task.content) for context, task in merge(results, task_sort_key)
+        ]
+        assert merged == [
+            ("work", "ship release"),
+            ("home", "call mum"),
+            ("home", "water plants"),
+            ("work", "tidy inbox"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_contexts_use_separate_vaults(self, vaults):
+        async with ContextFanout(vaults, names=["home", "work"]) as fanout:
+            home = fanout.storage("home").task_repository.connection
+            work = fanout.storage("work").task_repository.connection
+            assert home is not work
+
+    @pytest.mark.asyncio
+    async def test_slow_context_times_out_alone(self, vaults):
+        async def query(storage):
+            if storage.task_repository.db_path.endswith("work.db"):
+                await asyncio.sleep(5)
+            return await _list(storage)
+
+        started = time.perf_counter()
+        async with ContextFanout(vaults, names=["home", "work"], timeout=0.2) as fanout:
+            home, work = await fanout.gather(query)
+
+        assert time.perf_counter() - started < 2
+        assert home.ok and len(home.items) == 2
+        assert not work.ok and "0.2s" in work.error
+
+    @pytest.mark.asyncio
+    async def test_failing_context_is_reported(self, vaults):
+        async def query(storage):
+            if storage.task_repository.db_path.endswith("home.db"):
+                raise RuntimeError("vault locked")
+            return await _list(storage)
+
+        async with ContextFanout(vaults, names=["home", "work"]) as fanout:
+            home, work = await fanout.gather(query)
+        assert home.error == "vault locked"
+        assert work.ok and len(work.items) == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_vault_is_unavailable_not_created(self, vaults, tmp_path):
+        missing = tmp_path / "gone.db"
+        vaults.add_context(Context(name="gone", type="local", source=str(missing)))
+
+        async with ContextFanout(vaults, names=["home", "gone"]) as fanout:
+            home, gone = await fanout.gather(_list)
+
+        assert home.ok
+        assert gone.error == f"Vault not found: {missing}"
+        assert not missing.exists()
+
+    def test_unknown_context(self, tmp_config):
+        with pytest.raises(ValueError):
+            ContextFanout(tmp_config, names=["nowhere"])
+
+    @pytest.mark.asyncio
+    async def test_remote_context_uses_its_own_credentials(self, tmp_config):
+        tmp_config.save_credentials("cloud-token", context_name="cloud")
+        async with ContextFanout(tmp_config, names=["cloud"]) as fanout:
+            strategy = fanout.storage("cloud").strategy
+            assert isinstance(strategy, RemoteStorageStrategy)
+            headers = strategy._client._get_headers()
+        assert tmp_config.get_current_context().name == "local"
+        assert headers["Authorization"] == "Bearer cloud-token"
+
+
+class TestListAllContexts:
+    @pytest.mark.asyncio
+    async def test_rows_are_merged_and_limited(self, vaults):
+        vaults.config.contexts = [
+            c for c in vaults.config.contexts if c.name in ("home", "work")
+        ]
+        with patch(
+            "todopro_cli.commands.tasks_command.get_config_service",
+            return_value=vaults,
+        ):
+            rows = await _list_all_contexts(None, 2, 1, status="active")
+
+        assert [(row["context"], row["content"]) for row in rows] == [
+            ("home", "call mum"),
+            ("home", "water plants"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_context_with_more_tasks_than_limit_is_cut_in_merge_order(
+        self, tmp_config, tmp_path
+    ):
+        source = tmp_path / "home.db"
+        open_connection(source).close()
+        tmp_config.add_context(Context(name="home", type="local", source=str(source)))
+        tmp_config.config.contexts = [c for c in tmp_config.config.contexts if c.name == "home"]
+
+        async with ContextFanout(tmp_config, names=["home"]) as fanout:
+            storage = fanout.storage("home")
+            first, second = sorted(
+                [
+                    await storage.project_repository.create(ProjectCreate(name=name))
+                    for name in ("A", "B")
+                ],
+                key=lambda project: project.id,
+            )
+            # The backend's default order (project, then newest) would list
+            # "older" first; the merge wants the newest task first
+            for content, project, created_at in (
+                ("older", first, "2024-01-01T00:00:00+00:00"),
+                ("newer", second, "2024-02-01T00:00:00+00:00"),
+            ):
+                task = await storage.task_repository.add(
+                    TaskCreate(content=content, project_id=project.id)
+                )
+                storage.task_repository.connection.execute(
+                    "UPDATE tasks SET created_at = ? WHERE id = ?", (created_at, task.id)
+                )
+            storage.task_repository.connection.commit()
+
+        with patch(
+            "todopro_cli.commands.tasks_command.get_config_service",
+            return_value=tmp_config,
+        ):
+            rows = await _list_all_contexts(None, 1, 0, status="active")
+
+        assert [row["content"] for row in rows] == ["newer"]
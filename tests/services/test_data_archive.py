@@ -0,0 +1,275 @@
+"""Unit tests for NDJSON archives and the archive importer/exporter."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from todopro_cli.adapters.sqlite.connection import open_connection
+from todopro_cli.models import Label, Project, Task
+from todopro_cli.models.storage_strategy import (
+    LocalStorageStrategy,
+    StorageStrategyContext,
+)
+from todopro_cli.services.data_archive import (
+    ArchiveWriter,
+    count_records,
+    is_ndjson_archive,
+    is_ndjson_path,
+    iter_records,
+    open_archive,
+)
+from todopro_cli.services.data_transfer import (
+    ApiArchiveImporter,
+    ArchiveExporter,
+    ArchiveImporter,
+)
+
+NOW = datetime(2024, 1, 1)
+
+
+def _write_archive(path: Path, records: list[tuple[str, dict]]) -> None:
+    with ArchiveWriter(open_archive(path, "w")) as writer:
+        writer.write_header(encryption_enabled=False)
+        for record_type, data in records:
+            writer.write(record_type, data)
+
+
+async def _agen(items):
+    for item in items:
+        yield item
+
+
+class TestArchiveFormat:
+    @pytest.mark.parametrize("name", ["a.ndjson", "a.jsonl", "a.ndjson.gz", "a.ndjson.zst"])
+    def test_is_ndjson_path(self, name):
+        assert is_ndjson_path(Path(name))
+
+    @pytest.mark.parametrize("name", ["a.json", "a.json.gz", "archive"])
+    def test_is_not_ndjson_path(self, name):
+        assert not is_ndjson_path(Path(name))
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "backup.ndjson"
+        _write_archive(path, [("project", {"name": "Work"}), ("task", {"content": "x"})])
+
+        records = list(iter_records(path))
+
+        assert records[0][0] == "header"
+        assert records[1:3] == [("project", {"name": "Work"}), ("task", {"content": "x"})]
+        assert records[-1] == (
+            "stats",
+            {"projects_count": 1, "labels_count": 0, "contexts_count": 0, "tasks_count": 1},
+        )
+
+    def test_gzip_round_trip(self, tmp_path):
+        path = tmp_path / "backup.ndjson.gz"
+        _write_archive(path, [("task", {"content": "x"})])
+
+        with gzip.open(path, "rt") as f:
+            assert json.loads(f.readline())["type"] == "header"
+        assert ("task", {"content": "x"}) in list(iter_records(path))
+
+    def test_count_records(self, tmp_path):
+        path = tmp_path / "backup.ndjson"
+        _write_archive(path, [("label", {})] * 2 + [("task", {})] * 3)
+
+        assert count_records(path) == {"project": 0, "label": 2, "context": 0, "task": 3}
+
+    def test_parallel_parse_preserves_order(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("todopro_cli.services.data_archive.PARSE_BATCH_LINES", 3)
+        path = tmp_path / "backup.ndjson"
+        _write_archive(path, [("task", {"content": f"t{i}"}) for i in range(10)])
+
+        assert list(iter_records(path, parallel=True, workers=2)) == list(iter_records(path))
+
+    def test_legacy_json_is_read_as_records(self, tmp_path):
+        path = tmp_path / "legacy.json"
+        path.write_text(
+            json.dumps({"data": {"tasks": [{"content": "x"}], "projects": [{"name": "P"}]}}, indent=2)
+        )
+
+        assert not is_ndjson_archive(path)
+        records = list(iter_records(path))
+        assert [r[0] for r in records] == ["header", "project", "task"]
+
+
+class TestArchiveExporter:
+    @pytest.mark.asyncio
+    async def test_exports_all_entities_in_dependency_order(self, tmp_path):
+        storage = MagicMock()
+        storage.project_repository.iter_all = lambda _filters: _agen(
+            [Project(id="p1", name="Work", created_at=NOW, updated_at=NOW)]
+        )
+        storage.label_repository.iter_all = lambda: _agen([Label(id="l1", name="urgent")])
+        storage.task_repository.iter_all = lambda _filters: _agen(
+            [Task(id="t1", content="x", created_at=NOW, updated_at=NOW)]
+        )
+        path = tmp_path / "out.ndjson"
+        on_record = MagicMock()
+
+        with ArchiveWriter(open_archive(path, "w")) as writer:
+            writer.write_header(encryption_enabled=False)
+            await ArchiveExporter(storage).export(writer, [], on_record=on_record)
+
+        types = [r[0] for r in iter_records(path)]
+        assert types == ["header", "project", "label", "task", "stats"]
+        assert on_record.call_count == 3
+
+
+class TestArchiveImporter:
+    def _storage(self):
+        storage = MagicMock()
+        storage.project_repository.list_all = AsyncMock(return_value=[])
+        storage.project_repository.create_many = AsyncMock(return_value=["new-p"])
+        storage.label_repository.list_all = AsyncMock(return_value=[])
+        storage.label_repository.create_many = AsyncMock(return_value=["new-l"])
+        storage.task_repository.iter_all = lambda _filters: _agen([])
+        storage.task_repository.add_many = AsyncMock()
+        return storage
+
+    @pytest.mark.asyncio
+    async def test_task_references_are_remapped(self):
+        storage = self._storage()
+        importer = ArchiveImporter(storage)
+
+        await importer.import_record("project", {"id": "old-p", "name": "Work"})
+        await importer.import_record("label", {"id": "old-l", "name": "urgent"})
+        await importer.import_record(
+            "task", {"content": "x", "project_id": "old-p", "labels": ["old-l", "gone"]}
+        )
+        await importer.flush()
+
+        (task,) = storage.task_repository.add_many.call_args.args[0]
+        assert task.project_id == "new-p"
+        assert task.labels == ["new-l"]
+
+    @pytest.mark.asyncio
+    async def test_tasks_are_written_in_chunks(self):
+        storage = self._storage()
+        importer = ArchiveImporter(storage, chunk_size=2)
+
+        for i in range(5):
+            await importer.import_record("task", {"content": f"task {i}"})
+        await importer.flush()
+
+        sizes = [len(c.args[0]) for c in storage.task_repository.add_many.call_args_list]
+        assert sizes == [2, 2, 1]
+        assert importer.result()["summary"]["tasks"] == "5 created, 0 skipped"
+
+    @pytest.mark.asyncio
+    async def test_duplicate_content_within_chunk_is_skipped(self):
+        storage = self._storage()
+        importer = ArchiveImporter(storage)
+
+        await importer.import_record("task", {"content": "same"})
+        await importer.import_record("task", {"content": "same"})
+        await importer.flush()
+
+        assert importer.result()["summary"]["tasks"] == "1 created, 1 skipped"
+
+    @pytest.mark.asyncio
+    async def test_failed_import_leaves_vault_unchanged(self, tmp_path):
+        db_path = tmp_path / "vault.db"
+        connection = open_connection(db_path)
+        storage = StorageStrategyContext(
+            LocalStorageStrategy(db_path=str(db_path), connection=connection)
+        )
+
+        def counts():
+            return [
+                connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("users", "projects", "labels", "tasks")
+            ]
+
+        before = counts()
+        importer = ArchiveImporter(storage, chunk_size=2)
+        with pytest.raises(RuntimeError):
+            async with storage.transaction():
+                await importer.import_record("project", {"id": "p1", "name": "Work"})
+                await importer.import_record("label", {"id": "l1", "name": "urgent"})
+                for i in range(3):
+                    await importer.import_record("task", {"content": f"t{i}", "project_id": "p1"})
+                raise RuntimeError("archive is truncated")
+
+        assert counts() == before
+        await storage.strategy.close()
+
+
+class TestApiArchiveImporter:
+    @pytest.mark.asyncio
+    async def test_entities_are_sent_before_task_chunks(self):
+        client = MagicMock()
+        client.request = AsyncMock(
+            return_value={"summary": {"tasks": "2 created, 0 skipped"}}
+        )
+        importer = ApiArchiveImporter(client, chunk_size=2)
+
+        await importer.import_record("header", {"encryption": {"enabled": True}})
+        for i in range(3):
+            await importer.import_record("project", {"id": f"p{i}", "name": f"P{i}"})
+        await importer.import_record("label", {"id": "l1", "name": "urgent"})
+        for i in range(3):
+            await importer.import_record("task", {"content": f"t{i}", "project_id": "p2"})
+        await importer.flush()
+
+        payloads = [c.kwargs["json"] for c in client.request.call_args_list]
+        assert [sorted(p["data"]) for p in payloads] == [
+            ["labels", "projects"],
+            ["projects", "tasks"],
+            ["projects", "tasks"],
+        ]
+        assert len(payloads[0]["data"]["projects"]) == 3
+        assert [len(p["data"]["tasks"]) for p in payloads[1:]] == [2, 1]
+        assert all(p["encryption"] == {"enabled": True} for p in payloads)
+        assert importer.result()["summary"]["tasks"] == "6 created, 0 skipped"
+
+    @pytest.mark.asyncio
+    async def test_task_chunks_carry_the_entities_they_refer_to(self):
+        client = MagicMock()
+        client.request = AsyncMock(
+            side_effect=[
+                {
+                    "summary": {
+                        "projects": "2 created, 0 skipped",
+                        "labels": "2 created, 0 skipped",
+                    }
+                },
+                {
+                    "summary": {
+                        "projects": "0 created, 1 skipped",
+                        "labels": "0 created, 1 skipped",
+                        "tasks": "1 created, 0 skipped",
+                    }
+                },
+            ]
+        )
+        importer = ApiArchiveImporter(client, chunk_size=1)
+
+        await importer.import_record("project", {"id": "p1", "name": "Work"})
+        await importer.import_record("project", {"id": "p2", "name": "Home"})
+        await importer.import_record("label", {"id": "l1", "name": "urgent"})
+        await importer.import_record("label", {"id": "l2", "name": "later"})
+        await importer.import_record(
+            "task", {"content": "x", "project_id": "p2", "labels": ["l1", "gone"]}
+        )
+        await importer.flush()
+
+        entities, chunk = [c.kwargs["json"]["data"] for c in client.request.call_args_list]
+        assert len(entities["projects"]) == 2
+        assert chunk == {
+            "projects": [{"id": "p2", "name": "Home"}],
+            "labels": [{"id": "l1", "name": "urgent"}],
+            "tasks": [{"content": "x", "project_id": "p2", "labels": ["l1", "gone"]}],
+        }
+        # Entities re-sent with the task chunk are not counted twice
+        assert importer.result()["summary"] == {
+            "projects": "2 created, 0 skipped",
+            "labels": "2 created, 0 skipped",
+            "tasks": "1 created, 0 skipped",
+        }
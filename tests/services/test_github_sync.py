@@ -0,0 +1,256 @@
+"""Unit tests for the GitHub issues client, sync store and sync engine.
+
+HTTP is mocked at the httpx.AsyncClient level; the sync store uses a real
+SQLite file in a temporary directory.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from todopro_cli.models import Task
+from todopro_cli.services.github import (
+    GitHubClient,
+    GitHubIssueBatch,
+    GitHubSyncEngine,
+    GitHubSyncStore,
+)
+from todopro_cli.services.github.client import last_page
+
+NOW = datetime(2024, 1, 1)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _issue(number: int, updated_at: str = "2024-01-01T00:00:00Z", state: str = "open") -> dict:
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": "",
+        "labels": [],
+        "state": state,
+        "updated_at": updated_at,
+    }
+
+
+def _response(data, *, status_code: int = 200, headers: dict | None = None):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.json.return_value = data
+    resp.headers = headers or {}
+    resp.raise_for_status = MagicMock()
+    return resp
+
+
+def _http(get: AsyncMock) -> AsyncMock:
+    http = AsyncMock()
+    http.__aenter__ = AsyncMock(return_value=http)
+    http.__aexit__ = AsyncMock(return_value=False)
+    http.get = get
+    return http
+
+
+async def _agen(items):
+    for item in items:
+        yield item
+
+
+def _storage(existing_tasks: list | None = None) -> MagicMock:
+    storage = MagicMock()
+    storage.task_repository.iter_all = lambda _filters: _agen(existing_tasks or [])
+    storage.task_repository.add_many = AsyncMock(
+        side_effect=lambda tasks: [f"task-{t.content.split('#')[1].split(']')[0]}" for t in tasks]
+    )
+    storage.task_repository.update = AsyncMock()
+    return storage
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = GitHubSyncStore(tmp_path / "github.db")
+    yield s
+    s.close()
+
+
+# ---------------------------------------------------------------------------
+# GitHubClient
+# ---------------------------------------------------------------------------
+
+
+class TestLastPage:
+    def test_parses_last_link(self):
+        link = (
+            '<https://api.github.com/repositories/1/issues?per_page=100&page=2>; rel="next", '
+            '<https://api.github.com/repositories/1/issues?per_page=100&page=7>; rel="last"'
+        )
+        assert last_page(link) == 7
+
+    def test_defaults_to_one(self):
+        assert last_page(None) == 1
+        assert last_page('<https://x/issues?page=2>; rel="next"') == 1
+
+
+class TestGitHubClient:
+    @pytest.mark.asyncio
+    async def test_fetches_remaining_pages_after_first(self):
+        link = '<https://api.github.com/repos/o/r/issues?page=3>; rel="last"'
+        pages = {
+            None: _response([_issue(1)], headers={"Link": link, "ETag": '"abc"'}),
+            2: _response([_issue(2)]),
+            3: _response([_issue(3)]),
+        }
+        get = AsyncMock(side_effect=lambda *_a, params, **_kw: pages[params.get("page")])
+
+        with patch("todopro_cli.services.github.client.httpx.AsyncClient", return_value=_http(get)):
+            batch = await GitHubClient("tok").fetch_issues("o/r")
+
+        assert [i["number"] for i in batch.issues] == [1, 2, 3]
+        assert batch.etag == '"abc"'
+
+    @pytest.mark.asyncio
+    async def test_limit_caps_pages_fetched(self):
+        link = '<https://api.github.com/repos/o/r/issues?page=50>; rel="last"'
+        get = AsyncMock(
+            return_value=_response([_issue(n) for n in range(100)], headers={"Link": link})
+        )
+
+        with patch("todopro_cli.services.github.client.httpx.AsyncClient", return_value=_http(get)):
+            batch = await GitHubClient("tok").fetch_issues("o/r", limit=250)
+
+        assert get.await_count == 3
+        assert len(batch.issues) == 250
+
+    @pytest.mark.asyncio
+    async def test_not_modified_returns_no_issues(self):
+        get = AsyncMock(return_value=_response(None, status_code=304))
+
+        with patch("todopro_cli.services.github.client.httpx.AsyncClient", return_value=_http(get)):
+            batch = await GitHubClient("tok").fetch_issues("o/r", etag='"abc"')
+
+        assert batch.not_modified
+        assert get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+
+    @pytest.mark.asyncio
+    async def test_404_raises_lookup_error(self):
+        get = AsyncMock(return_value=_response({}, status_code=404))
+
+        with (
+            patch("todopro_cli.services.github.client.httpx.AsyncClient", return_value=_http(get)),
+            pytest.raises(LookupError, match="not found"),
+        ):
+            await GitHubClient("tok").fetch_issues("o/missing")
+
+
+# ---------------------------------------------------------------------------
+# GitHubSyncEngine
+# ---------------------------------------------------------------------------
+
+
+class TestGitHubSyncEngine:
+    @pytest.mark.asyncio
+    async def test_first_sync_creates_in_bulk_and_records_mappings(self, store):
+        client = MagicMock()
+        client.fetch_issues = AsyncMock(
+            return_value=GitHubIssueBatch(issues=[_issue(1), _issue(2)], etag='"e1"')
+        )
+        storage = _storage()
+
+        result = await GitHubSyncEngine(client, storage, store).sync("o/r")
+
+        assert result.created == 2
+        storage.task_repository.add_many.assert_awaited_once()
+        assert store.get_mappings("o/r") == {
+            1: ("task-1", "2024-01-01T00:00:00Z"),
+            2: ("task-2", "2024-01-01T00:00:00Z"),
+        }
+        assert store.get_cursor("o/r", "open") == ("2024-01-01T00:00:00Z", None)
+
+    @pytest.mark.asyncio
+    async def test_rerun_is_delta_and_upserts(self, store):
+        client = MagicMock()
+        client.fetch_issues = AsyncMock(
+            return_value=GitHubIssueBatch(issues=[_issue(1), _issue(2)])
+        )
+        storage = _storage()
+        engine = GitHubSyncEngine(client, storage, store)
+        await engine.sync("o/r")
+
+        client.fetch_issues.return_value = GitHubIssueBatch(
+            issues=[_issue(2), _issue(1, "2024-02-01T00:00:00Z", state="closed")]
+        )
+        result = await engine.sync("o/r")
+
+        kwargs = client.fetch_issues.call_args.kwargs
+        assert kwargs["since"] == "2024-01-01T00:00:00Z"
+        assert kwargs["state"] == "all"
+        assert (result.created, result.updated, result.unchanged) == (0, 1, 1)
+        task_id, update = storage.task_repository.update.call_args.args
+        assert task_id == "task-1"
+        assert update.is_completed is True
+
+    @pytest.mark.asyncio
+    async def test_etag_is_kept_once_cursor_settles(self, store):
+        client = MagicMock()
+        client.fetch_issues = AsyncMock(
+            return_value=GitHubIssueBatch(issues=[_issue(1)], etag='"e1"')
+        )
+        engine = GitHubSyncEngine(client, _storage(), store)
+
+        await engine.sync("o/r")  # cursor moves, ETag belongs to the old query
+        await engine.sync("o/r")  # same boundary issue, ETag now reusable
+        client.fetch_issues.return_value = GitHubIssueBatch(etag='"e1"', not_modified=True)
+        result = await engine.sync("o/r")
+
+        assert client.fetch_issues.call_args.kwargs["etag"] == '"e1"'
+        assert result.not_modified
+
+    @pytest.mark.asyncio
+    async def test_failed_write_keeps_cursor(self, store):
+        client = MagicMock()
+        client.fetch_issues = AsyncMock(return_value=GitHubIssueBatch(issues=[_issue(1)]))
+        storage = _storage()
+        storage.task_repository.add_many = AsyncMock(side_effect=Exception("down"))
+
+        result = await GitHubSyncEngine(client, storage, store).sync("o/r")
+
+        assert result.has_errors
+        assert store.get_cursor("o/r", "open") == (None, None)
+        assert store.get_mappings("o/r") == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_vault_commit_saves_no_mappings(self, store):
+        client = MagicMock()
+        client.fetch_issues = AsyncMock(return_value=GitHubIssueBatch(issues=[_issue(1)]))
+        storage = _storage()
+        storage.transaction.return_value.__aexit__ = AsyncMock(
+            side_effect=RuntimeError("disk full")
+        )
+
+        with pytest.raises(RuntimeError):
+            await GitHubSyncEngine(client, storage, store).sync("o/r")
+
+        assert store.get_mappings("o/r") == {}
+        assert store.get_cursor("o/r", "open") == (None, None)
+
+    @pytest.mark.asyncio
+    async def test_rerun_adopts_tasks_whose_mappings_were_lost(self, store):
+        client = MagicMock()
+        client.fetch_issues = AsyncMock(
+            return_value=GitHubIssueBatch(issues=[_issue(1), _issue(2)])
+        )
+        # Task 1 was committed to the vault, but the run stopped before its mapping
+        orphan = Task(id="task-1", content="[GitHub #1] Issue 1", created_at=NOW, updated_at=NOW)
+        storage = _storage([orphan])
+
+        result = await GitHubSyncEngine(client, storage, store).sync("o/r")
+
+        (created,) = storage.task_repository.add_many.call_args.args[0]
+        assert created.content == "[GitHub #2] Issue 2"
+        assert (result.created, result.unchanged) == (1, 1)
+        assert set(store.get_mappings("o/r")) == {1, 2}
+        assert store.get_mappings("o/r")[1][0] == "task-1"
@@ -19,13 +19,14 @@ Strategy
 from __future__ import annotations
 
 import json
+from datetime import UTC, timedelta
 from datetime import datetime as _real_datetime
-from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from todopro_cli.services import log_service as log_service_module
 from todopro_cli.services.log_service import LogService
 
 # ---------------------------------------------------------------------------
@@ -410,19 +411,17 @@ class TestMarkErrorsAsRead:
     def test_returns_zero_when_no_file(self, _log_dir):
         assert LogService.mark_errors_as_read() == 0
 
-    def test_marks_recent_entries_acknowledged(self, _log_dir, log_file, _patched_dt):
-        """Entries within the last 24 hours are marked acknowledged."""
+    @pytest.mark.usefixtures("patched_dt")
+    def test_marks_recent_entries_read_without_rewriting(self, log_file):
+        """Entries within the last 24 hours are read; the log is left as is."""
         recent_dt = FIXED_NOW - timedelta(hours=1)
         _write_entry(log_file, command="recent", dt=recent_dt, acknowledged=False)
+        before = log_file.read_bytes()
 
         count = LogService.mark_errors_as_read()
-        assert count >= 1
-
-        # Verify the file now contains acknowledged=True
-        lines = log_file.read_text(encoding="utf-8").strip().splitlines()
-        entries = [json.loads(ln) for ln in lines if ln.strip()]
-        recent_entries = [e for e in entries if e["command"] == "recent"]
-        assert all(e.get("acknowledged") is True for e in recent_entries)
+        assert count == 1
+        assert LogService.get_unread_errors() == []
+        assert log_file.read_bytes() == before
 
     def test_does_not_remark_already_acknowledged_entries(
         self, _log_dir, log_file, _patched_dt
@@ -558,3 +557,123 @@ class TestClearOldErrors:
         lines = log_file.read_text(encoding="utf-8").strip().splitlines()
         entries = [json.loads(ln) for ln in lines if ln.strip()]
         assert entries[0]["command"] == "valid"
+
+
+# ---------------------------------------------------------------------------
+# Tests: rotation, read cursor and tail reads
+# ---------------------------------------------------------------------------
+
+
+class TestRotationAndReadCursor:
+    """Tests for log rotation and the persisted read cursor."""
+
+    @pytest.mark.usefixtures("patched_dt")
+    def test_unread_errors_read_only_past_the_cursor(self, log_dir, log_file, mocker):
+        _write_entry(log_file, command="seen", dt=FIXED_NOW - timedelta(hours=2))
+        LogService.mark_errors_as_read()
+        _write_entry(log_file, command="new", dt=FIXED_NOW - timedelta(hours=1))
+
+        spy = mocker.spy(LogService, "_scan_unread")
+        unread = LogService.get_unread_errors()
+        assert [e["command"] for e in unread] == ["new"]
+        assert spy.call_count == 1
+
+        cursor = json.loads((log_dir / "errors.cursor.json").read_text())
+        assert cursor["offset"] == len(log_file.read_bytes().splitlines(True)[0])
+
+    @pytest.mark.usefixtures("patched_dt")
+    def test_new_entries_are_unread_again(self, log_file):
+        _write_entry(log_file, command="first", dt=FIXED_NOW - timedelta(hours=3))
+        assert LogService.mark_errors_as_read() == 1
+        assert LogService.mark_errors_as_read() == 0
+
+        _write_entry(log_file, command="second", dt=FIXED_NOW - timedelta(hours=1))
+        _write_entry(log_file, command="third", dt=FIXED_NOW)
+        unread = LogService.get_unread_errors()
+        assert [e["command"] for e in unread] == ["third", "second"]
+
+    @pytest.mark.usefixtures("patched_dt")
+    def test_partial_trailing_line_is_left_unread(self, log_file):
+        _write_entry(log_file, command="done", dt=FIXED_NOW - timedelta(hours=1))
+        with open(log_file, "a", encoding="utf-8") as fh:
+            fh.write('{"timestamp": "2024-01-15T12:00:00Z", "comm')
+        assert LogService.mark_errors_as_read() == 1
+
+        with open(log_file, "a", encoding="utf-8") as fh:
+            fh.write('and": "late", "error": "e"}\n')
+        assert [e["command"] for e in LogService.get_unread_errors()] == ["late"]
+
+    def test_rotates_by_size(self, log_dir, log_file, mocker):
+        mocker.patch("todopro_cli.services.log_service.MAX_LOG_BYTES", 200)
+        for i in range(5):
+            LogService.log_error(f"cmd{i}", "x" * 100)
+
+        assert (log_dir / "errors.1.jsonl").exists()
+        assert log_file.stat().st_size < 400
+        commands = [e["command"] for e in LogService.get_recent_errors(limit=5)]
+        assert commands == ["cmd4", "cmd3", "cmd2", "cmd1", "cmd0"]
+
+    def test_rotates_by_age_and_keeps_backup_count(self, log_dir, mocker):
+        mocker.patch("todopro_cli.services.log_service.BACKUP_COUNT", 2)
+        # Each error is logged 8 days after the previous one
+        start = FIXED_NOW.replace(tzinfo=UTC)
+        times = iter(start + timedelta(days=8 * i) for i in range(5))
+        mocker.patch.object(log_service_module, "_now", side_effect=lambda: next(times))
+        for i in range(5):
+            LogService.log_error(f"cmd{i}", "err")
+
+        names = sorted(p.name for p in log_dir.glob("errors*.jsonl"))
+        assert names == ["errors.1.jsonl", "errors.2.jsonl", "errors.jsonl"]
+        commands = [e["command"] for e in LogService.get_recent_errors()]
+        assert commands == ["cmd4", "cmd3", "cmd2"]
+
+    def test_cursor_follows_rotated_file(self, log_dir, mocker):
+        LogService.log_error("seen", "err")
+        LogService.mark_errors_as_read()
+        LogService.log_error("unread-before", "err")
+
+        mocker.patch("todopro_cli.services.log_service.MAX_LOG_BYTES", 1)
+        LogService.log_error("unread-after", "err")
+
+        assert (log_dir / "errors.1.jsonl").exists()
+        unread = LogService.get_unread_errors()
+        assert [e["command"] for e in unread] == ["unread-after", "unread-before"]
+
+    def test_get_recent_errors_reads_tail_only(self, log_file, mocker):
+        mocker.patch("todopro_cli.services.log_service._READ_BLOCK", 256)
+        for i in range(500):
+            _write_entry(log_file, command=f"cmd{i}")
+        reads = mocker.spy(log_service_module, "_parse_line")
+
+        result = LogService.get_recent_errors(limit=3)
+        assert [e["command"] for e in result] == ["cmd499", "cmd498", "cmd497"]
+        assert reads.call_count < 10
+
+    @pytest.mark.usefixtures("patched_dt")
+    def test_clear_old_errors_drops_rotated_files(self, log_dir, log_file):
+        old = log_dir / "errors.2.jsonl"
+        _write_entry(old, command="old", dt=FIXED_NOW - timedelta(days=40))
+        _write_entry(old, command="old", dt=FIXED_NOW - timedelta(days=39))
+        kept = log_dir / "errors.1.jsonl"
+        _write_entry(kept, command="kept", dt=FIXED_NOW - timedelta(days=20))
+        _write_entry(log_file, command="active", dt=FIXED_NOW)
+
+        assert LogService.clear_old_errors(days=30) == 2
+        assert not old.exists()
+        assert kept.exists()
+
+    @pytest.mark.usefixtures("patched_dt")
+    def test_clear_old_errors_keeps_cursor_on_active_file(self, log_file):
+        _write_entry(log_file, command="old", dt=FIXED_NOW - timedelta(days=40))
+        _write_entry(log_file, command="seen", dt=FIXED_NOW - timedelta(hours=2))
+        LogService.mark_errors_as_read()
+        _write_entry(log_file, command="new", dt=FIXED_NOW - timedelta(hours=1))
+
+        assert LogService.clear_old_errors(days=30) == 1
+        assert [e["command"] for e in LogService.get_unread_errors()] == ["new"]
+
+    @pytest.mark.usefixtures("patched_dt")
+    def test_reads_legacy_timestamp_format(self, log_file):
+        entry = {"timestamp": "2024-01-15T11:00:00+00:00Z", "command": "legacy"}
+        log_file.write_text(json.dumps(entry) + "\n", encoding="utf-8")
+        assert [e["command"] for e in LogService.get_unread_errors()] == ["legacy"]
@@ -0,0 +1,139 @@
+"""Unit tests for ReminderScheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from todopro_cli.adapters.sqlite import schema as db_schema
+from todopro_cli.adapters.sqlite.migrations.m006_reminder_indexes import (
+    ReminderIndexesMigration,
+)
+from todopro_cli.adapters.sqlite.reminder_repository import SqliteReminderRepository
+from todopro_cli.services.reminder_scheduler import ReminderScheduler
+
+NOW = datetime(2026, 10, 18, 9, 0, tzinfo=UTC)
+
+
+class Clock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def repo() -> SqliteReminderRepository:
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute(db_schema.CREATE_USERS_TABLE)
+    conn.execute(db_schema.CREATE_PROJECTS_TABLE)
+    conn.execute(db_schema.CREATE_TASKS_TABLE)
+    conn.execute(db_schema.CREATE_REMINDERS_TABLE)
+    ReminderIndexesMigration().up(conn)
+    for task_id in ("t1", "t2"):
+        conn.execute(
+            "INSERT INTO tasks (id, content, user_id, created_at, updated_at) "
+            "VALUES (?, ?, 'u', '2024-01-01', '2024-01-01')",
+            (task_id, task_id),
+        )
+    repository = SqliteReminderRepository(connection=conn)
+    repository._user_id = "u"
+    return repository
+
+
+def _scheduler(repo, delivered, clock=None, **kwargs) -> ReminderScheduler:
+    async def deliver(reminder):
+        delivered.append(reminder.id)
+
+    return ReminderScheduler(repo, deliver, clock=clock, **kwargs)
+
+
+class TestReminderScheduler:
+    @pytest.mark.asyncio
+    async def test_load_arms_reminders_within_horizon(self, repo):
+        soon = await repo.add("t1", NOW + timedelta(hours=1))
+        await repo.add("t2", NOW + timedelta(days=3))
+        scheduler = _scheduler(repo, [], clock=Clock(NOW))
+
+        await scheduler.load()
+        assert len(scheduler) == 1
+        assert scheduler.next_deadline == soon.reminder_date
+
+    @pytest.mark.asyncio
+    async def test_fire_due_delivers_in_order_once(self, repo):
+        clock = Clock(NOW)
+        second = await repo.add("t1", NOW + timedelta(minutes=20))
+        first = await repo.add("t2", NOW + timedelta(minutes=10))
+        later = await repo.add("t1", NOW + timedelta(hours=2))
+        delivered: list[str] = []
+        scheduler = _scheduler(repo, delivered, clock=clock)
+        await scheduler.load()
+
+        assert await scheduler.fire_due() == []
+        clock.now = NOW + timedelta(minutes=30)
+        fired = await scheduler.fire_due()
+
+        assert delivered == [first.id, second.id]
+        assert all(reminder.is_sent for reminder in fired)
+        assert await scheduler.fire_due() == []
+        assert scheduler.next_deadline == later.reminder_date
+
+    @pytest.mark.asyncio
+    async def test_snooze_and_complete_rearm(self, repo):
+        clock = Clock(NOW)
+        delivered: list[str] = []
+        scheduler = _scheduler(repo, delivered, clock=clock)
+        await scheduler.load()
+
+        dismissed = await scheduler.add("t1", NOW + timedelta(minutes=5))
+        snoozed = await scheduler.add("t2", NOW + timedelta(minutes=5))
+        await scheduler.complete(dismissed.id)
+        replacement = await scheduler.snooze(
+            snoozed.id, NOW + timedelta(minutes=15)
+        )
+        assert scheduler.next_deadline == replacement.reminder_date
+
+        clock.now = NOW + timedelta(minutes=10)
+        assert await scheduler.fire_due() == []
+        clock.now = NOW + timedelta(minutes=15)
+        await scheduler.fire_due()
+        assert delivered == [replacement.id]
+
+    @pytest.mark.asyncio
+    async def test_skips_reminders_handled_elsewhere(self, repo):
+        clock = Clock(NOW)
+        handled = await repo.add("t1", NOW + timedelta(minutes=1))
+        deleted = await repo.add("t2", NOW + timedelta(minutes=1))
+        delivered: list[str] = []
+        scheduler = _scheduler(repo, delivered, clock=clock)
+        await scheduler.load()
+
+        await repo.mark_sent(handled.id)
+        await repo.delete(deleted.id)
+        clock.now = NOW + timedelta(minutes=2)
+        assert await scheduler.fire_due() == []
+        assert delivered == []
+
+    @pytest.mark.asyncio
+    async def test_run_wakes_for_newly_added_reminder(self, repo):
+        delivered: list[str] = []
+        scheduler = _scheduler(repo, delivered, refresh=3600)
+        runner = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.01)
+
+        reminder = await scheduler.add(
+            "t1", datetime.now(UTC) + timedelta(milliseconds=50)
+        )
+        for _ in range(100):
+            if delivered:
+                break
+            await asyncio.sleep(0.01)
+        scheduler.stop()
+        await asyncio.wait_for(runner, 1)
+
+        assert delivered == [reminder.id]
@@ -21,16 +21,23 @@ from todopro_cli.services.sync_service import (
     SyncPushService,
     SyncResult,
     SyncService,
+    _read_ahead,
 )
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
 def _mock_repo(**overrides) -> MagicMock:
     """Return a MagicMock that behaves like any repository."""
     repo = MagicMock()
     repo.list_all = AsyncMock(return_value=overrides.get("list_all", []))
+    repo.iter_all = MagicMock(side_effect=lambda *_a, **_kw: _aiter([]))
     repo.get_by_id = AsyncMock(return_value=overrides.get("get_by_id"))
     repo.create = AsyncMock(return_value=None)
     repo.update = AsyncMock(return_value=None)
@@ -470,7 +477,7 @@ class TestSyncPullServicePull:
         svc = _make_pull_service()
         svc.source_project_repo.list_all = AsyncMock(return_value=[project])
         svc.source_label_repo.list_all = AsyncMock(return_value=[label])
-        svc.source_task_repo.list_all = AsyncMock(return_value=[task])
+        svc.source_task_repo.iter_all = MagicMock(return_value=_aiter([task]))
 
         result = asyncio.run(
             svc.pull("remote", "local", dry_run=True)
@@ -726,7 +733,7 @@ class TestSyncPullServiceNonDryRunLoops:
         svc = _make_pull_service()
         svc.source_project_repo.list_all = AsyncMock(return_value=[project])
         svc.source_label_repo.list_all = AsyncMock(return_value=[label])
-        svc.source_task_repo.list_all = AsyncMock(return_value=[task])
+        svc.source_task_repo.iter_all = MagicMock(return_value=_aiter([task]))
         # target repos return None → items are new
         svc.target_project_repo.get_by_id = AsyncMock(return_value=None)
         svc.target_label_repo.get_by_id = AsyncMock(return_value=None)
@@ -755,7 +762,7 @@ class TestSyncPullServiceNonDryRunLoops:
         svc = _make_pull_service()
         svc.source_project_repo.list_all = AsyncMock(return_value=projects)
         svc.source_label_repo.list_all = AsyncMock(return_value=labels)
-        svc.source_task_repo.list_all = AsyncMock(return_value=tasks)
+        svc.source_task_repo.iter_all = MagicMock(return_value=_aiter(tasks))
         svc.target_project_repo.get_by_id = AsyncMock(return_value=None)
         svc.target_label_repo.get_by_id = AsyncMock(return_value=None)
         svc.target_task_repo.get_by_id = AsyncMock(return_value=None)
@@ -886,3 +893,46 @@ class TestSyncPushServiceSyncTaskException:
         result = SyncResult()
         asyncio.run(svc._sync_task(_make_task(), result, "local_wins"))
         assert result.tasks_new == 0
+
+
+# ===========================================================================
+# _read_ahead (streamed pull)
+# ===========================================================================
+
+class TestReadAhead:
+    """The pull consumes remote pages through a bounded read-ahead buffer."""
+
+    def test_source_runs_ahead_of_consumer(self):
+        fetched = []
+
+        async def source():
+            for i in range(10):
+                fetched.append(i)
+                yield i
+
+        async def consume():
+            seen = []
+            async for item in _read_ahead(source(), size=4):
+                await asyncio.sleep(0.01)
+                seen.append((item, len(fetched)))
+            return seen
+
+        seen = asyncio.run(consume())
+        assert [item for item, _ in seen] == list(range(10))
+        # While the first item was being handled the source kept fetching
+        assert seen[0][1] > 1
+
+    def test_source_errors_propagate(self):
+        async def source():
+            yield 1
+            raise RuntimeError("page failed")
+
+        async def consume():
+            return [item async for item in _read_ahead(source())]
+
+        try:
+            asyncio.run(consume())
+        except RuntimeError as e:
+            assert "page failed" in str(e)
+        else:
+            raise AssertionError("expected RuntimeError")
@@ -16,7 +16,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from todopro_cli.models import Task, TaskUpdate
+from todopro_cli.models import Page, Task, TaskUpdate
 from todopro_cli.services.task_service import TaskService
 
 # ---------------------------------------------------------------------------
@@ -265,6 +265,113 @@ async def test_complete_task_delegates_to_repo(service, mock_repo):
     mock_repo.complete.assert_awaited_once_with("task-done")
 
 
+# ---------------------------------------------------------------------------
+# iter_tasks
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_iter_tasks_chains_page_cursors(service, mock_repo):
+    """iter_tasks should follow next_cursor until the last page."""
+    mock_repo.list_page = AsyncMock(
+        side_effect=[
+            Page[Task].model_construct(items=["a", "b"], next_cursor="c1", has_more=True),
+            Page[Task].model_construct(items=["c"], next_cursor=None, has_more=False),
+        ]
+    )
+
+    items = [task async for task in service.iter_tasks(status="all", page_size=2)]
+
+    assert items == ["a", "b", "c"]
+    cursors = [c.args[0].cursor for c in mock_repo.list_page.call_args_list]
+    assert cursors == [None, "c1"]
+
+
+@pytest.mark.asyncio
+async def test_iter_tasks_stops_at_limit(service, mock_repo):
+    """iter_tasks should shrink the last page to the remaining limit."""
+    mock_repo.list_page = AsyncMock(
+        side_effect=lambda filters, **_kw: Page[Task].model_construct(
+            items=["t"] * filters.limit, next_cursor="c", has_more=True
+        )
+    )
+
+    items = [task async for task in service.iter_tasks(limit=3, page_size=2)]
+
+    assert len(items) == 3
+    sizes = [c.args[0].limit for c in mock_repo.list_page.call_args_list]
+    assert sizes == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_iter_task_pages_yields_non_empty_pages(service, mock_repo):
+    """iter_task_pages should yield each page's items and skip empty pages."""
+    mock_repo.list_page = AsyncMock(
+        side_effect=[
+            Page[Task].model_construct(items=["a", "b"], next_cursor="c1", has_more=True),
+            Page[Task].model_construct(items=[], next_cursor=None, has_more=False),
+        ]
+    )
+
+    pages = [page async for page in service.iter_task_pages(page_size=2)]
+
+    assert pages == [["a", "b"]]
+
+
+# ---------------------------------------------------------------------------
+# skip_task / list_upcoming
+# ---------------------------------------------------------------------------
+
+
+def _upcoming_task(id_: str, due: datetime | None, rule: str | None = None) -> Task:
+    now = datetime(2026, 1, 1)
+    return Task(
+        id=id_,
+        content=id_,
+        due_date=due,
+        is_recurring=rule is not None,
+        recurrence_rule=rule,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_skip_task_delegates_to_repo(service, mock_repo):
+    """skip_task should delegate to repo.skip."""
+    mock_repo.skip = AsyncMock(return_value=MagicMock(spec=Task))
+
+    await service.skip_task("task-r")
+
+    mock_repo.skip.assert_awaited_once_with("task-r")
+
+
+@pytest.mark.asyncio
+async def test_list_upcoming_expands_recurring_tasks(service, mock_repo):
+    """list_upcoming should list every occurrence in the window, in time order."""
+    now = datetime(2026, 10, 18, 8, 0)
+    mock_repo.list_upcoming = AsyncMock(
+        return_value=[
+            _upcoming_task("one-off", datetime(2026, 10, 19, 12, 0)),
+            _upcoming_task("daily", datetime(2026, 10, 1, 9, 0), "FREQ=DAILY"),
+            _upcoming_task("overdue", datetime(2026, 10, 1, 9, 0)),
+            _upcoming_task("broken", datetime(2026, 10, 18, 10, 0), "FREQ=OFTEN"),
+            _upcoming_task("undated", None),
+        ]
+    )
+
+    occurrences = await service.list_upcoming(days=2, now=now)
+
+    assert [(at.day, at.hour, task.id) for at, task in occurrences] == [
+        (18, 9, "daily"),
+        (18, 10, "broken"),
+        (19, 9, "daily"),
+        (19, 12, "one-off"),
+    ]
+    start, end = mock_repo.list_upcoming.call_args.args
+    assert (start, end) == (now, datetime(2026, 10, 20, 8, 0))
+
+
 # ---------------------------------------------------------------------------
 # get_task_service factory (lines 254-259)
 # ---------------------------------------------------------------------------
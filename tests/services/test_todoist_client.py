@@ -219,3 +219,24 @@ class TestHttpErrors:
             pytest.raises(ValueError, match="API key"),
         ):
             await client._get("/projects")
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_is_retried_after_delay(self):
+        client = _make_client()
+        limited = _make_response({}, status_code=429)
+        limited.headers = {"Retry-After": "2"}
+        ok = _make_response([{"id": "p1", "name": "Inbox"}])
+
+        mock_async_client = AsyncMock()
+        mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
+        mock_async_client.__aexit__ = AsyncMock(return_value=False)
+        mock_async_client.get = AsyncMock(side_effect=[limited, ok])
+
+        with (
+            patch("todopro_cli.services.todoist.client.httpx.AsyncClient", return_value=mock_async_client),
+            patch("todopro_cli.services.todoist.client.asyncio.sleep", new=AsyncMock()) as sleep,
+        ):
+            data = await client._get("/projects")
+
+        assert data == [{"id": "p1", "name": "Inbox"}]
+        sleep.assert_awaited_once_with(2.0)
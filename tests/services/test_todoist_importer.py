@@ -1,19 +1,27 @@
 """Unit tests for TodoistImportService.
 
 The Todoist client and all TodoPro repositories are replaced with mocks
-so these tests are pure unit tests — no network, no filesystem.
+so these tests are pure unit tests — no network, no filesystem — except
+for the rollback test, which writes to a temporary SQLite vault.
 """
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from todopro_cli.adapters.sqlite.connection import open_connection
+from todopro_cli.models.storage_strategy import (
+    LocalStorageStrategy,
+    StorageStrategyContext,
+)
 from todopro_cli.services.todoist.importer import TodoistImportService
 from todopro_cli.services.todoist.models import (
     TodoistDue,
     TodoistImportOptions,
+    TodoistImportResult,
     TodoistLabel,
     TodoistProject,
     TodoistTask,
@@ -60,13 +68,18 @@ def _make_storage(
 
     # Task repository
     task_repo = MagicMock()
-    task_repo.list_all = AsyncMock(return_value=existing_tasks or [])
-    task_repo.add = AsyncMock(return_value=MagicMock(id="new-task-id"))
+    task_repo.iter_all = MagicMock(side_effect=lambda *_a, **_kw: _agen(existing_tasks or []))
+    task_repo.add_many = AsyncMock(side_effect=lambda tasks: [f"new-task-{i}" for i in range(len(tasks))])
     storage.task_repository = task_repo
 
     return storage
 
 
+async def _agen(items):
+    for item in items:
+        yield item
+
+
 def _default_options(**overrides) -> TodoistImportOptions:
     return TodoistImportOptions(**{"project_name_prefix": "[Todoist]", **overrides})
 
@@ -182,10 +195,59 @@ class TestDryRun:
 
         result = await service.import_all(_default_options(dry_run=True))
 
-        storage.task_repository.add.assert_not_called()
+        storage.task_repository.add_many.assert_not_called()
         assert result.tasks_created == 1
 
 
+# ---------------------------------------------------------------------------
+# Fetching and bulk writes
+# ---------------------------------------------------------------------------
+
+
+class TestConcurrentImport:
+    @pytest.mark.asyncio
+    async def test_task_fetches_respect_concurrency_limit(self):
+        in_flight = peak = 0
+
+        async def get_tasks(project_id, **_kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [_task(f"t-{project_id}", f"Task {project_id}", project_id)]
+
+        projects = [_project(f"p{i}", f"P{i}") for i in range(6)]
+        client = _make_client(projects=projects)
+        client.get_tasks = get_tasks
+        service = TodoistImportService(client, _make_storage())
+
+        result = await service.import_all(_default_options(max_concurrent_fetches=2))
+
+        assert peak == 2
+        assert result.tasks_created == 6
+
+    @pytest.mark.asyncio
+    async def test_tasks_written_in_one_bulk_insert_with_resolved_project(self):
+        client = _make_client(
+            projects=[_project("p1", "Work")],
+            tasks=[_task("t1", "A"), _task("t2", "B")],
+        )
+        storage = _make_storage()
+        storage.project_repository.create = AsyncMock(
+            return_value=MagicMock(id="work-id")
+        )
+        service = TodoistImportService(client, storage)
+
+        await service.import_all(_default_options())
+
+        (batch,) = [c.args[0] for c in storage.task_repository.add_many.call_args_list]
+        assert [t.content for t in batch] == ["A", "B"]
+        assert {t.project_id for t in batch} == {"work-id"}
+        # Projects are looked up once, not per task
+        assert storage.project_repository.list_all.await_count == 1
+
+
 # ---------------------------------------------------------------------------
 # Deduplication
 # ---------------------------------------------------------------------------
@@ -213,12 +275,25 @@ class TestDeduplication:
         existing_task.content = "Buy milk"
         client = _make_client(projects=[_project()], tasks=[_task(content="Buy milk")])
         storage = _make_storage(existing_tasks=[existing_task])
-        storage.task_repository.list_all = AsyncMock(return_value=[existing_task])
         service = TodoistImportService(client, storage)
 
         result = await service.import_all(_default_options())
 
-        storage.task_repository.add.assert_not_called()
+        storage.task_repository.add_many.assert_not_called()
+        assert result.tasks_skipped == 1
+
+    @pytest.mark.asyncio
+    async def test_skips_duplicate_content_within_import(self):
+        client = _make_client(
+            projects=[_project()],
+            tasks=[_task("t1", "Same"), _task("t2", "Same")],
+        )
+        storage = _make_storage()
+        service = TodoistImportService(client, storage)
+
+        result = await service.import_all(_default_options())
+
+        assert result.tasks_created == 1
         assert result.tasks_skipped == 1
 
     @pytest.mark.asyncio
@@ -313,9 +388,41 @@ class TestErrorHandling:
     async def test_task_repo_error_is_captured(self):
         client = _make_client(projects=[_project()], tasks=[_task()])
         storage = _make_storage()
-        storage.task_repository.add = AsyncMock(side_effect=Exception("Write fail"))
+        storage.task_repository.add_many = AsyncMock(side_effect=Exception("Write fail"))
         service = TodoistImportService(client, storage)
 
         result = await service.import_all(_default_options())
 
         assert result.has_errors
+
+    @pytest.mark.asyncio
+    async def test_interrupted_task_import_is_rolled_back(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("todopro_cli.services.todoist.importer._TASK_BATCH_SIZE", 2)
+        db_path = tmp_path / "vault.db"
+        connection = open_connection(db_path)
+        storage = StorageStrategyContext(
+            LocalStorageStrategy(db_path=str(db_path), connection=connection)
+        )
+        repo = storage.task_repository
+        add_many = repo.add_many
+        calls = 0
+
+        async def interrupted_add_many(tasks):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise asyncio.CancelledError
+            return await add_many(tasks)
+
+        monkeypatch.setattr(repo, "add_many", interrupted_add_many)
+        tasks = [_task(f"t{i}", f"Task {i}") for i in range(5)]
+        service = TodoistImportService(_make_client(tasks=tasks), storage)
+
+        # Fresh vault: the first batch also bootstraps the local user
+        with pytest.raises(asyncio.CancelledError):
+            await service._import_tasks(
+                [_project()], {}, {}, _default_options(), TodoistImportResult()
+            )
+
+        assert connection.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 0
+        await storage.strategy.close()
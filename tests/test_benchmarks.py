@@ -0,0 +1,133 @@
+"""Tests for the benchmark suite (vault generator, runner, comparison)."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from datetime import date
+
+import pytest
+
+from benchmarks.cases import CASES, Case, Timer
+from benchmarks.generator import VaultSpec, generate_vault
+from benchmarks.runner import Workspace, compare, run_case, select_cases, summarize
+from todopro_cli.models import TaskFilters
+
+ANCHOR = date(2026, 10, 18)
+
+
+def _rows(path, table):
+    with sqlite3.connect(path) as conn:
+        return conn.execute(f"SELECT * FROM {table} ORDER BY 1, 2").fetchall()
+
+
+def _results(medians: dict[str, float]) -> dict:
+    return {
+        "schema": 1,
+        "runs": [
+            {
+                "vault": {"name": "1k-plain-s42"},
+                "cases": {name: {"median": m} for name, m in medians.items()},
+            }
+        ],
+    }
+
+
+class TestGenerator:
+    def test_same_spec_generates_same_vault(self, tmp_path):
+        spec = VaultSpec(tasks=300, seed=7, anchor=ANCHOR)
+        first = generate_vault(spec, tmp_path / "a")
+        second = generate_vault(spec, tmp_path / "b")
+
+        for table in ("projects", "labels", "contexts", "tasks", "task_labels"):
+            assert _rows(first.path, table) == _rows(second.path, table)
+        assert _rows(first.focus_path, "pomodoro_sessions") == _rows(
+            second.focus_path, "pomodoro_sessions"
+        )
+        assert len(_rows(first.path, "tasks")) == 300
+
+    def test_seed_changes_data(self, tmp_path):
+        a = generate_vault(VaultSpec(tasks=50, seed=1, anchor=ANCHOR), tmp_path)
+        b = generate_vault(VaultSpec(tasks=50, seed=2, anchor=ANCHOR), tmp_path)
+        assert _rows(a.path, "tasks") != _rows(b.path, "tasks")
+
+    def test_e2ee_vault_decrypts_to_plain_vault(self, tmp_path):
+        plain = generate_vault(VaultSpec(tasks=100, anchor=ANCHOR), tmp_path)
+        e2ee = generate_vault(VaultSpec(tasks=100, e2ee=True, anchor=ANCHOR), tmp_path)
+
+        stored = _rows(e2ee.path, "tasks")[0]
+        assert stored[1] == ""  # content lives only in content_encrypted
+
+        def contents(vault):
+            ws = Workspace(vault, tmp_path)
+            repo = ws.storage().task_repository
+            tasks = asyncio.run(repo.list_all(TaskFilters(status="all")))
+            ws.release()
+            return sorted((t.id, t.content) for t in tasks)
+
+        assert contents(e2ee) == contents(plain)
+
+
+class TestRunner:
+    def test_run_case_times_only_the_timed_section(self, tmp_path):
+        vault = generate_vault(VaultSpec(tasks=50, anchor=ANCHOR), tmp_path / "v")
+        ws = Workspace(vault, tmp_path)
+        stats = run_case(CASES["list_page"], ws, repeat=3, warmup=1)
+
+        assert stats["runs"] == 3 and len(stats["times"]) == 3
+        assert stats["min"] <= stats["median"] <= stats["p95"]
+
+    def test_case_without_timer_is_an_error(self, tmp_path):
+        vault = generate_vault(VaultSpec(tasks=10, anchor=ANCHOR), tmp_path / "v")
+
+        async def untimed(_ws, _timer):
+            return None
+
+        broken = Case("broken", untimed, "")
+        with pytest.raises(RuntimeError, match="did not time"):
+            run_case(broken, Workspace(vault, tmp_path), repeat=1)
+
+    def test_slow_cases_skipped_on_large_vaults_unless_named(self):
+        large = [case.name for case in select_cases(None, 1_000_000)]
+        assert "list_all" in large and "sync_diff" not in large
+        assert [c.name for c in select_cases(["sync_diff"], 1_000_000)] == ["sync_diff"]
+
+    @pytest.mark.usefixtures("tmp_config")
+    def test_network_case_counts_requests(self, tmp_path):
+        vault = generate_vault(VaultSpec(tasks=60, anchor=ANCHOR), tmp_path / "v")
+        ws = Workspace(vault, tmp_path)
+        try:
+            stats = run_case(CASES["api_bulk_complete"], ws, repeat=2, warmup=0)
+            api = asyncio.run(ws.api())
+        finally:
+            ws.close()
+
+        with sqlite3.connect(vault.path) as conn:
+            live = conn.execute("SELECT id FROM tasks WHERE deleted_at IS NULL")
+            assert sorted(api.tasks) == sorted(row[0] for row in live)
+        assert stats["requests"] == 1
+
+    def test_summarize(self):
+        stats = summarize([0.3, 0.1, 0.2])
+        assert stats["min"] == 0.1
+        assert stats["median"] == 0.2
+        assert stats["mean"] == pytest.approx(0.2)
+        assert stats["times"] == [0.3, 0.1, 0.2]
+
+    def test_timer(self):
+        with Timer() as timer:
+            pass
+        assert timer.elapsed is not None and timer.elapsed >= 0
+
+
+class TestCompare:
+    def test_compare_flags_changes_beyond_threshold(self):
+        base = _results({"list_all": 1.0, "search": 1.0, "export": 1.0, "gone": 1.0})
+        new = _results({"list_all": 1.5, "search": 0.5, "export": 1.05, "added": 1.0})
+
+        rows = {row["case"]: row for row in compare(base, new, threshold=0.1)}
+        assert set(rows) == {"list_all", "search", "export"}
+        assert rows["list_all"]["verdict"] == "slower"
+        assert rows["search"]["verdict"] == "faster"
+        assert rows["export"]["verdict"] == "same"
+        assert rows["list_all"]["ratio"] == pytest.approx(1.5)
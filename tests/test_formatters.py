@@ -91,6 +91,22 @@ def test_format_output_pretty():
         # Just verify no exception is raised
 
 
+def test_format_output_csv():
+    """Test CSV output format uses the item keys as columns."""
+    data = {"projects": [{"id": "p1", "name": "Work"}, {"id": "p2", "name": "Home"}]}
+    with patch("sys.stdout", new=StringIO()) as out:
+        format_output(data, "csv")
+    assert out.getvalue().splitlines() == ["id,name", "p1,Work", "p2,Home"]
+
+
+def test_format_output_ndjson():
+    """Test NDJSON output format writes one object per line."""
+    data = [{"id": "123"}, {"id": "456"}]
+    with patch("sys.stdout", new=StringIO()) as out:
+        format_output(data, "ndjson")
+    assert out.getvalue().splitlines() == ['{"id":"123"}', '{"id":"456"}']
+
+
 def test_format_table_empty_data():
     """Test formatting empty data as table."""
     with patch("sys.stdout", new=StringIO()):
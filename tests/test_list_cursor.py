@@ -0,0 +1,67 @@
+"""Tests for the --next-page cursor cache."""
+
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from todopro_cli.services import cache_service
+from todopro_cli.services.cache_service import (
+    LIST_CURSOR_TTL,
+    get_list_cursor,
+    save_list_cursor,
+)
+
+LISTING = {"status": "active", "project": None, "limit": 30}
+
+
+@pytest.fixture
+def cursor_file(tmp_path, monkeypatch):
+    """Keep the cursor cache in a temporary directory."""
+    path = tmp_path / "list_cursor.json"
+    monkeypatch.setattr(cache_service, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cache_service, "LIST_CURSOR_FILE", path)
+    return path
+
+
+def _in_context(name):
+    return patch.object(cache_service, "_current_context_name", return_value=name)
+
+
+@pytest.mark.usefixtures("cursor_file")
+def test_save_and_get_list_cursor():
+    with _in_context("local"):
+        save_list_cursor(LISTING, "c1")
+        assert get_list_cursor(LISTING) == "c1"
+        assert get_list_cursor({**LISTING, "status": "all"}) is None
+
+
+@pytest.mark.usefixtures("cursor_file")
+def test_cursor_is_kept_per_context():
+    with _in_context("local"):
+        save_list_cursor(LISTING, "local-cursor")
+    with _in_context("cloud"):
+        assert get_list_cursor(LISTING) is None
+        save_list_cursor(LISTING, "cloud-cursor")
+    with _in_context("local"):
+        assert get_list_cursor(LISTING) == "local-cursor"
+
+
+def test_expired_cursor_is_ignored(cursor_file):
+    with _in_context("local"):
+        save_list_cursor(LISTING, "c1")
+        entries = json.loads(cursor_file.read_text())
+        for entry in entries.values():
+            entry["timestamp"] = time.time() - LIST_CURSOR_TTL - 10
+        cursor_file.write_text(json.dumps(entries))
+
+        assert get_list_cursor(LISTING) is None
+
+
+def test_corrupted_file_is_ignored(cursor_file):
+    cursor_file.write_text("not json")
+    with _in_context("local"):
+        assert get_list_cursor(LISTING) is None
+        save_list_cursor(LISTING, "c1")
+        assert get_list_cursor(LISTING) == "c1"
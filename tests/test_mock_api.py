@@ -0,0 +1,211 @@
+"""Tests for the benchmark suite's mock TodoPro API."""
+
+from __future__ import annotations
+
+import time
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+
+from benchmarks.mock_api import MockServer, MockTodoProAPI, NetworkProfile
+from todopro_cli.adapters.rest_api import RestApiTaskRepository
+from todopro_cli.adapters.sqlite.e2ee import E2EEHandler
+from todopro_cli.models import TaskCreate, TaskFilters, TaskUpdate
+from todopro_cli.services.api.client import APIClient
+
+
+def _client(api: MockTodoProAPI, token: str | None = None) -> httpx.AsyncClient:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=api),
+        base_url="http://mock",
+        headers=headers,
+    )
+
+
+def _api(tasks: int = 0, **kwargs) -> tuple[MockTodoProAPI, str, str]:
+    api = MockTodoProAPI(**kwargs)
+    api.populate(tasks=tasks)
+    access, refresh = api.issue_tokens()
+    return api, access, refresh
+
+
+@asynccontextmanager
+async def _repository(server: MockServer):
+    client = APIClient()
+    client.base_url = server.url
+    repo = RestApiTaskRepository()
+    repo._client = client
+    repo._e2ee_handler = E2EEHandler()
+    try:
+        yield repo
+    finally:
+        await client.close()
+
+
+async def _all_ids(client: httpx.AsyncClient, **params) -> list[str]:
+    ids: list[str] = []
+    while True:
+        data = (await client.get("/v1/tasks", params=params)).json()
+        ids += [task["id"] for task in data["tasks"]]
+        if data.get("next_cursor"):
+            params["cursor"] = data["next_cursor"]
+        elif "offset" in params and data["tasks"]:
+            params["offset"] += len(data["tasks"])
+        else:
+            return ids
+
+
+class TestMockAPI:
+    @pytest.mark.asyncio
+    async def test_cursor_pages_cover_every_task_once(self):
+        api, token, _ = _api(tasks=120)
+        async with _client(api, token) as client:
+            ids = await _all_ids(client, status="all", limit=50)
+        assert sorted(ids) == sorted(api.tasks)
+        assert api.stats.requests["GET /v1/tasks"] == 3
+
+    @pytest.mark.asyncio
+    async def test_offset_pages_without_cursor(self):
+        api, token, _ = _api(tasks=30, cursor_pagination=False)
+        async with _client(api, token) as client:
+            ids = await _all_ids(client, status="all", limit=10, offset=0)
+            first = (await client.get("/v1/tasks", params={"status": "all"})).json()
+        assert sorted(ids) == sorted(api.tasks)
+        assert "next_cursor" not in first and len(first["tasks"]) == 30
+
+    @pytest.mark.asyncio
+    async def test_status_filter(self):
+        api, token, _ = _api(tasks=50)
+        async with _client(api, token) as client:
+            active = (await client.get("/v1/tasks")).json()["tasks"]
+        assert active and not any(task["is_completed"] for task in active)
+
+    @pytest.mark.asyncio
+    async def test_requires_token(self):
+        api, _, _ = _api()
+        async with _client(api) as client:
+            response = await client.get("/v1/tasks")
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_token_expires_and_refresh_rotates(self):
+        api, token, refresh = _api(token_ttl=1)
+        async with _client(api, token) as client:
+            assert (await client.get("/v1/projects")).status_code == 200
+            assert (await client.get("/v1/projects")).status_code == 401
+
+            response = await client.post(
+                "/v1/auth/refresh", json={"refresh_token": refresh}
+            )
+            assert response.status_code == 200
+            new_token = response.json()["access_token"]
+            reused = await client.post(
+                "/v1/auth/refresh", json={"refresh_token": refresh}
+            )
+            assert reused.status_code == 401
+
+            headers = {"Authorization": f"Bearer {new_token}"}
+            response = await client.get("/v1/projects", headers=headers)
+            assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_injected_errors(self):
+        api, token, _ = _api(profile=NetworkProfile(error_rate=1.0))
+        async with _client(api, token) as client:
+            response = await client.get("/v1/labels")
+        assert response.status_code == 503
+        assert api.stats.statuses[503] == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit(self):
+        api, token, _ = _api(profile=NetworkProfile(rate_limit=0.1, burst=2))
+        async with _client(api, token) as client:
+            statuses = [(await client.get("/v1/labels")).status_code for _ in range(3)]
+            limited = await client.get("/v1/labels")
+        assert statuses == [200, 200, 429]
+        assert int(limited.headers["retry-after"]) >= 1
+
+    @pytest.mark.asyncio
+    async def test_latency_and_bandwidth(self):
+        profile = NetworkProfile(latency=0.05, bandwidth=100_000)
+        api, token, _ = _api(tasks=100, profile=profile)
+        async with _client(api, token) as client:
+            start = time.perf_counter()
+            response = await client.get("/v1/tasks", params={"status": "all"})
+            elapsed = time.perf_counter() - start
+        assert elapsed >= 0.05 + len(response.content) / 100_000
+
+    @pytest.mark.asyncio
+    async def test_batch_complete_and_missing_task(self):
+        api, token, _ = _api()
+        ids = [api.add_task({"content": f"t{i}"})["id"] for i in range(3)]
+        async with _client(api, token) as client:
+            response = await client.post(
+                "/v1/tasks/batch/complete", json={"task_ids": [*ids, "missing"]}
+            )
+            missing = await client.get("/v1/tasks/missing")
+            unknown = await client.get("/v1/nothing")
+        assert response.json()["completed"] == 3
+        assert all(api.tasks[task_id]["is_completed"] for task_id in ids)
+        assert missing.status_code == 404 and unknown.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_sections(self):
+        api, token, _ = _api()
+        project = api.add_project({"name": "Inbox"})
+        base = f"/v1/projects/{project['id']}/sections"
+        async with _client(api, token) as client:
+            created = (await client.post(base, json={"name": "Later"})).json()
+            listed = (await client.get(base)).json()
+        assert [section["id"] for section in listed] == [created["id"]]
+
+
+class TestMockServer:
+    def test_serves_over_http_with_keep_alive(self):
+        api, token, _ = _api(tasks=10)
+        with MockServer(api) as server:
+            headers = {"Authorization": f"Bearer {token}"}
+            with httpx.Client(base_url=server.url, headers=headers) as client:
+                first = client.get("/v1/tasks", params={"status": "all"})
+                second = client.get("/v1/labels")
+        assert first.status_code == 200 and len(first.json()["tasks"]) == 10
+        assert second.status_code == 200
+        assert api.stats.total == 2
+
+    @pytest.mark.asyncio
+    async def test_rest_repository_pages_and_refreshes(self, tmp_config):
+        api, token, refresh = _api(tasks=75, token_ttl=3)
+        tmp_config.save_credentials(
+            token, refresh, tmp_config.get_current_context().name
+        )
+        with MockServer(api) as server:
+            async with _repository(server) as repo:
+                listed = [
+                    task.id
+                    async for task in repo.iter_all(
+                        TaskFilters(status="all"), page_size=20
+                    )
+                ]
+        assert sorted(listed) == sorted(api.tasks)
+        # The access token expired on the fourth page and was refreshed
+        assert api.stats.requests["POST /v1/auth/refresh"] == 1
+        assert api.stats.requests["GET /v1/tasks"] == 5
+
+    @pytest.mark.asyncio
+    async def test_rest_repository_concurrent_writes(self, tmp_config):
+        api, token, refresh = _api(profile=NetworkProfile(latency=0.02))
+        tmp_config.save_credentials(
+            token, refresh, tmp_config.get_current_context().name
+        )
+        with MockServer(api) as server:
+            async with _repository(server) as repo:
+                created = await repo.add_many(
+                    [TaskCreate(content=f"new {i}") for i in range(12)]
+                )
+                done = await repo.bulk_update(created, TaskUpdate(is_completed=True))
+        assert sorted(created) == sorted(api.tasks)
+        assert len(done) == 12 and all(task.is_completed for task in done)
+        assert api.stats.max_in_flight > 1
+        assert api.stats.requests["POST /v1/tasks/batch/complete"] == 1
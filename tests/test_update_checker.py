@@ -8,6 +8,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from todopro_cli import __version__
+from todopro_cli.utils import deferred, update_checker
 from todopro_cli.utils.update_checker import (
     DEFAULT_BACKEND_URL,
     check_for_updates,
@@ -31,6 +32,15 @@ def mock_cache_dir(tmp_path):
         yield cache_dir
 
 
+@pytest.fixture(autouse=True)
+def _refresh_inline():
+    """Run background metadata refreshes inline, so tests see their effect."""
+    with patch(
+        "todopro_cli.utils.update_checker._spawn", side_effect=lambda target: target()
+    ) as spawn:
+        yield spawn
+
+
 def test_check_for_updates_with_newer_version(_mock_cache_dir, capsys):
     """Test that update notification is shown when newer version is available."""
     mock_response = Mock()
@@ -387,7 +397,7 @@ def test_get_latest_version_corrupt_cache_returns_none_on_network_error(mock_cac
 
 
 def test_get_backend_url_corrupt_cache_priority2_falls_through(mock_cache_dir):
-    """Lines 143-144: corrupt cache in priority-2 branch falls through to PyPI."""
+    """A corrupt cache answers with the default and is refreshed for next time."""
     cache_file = mock_cache_dir / "update_check.json"
     mock_cache_dir.mkdir(parents=True, exist_ok=True)
     cache_file.write_text("!!! not json !!!")
@@ -402,12 +412,13 @@ def test_get_backend_url_corrupt_cache_priority2_falls_through(mock_cache_dir):
     }
 
     with patch("todopro_cli.utils.update_checker.httpx.get", return_value=mock_response):
+        assert get_backend_url() == DEFAULT_BACKEND_URL
         url = get_backend_url()
     assert url == "https://pypi.backend.example/api"
 
 
 def test_get_backend_url_pypi_caches_with_corrupt_existing_cache(mock_cache_dir):
-    """Lines 156-159: when PyPI returns a backend_url but existing cache is corrupt,
+    """When PyPI returns a backend_url but existing cache is corrupt,
     the corrupt cache is silently ignored and new data is written."""
     cache_file = mock_cache_dir / "update_check.json"
     mock_cache_dir.mkdir(parents=True, exist_ok=True)
@@ -423,13 +434,13 @@ def test_get_backend_url_pypi_caches_with_corrupt_existing_cache(mock_cache_dir)
     }
 
     with patch("todopro_cli.utils.update_checker.httpx.get", return_value=mock_response):
-        url = get_backend_url()
-    assert url == "https://new-backend.example/api"
+        get_backend_url()
     # New cache file should have been written with the backend URL
     assert cache_file.exists()
     import json as jsonlib
     data = jsonlib.loads(cache_file.read_text())
     assert data["backend_url"] == "https://new-backend.example/api"
+    assert data["latest_version"] == "1.0.0"
 
 
 def test_get_backend_url_corrupt_expired_cache_fallback(mock_cache_dir):
@@ -454,3 +465,90 @@ def test_get_backend_url_corrupt_expired_cache_no_crash(mock_cache_dir):
         # Should not raise
         url = get_backend_url()
     assert isinstance(url, str)  # returns something valid
+
+
+# ---------------------------------------------------------------------------
+# Stale-while-revalidate: lookups never wait for PyPI
+# ---------------------------------------------------------------------------
+
+
+def _expired_cache(cache_dir, **extra):
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    data = {"last_check_timestamp": time.time() - 7200, **extra}
+    (cache_dir / "update_check.json").write_text(json.dumps(data))
+
+
+def test_get_backend_url_serves_expired_cache_without_waiting(
+    mock_cache_dir, _refresh_inline
+):
+    _expired_cache(mock_cache_dir, backend_url="https://stale.example/api")
+    _refresh_inline.side_effect = None  # leave the refresh pending
+
+    with patch("todopro_cli.utils.update_checker.httpx.get") as mock_get:
+        assert get_backend_url() == "https://stale.example/api"
+        mock_get.assert_not_called()
+    _refresh_inline.assert_called_once()
+
+
+@pytest.mark.usefixtures("mock_cache_dir")
+def test_get_backend_url_without_cache_returns_default_without_waiting(
+    _refresh_inline,
+):
+    _refresh_inline.side_effect = None
+
+    with patch("todopro_cli.utils.update_checker.httpx.get") as mock_get:
+        assert get_backend_url() == DEFAULT_BACKEND_URL
+        mock_get.assert_not_called()
+
+
+def test_check_for_updates_does_not_wait_for_pypi(mock_cache_dir, _refresh_inline):
+    _expired_cache(mock_cache_dir, latest_version="1.0.0")
+    _refresh_inline.side_effect = None
+
+    with patch("todopro_cli.utils.update_checker.httpx.get") as mock_get:
+        check_for_updates()
+        mock_get.assert_not_called()
+    _refresh_inline.assert_called_once()
+
+
+def test_refresh_keeps_backend_url_when_pypi_has_none(mock_cache_dir):
+    _expired_cache(mock_cache_dir, backend_url="https://kept.example/api")
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "info": {"version": "2.0.0", "project_urls": None}
+    }
+
+    with patch("todopro_cli.utils.update_checker.httpx.get", return_value=mock_response):
+        assert update_checker.refresh_metadata()["latest_version"] == "2.0.0"
+    assert get_backend_url() == "https://kept.example/api"
+
+
+@pytest.mark.usefixtures("mock_cache_dir")
+def test_no_refresh_scheduled_while_one_is_running(_refresh_inline):
+    with update_checker._refresh_lock:
+        update_checker.schedule_refresh()
+    _refresh_inline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_refreshes_inside_a_command_are_deferred_and_coalesced(mock_cache_dir):
+    _expired_cache(mock_cache_dir, backend_url="https://stale.example/api")
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "info": {
+            "version": "1.0.0",
+            "project_urls": {"Backend": "https://fresh.example/api"},
+        }
+    }
+
+    with patch(
+        "todopro_cli.utils.update_checker.httpx.get", return_value=mock_response
+    ) as mock_get:
+        assert get_backend_url() == "https://stale.example/api"
+        assert get_backend_url() == "https://stale.example/api"
+        await deferred.drain()
+
+    mock_get.assert_called_once()
+    assert get_backend_url() == "https://fresh.example/api"
@@ -6,11 +6,13 @@ data structures, current-section resolution, and navigation logic.
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 
 from todopro_cli.utils.ui.board_view import (
+    CARD_HEIGHT,
     AddTaskButton,
     BoardViewApp,
     Section,
@@ -18,7 +20,9 @@ from todopro_cli.utils.ui.board_view import (
     SectionTitle,
     SectionViewModel,
     TaskCard,
+    TaskCardMap,
     TaskCheckbox,
+    TaskColumn,
     TaskViewModel,
 )
 
@@ -30,6 +34,10 @@ def _task_data(id_: str, content: str, *, due_date=None, is_completed=False):
     return {"id": id_, "content": content, "due_date": due_date, "is_completed": is_completed}
 
 
+async def _drain(loader):
+    return [page async for page in loader()]
+
+
 def _make_app(*task_ids, contents=None):
     """Build a BoardViewApp with N tasks in the default (no) section."""
     contents = contents or [f"Task {i}" for i in range(len(task_ids))]
@@ -1306,7 +1314,150 @@ class TestRunBoardView:
             mock_app_instance = MM()
             MockApp.return_value = mock_app_instance
             run_board_view("myproject")
-            # App was created with non-empty tasks list from dict response
+            # App gets a loader that yields the tasks from the dict response
             MockApp.assert_called_once()
-            args = MockApp.call_args[0]
-            assert isinstance(args[1], list)
+            loader = MockApp.call_args.kwargs["loader"]
+            pages = asyncio.run(_drain(loader))
+        assert pages == [[{"id": "t1", "content": "T", "is_completed": False}]]
+        mock_client.close.assert_awaited_once()
+
+
+# ===========================================================================
+# TaskCardMap
+# ===========================================================================
+
+class TestTaskCardMap:
+    """Tests for the lazily built task card mapping."""
+
+    def test_cards_built_on_first_access(self):
+        cards = TaskCardMap()
+        cards.add(TaskViewModel(id="t1", content="x"))
+
+        assert "t1" in cards
+        assert cards.cached("t1") is None
+        card = cards["t1"]
+        assert cards["t1"] is card
+        assert cards.cached("t1") is card
+
+    def test_release_builds_a_fresh_card_next_time(self):
+        cards = TaskCardMap()
+        cards.add(TaskViewModel(id="t1", content="x"))
+        card = cards["t1"]
+
+        cards.release(card)
+
+        assert cards["t1"] is not card
+        assert cards["t1"].model is card.model
+
+    def test_only_accessed_cards_are_built(self):
+        app = _make_app(*(f"t{i}" for i in range(1000)))
+        assert len(app.task_card_map) == 1000
+        assert sum(app.task_card_map.cached(f"t{i}") is not None for i in range(1000)) == 1
+
+
+# ===========================================================================
+# BoardViewApp — incremental updates
+# ===========================================================================
+
+class TestApplyTasks:
+    """Tests for add_tasks() and apply_tasks()."""
+
+    def test_add_tasks_appends_with_next_display_order(self):
+        app = _make_app("t1")
+        app.add_tasks([_task_data("t2", "Second")])
+        assert [t.display_order for t in app.sections[0].tasks] == [0, 1]
+        assert "t2" in app.task_card_map
+
+    def test_changed_task_updates_model_and_keeps_card(self):
+        app = _make_app("t1", "t2")
+        card = app.task_card_map["t1"]
+
+        app.apply_tasks(
+            [_task_data("t1", "Renamed", is_completed=True), _task_data("t2", "Task 1")]
+        )
+
+        assert app.task_card_map["t1"] is card
+        assert card.model.content == "Renamed"
+        assert card.model.is_completed is True
+
+    def test_removed_task_dropped_and_orders_renumbered(self):
+        app = _make_app("t1", "t2", "t3")
+        app.apply_tasks([_task_data("t1", "Task 0"), _task_data("t3", "Task 2")])
+
+        tasks = app.sections[0].tasks
+        assert [t.id for t in tasks] == ["t1", "t3"]
+        assert [t.display_order for t in tasks] == [0, 1]
+        assert "t2" not in app.task_card_map
+
+    def test_new_task_appended(self):
+        app = _make_app("t1")
+        app.apply_tasks([_task_data("t1", "Task 0"), _task_data("t9", "New")])
+        assert [t.id for t in app.sections[0].tasks] == ["t1", "t9"]
+
+    def test_removing_selected_task_selects_first_remaining(self):
+        app = _make_app("t1", "t2")
+        app.apply_tasks([_task_data("t2", "Task 1")])
+        assert app.selected_component is app.task_card_map["t2"]
+
+
+# ===========================================================================
+# TaskColumn — virtualization (runs the app headless)
+# ===========================================================================
+
+def _mounted_ids(app: BoardViewApp) -> list[str]:
+    return [card.model.id for card in app.query(TaskCard)]
+
+
+class TestTaskColumnVirtualization:
+    """Only the cards in view are mounted, however many tasks there are."""
+
+    @pytest.mark.asyncio
+    async def test_mounts_only_visible_cards(self):
+        app = _make_app(*(f"t{i}" for i in range(2000)))
+        async with app.run_test(size=(100, 40)) as pilot:
+            await pilot.pause()
+            mounted = _mounted_ids(app)
+            column = app.query_one(TaskColumn)
+
+            assert 0 < len(mounted) < 30
+            assert mounted[0] == "t0"
+            assert column.virtual_size.height >= 2000 * CARD_HEIGHT
+
+    @pytest.mark.asyncio
+    async def test_scrolling_swaps_the_window(self):
+        app = _make_app(*(f"t{i}" for i in range(2000)))
+        async with app.run_test(size=(100, 40)) as pilot:
+            column = app.query_one(TaskColumn)
+            column.scroll_to(y=1000 * CARD_HEIGHT, animate=False)
+            await pilot.pause()
+            mounted = _mounted_ids(app)
+
+            assert "t0" not in mounted
+            assert "t1000" in mounted
+            assert len(mounted) < 30
+
+    @pytest.mark.asyncio
+    async def test_navigating_far_mounts_the_target(self):
+        app = _make_app(*(f"t{i}" for i in range(2000)))
+        async with app.run_test(size=(100, 40)) as pilot:
+            await pilot.pause()
+            app.go_to_component(app.task_card_map["t1500"])
+            await pilot.pause()
+
+            assert "t1500" in _mounted_ids(app)
+            assert app.selected_component.is_mounted
+
+    @pytest.mark.asyncio
+    async def test_loader_pages_are_shown_as_they_arrive(self):
+        async def loader():
+            yield [_task_data("t1", "First")]
+            yield [_task_data("t2", "Second")]
+
+        app = BoardViewApp(project_code="inbox", loader=loader)
+        async with app.run_test(size=(100, 40)) as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert _mounted_ids(app) == ["t1", "t2"]
+            assert app.selected_component is app.task_card_map["t1"]
+            assert app.sub_title == "2 tasks"
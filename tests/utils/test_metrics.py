@@ -0,0 +1,177 @@
+"""Unit tests for todopro_cli.utils.metrics."""
+
+from __future__ import annotations
+
+import json
+import threading
+import urllib.request
+
+import pytest
+from typer.testing import CliRunner
+
+from todopro_cli.main import app
+from todopro_cli.services.sync_service import SyncResult
+from todopro_cli.utils import metrics
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    yield
+    metrics.disable()
+
+
+def _sync_result(success=True, duration=2.0, conflicts=0) -> SyncResult:
+    result = SyncResult()
+    result.success = success
+    result.duration = duration
+    result.tasks_fetched = 10
+    result.tasks_new = 3
+    result.tasks_conflicts = conflicts
+    return result
+
+
+class TestDisabled:
+    def test_hooks_are_noops(self):
+        assert metrics.timed("todopro_command_duration_seconds") is metrics.timed(
+            "todopro_command_duration_seconds"
+        )
+        metrics.inc("todopro_http_retries", method="GET")
+        metrics.cache_lookup("task_ids", True)
+        metrics.record_sync("pull", _sync_result())
+        assert metrics.is_enabled() is False
+        assert metrics.finish() is None
+
+
+class TestRegistry:
+    def test_counters_histograms_and_gauges(self, tmp_path):
+        registry = metrics.enable(tmp_path / "m.prom")
+        metrics.inc("todopro_http_retries", method="GET")
+        metrics.inc("todopro_http_retries", 2, method="GET")
+        metrics.observe("todopro_http_request_duration_seconds", 0.02, method="GET")
+        metrics.observe("todopro_http_request_duration_seconds", 3.0, method="GET")
+        metrics.set_gauge("todopro_sync_last_success_timestamp_seconds", 5, d="x")
+
+        assert registry.values["todopro_http_retries"] == {(("method", "GET"),): 3}
+        hist = registry.values["todopro_http_request_duration_seconds"][
+            (("method", "GET"),)
+        ]
+        bounds = metrics.FAST_BUCKETS
+        assert hist["buckets"][bounds.index(0.025)] == 1
+        assert hist["buckets"][bounds.index(5.0)] == 2
+        assert hist["count"] == 2 and hist["sum"] == pytest.approx(3.02)
+
+    def test_unknown_metric_is_an_error(self, tmp_path):
+        metrics.enable(tmp_path / "m.prom")
+        with pytest.raises(KeyError):
+            metrics.inc("todopro_typo")
+
+    def test_record_sync(self, tmp_path):
+        registry = metrics.enable(tmp_path / "m.prom")
+        metrics.record_sync("pull", _sync_result(conflicts=2))
+        metrics.record_sync("pull", _sync_result(success=False, duration=1.0))
+
+        values = registry.values
+        runs = values["todopro_sync_runs"]
+        assert runs[(("direction", "pull"), ("outcome", "success"))] == 1
+        assert runs[(("direction", "pull"), ("outcome", "failure"))] == 1
+        items = values["todopro_sync_items"]
+        key = (("change", "fetched"), ("direction", "pull"), ("entity", "tasks"))
+        assert items[key] == 20
+        assert values["todopro_sync_conflicts"][(("direction", "pull"),)] == 2
+        duration = values["todopro_sync_duration_seconds"][(("direction", "pull"),)]
+        assert duration["count"] == 2 and duration["sum"] == 3.0
+        assert "todopro_sync_last_success_timestamp_seconds" in values
+
+
+class TestExposition:
+    def test_render(self, tmp_path):
+        registry = metrics.enable(tmp_path / "m.prom")
+        metrics.cache_lookup("task_ids", True)
+        metrics.cache_lookup("task_ids", False)
+        metrics.cache_lookup("mirror", None)
+        metrics.observe("todopro_command_duration_seconds", 0.3, command="list")
+
+        text = metrics.render(registry.values)
+        lines = text.splitlines()
+        assert "# TYPE todopro_cache_requests_total counter" in lines
+        assert 'todopro_cache_requests_total{cache="task_ids",result="hit"} 1' in lines
+        assert 'todopro_cache_requests_total{cache="mirror",result="stale"} 1' in lines
+        bucket = 'todopro_command_duration_seconds_bucket{command="list",le="%s"} %d'
+        assert bucket % ("0.1", 0) in lines
+        assert bucket % ("0.5", 1) in lines
+        assert bucket % ("+Inf", 1) in lines
+        assert 'todopro_command_duration_seconds_count{command="list"} 1' in lines
+        assert lines[-1] == "# EOF"
+
+    def test_label_values_are_escaped(self):
+        state = {"todopro_http_retries": {(("method", 'a"b\\c\nd'),): 1}}
+        assert 'method="a\\"b\\\\c\\nd"' in metrics.render(state)
+
+    def test_render_skips_series_with_other_buckets(self):
+        key = (("command", "list"),)
+        stale = {"buckets": [1, 1], "sum": 0.3, "count": 1}
+        state = {"todopro_command_duration_seconds": {key: stale}}
+        assert "todopro_command_duration_seconds_count" not in metrics.render(state)
+
+    def test_finish_accumulates_across_runs(self, tmp_path):
+        path = tmp_path / "textfile" / "todopro.prom"
+        for _ in range(2):
+            metrics.enable(path)
+            metrics.record_sync("push", _sync_result(conflicts=1))
+            metrics.finish()
+
+        text = path.read_text()
+        assert 'todopro_sync_runs_total{direction="push",outcome="success"} 2' in text
+        assert 'todopro_sync_conflicts_total{direction="push"} 2' in text
+        assert 'todopro_sync_duration_seconds_count{direction="push"} 2' in text
+        assert json.loads(metrics.state_path(path).read_text())["version"] == 1
+        assert sorted(p.name for p in path.parent.glob("*.prom")) == ["todopro.prom"]
+
+    def test_corrupt_state_starts_over(self, tmp_path):
+        path = tmp_path / "todopro.prom"
+        metrics.state_path(path).write_text("not json")
+        metrics.enable(path)
+        metrics.inc("todopro_http_retries", method="GET")
+        metrics.finish()
+        assert 'todopro_http_retries_total{method="GET"} 1' in path.read_text()
+
+    def test_server_serves_current_state(self, tmp_path):
+        path = tmp_path / "todopro.prom"
+        metrics.enable(path)
+        metrics.inc("todopro_http_retries", method="POST")
+        metrics.finish()
+
+        server = metrics.make_server(path, "127.0.0.1", 0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/metrics"
+            with urllib.request.urlopen(url) as response:
+                body = response.read().decode()
+                content_type = response.headers["Content-Type"]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert 'todopro_http_retries_total{method="POST"} 1' in body
+        assert content_type.startswith("text/plain")
+
+
+class TestCommands:
+    def test_env_collects_command_metrics(self, tmp_path, monkeypatch):
+        path = tmp_path / "todopro.prom"
+        monkeypatch.setenv(metrics.ENV_VAR, str(path))
+        runner = CliRunner()
+        runner.invoke(app, ["metrics", "show"])
+        result = runner.invoke(app, ["metrics", "show"])
+
+        assert result.exit_code == 0
+        assert not metrics.is_enabled()
+        assert 'todopro_command_duration_seconds_count{command="show_command"} 1' in (
+            result.output
+        )
+
+    def test_show_without_file_fails(self, monkeypatch):
+        monkeypatch.delenv(metrics.ENV_VAR, raising=False)
+        result = CliRunner().invoke(app, ["metrics", "show"])
+        assert result.exit_code == 1
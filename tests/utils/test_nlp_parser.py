@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
+from todopro_cli.utils import nlp_parser
 from todopro_cli.utils.nlp_parser import LocalNLPParser, parse_natural_language
 
 # ---------------------------------------------------------------------------
@@ -234,6 +235,95 @@ class TestSimpleDateParse:
         assert result["due_date"].weekday() == 1
 
 
+# ---------------------------------------------------------------------------
+# Date grammar – forms read without dateparser
+# ---------------------------------------------------------------------------
+
+
+class TestDateGrammar:
+    def test_month_day_prefers_future(self):
+        now = datetime.now()
+        result = parse_natural_language("Pay rent Jan 15")
+        expected_year = now.year if (now.month, now.day) <= (1, 15) else now.year + 1
+        assert result["due_date"].date() == datetime(expected_year, 1, 15).date()
+        assert result["content"] == "Pay rent"
+
+    def test_day_month_year(self):
+        result = parse_natural_language("Renew passport 15 March 2030")
+        assert result["due_date"].date() == datetime(2030, 3, 15).date()
+
+    def test_abbreviated_month_with_ordinal(self):
+        result = parse_natural_language("Launch Sept 3rd, 2031")
+        assert result["due_date"].date() == datetime(2031, 9, 3).date()
+        assert result["content"] == "Launch"
+
+    def test_iso_date_with_time(self):
+        result = parse_natural_language("Ship 2030-06-01 at 9am")
+        assert result["due_date"] == datetime(2030, 6, 1, 9, 0)
+
+    def test_numeric_month_day(self):
+        result = parse_natural_language("Dentist 3/14/2030 at 10:30")
+        assert result["due_date"] == datetime(2030, 3, 14, 10, 30)
+
+    def test_in_weeks(self):
+        result = parse_natural_language("Deploy in 2 weeks")
+        expected = (datetime.now() + timedelta(days=14)).date()
+        assert result["due_date"].date() == expected
+
+    def test_in_minutes_is_exact(self):
+        before = datetime.now().replace(microsecond=0)
+        result = parse_natural_language("Check oven in 90 minutes")
+        assert result["due_date"] - before >= timedelta(minutes=90)
+        assert result["due_date"] - before < timedelta(minutes=91)
+
+    def test_next_month_clamps_day(self):
+        spec = nlp_parser._phrase_spec("next month")
+        due = spec.resolve(datetime(2025, 1, 31))
+        assert due.date() == datetime(2025, 2, 28).date()
+
+    def test_next_weekday(self):
+        result = parse_natural_language("Plan trip next friday")
+        assert result["due_date"].weekday() == 4
+        assert result["content"] == "Plan trip"
+
+    def test_month_name_needs_whole_word(self):
+        result = parse_natural_language("Buy 2 mars bars")
+        assert result["due_date"] is None
+
+    def test_invalid_date_is_not_parsed(self):
+        with patch("todopro_cli.utils.nlp_parser.HAS_DATEPARSER", False):
+            result = parse_natural_language("Report Feb 30")
+        assert result["due_date"] is None
+
+    def test_other_words_kept_in_content(self):
+        result = parse_natural_language("Plan next sprint tomorrow")
+        assert result["content"] == "Plan next sprint"
+
+    def test_phrase_specs_are_memoized(self):
+        nlp_parser._phrase_spec.cache_clear()
+        parse_natural_language("Standup tomorrow at 9am")
+        parse_natural_language("Review PR Tomorrow at 9AM")
+        info = nlp_parser._phrase_spec.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_grammar_forms_do_not_load_dateparser(self):
+        with patch("todopro_cli.utils.nlp_parser._dateparser") as load:
+            parse_natural_language("Pay rent Jan 15 at 5pm")
+            parse_natural_language("Deploy in 3 days")
+        load.assert_not_called()
+
+    def test_unknown_phrase_falls_back_to_dateparser(self):
+        nlp_parser._dateparser_parse.cache_clear()
+        with (
+            patch("todopro_cli.utils.nlp_parser.HAS_DATEPARSER", True),
+            patch("todopro_cli.utils.nlp_parser._dateparser") as load,
+        ):
+            load.return_value.parse.return_value = datetime(2030, 1, 1)
+            result = parse_natural_language("Plan offsite next quarter")
+        assert result["due_date"] == datetime(2030, 1, 1)
+        assert load.return_value.parse.call_args.args[0] == "next quarter"
+
+
 # ---------------------------------------------------------------------------
 # Date removal from content
 # ---------------------------------------------------------------------------
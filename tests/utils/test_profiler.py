@@ -0,0 +1,158 @@
+"""Unit tests for todopro_cli.utils.profiler."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+
+import pytest
+from typer.testing import CliRunner
+
+from todopro_cli.main import app
+from todopro_cli.utils import profiler
+
+
+@pytest.fixture(autouse=True)
+def _reset_profiler():
+    yield
+    profiler.disable()
+
+
+class TestDisabled:
+    def test_span_is_shared_noop(self):
+        assert profiler.span("a") is profiler.span("b")
+        with profiler.span("a"):
+            pass
+        profiler.count(profiler.SQL_STATEMENTS)
+        assert profiler.is_enabled() is False
+
+    @pytest.mark.asyncio
+    async def test_traced_calls_through(self):
+        @profiler.traced()
+        async def work(x):
+            return x * 2
+
+        assert await work(21) == 42
+        assert work.__name__ == "work"
+
+
+class TestSpans:
+    def test_spans_nest_under_import_and_root(self):
+        profile = profiler.enable(report=False)
+        with (
+            profiler.span("outer", "command"),
+            profiler.span("inner", "sqlite", rows=3),
+        ):
+            pass
+        profiler.disable()
+
+        root = profile.root
+        assert [c.name for c in root.children] == ["import", "outer"]
+        inner = root.children[1].children[0]
+        assert inner.name == "inner"
+        assert inner.args == {"rows": 3}
+        assert root.duration >= root.children[1].duration >= inner.duration
+
+    @pytest.mark.asyncio
+    async def test_traced_methods_wraps_public_async_methods(self):
+        @profiler.traced_methods("sqlite")
+        class Repo:
+            async def get(self, key):
+                return await self.load(key)
+
+            async def load(self, key):
+                return key
+
+            async def iterate(self):
+                yield 1
+                yield 2
+
+            async def _private(self):
+                return None
+
+        profile = profiler.enable(report=False)
+        repo = Repo()
+        assert await repo.get("k") == "k"
+        assert [item async for item in repo.iterate()] == [1, 2]
+        await repo._private()
+        profiler.disable()
+
+        names = [span.name for span, _ in profile.walk()]
+        assert names == ["tp", "import", "Repo.get", "Repo.load", "Repo.iterate"]
+
+    def test_counts_sql_statements(self):
+        profile = profiler.enable(report=False)
+        conn = sqlite3.connect(":memory:", isolation_level=None)
+        conn.set_trace_callback(profiler.count_sql)
+        conn.execute("CREATE TABLE t (x)")
+        conn.executemany("INSERT INTO t VALUES (?)", [(1,), (2,)])
+        profiler.disable()
+        conn.execute("SELECT * FROM t")
+
+        assert profile.counters[profiler.SQL_STATEMENTS] == 3
+
+
+class TestReports:
+    def test_format_tree_merges_repeated_siblings(self):
+        profile = profiler.enable(report=False)
+        with profiler.span("command today"):
+            for _ in range(3):
+                with profiler.span("Repo.get"):
+                    pass
+        profiler.count(profiler.HTTP_REQUESTS, 2)
+        profiler.disable()
+
+        lines = profiler.format_tree(profile)
+        assert lines[0].startswith("tp ")
+        assert any("└── command today" in line for line in lines)
+        repo_line = next(line for line in lines if "Repo.get" in line)
+        assert repo_line.startswith("    └── ")
+        assert repo_line.endswith("×3")
+        assert lines[-1] == "SQL statements: 0 · HTTP requests: 2"
+
+    def test_chrome_trace_events(self):
+        profile = profiler.enable(report=False)
+        with profiler.span("render", "render"):
+            pass
+        profiler.count(profiler.SQL_STATEMENTS, 5)
+        profiler.disable()
+
+        trace = profiler.chrome_trace(profile)
+        events = trace["traceEvents"]
+        spans = [e for e in events if e["ph"] == "X"]
+        assert [e["name"] for e in spans] == ["tp", "import", "render"]
+        assert spans[0]["ts"] == 0
+        assert all(e["dur"] >= 0 for e in spans)
+        counter = next(e for e in events if e["ph"] == "C")
+        assert counter["args"] == {profiler.SQL_STATEMENTS: 5}
+        assert trace["otherData"] == {profiler.SQL_STATEMENTS: 5}
+
+    def test_finish_writes_trace_and_prints_tree(self, tmp_path, capsys):
+        trace_path = tmp_path / "out" / "trace.json"
+        profiler.enable(trace_path=str(trace_path), report=True)
+        profile = profiler.finish()
+
+        assert profile is not None and not profiler.is_enabled()
+        assert json.loads(trace_path.read_text())["traceEvents"][0]["name"] == "tp"
+        assert "SQL statements" in capsys.readouterr().err
+        assert profiler.finish() is None
+
+
+class TestProfileOption:
+    def test_profile_flag_prints_tree_to_stderr(self, monkeypatch):
+        monkeypatch.delenv("TODOPRO_TRACE", raising=False)
+        result = CliRunner(mix_stderr=False).invoke(app, ["--profile", "version"])
+
+        assert result.exit_code == 0
+        assert "import" in result.stderr
+        assert "HTTP requests" in result.stderr
+        assert not profiler.is_enabled()
+
+    def test_trace_env_writes_trace_without_report(self, tmp_path, monkeypatch):
+        trace_path = tmp_path / "trace.json"
+        monkeypatch.setenv("TODOPRO_TRACE", str(trace_path))
+        result = CliRunner(mix_stderr=False).invoke(app, ["version"])
+
+        assert result.exit_code == 0
+        assert "HTTP requests" not in result.stderr
+        assert json.loads(trace_path.read_text())["traceEvents"]
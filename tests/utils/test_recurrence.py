@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from todopro_cli.utils import recurrence
 from todopro_cli.utils.recurrence import (
     VALID_PATTERNS,
+    advance,
     describe_rrule,
+    first_occurrence,
+    iter_occurrences,
+    next_occurrence,
+    occurrences_between,
     resolve_rrule,
 )
 
+# A Sunday
+_SUNDAY = datetime(2026, 10, 18, 9, 0)
+
 
 class TestResolveRrule:
     def test_daily(self):
@@ -67,3 +80,113 @@ class TestValidPatterns:
 
     def test_valid_patterns_is_list(self):
         assert isinstance(VALID_PATTERNS, list)
+
+
+class TestIterOccurrences:
+    def test_is_lazy_and_memoizes_compiled_rules(self):
+        recurrence._compile.cache_clear()
+        occurrences = iter_occurrences("FREQ=DAILY", _SUNDAY)
+        assert next(occurrences) == _SUNDAY
+        assert next(occurrences) == _SUNDAY + timedelta(days=1)
+
+        iter_occurrences("FREQ=DAILY", _SUNDAY)
+        assert recurrence._compile.cache_info().hits == 1
+
+    def test_after_and_until(self):
+        occurrences = iter_occurrences(
+            "FREQ=DAILY",
+            _SUNDAY,
+            after=_SUNDAY + timedelta(days=1),
+            inclusive=True,
+            until=_SUNDAY + timedelta(days=3),
+        )
+        assert [o.day for o in occurrences] == [19, 20, 21]
+
+    def test_invalid_rule_raises_value_error(self):
+        with pytest.raises(ValueError, match="Invalid recurrence rule"):
+            next_occurrence("FREQ=SOMETIMES", _SUNDAY)
+
+
+class TestFirstAndNextOccurrence:
+    def test_first_occurrence_snaps_to_rule(self):
+        weekdays = resolve_rrule("weekdays")
+        assert first_occurrence(weekdays, _SUNDAY) == datetime(2026, 10, 19, 9, 0)
+
+    def test_first_occurrence_keeps_matching_start(self):
+        assert first_occurrence("FREQ=DAILY", _SUNDAY) == _SUNDAY
+
+    def test_next_occurrence_is_exclusive(self):
+        assert next_occurrence("FREQ=WEEKLY", _SUNDAY) == _SUNDAY + timedelta(weeks=1)
+
+    def test_series_end(self):
+        assert next_occurrence("FREQ=DAILY;COUNT=1", _SUNDAY) is None
+        assert next_occurrence("FREQ=DAILY", _SUNDAY, until=_SUNDAY) is None
+
+    def test_mixed_naive_and_aware(self):
+        aware = _SUNDAY.replace(tzinfo=UTC)
+        after = next(iter_occurrences("FREQ=DAILY", aware, after=_SUNDAY))
+        assert after.tzinfo is not None
+
+
+class TestAdvance:
+    def test_moves_to_next_occurrence(self):
+        assert advance("FREQ=DAILY", _SUNDAY) == (
+            _SUNDAY + timedelta(days=1),
+            "FREQ=DAILY",
+        )
+
+    def test_passes_missed_occurrences_and_shifts_count(self):
+        step = advance(
+            "FREQ=DAILY;COUNT=5", _SUNDAY, after=_SUNDAY + timedelta(days=2, hours=1)
+        )
+        assert step == (_SUNDAY + timedelta(days=3), "FREQ=DAILY;COUNT=2")
+
+    def test_returns_none_when_series_ends(self):
+        after = _SUNDAY + timedelta(days=2)
+        assert advance("FREQ=DAILY;COUNT=2", _SUNDAY, after=after) is None
+        assert advance("FREQ=DAILY", _SUNDAY, until=_SUNDAY) is None
+
+
+class TestOccurrencesBetween:
+    def test_one_off_task(self):
+        window = (_SUNDAY - timedelta(hours=1), _SUNDAY + timedelta(days=1))
+        assert list(occurrences_between(None, _SUNDAY, *window)) == [_SUNDAY]
+        assert list(occurrences_between(None, _SUNDAY, window[1], window[1])) == []
+
+    def test_recurring_task_in_window(self):
+        start = datetime(2026, 10, 20)
+        times = list(
+            occurrences_between("FREQ=DAILY", _SUNDAY, start, start + timedelta(days=3))
+        )
+        assert [t.day for t in times] == [20, 21, 22]
+
+    def test_overdue_series_starts_at_window(self):
+        long_ago = _SUNDAY - timedelta(days=3650)
+        start = datetime(2026, 10, 20)
+        times = list(
+            occurrences_between(
+                "FREQ=DAILY", long_ago, start, start + timedelta(days=2)
+            )
+        )
+        assert [t.day for t in times] == [20, 21]
+
+    def test_respects_recurrence_end(self):
+        start = _SUNDAY - timedelta(hours=1)
+        times = list(
+            occurrences_between(
+                "FREQ=DAILY",
+                _SUNDAY,
+                start,
+                start + timedelta(days=7),
+                until=_SUNDAY + timedelta(days=1),
+            )
+        )
+        assert len(times) == 2
+
+    def test_results_use_window_timezone(self):
+        aware_due = _SUNDAY.replace(tzinfo=UTC)
+        start = _SUNDAY - timedelta(hours=1)
+        (first,) = occurrences_between(
+            "FREQ=DAILY;COUNT=1", aware_due, start, start + timedelta(days=1)
+        )
+        assert first.tzinfo is None
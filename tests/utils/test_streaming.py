@@ -0,0 +1,98 @@
+"""Unit tests for streaming output writers."""
+
+from __future__ import annotations
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from todopro_cli.utils.ui.streaming import TASK_COLUMNS, RowWriter, stream_items
+
+
+def _task(n: int) -> dict:
+    return {
+        "id": f"task-{n:04d}",
+        "content": f"Task {n}",
+        "priority": 4,
+        "is_completed": False,
+        "labels": ["a", "b"],
+        "due_date": None,
+    }
+
+
+async def _agen(items):
+    for item in items:
+        yield item
+
+
+class TestRowWriter:
+    def test_ndjson_writes_one_object_per_line(self):
+        out = io.StringIO()
+        writer = RowWriter("ndjson", out)
+        writer.write(_task(1))
+        writer.write(_task(2))
+
+        lines = out.getvalue().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["task-0001", "task-0002"]
+
+    def test_csv_has_header_and_flattened_cells(self):
+        out = io.StringIO()
+        RowWriter("csv", out).write(_task(1))
+
+        header, row = out.getvalue().splitlines()
+        assert header == ",".join(TASK_COLUMNS)
+        cells = dict(zip(TASK_COLUMNS, row.split(",", len(TASK_COLUMNS) - 1), strict=True))
+        assert cells["is_completed"] == "false"
+        assert cells["due_date"] == ""
+
+    def test_tsv_uses_tabs_and_custom_columns(self):
+        out = io.StringIO()
+        RowWriter("tsv", out, columns=("id", "labels")).write(_task(1))
+
+        assert out.getvalue().splitlines() == ["id\tlabels", "task-0001\ta,b"]
+
+
+class TestStreamItems:
+    @pytest.mark.asyncio
+    async def test_writes_and_flushes_incrementally(self):
+        out = io.StringIO()
+        flushes = []
+        out.flush = lambda: flushes.append(out.getvalue().count("\n"))
+
+        with patch("todopro_cli.utils.ui.streaming.FLUSH_EVERY", 2):
+            count = await stream_items(_agen([_task(n) for n in range(5)]), "ndjson", out)
+
+        assert count == 5
+        assert flushes == [2, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_stops_when_reader_goes_away(self):
+        consumed = []
+
+        async def tasks():
+            for n in range(1000):
+                consumed.append(n)
+                yield _task(n)
+
+        class ClosedPipe(io.StringIO):
+            def write(self, s):
+                if self.tell() > 100:
+                    raise BrokenPipeError
+                return super().write(s)
+
+        count = await stream_items(tasks(), "ndjson", ClosedPipe())
+
+        assert count < 10
+        assert len(consumed) == count + 1
+
+    @pytest.mark.asyncio
+    async def test_pretty_renders_task_lines(self):
+        out = io.StringIO()
+
+        await stream_items(_agen([_task(1)]), "pretty", out)
+
+        text = out.getvalue()
+        assert "Task 1" in text
+        assert "#k-0001" in text